@@ -3,6 +3,7 @@ import { Resend } from 'resend';
 import { verifyTurnstileToken } from '@/lib/turnstile';
 import { getContactConfirmationEmailHtml, getContactNotificationEmailHtml } from '@/lib/email-templates';
 import { FORM_SUBMISSION_EMAIL } from '@/lib/email-config';
+import { routeLeadForEmail } from '@/lib/lead-routing';
 
 // Initialize Resend with API key from environment variable
 const resend = process.env.RESEND_API_KEY ? new Resend(process.env.RESEND_API_KEY) : null;
@@ -152,6 +153,7 @@ export async function POST(request: NextRequest) {
       manufacturerPreferredSupplier: manufacturerPreferredSupplier || undefined,
       manufacturerSponsoredListing: manufacturerSponsoredListing || undefined,
       manufacturerWebsite: manufacturerWebsite || undefined,
+      matchedRoofers: userType === 'resident' ? routeLeadForEmail(zipCode || propertyAddress) : undefined,
     });
 
     // Check if Resend is configured
@@ -3,6 +3,7 @@ import { Resend } from 'resend';
 import { verifyTurnstileToken } from '@/lib/turnstile';
 import { getEstimateConfirmationEmailHtml, getEstimateNotificationEmailHtml } from '@/lib/email-templates';
 import { FORM_SUBMISSION_EMAIL } from '@/lib/email-config';
+import { routeLeadForEmail } from '@/lib/lead-routing';
 
 // Initialize Resend with API key from environment variable
 const resend = process.env.RESEND_API_KEY ? new Resend(process.env.RESEND_API_KEY) : null;
@@ -138,6 +139,8 @@ export async function POST(request: NextRequest) {
       savedRoofers: savedRoofers || undefined,
       savedProducts: savedProducts || undefined,
       savedLocations: savedLocations || undefined,
+      // Precomputed ZIP routing (scripts/build-lead-routes.py)
+      matchedRoofers: routeLeadForEmail(zipCode || propertyAddress),
     });
 
     // Check if Resend is configured
@@ -26,6 +26,11 @@ export interface RooferData {
   city?: string;
   state?: string;
   zipCode?: string;
+  // Precomputed by scripts/geocode-roofers.py (no geocoding at request time)
+  latitude?: number;
+  longitude?: number;
+  // What latitude/longitude point at; only 'address' is the roofer's own location
+  geocodePrecision?: 'address' | 'street' | 'city' | 'county' | 'static';
   yearsInBusiness?: number;
   specialties?: string[];
   // Google Business Profile mapping
@@ -35,6 +40,22 @@ export interface RooferData {
   bbbAccredited?: boolean; // Whether the business is BBB Accredited
   bbbUrl?: string; // Link to BBB profile page
   bbbRating?: string; // BBB rating (e.g., "A+", "A", "B", etc.)
+  // Precomputed by scripts/analyze-rating-trends.py from the rating history
+  ratingTrends?: Record<string, RatingTrend>; // keyed by source ('yelp', 'google')
+  // Precomputed by scripts/score-roofer-ratings.py: Google and Yelp combined with a Bayesian prior
+  ratingScore?: number; // left out for roofers with no reviews
+  ratingCount?: number; // reviews across sources behind ratingScore
+}
+
+export interface RatingTrend {
+  rating?: number; // latest fetched rating
+  reviewCount?: number;
+  average30d?: number; // mean rating over the last 30 days
+  change90d?: number; // latest rating minus the rating 90 days earlier
+  reviewsPerMonth?: number;
+  trend?: 'rising' | 'falling' | 'steady';
+  ratingDrop?: boolean; // latest rating is well below the previous 90-day average
+  updated: string; // date of the latest snapshot
 }
 
 // Helper to create slug from name
@@ -80,7 +101,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['pinellas-park']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.8961,
+    longitude: -82.7412,
+    geocodePrecision: 'city'
   },
 
   '3mg-roofing-llc': {
@@ -115,7 +139,12 @@ export const rooferData: Record<string, RooferData | any> = {
     },
     isPreferred: false,
     isHidden: false,
-    category: "sponsored"
+    category: "sponsored",
+    latitude: 28.5383,
+    longitude: -81.3792,
+    ratingScore: 4.611,
+    ratingCount: 12,
+    geocodePrecision: 'city'
   },
 
   '4th-generation-roofing-sheet-metal-llc': {
@@ -141,7 +170,13 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['miami']
   },
     isPreferred: false,
-    isHidden: false, category: "preferred" },
+    isHidden: false, category: "preferred",
+    latitude: 25.7617,
+    longitude: -80.1918,
+    ratingScore: 4.641,
+    ratingCount: 15,
+    geocodePrecision: 'city'
+  },
 
   'a-1-american-roofing-sheet-metal-inc': {
     id: '6',
@@ -167,7 +202,12 @@ export const rooferData: Record<string, RooferData | any> = {
     },
     isPreferred: false,
     isHidden: false,
-    category: "sponsored"
+    category: "sponsored",
+    latitude: 26.9298,
+    longitude: -81.9498,
+    ratingScore: 4.502,
+    ratingCount: 6,
+    geocodePrecision: 'county'
   },
 
   'aam-industries-inc': {
@@ -193,7 +233,13 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['boynton-beach']
     },
     isPreferred: false,
-    isHidden: false, category: "sponsored" },
+    isHidden: false, category: "sponsored",
+    latitude: 26.7056,
+    longitude: -80.0364,
+    ratingScore: 4.542,
+    ratingCount: 5,
+    geocodePrecision: 'county'
+  },
 
   'a-bartlett-roofing-construction-services-llc': {
     id: '8',
@@ -219,7 +265,13 @@ export const rooferData: Record<string, RooferData | any> = {
     },
     isPreferred: false,
     isHidden: false,
-    category: "preferred"},
+    category: "preferred",
+    latitude: 28.3078,
+    longitude: -82.4654,
+    ratingScore: 4.443,
+    ratingCount: 12,
+    geocodePrecision: 'city'
+  },
 
   'american-building-contractors': {
     id: '9',
@@ -244,7 +296,12 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['deerfield-beach']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    ratingScore: 4.391,
+    ratingCount: 9,
+    geocodePrecision: 'county'
   },
 
   'abc-roofing-corp': {
@@ -270,7 +327,12 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['coral-springs']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.1224,
+    longitude: -80.1373,
+    ratingScore: 4.593,
+    ratingCount: 14,
+    geocodePrecision: 'city'
   },
 
   'ace-property-services': {
@@ -296,7 +358,12 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['miami']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 25.7617,
+    longitude: -80.1918,
+    ratingScore: 4.502,
+    ratingCount: 6,
+    geocodePrecision: 'city'
   },
 
   'acoma-roofing-inc': {
@@ -322,7 +389,12 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['oldsmar']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.8961,
+    longitude: -82.7412,
+    ratingScore: 4.535,
+    ratingCount: 8,
+    geocodePrecision: 'city'
   },
 
   'action-roofing-services-inc': {
@@ -348,7 +420,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['pompano-beach']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.1224,
+    longitude: -80.1373,
+    geocodePrecision: 'city'
   },
 
   'aderhold-roofing-corp': {
@@ -374,7 +449,12 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['tampa']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.9506,
+    longitude: -82.4572,
+    ratingScore: 4.617,
+    ratingCount: 4,
+    geocodePrecision: 'city'
   },
 
   'advanced-roofing-inc': {
@@ -400,7 +480,11 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['ft-lauderdale']
     },
     isPreferred: false,
-    isHidden: false, category: "sponsored"},
+    isHidden: false, category: "sponsored",
+    latitude: 26.1224,
+    longitude: -80.1373,
+    geocodePrecision: 'county'
+  },
 
   'advanced-roof-technology-inc': {
     id: '16',
@@ -451,7 +535,11 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['jacksonville']
   },
     isPreferred: false,
-    isHidden: false, category: "preferred"},
+    isHidden: false, category: "preferred",
+    latitude: 30.3322,
+    longitude: -81.6557,
+    geocodePrecision: 'city'
+  },
 
   'affordable-rfg-by-john-cadwell-inc': {
     id: '18',
@@ -477,7 +565,11 @@ export const rooferData: Record<string, RooferData | any> = {
   },
     isPreferred: false,
     isHidden: false,
-    category: "sponsored"},
+    category: "sponsored",
+    latitude: 28.3056,
+    longitude: -81.4165,
+    geocodePrecision: 'city'
+  },
 
   'all-florida-urethane-inc': {
     id: '19',
@@ -528,7 +620,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['oakland', 'oakland-park']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.1224,
+    longitude: -80.1373,
+    geocodePrecision: 'county'
   },
 
   'ajf-roofing-inc': {
@@ -554,7 +649,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['miami']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 25.7617,
+    longitude: -80.1918,
+    geocodePrecision: 'city'
   },
 
   'ajl-select-enterprises-llc': {
@@ -580,7 +678,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['panama-city-beach']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.1844,
+    longitude: -85.6608,
+    geocodePrecision: 'county'
   },
 
   'ak-certified-contracting-llc': {
@@ -633,7 +734,11 @@ export const rooferData: Record<string, RooferData | any> = {
     },
     isPreferred: false,
     isHidden: false,
-    category: "sponsored"},
+    category: "sponsored",
+    latitude: 27.3364,
+    longitude: -82.5307,
+    geocodePrecision: 'county'
+  },
 
   'alan-s-roofing-inc': {
     id: '25',
@@ -658,7 +763,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['brooksville']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5556,
+    longitude: -82.4544,
+    geocodePrecision: 'city'
   },
 
   'alan-taylor-roofing-llc': {
@@ -684,7 +792,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['orange-park']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.3322,
+    longitude: -81.6557,
+    geocodePrecision: 'city'
   },
 
   'albright-roofing-contracting': {
@@ -710,7 +821,11 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['clearwater']
   },
     isPreferred: false,
-    isHidden: false, category: "sponsored"},
+    isHidden: false, category: "sponsored",
+    latitude: 27.8961,
+    longitude: -82.7412,
+    geocodePrecision: 'city'
+  },
 
   'all-area-roofing-construction-inc': {
     id: '28',
@@ -735,7 +850,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['ft-pierce']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'allied-roofing-sheet-metal-inc': {
@@ -761,7 +879,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['ft-lauderdale']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.1224,
+    longitude: -80.1373,
+    geocodePrecision: 'county'
   },
 
   'allied-roofing-inc': {
@@ -787,7 +908,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['tampa']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.9506,
+    longitude: -82.4572,
+    geocodePrecision: 'city'
   },
 
   'all-phase-construction-usa-llc': {
@@ -813,7 +937,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['deerfield-beach']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'all-pro-contracting-services-llc': {
@@ -839,7 +966,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['casselberry']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.7178,
+    longitude: -81.3081,
+    geocodePrecision: 'city'
   },
 
   'all-pro-roofing-consulting-llc': {
@@ -865,7 +995,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['jacksonville']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.3322,
+    longitude: -81.6557,
+    geocodePrecision: 'city'
   },
 
   'maddox-roofing-inc': {
@@ -891,7 +1024,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['riviera-beach']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'alpha-roofing-sheet-metal-llc': {
@@ -917,7 +1053,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['orlando']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'altec-roofing': {
@@ -943,7 +1082,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['west-palm-beach']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'alvarez-roofing': {
@@ -995,7 +1137,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['riviera-beach']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'amherst-roofing-inc': {
@@ -1021,7 +1166,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['naples']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.142,
+    longitude: -81.7948,
+    geocodePrecision: 'city'
   },
 
   'amick-roofing-inc': {
@@ -1047,7 +1195,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['bradenton']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.3364,
+    longitude: -82.5307,
+    geocodePrecision: 'county'
   },
 
   'anthony-c-leonard-enterprises-inc': {
@@ -1073,7 +1224,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['englewood']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.3364,
+    longitude: -82.5307,
+    geocodePrecision: 'county'
   },
 
   'blackburn-roofing-sheet-metal-inc': {
@@ -1098,7 +1252,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['naples']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.142,
+    longitude: -81.7948,
+    geocodePrecision: 'city'
   },
 
   'byrne-roofing-inc': {
@@ -1123,7 +1280,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['palm-city']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'gainesville-roofing-co-inc': {
@@ -1148,7 +1308,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['bronson']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 29.6516,
+    longitude: -82.3248,
+    geocodePrecision: 'county'
   },
 
   'center-point-roofing-sheet-metal-inc': {
@@ -1173,7 +1336,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['brandon']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.9378,
+    longitude: -82.2859,
+    geocodePrecision: 'city'
   },
 
   'florida-roof-systems-inc': {
@@ -1223,7 +1389,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['goodland']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.142,
+    longitude: -81.7948,
+    geocodePrecision: 'county'
   },
 
   'eagle-i-construction-corp': {
@@ -1322,7 +1491,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['new-pt-richey']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.3078,
+    longitude: -82.4654,
+    geocodePrecision: 'county'
   },
 
   'guy-s-diversified-inc': {
@@ -1347,7 +1519,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['auburndale']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.0406,
+    longitude: -81.9498,
+    geocodePrecision: 'city'
   },
 
   'tack-warren-inc': {
@@ -1372,7 +1547,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['clearwater']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.8961,
+    longitude: -82.7412,
+    geocodePrecision: 'city'
   },
 
   'dimensional-roof-systems': {
@@ -1397,7 +1575,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['orlando']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'alan-lindsey-roofing-inc': {
@@ -1447,7 +1628,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['newberry']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 29.6516,
+    longitude: -82.3248,
+    geocodePrecision: 'county'
   },
 
   'palm-beach-roofing-maintenance-llc': {
@@ -1472,7 +1656,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['west-palm-beach']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'pdf-roofing-llc': {
@@ -1497,7 +1684,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['sarasota']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.3364,
+    longitude: -82.5307,
+    geocodePrecision: 'city'
   },
 
   'john-gilmore-roofing-inc': {
@@ -1522,7 +1712,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['jacksonville']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.3322,
+    longitude: -81.6557,
+    geocodePrecision: 'city'
   },
 
   'advantage-building-roofing-corp': {
@@ -1547,7 +1740,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['boca-raton']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'sal-vitale-the-roof-doctor-inc': {
@@ -1597,7 +1793,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['vero-beach']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.6936,
+    longitude: -80.4756,
+    geocodePrecision: 'county'
   },
 
   'rs-martin-roofing-inc': {
@@ -1622,7 +1821,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['largo']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.8961,
+    longitude: -82.7412,
+    geocodePrecision: 'city'
   },
 
   'cjm-roofing-inc': {
@@ -1647,7 +1849,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['w-palm-beach']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'st-johns-heating-air-conditioning': {
@@ -1672,7 +1877,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['st-augustine']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 29.9012,
+    longitude: -81.3124,
+    geocodePrecision: 'city'
   },
 
   'assure-u-at-home-services-inc': {
@@ -1697,7 +1905,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['orlando']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'tampa-roofing-co-inc': {
@@ -1722,7 +1933,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['tampa']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.9506,
+    longitude: -82.4572,
+    geocodePrecision: 'city'
   },
 
   'jim-wheeler-repairs-llc': {
@@ -1747,7 +1961,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['destin']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.4383,
+    longitude: -87.2166,
+    geocodePrecision: 'county'
   },
 
   'tom-sawyer-roofing': {
@@ -1797,7 +2014,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['w-palm-beach']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'watertite-roofing-co-llc': {
@@ -1822,7 +2042,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['nokomis']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.3364,
+    longitude: -82.5307,
+    geocodePrecision: 'county'
   },
 
   'w-davis-llc': {
@@ -1872,7 +2095,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['clearwater']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.8961,
+    longitude: -82.7412,
+    geocodePrecision: 'city'
   },
 
   'apachee-roofing-inc': {
@@ -1898,7 +2124,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['tallahassee']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.455,
+    longitude: -84.2807,
+    geocodePrecision: 'city'
   },
 
   'armor-roofing-home-improvement': {
@@ -1924,7 +2153,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['tavares']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.7505,
+    longitude: -81.6859,
+    geocodePrecision: 'city'
   },
 
   'arry-s-roofing-services-inc': {
@@ -1950,7 +2182,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['tarpon-springs']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.8961,
+    longitude: -82.7412,
+    geocodePrecision: 'city'
   },
 
   'advanced-roofing-sheet-metal': {
@@ -1976,7 +2211,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['ft-myers']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.9298,
+    longitude: -81.9498,
+    geocodePrecision: 'county'
   },
 
   'american-roofing-sheet-metal-inc': {
@@ -2002,7 +2240,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['tampa']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.9506,
+    longitude: -82.4572,
+    geocodePrecision: 'city'
   },
 
   'art-construction-of-nw-fl-llc': {
@@ -2028,7 +2269,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['panama-city-beach', 'panama-city']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.1844,
+    longitude: -85.6608,
+    geocodePrecision: 'county'
   },
 
   'architectural-sheet-metal-inc': {
@@ -2054,7 +2298,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['orlando']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'atlantic-roofing-exteriors-llc': {
@@ -2080,7 +2327,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['gainesville']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 29.6516,
+    longitude: -82.3248,
+    geocodePrecision: 'city'
   },
 
   'atlas-apex-roofing-llc': {
@@ -2106,7 +2356,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['ft-lauderdale']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.1224,
+    longitude: -80.1373,
+    geocodePrecision: 'county'
   },
 
   'b-d-roofing-of-central-fl-inc': {
@@ -2131,7 +2384,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['deland']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'county'
   },
 
   'john-son-roofing-inc': {
@@ -2156,7 +2412,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['vero-beach']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.6936,
+    longitude: -80.4756,
+    geocodePrecision: 'county'
   },
 
   'murphy-builders-iinc': {
@@ -2181,7 +2440,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['lake-worth']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'port-orange-a-c-heating-inc': {
@@ -2231,7 +2493,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['jacksonville']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.3322,
+    longitude: -81.6557,
+    geocodePrecision: 'city'
   },
 
   'avery-roof-services-llc': {
@@ -2257,7 +2522,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['sarasota']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.3364,
+    longitude: -82.5307,
+    geocodePrecision: 'city'
   },
 
   'barrier-roofing-construction-inc': {
@@ -2283,7 +2551,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['miami-lakes', 'miami']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.1224,
+    longitude: -80.1373,
+    geocodePrecision: 'county'
   },
 
   'barrios-roofing-waterproofing-llc': {
@@ -2334,7 +2605,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['jacksonville']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.3322,
+    longitude: -81.6557,
+    geocodePrecision: 'city'
   },
 
   'beachfront-roofing-inc': {
@@ -2360,7 +2634,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['west-palm-beach']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'beaver-home-services-inc': {
@@ -2386,7 +2663,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['orange-park']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.3322,
+    longitude: -81.6557,
+    geocodePrecision: 'city'
   },
 
   'beery-roofing-redesign-llc': {
@@ -2412,7 +2692,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['deland']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'county'
   },
 
   'jk-behan-general-roofing-contractor': {
@@ -2464,7 +2747,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['orlando']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'andrew-palmer-roofing-inc': {
@@ -2489,7 +2775,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['miami']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 25.7617,
+    longitude: -80.1918,
+    geocodePrecision: 'city'
   },
 
   'burger-roofing-co': {
@@ -2514,7 +2803,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['jacksonville']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.3322,
+    longitude: -81.6557,
+    geocodePrecision: 'city'
   },
 
   'john-carruth-retired': {
@@ -2539,7 +2831,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['tamarac']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.1224,
+    longitude: -80.1373,
+    geocodePrecision: 'city'
   },
 
   'ralph-decicco': {
@@ -2564,7 +2859,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['jacksonville']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.3322,
+    longitude: -81.6557,
+    geocodePrecision: 'city'
   },
 
   'edgar-quintin-inc': {
@@ -2589,7 +2887,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['orlando']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'vila-builders-inc': {
@@ -2614,7 +2915,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['miami']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 25.7617,
+    longitude: -80.1918,
+    geocodePrecision: 'city'
   },
 
   'leeward-roofing-llc': {
@@ -2664,7 +2968,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['palm-beach-gardens']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'roof-solutions-inc': {
@@ -2689,7 +2996,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['plantation']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.1224,
+    longitude: -80.1373,
+    geocodePrecision: 'city'
   },
 
   'florida-roofing-of-palm-beach-county': {
@@ -2714,7 +3024,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['boynton-beach']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'batchelor-s-inc-roofing-contractors': {
@@ -2739,7 +3052,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['pensacola']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.4383,
+    longitude: -87.2166,
+    geocodePrecision: 'city'
   },
 
   'petito-roofing-inc': {
@@ -2764,7 +3080,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['coral-springs']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.1224,
+    longitude: -80.1373,
+    geocodePrecision: 'city'
   },
 
   'r-r-roofing-of-brevard-inc': {
@@ -2814,7 +3133,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['pt-salerno']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'universal-roofing-inc': {
@@ -2839,7 +3161,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['hollywood']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.1224,
+    longitude: -80.1373,
+    geocodePrecision: 'city'
   },
 
   'michael-kevin-walsh-roofing-inc': {
@@ -2864,7 +3189,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['palm-city']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'whitton-roofing-co': {
@@ -2889,7 +3217,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['melrose']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 29.6516,
+    longitude: -82.3248,
+    geocodePrecision: 'county'
   },
 
   'bentley-roofing-llc': {
@@ -2915,7 +3246,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['pompano-beach']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.1224,
+    longitude: -80.1373,
+    geocodePrecision: 'city'
   },
 
   'best-roofing': {
@@ -2941,7 +3275,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['ft-lauderdale']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.1224,
+    longitude: -80.1373,
+    geocodePrecision: 'county'
   },
 
   'bfarr-contracting': {
@@ -2967,7 +3304,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['winter-park']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'big-fish-roofing-waterproofing-llc': {
@@ -2993,7 +3333,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['jacksonville']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.3322,
+    longitude: -81.6557,
+    geocodePrecision: 'city'
   },
 
   'bigfoot-roofing-construction-inc': {
@@ -3019,7 +3362,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['jacksonville']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.3322,
+    longitude: -81.6557,
+    geocodePrecision: 'city'
   },
 
   'benton-integrity-roofing-systems': {
@@ -3045,7 +3391,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['jacksonville']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.3322,
+    longitude: -81.6557,
+    geocodePrecision: 'city'
   },
 
   'bkm-roofing-inc': {
@@ -3071,7 +3420,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['yulee']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.6105,
+    longitude: -81.8001,
+    geocodePrecision: 'city'
   },
 
   'hall-roofing-company-llc': {
@@ -3097,7 +3449,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['pt-st-joe']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.1844,
+    longitude: -85.6608,
+    geocodePrecision: 'county'
   },
 
   'blues-brothers-construction-corp': {
@@ -3123,7 +3478,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['boca-raton']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'blue-star-roofing-inc': {
@@ -3149,7 +3507,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['orlando']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'bob-jerry-s-roofing-inc': {
@@ -3175,7 +3536,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['auburndale']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.0406,
+    longitude: -81.9498,
+    geocodePrecision: 'city'
   },
 
   'bodan-roofing-inc': {
@@ -3201,7 +3565,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['wesley-chapel']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.3078,
+    longitude: -82.4654,
+    geocodePrecision: 'city'
   },
 
   'bohemia-roofing-co-inc': {
@@ -3227,7 +3594,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['jacksonville']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.3322,
+    longitude: -81.6557,
+    geocodePrecision: 'city'
   },
 
   'bowen-son-roofing-inc': {
@@ -3253,7 +3623,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['sebring']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.0406,
+    longitude: -81.9498,
+    geocodePrecision: 'county'
   },
 
   'brad-mcdonald-roofing-construction-inc': {
@@ -3279,7 +3652,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['new-port-richey']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.3078,
+    longitude: -82.4654,
+    geocodePrecision: 'city'
   },
 
   'brickell-vizcaya-development-inc': {
@@ -3305,7 +3681,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['miami']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 25.7617,
+    longitude: -80.1918,
+    geocodePrecision: 'city'
   },
 
   'john-keller-roofing': {
@@ -3331,7 +3710,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['longwood']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.7178,
+    longitude: -81.3081,
+    geocodePrecision: 'city'
   },
 
   'brilliant-roofing': {
@@ -3357,7 +3739,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['stuart']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'brite-top-roofing': {
@@ -3383,7 +3768,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['orlando']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'busy-bee-roofing': {
@@ -3409,7 +3797,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['tampa']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.9506,
+    longitude: -82.4572,
+    geocodePrecision: 'city'
   },
 
   'clark-associates-contracting-inc': {
@@ -3435,7 +3826,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['orlando']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'cache-co-llc': {
@@ -3461,7 +3855,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['jacksonville']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.3322,
+    longitude: -81.6557,
+    geocodePrecision: 'city'
   },
 
   'caldwell-roofing': {
@@ -3487,7 +3884,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['boca-raton']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'campany-roof-maintenance-llc': {
@@ -3513,7 +3913,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['w-palm-beach']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'capps-roofing-inc': {
@@ -3539,7 +3942,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['hobe-sound']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'cardinal-roofing-siding-co-inc': {
@@ -3565,7 +3971,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['pt-st-lucie']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'cardinal-roofing': {
@@ -3591,7 +4000,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['brandon']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.9378,
+    longitude: -82.2859,
+    geocodePrecision: 'city'
   },
 
   'carpenter-s-roofing-sheet-metal-inc': {
@@ -3617,7 +4029,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['riviera-beach']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'castle-roofing-group-llc': {
@@ -3643,7 +4058,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['apopka']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'the-roofing-experts': {
@@ -3669,7 +4087,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['orlando']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'cedar-valley-exteriors-inc': {
@@ -3695,7 +4116,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['sanford']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.7178,
+    longitude: -81.3081,
+    geocodePrecision: 'city'
   },
 
   'centimark-corp': {
@@ -3721,7 +4145,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['cape-coral']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.6636,
+    longitude: -81.9532,
+    geocodePrecision: 'city'
   },
 
   'cochran-brothers-roofing-ii-inc': {
@@ -3747,7 +4174,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['sebring']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.0406,
+    longitude: -81.9498,
+    geocodePrecision: 'county'
   },
 
   'copping-roofing-inc': {
@@ -3773,7 +4203,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['n-ft-myers']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.9298,
+    longitude: -81.9498,
+    geocodePrecision: 'county'
   },
 
   'certified-best-roofing-inc': {
@@ -3799,7 +4232,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['oviedo']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.7178,
+    longitude: -81.3081,
+    geocodePrecision: 'city'
   },
 
   'certified-roofing-specialists-inc': {
@@ -3825,7 +4261,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['pompano-beach']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.1224,
+    longitude: -80.1373,
+    geocodePrecision: 'city'
   },
 
   'certified-roofers-general-contractors-inc': {
@@ -3877,7 +4316,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['oviedo']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.7178,
+    longitude: -81.3081,
+    geocodePrecision: 'city'
   },
 
   'robert-batson-roofing-inc': {
@@ -3902,7 +4344,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['orlando']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'boulais-roofing-co': {
@@ -3952,7 +4397,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['deland']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'county'
   },
 
   'cfl-roofing-inc': {
@@ -3977,7 +4425,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['orlando']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'g-g-roofing': {
@@ -4027,7 +4478,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['ft-myers']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.9298,
+    longitude: -81.9498,
+    geocodePrecision: 'county'
   },
 
   'chase-roofing-contracting-inc': {
@@ -4053,7 +4507,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['pompano-beach']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.1224,
+    longitude: -80.1373,
+    geocodePrecision: 'city'
   },
 
   'cherry-roofing-enterprises-inc': {
@@ -4079,7 +4536,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['west-park']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.1224,
+    longitude: -80.1373,
+    geocodePrecision: 'county'
   },
 
   'citrus-roofing-contractors-llc': {
@@ -4105,7 +4565,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['winter-park']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'coastal-acquisitions-of-florida-llc': {
@@ -4131,7 +4594,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['panama-city-beach', 'panama-city']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.1844,
+    longitude: -85.6608,
+    geocodePrecision: 'county'
   },
 
   'coastal-roofing-systems-of-amelia': {
@@ -4157,7 +4623,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['amelia-island']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.1094,
+    longitude: -81.8196,
+    geocodePrecision: 'county'
   },
 
   'sheet-metal-masters-inc': {
@@ -4183,7 +4652,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['pensacola']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.4383,
+    longitude: -87.2166,
+    geocodePrecision: 'city'
   },
 
   'collis-roofing': {
@@ -4209,7 +4681,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['longwood']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.7178,
+    longitude: -81.3081,
+    geocodePrecision: 'city'
   },
 
   'colonial-roofing-inc': {
@@ -4235,7 +4710,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['lehigh-acres']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.6636,
+    longitude: -81.9532,
+    geocodePrecision: 'city'
   },
 
   'armstrong-roofing-inc': {
@@ -4310,7 +4788,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['port-charlotte']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.9298,
+    longitude: -81.9498,
+    geocodePrecision: 'county'
   },
 
   'champion-roofing-services-inc': {
@@ -4335,7 +4816,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['jacksonville']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.3322,
+    longitude: -81.6557,
+    geocodePrecision: 'city'
   },
 
   'cw-s-quality-roofing-inc': {
@@ -4360,7 +4844,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['pt-charlotte']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.9298,
+    longitude: -81.9498,
+    geocodePrecision: 'county'
   },
 
   'bama-roofing-construction-co': {
@@ -4385,7 +4872,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['ft-lauderdale']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.1224,
+    longitude: -80.1373,
+    geocodePrecision: 'county'
   },
 
   'harrell-roofing-llc': {
@@ -4410,7 +4900,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['tallahassee']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.455,
+    longitude: -84.2807,
+    geocodePrecision: 'city'
   },
 
   'moody-s-roofing-inc': {
@@ -4435,7 +4928,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['jacksonville']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.3322,
+    longitude: -81.6557,
+    geocodePrecision: 'city'
   },
 
   'ryan-holmes-contracting-inc': {
@@ -4460,7 +4956,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['stuart']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'sun-coast-roofing-inc': {
@@ -4485,7 +4984,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['naples']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.142,
+    longitude: -81.7948,
+    geocodePrecision: 'city'
   },
 
   'tarpon-dock-metal-craft-inc': {
@@ -4510,7 +5012,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['panama-city-beach', 'panama-city']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.1844,
+    longitude: -85.6608,
+    geocodePrecision: 'county'
   },
 
   'thomas-roofing-solutions-llc': {
@@ -4535,7 +5040,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['pensacola']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.4383,
+    longitude: -87.2166,
+    geocodePrecision: 'city'
   },
 
   'copeland-s-complete-construction-llc': {
@@ -4561,7 +5069,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['auburndale']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.0406,
+    longitude: -81.9498,
+    geocodePrecision: 'city'
   },
 
   'core-roofing-systems-inc': {
@@ -4587,7 +5098,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['orlando']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'cory-associates-inc': {
@@ -4613,7 +5127,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['hallandale']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.1224,
+    longitude: -80.1373,
+    geocodePrecision: 'county'
   },
 
   'woody-cushing-roofing-inc': {
@@ -4639,7 +5156,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['pensacola']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.4383,
+    longitude: -87.2166,
+    geocodePrecision: 'city'
   },
 
   'michael-e-warren-inc': {
@@ -4664,7 +5184,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['niceville']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.4383,
+    longitude: -87.2166,
+    geocodePrecision: 'county'
   },
 
   'crawford-roofing-construction': {
@@ -4716,7 +5239,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['deerfield-beach']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'crosier-son-roofing-inc': {
@@ -4742,7 +5268,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['gainesville']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 29.6516,
+    longitude: -82.3248,
+    geocodePrecision: 'city'
   },
 
   'crown-residential-services-llc': {
@@ -4768,7 +5297,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['sarasota']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.3364,
+    longitude: -82.5307,
+    geocodePrecision: 'city'
   },
 
   'crown-roofing-waterproofing-llc': {
@@ -4794,7 +5326,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['sarasota']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.3364,
+    longitude: -82.5307,
+    geocodePrecision: 'city'
   },
 
   'crowther-roofing-sheet-metal-of-fl-inc': {
@@ -4820,7 +5355,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['ft-myers']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.9298,
+    longitude: -81.9498,
+    geocodePrecision: 'county'
   },
 
   'c-s-roofing-co': {
@@ -4872,7 +5410,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['jacksonville']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.3322,
+    longitude: -81.6557,
+    geocodePrecision: 'city'
   },
 
   'dal-mar-roofing-industries-inc': {
@@ -4924,7 +5465,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['miami']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 25.7617,
+    longitude: -80.1918,
+    geocodePrecision: 'city'
   },
 
   'davis-roofing-sheet-metal-llc': {
@@ -4950,7 +5494,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['milton']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.4383,
+    longitude: -87.2166,
+    geocodePrecision: 'county'
   },
 
   'daylight-concepts-llc': {
@@ -4976,7 +5523,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['tampa']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.9506,
+    longitude: -82.4572,
+    geocodePrecision: 'city'
   },
 
   'dynasty-building-solutions-llc': {
@@ -5002,7 +5552,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['tampa']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.9506,
+    longitude: -82.4572,
+    geocodePrecision: 'city'
   },
 
   'dcg-roofing': {
@@ -5028,7 +5581,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['miami-lakes', 'miami']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.1224,
+    longitude: -80.1373,
+    geocodePrecision: 'county'
   },
 
   'destin-roofing-inc': {
@@ -5054,7 +5610,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['destin']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.4383,
+    longitude: -87.2166,
+    geocodePrecision: 'county'
   },
 
   'dibble-roofing-co-inc': {
@@ -5080,7 +5639,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['jacksonville']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.3322,
+    longitude: -81.6557,
+    geocodePrecision: 'city'
   },
 
   'dickson-roofing-llc': {
@@ -5106,7 +5668,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['naples']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.142,
+    longitude: -81.7948,
+    geocodePrecision: 'city'
   },
 
   'distinctive-roofing-inc': {
@@ -5132,7 +5697,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['pompano-beach']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.1224,
+    longitude: -80.1373,
+    geocodePrecision: 'city'
   },
 
   'd-j-roofing-and-construction-inc': {
@@ -5158,7 +5726,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['sarasota']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.3364,
+    longitude: -82.5307,
+    geocodePrecision: 'city'
   },
 
   'dockside-roofing-inc': {
@@ -5184,7 +5755,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['tampa']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.9506,
+    longitude: -82.4572,
+    geocodePrecision: 'city'
   },
 
   'don-schmidt-contracting-roofing-inc': {
@@ -5210,7 +5784,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['st-cloud']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.3056,
+    longitude: -81.4165,
+    geocodePrecision: 'city'
   },
 
   'double-c-roofing-inc': {
@@ -5236,7 +5813,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['deland']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'county'
   },
 
   'd-peck-roofing-inc': {
@@ -5262,7 +5842,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['fort-myers']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.6636,
+    longitude: -81.9532,
+    geocodePrecision: 'city'
   },
 
   'drew-roofing-llc': {
@@ -5288,7 +5871,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['st-petersburg', 'saint-petersburg']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.8961,
+    longitude: -82.7412,
+    geocodePrecision: 'county'
   },
 
   'd-roofing-group-inc': {
@@ -5314,7 +5900,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['naples']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.142,
+    longitude: -81.7948,
+    geocodePrecision: 'city'
   },
 
   'drs-of-central-florida-inc': {
@@ -5340,7 +5929,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['orlando']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'durabilis-roofing-llc': {
@@ -5366,7 +5958,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['lehigh-acres']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.6636,
+    longitude: -81.9532,
+    geocodePrecision: 'city'
   },
 
   'dynamic-national': {
@@ -5392,7 +5987,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['st-petersburg']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.8961,
+    longitude: -82.7412,
+    geocodePrecision: 'city'
   },
 
   'dynamic-roofing-concepts-inc': {
@@ -5418,7 +6016,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['brandon']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.9378,
+    longitude: -82.2859,
+    geocodePrecision: 'city'
   },
 
   'elias-brothers-general-contractor-inc': {
@@ -5444,7 +6045,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['naples']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.142,
+    longitude: -81.7948,
+    geocodePrecision: 'city'
   },
 
   'eco-construction-group': {
@@ -5470,7 +6074,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['mt-dora']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'county'
   },
 
   'emerald-coast-roofscapes-inc': {
@@ -5496,7 +6103,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['destin']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.4383,
+    longitude: -87.2166,
+    geocodePrecision: 'county'
   },
 
   'edge-2-edge-roofing': {
@@ -5522,7 +6132,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['altamonte-springs']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.7178,
+    longitude: -81.3081,
+    geocodePrecision: 'city'
   },
 
   'edwards-roofing-co-inc': {
@@ -5548,7 +6161,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['pensacola']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.4383,
+    longitude: -87.2166,
+    geocodePrecision: 'city'
   },
 
   'eguard-roof-safety-systems-llc': {
@@ -5574,7 +6190,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['orlando']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'elite-roofing-services': {
@@ -5600,7 +6219,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['tampa']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.9506,
+    longitude: -82.4572,
+    geocodePrecision: 'city'
   },
 
   'elite-roofing-inc': {
@@ -5626,7 +6248,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['west-palm-beach']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'elo-roofing': {
@@ -5652,7 +6277,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['jacksonville']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.3322,
+    longitude: -81.6557,
+    geocodePrecision: 'city'
   },
 
   'emc-roofing-llc': {
@@ -5704,7 +6332,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['sunrise']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.1224,
+    longitude: -80.1373,
+    geocodePrecision: 'city'
   },
 
   'empire-roofing-sales-services-inc': {
@@ -5730,7 +6361,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['jacksonville']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.3322,
+    longitude: -81.6557,
+    geocodePrecision: 'city'
   },
 
   'energy-roofing-technology-se-llc': {
@@ -5756,7 +6390,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['lake-city']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 29.9012,
+    longitude: -81.3124,
+    geocodePrecision: 'county'
   },
 
   'evans-roofing': {
@@ -5782,7 +6419,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['oakland', 'oakland-park']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.1224,
+    longitude: -80.1373,
+    geocodePrecision: 'county'
   },
 
   'e-z-general-roofing-contractors-inc': {
@@ -5808,7 +6448,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['naples']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.142,
+    longitude: -81.7948,
+    geocodePrecision: 'city'
   },
 
   'ferber-sheet-metal-works-inc': {
@@ -5834,7 +6477,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['jacksonville']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.3322,
+    longitude: -81.6557,
+    geocodePrecision: 'city'
   },
 
   'fl-brees': {
@@ -5860,7 +6506,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['destin']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.4383,
+    longitude: -87.2166,
+    geocodePrecision: 'county'
   },
 
   'new-roofing-contractors': {
@@ -5886,7 +6535,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['orlando']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'creative-home-pros-llc': {
@@ -5912,7 +6564,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['jacksonville']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.3322,
+    longitude: -81.6557,
+    geocodePrecision: 'city'
   },
 
   'florida-legacy-roofing-llc': {
@@ -5938,7 +6593,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['new-port-richey']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.3078,
+    longitude: -82.4654,
+    geocodePrecision: 'city'
   },
 
   'florida-roof-bros-llc': {
@@ -5990,7 +6648,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['molino']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.4383,
+    longitude: -87.2166,
+    geocodePrecision: 'county'
   },
 
   'florida-shelter-roofing-llc': {
@@ -6016,7 +6677,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['tampa']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.9506,
+    longitude: -82.4572,
+    geocodePrecision: 'city'
   },
 
   'smart-energy-inc': {
@@ -6042,7 +6706,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['pompano-beach']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.1224,
+    longitude: -80.1373,
+    geocodePrecision: 'city'
   },
 
   'florida-southern-roofing-sheet-metal-inc': {
@@ -6068,7 +6735,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['sarasota']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.3364,
+    longitude: -82.5307,
+    geocodePrecision: 'city'
   },
 
   'florida-roof-restorations': {
@@ -6094,7 +6764,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['ocala']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'county'
   },
 
   'fl-specialty-roofing': {
@@ -6171,7 +6844,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['brooksville']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5556,
+    longitude: -82.4544,
+    geocodePrecision: 'city'
   },
 
   'frank-s-roofing-spraying-inc': {
@@ -6197,7 +6873,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['ft-myers']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.9298,
+    longitude: -81.9498,
+    geocodePrecision: 'county'
   },
 
   'freeman-roofing': {
@@ -6223,7 +6902,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['pace']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.4383,
+    longitude: -87.2166,
+    geocodePrecision: 'county'
   },
 
   'fowler-s-sheet-metal-inc': {
@@ -6249,7 +6931,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['w-palm-beach']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'galaxy-builders-inc': {
@@ -6275,7 +6960,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['jacksonville']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.3322,
+    longitude: -81.6557,
+    geocodePrecision: 'city'
   },
 
   'galloway-roofing-llc': {
@@ -6301,7 +6989,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['englewood']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.3364,
+    longitude: -82.5307,
+    geocodePrecision: 'county'
   },
 
   'garabar-inc': {
@@ -6327,7 +7018,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['lake-worth']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'gary-s-roofing-llc': {
@@ -6353,7 +7047,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['sarasota']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.3364,
+    longitude: -82.5307,
+    geocodePrecision: 'city'
   },
 
   'gulf-coast-roofing-co-inc': {
@@ -6379,7 +7076,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['naples']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.142,
+    longitude: -81.7948,
+    geocodePrecision: 'city'
   },
 
   'giampri-corp': {
@@ -6405,7 +7105,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['weston']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.1224,
+    longitude: -80.1373,
+    geocodePrecision: 'city'
   },
 
   'gibson-sons-roofing-inc': {
@@ -6431,7 +7134,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['largo']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.8961,
+    longitude: -82.7412,
+    geocodePrecision: 'city'
   },
 
   'gustafson-industries': {
@@ -6457,7 +7163,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['boynton-beach']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'giza-roofing-solutions-inc': {
@@ -6483,7 +7192,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['cape-coral']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.6636,
+    longitude: -81.9532,
+    geocodePrecision: 'city'
   },
 
   'aastro-roofing-company-inc': {
@@ -6509,7 +7221,11 @@ export const rooferData: Record<string, RooferData | any> = {
     },
     isPreferred: false,
     isHidden: false,
-    category: "preferred"},
+    category: "preferred",
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
+  },
 
   'nine-square-roofing-construction-llc': {
     id: '254',
@@ -6533,7 +7249,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['orlando']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'the-roofing-company': {
@@ -6558,7 +7277,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['new-pt-richey']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.3078,
+    longitude: -82.4654,
+    geocodePrecision: 'county'
   },
 
   'americas-preferred-roofers-inc': {
@@ -6583,7 +7305,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['miami']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 25.7617,
+    longitude: -80.1918,
+    geocodePrecision: 'city'
   },
 
   'ameri-con-enterprises-inc': {
@@ -6608,7 +7333,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['lake-placid']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.0406,
+    longitude: -81.9498,
+    geocodePrecision: 'county'
   },
 
   'a-star-contractors-inc': {
@@ -6633,7 +7361,11 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['hollywood']
   },
     isPreferred: false,
-    isHidden: false, category: "sponsored" },
+    isHidden: false, category: "sponsored",
+    latitude: 26.1224,
+    longitude: -80.1373,
+    geocodePrecision: 'city'
+  },
 
   'a-to-z-contractors-inc': {
     id: '259',
@@ -6657,7 +7389,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['pt-charlotte']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.9298,
+    longitude: -81.9498,
+    geocodePrecision: 'county'
   },
 
   'aztec-roofs-inc': {
@@ -6682,7 +7417,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['bokeelia']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.9298,
+    longitude: -81.9498,
+    geocodePrecision: 'county'
   },
 
   'backbone-roofing-inc': {
@@ -6707,7 +7445,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['plant-city']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.0181,
+    longitude: -82.1129,
+    geocodePrecision: 'city'
   },
 
   'bill-ramsey-your-roofing-contractor-llc': {
@@ -6732,7 +7473,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['st-petersburg']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.8961,
+    longitude: -82.7412,
+    geocodePrecision: 'city'
   },
 
   'bp-roofing-inc': {
@@ -6757,7 +7501,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['ft-myers']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.9298,
+    longitude: -81.9498,
+    geocodePrecision: 'county'
   },
 
   'property-renovations-construction-llc': {
@@ -6807,7 +7554,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['riviera-beach']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'andrews-roofing-llc': {
@@ -6832,7 +7582,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['ft-myers']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.9298,
+    longitude: -81.9498,
+    geocodePrecision: 'county'
   },
 
   'certified-construction': {
@@ -6882,7 +7635,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['ft-pierce']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'gary-southard-construction-llc': {
@@ -6907,7 +7663,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['bronson']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 29.6516,
+    longitude: -82.3248,
+    geocodePrecision: 'county'
   },
 
   'ctr-roofing-llc': {
@@ -6932,7 +7691,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['st-cloud']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.3056,
+    longitude: -81.4165,
+    geocodePrecision: 'city'
   },
 
   'graston-roofing-co-inc': {
@@ -6957,7 +7719,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['st-johns']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.3322,
+    longitude: -81.6557,
+    geocodePrecision: 'county'
   },
 
   'power-roofing-construction-llc': {
@@ -6982,7 +7747,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['celebration']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.3056,
+    longitude: -81.4165,
+    geocodePrecision: 'city'
   },
 
   'david-bange-roofing-llc': {
@@ -7007,7 +7775,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['davie']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.1224,
+    longitude: -80.1373,
+    geocodePrecision: 'city'
   },
 
   'ddr-quality-roofing-sheet-metal': {
@@ -7057,7 +7828,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['cape-coral']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.6636,
+    longitude: -81.9532,
+    geocodePrecision: 'city'
   },
 
   'd-squared-services-llc': {
@@ -7082,7 +7856,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['arcadia']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.3364,
+    longitude: -82.5307,
+    geocodePrecision: 'county'
   },
 
   'east-coast-roofing-solutions-inc': {
@@ -7132,7 +7909,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['bradenton']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.3364,
+    longitude: -82.5307,
+    geocodePrecision: 'county'
   },
 
   'five-star-roofing-of-north-east-fl-inc': {
@@ -7182,7 +7962,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['tampa']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.9506,
+    longitude: -82.4572,
+    geocodePrecision: 'city'
   },
 
   'florida-roofing-sheet-metal-llc': {
@@ -7207,7 +7990,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['palm-springs']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'florida-roof-design-inc': {
@@ -7257,7 +8043,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['deland']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'county'
   },
 
   'otis-joiner-roofing-contractor-inc': {
@@ -7282,7 +8071,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['palmetto']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.3364,
+    longitude: -82.5307,
+    geocodePrecision: 'county'
   },
 
   'all-south-roofing-company-inc': {
@@ -7307,7 +8099,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['jacksonville']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.3322,
+    longitude: -81.6557,
+    geocodePrecision: 'city'
   },
 
   'jb-roofing-waterproofing-llc': {
@@ -7332,7 +8127,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['stuart']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'jireh-roofing-contractor-usa-inc': {
@@ -7357,7 +8155,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['miami']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 25.7617,
+    longitude: -80.1918,
+    geocodePrecision: 'city'
   },
 
   'certified-industries-inc': {
@@ -7407,7 +8208,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['deerfield-beach']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.1224,
+    longitude: -80.1373,
+    geocodePrecision: 'county'
   },
 
   'larry-neese-llc': {
@@ -7432,7 +8236,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['ft-pierce']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'american-roofing-central-inc': {
@@ -7457,7 +8264,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['sebring']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.0406,
+    longitude: -81.9498,
+    geocodePrecision: 'county'
   },
 
   'luxury-roofing-service-llc': {
@@ -7482,7 +8292,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['sanford']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.7178,
+    longitude: -81.3081,
+    geocodePrecision: 'city'
   },
 
   'marzo-roofing-inc': {
@@ -7507,7 +8320,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['pt-st-lucie']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'southern-style-roofing-inc': {
@@ -7532,7 +8348,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['orlando']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'dan-mccullers-incorporated': {
@@ -7557,7 +8376,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['largo']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.8961,
+    longitude: -82.7412,
+    geocodePrecision: 'city'
   },
 
   'moore-roofing-builders-inc': {
@@ -7582,7 +8404,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['marco-island']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.142,
+    longitude: -81.7948,
+    geocodePrecision: 'city'
   },
 
   'tecta-america-southeast-llc': {
@@ -7607,7 +8432,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['sanford']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.7178,
+    longitude: -81.3081,
+    geocodePrecision: 'city'
   },
 
   'nemetz-roofing': {
@@ -7682,7 +8510,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['naples']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.142,
+    longitude: -81.7948,
+    geocodePrecision: 'city'
   },
 
   'orem-construction-services-llc': {
@@ -7731,7 +8562,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['davie']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.1224,
+    longitude: -80.1373,
+    geocodePrecision: 'city'
   },
 
   'wayne-s-roofing-sheet-metal': {
@@ -7781,7 +8615,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['vero-beach']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.6936,
+    longitude: -80.4756,
+    geocodePrecision: 'county'
   },
 
   'rh-quality-metal-of-florida-llc': {
@@ -7806,7 +8643,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['davenport']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.0406,
+    longitude: -81.9498,
+    geocodePrecision: 'county'
   },
 
   'robert-jones-roofing-general-contracting-llc': {
@@ -7831,7 +8671,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['titusville']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'county'
   },
 
   'huey-services-inc': {
@@ -7856,7 +8699,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['tampa']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.9506,
+    longitude: -82.4572,
+    geocodePrecision: 'city'
   },
 
   'roofing-construction-corp': {
@@ -7881,7 +8727,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['ft-lauderdale']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.1224,
+    longitude: -80.1373,
+    geocodePrecision: 'county'
   },
 
   'roof-pro': {
@@ -7906,7 +8755,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['riviera-beach']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'roofpro-roofing-llc': {
@@ -7931,7 +8783,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['destin']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.4383,
+    longitude: -87.2166,
+    geocodePrecision: 'county'
   },
 
   'sand-dollar-roofing-inc': {
@@ -7956,7 +8811,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['ft-myers']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.9298,
+    longitude: -81.9498,
+    geocodePrecision: 'county'
   },
 
   'story-bleich-roofing': {
@@ -7981,7 +8839,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['pensacola']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.4383,
+    longitude: -87.2166,
+    geocodePrecision: 'city'
   },
 
   'summerfield-roofing-sheet-metal': {
@@ -8031,7 +8892,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['lake-alfred']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.0406,
+    longitude: -81.9498,
+    geocodePrecision: 'county'
   },
 
   'tm-scott-inc': {
@@ -8056,7 +8920,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['lake-placid']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.0406,
+    longitude: -81.9498,
+    geocodePrecision: 'county'
   },
 
   'tmt-roofing-llc': {
@@ -8081,7 +8948,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['lake-city']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 29.9012,
+    longitude: -81.3124,
+    geocodePrecision: 'county'
   },
 
   'warner-roof-consulting-inc': {
@@ -8131,7 +9001,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['crest-view']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.4383,
+    longitude: -87.2166,
+    geocodePrecision: 'county'
   },
 
   'we-brodbeck-roofing-co-inc': {
@@ -8156,7 +9029,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['lake-worth']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'zenith-construction-services-llc': {
@@ -8181,7 +9057,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['frostproof']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.0406,
+    longitude: -81.9498,
+    geocodePrecision: 'county'
   },
 
   'gold-key-roofing-llc': {
@@ -8207,7 +9086,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['orlando']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'gomez-roofing-co': {
@@ -8233,7 +9115,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['pompano-beach']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.1224,
+    longitude: -80.1373,
+    geocodePrecision: 'city'
   },
 
   'tim-graboski-roofing-inc': {
@@ -8259,7 +9144,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['deerfield-beach']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'greentek-property-solutions-llc': {
@@ -8311,7 +9199,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['panama-city-beach', 'panama-city']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.1844,
+    longitude: -85.6608,
+    geocodePrecision: 'county'
   },
 
   'gwr-gulf-western': {
@@ -8337,7 +9228,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['bonita-springs']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.6636,
+    longitude: -81.9532,
+    geocodePrecision: 'city'
   },
 
   'gulledge-roofing-inc': {
@@ -8363,7 +9257,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['deland']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'county'
   },
 
   'gutterhawk-inc': {
@@ -8389,7 +9286,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['tallahassee']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.455,
+    longitude: -84.2807,
+    geocodePrecision: 'city'
   },
 
   'hamilton-roofing-inc': {
@@ -8441,7 +9341,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['clearwater']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.8961,
+    longitude: -82.7412,
+    geocodePrecision: 'city'
   },
 
   'hartford-south-llc': {
@@ -8467,7 +9370,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['orlando']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'harvath-roofing-inc': {
@@ -8493,7 +9399,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['bradenton']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.3364,
+    longitude: -82.5307,
+    geocodePrecision: 'county'
   },
 
   'hd-roofing-and-construction-llc': {
@@ -8519,7 +9428,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['longwood']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.7178,
+    longitude: -81.3081,
+    geocodePrecision: 'city'
   },
 
   'heart-of-florida-roofing': {
@@ -8545,7 +9457,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['orlando']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'hendrick-roofing-inc': {
@@ -8571,7 +9486,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['largo']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.8961,
+    longitude: -82.7412,
+    geocodePrecision: 'city'
   },
 
   'hercules-roofing-llc': {
@@ -8597,7 +9515,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['boynton-beach']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'hermitage-roofing-co': {
@@ -8623,7 +9544,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['magnolia-park']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'hi-rise-commercial-roofing-inc': {
@@ -8649,7 +9573,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['ft-lauderdale']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.1224,
+    longitude: -80.1373,
+    geocodePrecision: 'county'
   },
 
   'high-tide-roofing-waterproofing-inc': {
@@ -8675,7 +9602,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['st-augustine']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 29.9012,
+    longitude: -81.3124,
+    geocodePrecision: 'city'
   },
 
   'high-tower-roofing-contracting-llc': {
@@ -8701,7 +9631,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['lakeland']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.0406,
+    longitude: -81.9498,
+    geocodePrecision: 'city'
   },
 
   'bob-hilson-co-inc': {
@@ -8727,7 +9660,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['homestead']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 25.7617,
+    longitude: -80.1918,
+    geocodePrecision: 'city'
   },
 
   'hopkins-roofing-inc': {
@@ -8753,7 +9689,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['st-petersburg']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.8961,
+    longitude: -82.7412,
+    geocodePrecision: 'city'
   },
 
   'anchor-roofing-co': {
@@ -8778,7 +9717,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['hialeah']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 25.7617,
+    longitude: -80.1918,
+    geocodePrecision: 'city'
   },
 
   'richard-barfield-roofing-inc': {
@@ -8803,7 +9745,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['pt-st-joe']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.1844,
+    longitude: -85.6608,
+    geocodePrecision: 'county'
   },
 
   'b-t-metal-works-inc': {
@@ -8853,7 +9798,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['lakeland']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.0406,
+    longitude: -81.9498,
+    geocodePrecision: 'city'
   },
 
   'all-ways-roofing-llc': {
@@ -8878,7 +9826,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['clermont']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.7505,
+    longitude: -81.6859,
+    geocodePrecision: 'city'
   },
 
   'larry-miller-inc': {
@@ -8903,7 +9854,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['tampa']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.9506,
+    longitude: -82.4572,
+    geocodePrecision: 'city'
   },
 
   'stuart-lyons-roofing-inc': {
@@ -8978,7 +9932,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['panama-city-beach']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.1844,
+    longitude: -85.6608,
+    geocodePrecision: 'county'
   },
 
   'rock-home-improvements-llc': {
@@ -9028,7 +9985,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['lake-city']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 29.9012,
+    longitude: -81.3124,
+    geocodePrecision: 'county'
   },
 
   'sentry-metals-llc': {
@@ -9053,7 +10013,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['nokomis']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.3364,
+    longitude: -82.5307,
+    geocodePrecision: 'county'
   },
 
   'hough-roofing-screen-rooms': {
@@ -9131,7 +10094,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['lake-city']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 29.9012,
+    longitude: -81.3124,
+    geocodePrecision: 'county'
   },
 
   'hurricane-roofer-llc': {
@@ -9157,7 +10123,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['windermere']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'hw-contracting-llc': {
@@ -9183,7 +10152,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['st-johns']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.3322,
+    longitude: -81.6557,
+    geocodePrecision: 'county'
   },
 
   'imperial-roofing-of-polk-county-inc': {
@@ -9209,7 +10181,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['winter-haven']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.0406,
+    longitude: -81.9498,
+    geocodePrecision: 'city'
   },
 
   'ims-roofing-lc': {
@@ -9235,7 +10210,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['orlando']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'infinity-roofing-llc': {
@@ -9261,7 +10239,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['deltona']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'county'
   },
 
   'integrity-roofing-gutters-inc': {
@@ -9287,7 +10268,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['orlando']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'innovative-roofing-inc': {
@@ -9313,7 +10297,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['pompano-beach']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.1224,
+    longitude: -80.1373,
+    geocodePrecision: 'city'
   },
 
   'isaacs-roofing-insulation-corp': {
@@ -9339,7 +10326,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['palmetto-bay']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 25.7617,
+    longitude: -80.1918,
+    geocodePrecision: 'county'
   },
 
   'jada-roofing-llc': {
@@ -9365,7 +10355,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['middleburg']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 29.9012,
+    longitude: -81.3124,
+    geocodePrecision: 'county'
   },
 
   'james-roofing-services-inc': {
@@ -9391,7 +10384,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['st-petersburg']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.8961,
+    longitude: -82.7412,
+    geocodePrecision: 'city'
   },
 
   'janney-construction-services-llc': {
@@ -9417,7 +10413,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['orlando']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'jav-contractors-inc': {
@@ -9443,7 +10442,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['st-cloud']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.3056,
+    longitude: -81.4165,
+    geocodePrecision: 'city'
   },
 
   'jack-c-wilson-roofing-co': {
@@ -9469,7 +10471,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['jacksonville']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.3322,
+    longitude: -81.6557,
+    geocodePrecision: 'city'
   },
 
   'jebco-weatherproofing-management-llc': {
@@ -9495,7 +10500,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['jacksonville']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.3322,
+    longitude: -81.6557,
+    geocodePrecision: 'city'
   },
 
   'jeff-albert-roofing-inc': {
@@ -9521,7 +10529,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['delray-beach']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'jiffy-services-of-central-florida': {
@@ -9573,7 +10584,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['naples']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.142,
+    longitude: -81.7948,
+    geocodePrecision: 'city'
   },
 
   'johnson-s-air-conditioning-inc': {
@@ -9599,7 +10613,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['naples']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.142,
+    longitude: -81.7948,
+    geocodePrecision: 'city'
   },
 
   'earl-w-johnston-roofing-llc': {
@@ -9625,7 +10642,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['hollywood']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.1224,
+    longitude: -80.1373,
+    geocodePrecision: 'city'
   },
 
   'us-roofing-group-llc': {
@@ -9651,7 +10671,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['tampa']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.9506,
+    longitude: -82.4572,
+    geocodePrecision: 'city'
   },
 
   'jr-co': {
@@ -9677,7 +10700,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['bonita-springs']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.6636,
+    longitude: -81.9532,
+    geocodePrecision: 'city'
   },
 
   'jan-tukker-inc': {
@@ -9703,7 +10729,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['altamonte-springs']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.7178,
+    longitude: -81.3081,
+    geocodePrecision: 'city'
   },
 
   'jto-contracting-inc': {
@@ -9729,7 +10758,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['sanford']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.7178,
+    longitude: -81.3081,
+    geocodePrecision: 'city'
   },
 
   'jurin-roofing-services-inc': {
@@ -9755,7 +10787,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['dundee']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.0406,
+    longitude: -81.9498,
+    geocodePrecision: 'county'
   },
 
   'jv-contractors-llc': {
@@ -9781,7 +10816,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['deltona']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'county'
   },
 
   'kam-roofing-services-llc': {
@@ -9807,7 +10845,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['clearwater']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.8961,
+    longitude: -82.7412,
+    geocodePrecision: 'city'
   },
 
   'k-g-construction-co-inc': {
@@ -9833,7 +10874,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['jacksonville']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.3322,
+    longitude: -81.6557,
+    geocodePrecision: 'city'
   },
 
   'karma-roofing': {
@@ -9859,7 +10903,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['orlando']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'key-roofing-exteriors': {
@@ -9885,7 +10932,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['sarasota']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.3364,
+    longitude: -82.5307,
+    geocodePrecision: 'city'
   },
 
   'keys-roofing-inc': {
@@ -9911,7 +10961,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['key-largo', 'largo']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.1224,
+    longitude: -80.1373,
+    geocodePrecision: 'county'
   },
 
   'king-roofing-service-inc': {
@@ -9937,7 +10990,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['naples']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.142,
+    longitude: -81.7948,
+    geocodePrecision: 'city'
   },
 
   'kirkey-roofing-inc': {
@@ -9963,7 +11019,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['englewood']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.3364,
+    longitude: -82.5307,
+    geocodePrecision: 'county'
   },
 
   'klr-roofing-corp': {
@@ -9989,7 +11048,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['west-palm-beach']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'kl-smith-inc': {
@@ -10015,7 +11077,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['lakeland']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.0406,
+    longitude: -81.9498,
+    geocodePrecision: 'city'
   },
 
   'lamphier-company': {
@@ -10041,7 +11106,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['sanford']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.7178,
+    longitude: -81.3081,
+    geocodePrecision: 'city'
   },
 
   'latite-roofing-sheet-metal-co': {
@@ -10067,7 +11135,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['pompano-beach']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.1224,
+    longitude: -80.1373,
+    geocodePrecision: 'city'
   },
 
   'legacy-contracting-solutions-inc': {
@@ -10093,7 +11164,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['riviera-beach']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'legacy-roofing-srq': {
@@ -10119,7 +11193,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['sarasota']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.3364,
+    longitude: -82.5307,
+    geocodePrecision: 'city'
   },
 
   'len-s-roofing-inc': {
@@ -10145,7 +11222,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['bradenton']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.3364,
+    longitude: -82.5307,
+    geocodePrecision: 'county'
   },
 
   'family-pride-roofing-inc': {
@@ -10171,7 +11251,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['north-port']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.3364,
+    longitude: -82.5307,
+    geocodePrecision: 'city'
   },
 
   'greg-s-roofing-inc': {
@@ -10223,7 +11306,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['pt-charlotte']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.9298,
+    longitude: -81.9498,
+    geocodePrecision: 'county'
   },
 
   'lou-jezdimir-roofing-inc': {
@@ -10275,7 +11361,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['okeechobee']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'maco-construction-services-llc': {
@@ -10301,7 +11390,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['west-palm-beach']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'magnum-roofing-restoration': {
@@ -10353,7 +11445,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['tampa']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.9506,
+    longitude: -82.4572,
+    geocodePrecision: 'city'
   },
 
   'manson-roofing-inc': {
@@ -10379,7 +11474,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['bradenton']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.3364,
+    longitude: -82.5307,
+    geocodePrecision: 'county'
   },
 
   'marathon-roofing-and-contracting-inc': {
@@ -10405,7 +11503,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['longwood']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.7178,
+    longitude: -81.3081,
+    geocodePrecision: 'city'
   },
 
   'mark-taylor-construction-llc': {
@@ -10431,7 +11532,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['pensacola']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.4383,
+    longitude: -87.2166,
+    geocodePrecision: 'city'
   },
 
   'martin-roofing-services-inc': {
@@ -10457,7 +11561,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['winter-park']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'amw-contracting-inc': {
@@ -10483,7 +11590,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['jacksonville']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.3322,
+    longitude: -81.6557,
+    geocodePrecision: 'city'
   },
 
   'mighty-dog-roofing-151': {
@@ -10509,7 +11619,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['windermere']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'mighty-dog-roofing': {
@@ -10535,7 +11648,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['bradenton']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.3364,
+    longitude: -82.5307,
+    geocodePrecision: 'county'
   },
 
   'jackson-enterprises-of-brevard': {
@@ -10587,7 +11703,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['new-port-richey']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.3078,
+    longitude: -82.4654,
+    geocodePrecision: 'city'
   },
 
   'mark-kaufman-roofing': {
@@ -10613,7 +11732,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['north-port']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.3364,
+    longitude: -82.5307,
+    geocodePrecision: 'city'
   },
 
   'modtek-roofing-inc': {
@@ -10639,7 +11761,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['vero-beach']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.6936,
+    longitude: -80.4756,
+    geocodePrecision: 'county'
   },
 
   'molsbee-roofing-inc': {
@@ -10665,7 +11790,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['lake-worth']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'montgomery-winslow-roofing': {
@@ -10691,7 +11819,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['ft-myers']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.9298,
+    longitude: -81.9498,
+    geocodePrecision: 'county'
   },
 
   'moody-s-sheet-metal': {
@@ -10743,7 +11874,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['jacksonville']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.3322,
+    longitude: -81.6557,
+    geocodePrecision: 'city'
   },
 
   'movi-contractors-llc': {
@@ -10769,7 +11903,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['kissimmee']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.3056,
+    longitude: -81.4165,
+    geocodePrecision: 'city'
   },
 
   'affordable-roofing-of-central-fl': {
@@ -10794,7 +11931,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['jennings']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 29.9012,
+    longitude: -81.3124,
+    geocodePrecision: 'county'
   },
 
   'done-rite-roofing-inc': {
@@ -10819,7 +11959,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['palm-harbor']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.8961,
+    longitude: -82.7412,
+    geocodePrecision: 'city'
   },
 
   'd-r-martineau-construction-inc': {
@@ -10844,7 +11987,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['ft-myers']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.9298,
+    longitude: -81.9498,
+    geocodePrecision: 'county'
   },
 
   'mullet-s-aluminum-products-inc': {
@@ -10870,7 +12016,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['sarasota']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.3364,
+    longitude: -82.5307,
+    geocodePrecision: 'city'
   },
 
   'munyan-restoration-waterproofing': {
@@ -10896,7 +12045,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['clearwater']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.8961,
+    longitude: -82.7412,
+    geocodePrecision: 'city'
   },
 
   'midwest-roofing-company-inc': {
@@ -10948,7 +12100,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['west-palm-beach']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'my-florida-roofing-contractor': {
@@ -10974,7 +12129,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['vero-beach']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.6936,
+    longitude: -80.4756,
+    geocodePrecision: 'county'
   },
 
   'roofsmith-of-tampa-bay-inc': {
@@ -11000,7 +12158,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['tampa']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.9506,
+    longitude: -82.4572,
+    geocodePrecision: 'city'
   },
 
   'national-roofing-of-collier-inc': {
@@ -11026,7 +12187,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['naples']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.142,
+    longitude: -81.7948,
+    geocodePrecision: 'city'
   },
 
   'nations-roofing-construction-mechanical-llc': {
@@ -11052,7 +12216,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['dade-city']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.3078,
+    longitude: -82.4654,
+    geocodePrecision: 'city'
   },
 
   'nature-coast-roofing-solutions-inc': {
@@ -11078,7 +12245,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['hudson']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.3078,
+    longitude: -82.4654,
+    geocodePrecision: 'city'
   },
 
   'national-building-contractors-inc': {
@@ -11104,7 +12274,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['orange-park']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.3322,
+    longitude: -81.6557,
+    geocodePrecision: 'city'
   },
 
   'neal-strickland-roofing-inc': {
@@ -11156,7 +12329,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['tallahassee']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.455,
+    longitude: -84.2807,
+    geocodePrecision: 'city'
   },
 
   'neumann-construction-roofing-llc': {
@@ -11182,7 +12358,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['san-antonio']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.3078,
+    longitude: -82.4654,
+    geocodePrecision: 'city'
   },
 
   'ocala-roofing-inc': {
@@ -11234,7 +12413,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['st-augustine']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 29.9012,
+    longitude: -81.3124,
+    geocodePrecision: 'city'
   },
 
   'o-neal-roofing-company-inc': {
@@ -11260,7 +12442,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['lake-city']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 29.9012,
+    longitude: -81.3124,
+    geocodePrecision: 'county'
   },
 
   'one-love-roofing': {
@@ -11312,7 +12497,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['orlando']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'owens-contracting-services-inc': {
@@ -11338,7 +12526,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['orlando']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'protech-roofing-services-llc': {
@@ -11363,7 +12554,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['brooksville']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5556,
+    longitude: -82.4544,
+    geocodePrecision: 'city'
   },
 
   'ras-roofing-llc': {
@@ -11388,7 +12582,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['w-palm-beach']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'worley-roofing-inc': {
@@ -11413,7 +12610,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['jupiter']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'over-the-top-roof-repair-inc': {
@@ -11439,7 +12639,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['stuart']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'p-a-roofing-sheet-metal-inc': {
@@ -11465,7 +12668,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['orlando']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'paletz-roofing-inspections-inc': {
@@ -11491,7 +12697,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['davie']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.1224,
+    longitude: -80.1373,
+    geocodePrecision: 'city'
   },
 
   'roofing-unlimited-sheet-metal-inc': {
@@ -11517,7 +12726,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['w-palm-beach']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'palm-roofing-corp': {
@@ -11543,7 +12755,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['miami']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 25.7617,
+    longitude: -80.1918,
+    geocodePrecision: 'city'
   },
 
   'panda-roof': {
@@ -11569,7 +12784,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['vero-beach']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.6936,
+    longitude: -80.4756,
+    geocodePrecision: 'county'
   },
 
   'patrick-roofing-inc': {
@@ -11621,7 +12839,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['vero-beach']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'county'
   },
 
   'paul-bange-roofing-inc': {
@@ -11647,7 +12868,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['davie']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.1224,
+    longitude: -80.1373,
+    geocodePrecision: 'city'
   },
 
   'pbrown-builders-llc': {
@@ -11673,7 +12897,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['pensacola']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.4383,
+    longitude: -87.2166,
+    geocodePrecision: 'city'
   },
 
   'prime-choice-roofing-llc': {
@@ -11699,7 +12926,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['haines-city']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.0406,
+    longitude: -81.9498,
+    geocodePrecision: 'city'
   },
 
   'peet-roofing': {
@@ -11725,7 +12955,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['maitland']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'pegasus-builders-inc': {
@@ -11751,7 +12984,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['wellington']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'perfect-choice-roofing-inc': {
@@ -11777,7 +13013,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['pembroke-pines']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.1224,
+    longitude: -80.1373,
+    geocodePrecision: 'county'
   },
 
   'performance-roofing-llc': {
@@ -11803,7 +13042,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['oviedo']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.7178,
+    longitude: -81.3081,
+    geocodePrecision: 'city'
   },
 
   'perkins-roofing-corporation': {
@@ -11829,7 +13071,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['miami']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 25.7617,
+    longitude: -80.1918,
+    geocodePrecision: 'city'
   },
 
   'perry-roofing-contractors': {
@@ -11855,7 +13100,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['gainesville']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 29.6516,
+    longitude: -82.3248,
+    geocodePrecision: 'city'
   },
 
   'pestana-roofing-co-inc': {
@@ -11881,7 +13129,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['lake-worth']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'pinnacle-roofing-group-llc': {
@@ -11907,7 +13158,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['sanford']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.7178,
+    longitude: -81.3081,
+    geocodePrecision: 'city'
   },
 
   'pioneer-roofing-company-llc': {
@@ -11933,7 +13187,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['hollywood']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.1224,
+    longitude: -80.1373,
+    geocodePrecision: 'city'
   },
 
   'pit-crew-roofing': {
@@ -11985,7 +13242,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['st-augustine', 'saint-augustine']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 29.9012,
+    longitude: -81.3124,
+    geocodePrecision: 'county'
   },
 
   'polaris-roofing-inc': {
@@ -12011,7 +13271,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['estero']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.6636,
+    longitude: -81.9532,
+    geocodePrecision: 'city'
   },
 
   'pooles-roofing-repairs-inc': {
@@ -12037,7 +13300,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['naples']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.142,
+    longitude: -81.7948,
+    geocodePrecision: 'city'
   },
 
   'poseidon-roofing-llc': {
@@ -12063,7 +13329,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['ft-myers']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.9298,
+    longitude: -81.9498,
+    geocodePrecision: 'county'
   },
 
   'prattco-inc': {
@@ -12089,7 +13358,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['plant-city']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.0181,
+    longitude: -82.1129,
+    geocodePrecision: 'city'
   },
 
   'premium-roofing-systems-llc': {
@@ -12141,7 +13413,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['jacksonville']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.3322,
+    longitude: -81.6557,
+    geocodePrecision: 'city'
   },
 
   'prg-roofing-construction-inc': {
@@ -12167,7 +13442,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['ft-myers']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.9298,
+    longitude: -81.9498,
+    geocodePrecision: 'county'
   },
 
   'prime-roofing': {
@@ -12193,7 +13471,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['jacksonville']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.3322,
+    longitude: -81.6557,
+    geocodePrecision: 'city'
   },
 
   'procraft-exteriors-inc': {
@@ -12219,7 +13500,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['marco-island']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.142,
+    longitude: -81.7948,
+    geocodePrecision: 'city'
   },
 
   'pro-s-choice-roofing-llc': {
@@ -12297,7 +13581,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['bradenton']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.3364,
+    longitude: -82.5307,
+    geocodePrecision: 'county'
   },
 
   'psi-roofing': {
@@ -12323,7 +13610,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['oakland', 'oakland-park']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.1224,
+    longitude: -80.1373,
+    geocodePrecision: 'county'
   },
 
   'quality-metals-inc': {
@@ -12349,7 +13639,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['sanford']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.7178,
+    longitude: -81.3081,
+    geocodePrecision: 'city'
   },
 
   'quality-roofing-inc': {
@@ -12375,7 +13668,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['tampa']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.9506,
+    longitude: -82.4572,
+    geocodePrecision: 'city'
   },
 
   'quality-roofing-solutions-llc': {
@@ -12401,7 +13697,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['pensacola']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.4383,
+    longitude: -87.2166,
+    geocodePrecision: 'city'
   },
 
   'quick-roofing-llc': {
@@ -12427,7 +13726,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['lakeland']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.0406,
+    longitude: -81.9498,
+    geocodePrecision: 'city'
   },
 
   'r-j-group-inc': {
@@ -12479,7 +13781,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['davie']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.1224,
+    longitude: -80.1373,
+    geocodePrecision: 'city'
   },
 
   'rainshield-roofing-corp': {
@@ -12505,7 +13810,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['deerfield-beach']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'ramcon-llc': {
@@ -12531,7 +13839,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['tampa']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.9506,
+    longitude: -82.4572,
+    geocodePrecision: 'city'
   },
 
   'rbs-construction-llc': {
@@ -12557,7 +13868,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['orlando']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'r-c-roofing-and-contracting-llc': {
@@ -12583,7 +13897,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['orlando']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'r-d-construction-and-roofing': {
@@ -12609,7 +13926,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['miami']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 25.7617,
+    longitude: -80.1918,
+    geocodePrecision: 'city'
   },
 
   'recovery-roofing-inc': {
@@ -12635,7 +13955,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['jacksonville']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.3322,
+    longitude: -81.6557,
+    geocodePrecision: 'city'
   },
 
   'red-dog-s-roofing-of-florida-inc': {
@@ -12661,7 +13984,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['sarasota']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.3364,
+    longitude: -82.5307,
+    geocodePrecision: 'city'
   },
 
   'red-stag-contracting-inc': {
@@ -12687,7 +14013,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['jacksonville']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.3322,
+    longitude: -81.6557,
+    geocodePrecision: 'city'
   },
 
   'register-roofing-sheet-metal-inc': {
@@ -12713,7 +14042,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['jacksonville']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.3322,
+    longitude: -81.6557,
+    geocodePrecision: 'city'
   },
 
   'reliable-roofing-of-florida-inc': {
@@ -12739,7 +14071,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['windermere']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'reliant-roofing-solar-hurricane-shutters': {
@@ -12765,7 +14100,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['jacksonville']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.3322,
+    longitude: -81.6557,
+    geocodePrecision: 'city'
   },
 
   'reliant-roofing-services-llc': {
@@ -12791,7 +14129,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['deltona']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'county'
   },
 
   'restore-group-llc': {
@@ -12817,7 +14158,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['longwood']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.7178,
+    longitude: -81.3081,
+    geocodePrecision: 'city'
   },
 
   'revildor': {
@@ -12843,7 +14187,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['orlando']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'rf-lusa-sons-sheet-metal-inc': {
@@ -12869,7 +14216,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['lakeland']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.0406,
+    longitude: -81.9498,
+    geocodePrecision: 'city'
   },
 
   'rich-moore-roofing-llc': {
@@ -12895,7 +14245,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['lake-worth']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'lindholm-construction-inc': {
@@ -12921,7 +14274,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['islamorada']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.1224,
+    longitude: -80.1373,
+    geocodePrecision: 'county'
   },
 
   'right-now-roofing-fl-inc': {
@@ -12947,7 +14303,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['pt-charlotte']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.9298,
+    longitude: -81.9498,
+    geocodePrecision: 'county'
   },
 
   'r-j-coatings-waterproofing-inc': {
@@ -12999,7 +14358,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['orlando']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'roberson-roofing-inc': {
@@ -13051,7 +14413,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['winter-haven']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.0406,
+    longitude: -81.9498,
+    geocodePrecision: 'city'
   },
 
   'robinson-roofing-restoration-llc': {
@@ -13077,7 +14442,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['tampa']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.9506,
+    longitude: -82.4572,
+    geocodePrecision: 'city'
   },
 
   'rodemeyer-roofing-llc': {
@@ -13103,7 +14471,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['deerfield-beach']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.1224,
+    longitude: -80.1373,
+    geocodePrecision: 'county'
   },
 
   'roman-roofing-inc': {
@@ -13129,7 +14500,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['cape-coral']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.6636,
+    longitude: -81.9532,
+    geocodePrecision: 'city'
   },
 
   'roofcrafters-roofing-llc': {
@@ -13155,7 +14529,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['odessa']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.3078,
+    longitude: -82.4654,
+    geocodePrecision: 'city'
   },
 
   'roof-right-llc': {
@@ -13181,7 +14558,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['ft-myers']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.9298,
+    longitude: -81.9498,
+    geocodePrecision: 'county'
   },
 
   'summit-roofing-solar-llc': {
@@ -13207,7 +14587,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['jacksonville']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.3322,
+    longitude: -81.6557,
+    geocodePrecision: 'city'
   },
 
   'roof-commander-inc': {
@@ -13233,7 +14616,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['tavares']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.7505,
+    longitude: -81.6859,
+    geocodePrecision: 'city'
   },
 
   'roof-express-llc': {
@@ -13259,7 +14645,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['lake-worth']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'roofing-by-curry': {
@@ -13285,7 +14674,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['sarasota']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.3364,
+    longitude: -82.5307,
+    geocodePrecision: 'city'
   },
 
   'roofing-pioneers-llc': {
@@ -13311,7 +14703,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['oviedo']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.7178,
+    longitude: -81.3081,
+    geocodePrecision: 'city'
   },
 
   'roofing-reina': {
@@ -13337,7 +14732,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['davie']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.1224,
+    longitude: -80.1373,
+    geocodePrecision: 'city'
   },
 
   'roofman-inc': {
@@ -13363,7 +14761,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['n-palm-beach']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'roofmaster-of-south-florida-inc': {
@@ -13389,7 +14790,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['lehigh-acres']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.6636,
+    longitude: -81.9532,
+    geocodePrecision: 'city'
   },
 
   'garrett-roofing-inc': {
@@ -13441,7 +14845,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['orlando']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'roof-pros-usa-llc': {
@@ -13467,7 +14874,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['longwood']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.7178,
+    longitude: -81.3081,
+    geocodePrecision: 'city'
   },
 
   'rooftech-roofing-sheet-metal-inc': {
@@ -13493,7 +14903,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['pompano-beach']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.1224,
+    longitude: -80.1373,
+    geocodePrecision: 'city'
   },
 
   'roof-technologies-llc': {
@@ -13519,7 +14932,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['lauderhill']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.1224,
+    longitude: -80.1373,
+    geocodePrecision: 'county'
   },
 
   'roof-top-services-of-central-florida-inc': {
@@ -13545,7 +14961,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['winter-springs']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.7178,
+    longitude: -81.3081,
+    geocodePrecision: 'city'
   },
 
   'roof-x-inc': {
@@ -13571,7 +14990,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['tampa']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.9506,
+    longitude: -82.4572,
+    geocodePrecision: 'city'
   },
 
   'rouen-services-inc': {
@@ -13597,7 +15019,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['miami']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 25.7617,
+    longitude: -80.1918,
+    geocodePrecision: 'city'
   },
 
   'r-r-industries-inc': {
@@ -13675,7 +15100,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['ft-myers']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.9298,
+    longitude: -81.9498,
+    geocodePrecision: 'county'
   },
 
   'salomon-roofing-waterproofing': {
@@ -13701,7 +15129,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['miami-gardens', 'miami']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.1224,
+    longitude: -80.1373,
+    geocodePrecision: 'county'
   },
 
   'salt-roofing': {
@@ -13727,7 +15158,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['eustis']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.7505,
+    longitude: -81.6859,
+    geocodePrecision: 'city'
   },
 
   'sarasota-roofing-co-inc': {
@@ -13753,7 +15187,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['sarasota']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.3364,
+    longitude: -82.5307,
+    geocodePrecision: 'city'
   },
 
   'southern-coast-foundation-systems': {
@@ -13779,7 +15216,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['deerfield-beach']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'southern-coast-enterprises-inc': {
@@ -13805,7 +15245,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['deerfield-beach']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'schick-roofing-llc': {
@@ -13831,7 +15274,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['orlando']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'scott-smith-roofing-inc': {
@@ -13883,7 +15329,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['miami']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 25.7617,
+    longitude: -80.1918,
+    geocodePrecision: 'city'
   },
 
   'marion-service-roofing-sheet-metal-co': {
@@ -13935,7 +15384,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['tampa']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.9506,
+    longitude: -82.4572,
+    geocodePrecision: 'city'
   },
 
   'sheegog-contracting': {
@@ -13961,7 +15413,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['winter-park']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'sheet-metal-unlimited-pl-inc': {
@@ -13987,7 +15442,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['ft-lauderdale']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.1224,
+    longitude: -80.1373,
+    geocodePrecision: 'county'
   },
 
   'shield-coatings-waterproofing-inc': {
@@ -14013,7 +15471,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['tampa']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.9506,
+    longitude: -82.4572,
+    geocodePrecision: 'city'
   },
 
   'shorebreak-inc': {
@@ -14039,7 +15500,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['yulee']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.6105,
+    longitude: -81.8001,
+    geocodePrecision: 'city'
   },
 
   'simon-roofing': {
@@ -14065,7 +15529,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['tampa']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.9506,
+    longitude: -82.4572,
+    geocodePrecision: 'city'
   },
 
   'sinclair-construction': {
@@ -14091,7 +15558,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['cape-coral']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.6636,
+    longitude: -81.9532,
+    geocodePrecision: 'city'
   },
 
   'alvin-j-singleton-inc': {
@@ -14117,7 +15587,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['sarasota']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.3364,
+    longitude: -82.5307,
+    geocodePrecision: 'city'
   },
 
   'six-sigma-roofing-contractors-llc': {
@@ -14143,7 +15616,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['ft-myers']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.9298,
+    longitude: -81.9498,
+    geocodePrecision: 'county'
   },
 
   'skilcon-inc': {
@@ -14194,7 +15670,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['delray-beach']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'skymark-roofing-llc': {
@@ -14220,7 +15699,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['mt-dora']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'county'
   },
 
   'smitty-s-welding-and-sheet-metal-fabrication-llc': {
@@ -14272,7 +15754,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['pt-st-lucie']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'sonshine-roofing-inc': {
@@ -14298,7 +15783,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['sarasota']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.3364,
+    longitude: -82.5307,
+    geocodePrecision: 'city'
   },
 
   'southeastern-coatings-waterproofing-inc': {
@@ -14324,7 +15812,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['lake-city']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 29.9012,
+    longitude: -81.3124,
+    geocodePrecision: 'county'
   },
 
   'southern-coast-roofing-construction-inc': {
@@ -14350,7 +15841,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['jacksonville']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.3322,
+    longitude: -81.6557,
+    geocodePrecision: 'city'
   },
 
   'south-quality-roofing-llc': {
@@ -14376,7 +15870,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['homestead']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 25.7617,
+    longitude: -80.1918,
+    geocodePrecision: 'city'
   },
 
   'southern-roofing-co-inc': {
@@ -14402,7 +15899,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['tampa']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.9506,
+    longitude: -82.4572,
+    geocodePrecision: 'city'
   },
 
   'specialty-roofers-inc': {
@@ -14428,7 +15928,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['freeport']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.1844,
+    longitude: -85.6608,
+    geocodePrecision: 'county'
   },
 
   'spilker-roofing-sheet-metal': {
@@ -14480,7 +15983,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['eaton-park']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.0406,
+    longitude: -81.9498,
+    geocodePrecision: 'county'
   },
 
   's-s-roofing-systems-inc': {
@@ -14506,7 +16012,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['longwood']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.7178,
+    longitude: -81.3081,
+    geocodePrecision: 'city'
   },
 
   'ssi-construction-inc': {
@@ -14532,7 +16041,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['oakland', 'oakland-park']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.1224,
+    longitude: -80.1373,
+    geocodePrecision: 'county'
   },
 
   'starpro-roofing-sheet-metal-inc': {
@@ -14558,7 +16070,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['stuart']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'state-pride-roofing-of-fl-inc': {
@@ -14584,7 +16099,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['west-palm-beach']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'state-roofing-i-llc': {
@@ -14610,7 +16128,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['fort-myers']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.6636,
+    longitude: -81.9532,
+    geocodePrecision: 'city'
   },
 
   'stay-dry-roofing-llc': {
@@ -14636,7 +16157,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['fort-myers']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.6636,
+    longitude: -81.9532,
+    geocodePrecision: 'city'
   },
 
   'steel-rudder-roofing-llc': {
@@ -14662,7 +16186,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['jacksonville']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.3322,
+    longitude: -81.6557,
+    geocodePrecision: 'city'
   },
 
   'steppi-roofing-inc': {
@@ -14688,7 +16215,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['orlando']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'stgo-pro4mance-llc': {
@@ -14714,7 +16244,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['davenport']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.0406,
+    longitude: -81.9498,
+    geocodePrecision: 'county'
   },
 
   'stormforce-of-jacksonville': {
@@ -14740,7 +16273,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['jacksonville']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.3322,
+    longitude: -81.6557,
+    geocodePrecision: 'city'
   },
 
   'stratus-roofing': {
@@ -14766,7 +16302,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['maitland']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'streamline-roofing-construction-inc': {
@@ -14792,7 +16331,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['tallahassee']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.455,
+    longitude: -84.2807,
+    geocodePrecision: 'city'
   },
 
   'sun-catcher-roofing-ii-inc': {
@@ -14818,7 +16360,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['ft-lauderdale']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.1224,
+    longitude: -80.1373,
+    geocodePrecision: 'county'
   },
 
   'sun-coast-roofing-services-inc': {
@@ -14870,7 +16415,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['naples']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.142,
+    longitude: -81.7948,
+    geocodePrecision: 'city'
   },
 
   'suntech-development-inc': {
@@ -14896,7 +16444,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['miami']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 25.7617,
+    longitude: -80.1918,
+    geocodePrecision: 'city'
   },
 
   'sutter-roofing-co-of-fl': {
@@ -14922,7 +16473,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['sarasota']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.3364,
+    longitude: -82.5307,
+    geocodePrecision: 'city'
   },
 
   'tactical-roofing-solutions-llc': {
@@ -14948,7 +16502,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['cape-coral']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.6636,
+    longitude: -81.9532,
+    geocodePrecision: 'city'
   },
 
   'tadlock-roofing-inc': {
@@ -14974,7 +16531,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['tallahassee']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.455,
+    longitude: -84.2807,
+    geocodePrecision: 'city'
   },
 
   'tallahassee-roofing-inc': {
@@ -15000,7 +16560,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['tallahassee']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.455,
+    longitude: -84.2807,
+    geocodePrecision: 'city'
   },
 
   'cedar-cove-inc': {
@@ -15078,7 +16641,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['st-petersburg']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.8961,
+    longitude: -82.7412,
+    geocodePrecision: 'city'
   },
 
   'sam-damm-roofing-inc': {
@@ -15104,7 +16670,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['pt-richey']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.3078,
+    longitude: -82.4654,
+    geocodePrecision: 'county'
   },
 
   'the-roof-authority-inc': {
@@ -15130,7 +16699,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['ft-pierce']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'tanenbaum-roofing': {
@@ -15156,7 +16728,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['orlando']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'tarheel-roofing-inc': {
@@ -15182,7 +16757,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['st-petersburg']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.8961,
+    longitude: -82.7412,
+    geocodePrecision: 'city'
   },
 
   'taylor-s-roofing-llc': {
@@ -15208,7 +16786,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['lake-wales']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.0406,
+    longitude: -81.9498,
+    geocodePrecision: 'county'
   },
 
   'childers-roofing-s-m-a-tecta-america-company-llc': {
@@ -15234,7 +16815,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['jacksonville']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.3322,
+    longitude: -81.6557,
+    geocodePrecision: 'city'
   },
 
   'reroof-america-contractors-of-fl-llc': {
@@ -15312,7 +16896,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['st-augustine', 'saint-augustine']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 29.9012,
+    longitude: -81.3124,
+    geocodePrecision: 'county'
   },
 
   'orlando-roofing-llc': {
@@ -15338,7 +16925,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['ocoee']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'thorne-metal-systems-inc': {
@@ -15364,7 +16954,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['middleburg']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 29.9012,
+    longitude: -81.3124,
+    geocodePrecision: 'county'
   },
 
   'total-home-roofing': {
@@ -15416,7 +17009,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['ft-lauderdale']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.1224,
+    longitude: -80.1373,
+    geocodePrecision: 'county'
   },
 
   'timberman-roofing-inc': {
@@ -15442,7 +17038,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['valparaiso']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.4383,
+    longitude: -87.2166,
+    geocodePrecision: 'county'
   },
 
   'tip-top-roofing-co-inc': {
@@ -15468,7 +17067,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['orlando']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'tlc-construction-industries-corp': {
@@ -15546,7 +17148,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['lauderdale-lakes']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.1224,
+    longitude: -80.1373,
+    geocodePrecision: 'city'
   },
 
   'top-gun-roofing-inc': {
@@ -15572,7 +17177,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['jacksonville']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.3322,
+    longitude: -81.6557,
+    geocodePrecision: 'city'
   },
 
   'total-quality-roofing-inc': {
@@ -15598,7 +17206,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['tallahassee']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.455,
+    longitude: -84.2807,
+    geocodePrecision: 'city'
   },
 
   'total-roof-services-corp': {
@@ -15624,7 +17235,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['orlando']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'trademark-roofing': {
@@ -15650,7 +17264,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['cape-coral']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.6636,
+    longitude: -81.9532,
+    geocodePrecision: 'city'
   },
 
   'trade-winds-roofing-inc': {
@@ -15676,7 +17293,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['ft-pierce']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'triple-m-roofing-corp': {
@@ -15702,7 +17322,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['ft-lauderdale']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.1224,
+    longitude: -80.1373,
+    geocodePrecision: 'county'
   },
 
   'tspark-enterprises-llc': {
@@ -15728,7 +17351,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['tallahassee']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.455,
+    longitude: -84.2807,
+    geocodePrecision: 'city'
   },
 
   'turley-roofing': {
@@ -15780,7 +17406,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['orlando']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'universal-contracting-solar': {
@@ -15806,7 +17435,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['lehigh-acres']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.6636,
+    longitude: -81.9532,
+    geocodePrecision: 'city'
   },
 
   'universal-roof-contracting': {
@@ -15832,7 +17464,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['orlando']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'bartlett-roofing-services-inc': {
@@ -15857,7 +17492,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['pt-richey']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.3078,
+    longitude: -82.4654,
+    geocodePrecision: 'county'
   },
 
   'reed-roofing-co': {
@@ -15882,7 +17520,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['st-petersburg']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.8961,
+    longitude: -82.7412,
+    geocodePrecision: 'city'
   },
 
   'vero-beach-roofing-inc': {
@@ -15908,7 +17549,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['vero-beach']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.6936,
+    longitude: -80.4756,
+    geocodePrecision: 'county'
   },
 
   'veterans-national-property-services-llc': {
@@ -15934,7 +17578,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['tampa']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.9506,
+    longitude: -82.4572,
+    geocodePrecision: 'city'
   },
 
   'veteran-roofing-inc': {
@@ -15960,7 +17607,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['oakland', 'oakland-park']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.1224,
+    longitude: -80.1373,
+    geocodePrecision: 'county'
   },
 
   'veterans-roofing-property-maintenance': {
@@ -15986,7 +17636,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['winter-haven']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.0406,
+    longitude: -81.9498,
+    geocodePrecision: 'city'
   },
 
   'vickers-metal-works-inc': {
@@ -16012,7 +17665,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['orlando']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'waypoint-roofing-construction-inc': {
@@ -16064,7 +17720,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['ft-myers']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.9298,
+    longitude: -81.9498,
+    geocodePrecision: 'county'
   },
 
   'weatherguard-roofing-waterproofing-inc': {
@@ -16090,7 +17749,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['hialeah']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 25.7617,
+    longitude: -80.1918,
+    geocodePrecision: 'city'
   },
 
   'weather-recovery-solutions': {
@@ -16116,7 +17778,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['deerfield-beach']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'weathershield-roofing-group-inc': {
@@ -16142,7 +17807,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['longwood']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.7178,
+    longitude: -81.3081,
+    geocodePrecision: 'city'
   },
 
   'wescon-construction-inc': {
@@ -16194,7 +17862,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['tampa']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.9506,
+    longitude: -82.4572,
+    geocodePrecision: 'city'
   },
 
   'whale-roofing-construction-llc': {
@@ -16220,7 +17891,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['boca-raton']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'whitco-roofing-inc': {
@@ -16246,7 +17920,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['altamonte-springs']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.7178,
+    longitude: -81.3081,
+    geocodePrecision: 'city'
   },
 
   'winter-park-roofing-inc': {
@@ -16272,7 +17949,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['winter-park']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'wormley-roofing-inc': {
@@ -16298,7 +17978,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['apopka']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'worthmann-llc': {
@@ -16324,7 +18007,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['high-springs']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 29.6516,
+    longitude: -82.3248,
+    geocodePrecision: 'county'
   },
 
   'weather-shield-metal-roofing-inc': {
@@ -16350,7 +18036,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['gulf-breeze']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.4383,
+    longitude: -87.2166,
+    geocodePrecision: 'city'
   },
 
   'advantage-roofing-inc': {
@@ -16375,7 +18064,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['orlando']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'alfrey-roofing-inc': {
@@ -16450,7 +18142,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['jacksonville']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.3322,
+    longitude: -81.6557,
+    geocodePrecision: 'city'
   },
 
   'ad-ler-roofing-inc': {
@@ -16475,7 +18170,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['ft-myers']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.9298,
+    longitude: -81.9498,
+    geocodePrecision: 'county'
   },
 
   'a-all-pro-roofing-inc': {
@@ -16525,7 +18223,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['jacksonville']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.3322,
+    longitude: -81.6557,
+    geocodePrecision: 'city'
   },
 
   'aj-wells-roofing-construction': {
@@ -16550,7 +18251,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['jacksonville']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.3322,
+    longitude: -81.6557,
+    geocodePrecision: 'city'
   },
 
   'bcr-inc': {
@@ -16575,7 +18279,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['green-cove-springs']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 29.9012,
+    longitude: -81.3124,
+    geocodePrecision: 'county'
   },
 
   'b-z-custom-sheet-metal-inc': {
@@ -16600,7 +18307,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['orlando']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'leeg-roofing-inc': {
@@ -16675,7 +18385,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['vero-beach']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.6936,
+    longitude: -80.4756,
+    geocodePrecision: 'county'
   },
 
   'fnf-enterprises-inc': {
@@ -16725,7 +18438,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['gainesville']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 29.6516,
+    longitude: -82.3248,
+    geocodePrecision: 'city'
   },
 
   'hopton-roofing-inc': {
@@ -16750,7 +18466,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['lake-helen']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'county'
   },
 
   'jim-taylor-roofing-inc': {
@@ -16800,7 +18519,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['clearwater']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.8961,
+    longitude: -82.7412,
+    geocodePrecision: 'city'
   },
 
   'global-roofing-and-contracting-llc': {
@@ -16825,7 +18547,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['naples']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.142,
+    longitude: -81.7948,
+    geocodePrecision: 'city'
   },
 
   'wooley-brothers-inc': {
@@ -16850,7 +18575,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['st-cloud']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.3056,
+    longitude: -81.4165,
+    geocodePrecision: 'city'
   },
 
   'orange-county-roofing-inc': {
@@ -16875,7 +18603,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['orlando']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'rlk-construction-co-of-naples-inc': {
@@ -16900,7 +18631,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['naples']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.142,
+    longitude: -81.7948,
+    geocodePrecision: 'city'
   },
 
   'rodman-roofing-inc': {
@@ -16925,7 +18659,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['miami']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 25.7617,
+    longitude: -80.1918,
+    geocodePrecision: 'city'
   },
 
   'roofing-company-llc': {
@@ -16950,7 +18687,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['casselberry']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.7178,
+    longitude: -81.3081,
+    geocodePrecision: 'city'
   },
 
   'russ-noyes-roofing-inc-rhino-roofing': {
@@ -16975,7 +18715,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['winter-springs']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.7178,
+    longitude: -81.3081,
+    geocodePrecision: 'city'
   },
 
   'ferber-osteen-roofing-and-sheet-metal': {
@@ -17000,7 +18743,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['gainesville']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 29.6516,
+    longitude: -82.3248,
+    geocodePrecision: 'city'
   },
 
   'all-seasons-roofing-repair-of-orlando': {
@@ -17025,7 +18771,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['orlando']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.5383,
+    longitude: -81.3792,
+    geocodePrecision: 'city'
   },
 
   'yoder-roofing-inc': {
@@ -17051,7 +18800,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['sarasota']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.3364,
+    longitude: -82.5307,
+    geocodePrecision: 'city'
   },
 
   'york-roofing-llc': {
@@ -17077,7 +18829,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['longwood']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.7178,
+    longitude: -81.3081,
+    geocodePrecision: 'city'
   },
 
   'all-weather-roofing': {
@@ -17103,7 +18858,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['bradenton']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.3364,
+    longitude: -82.5307,
+    geocodePrecision: 'county'
   },
 
   'endless-summer-roofing-co': {
@@ -17129,7 +18887,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['jacksonville']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.3322,
+    longitude: -81.6557,
+    geocodePrecision: 'city'
   },
 
   'z-roofing-waterproofing-inc': {
@@ -17155,7 +18916,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['hialeah']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 25.7617,
+    longitude: -80.1918,
+    geocodePrecision: 'city'
   },
 
   'megram-construction-co': {
@@ -17181,7 +18945,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['oviedo']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.7178,
+    longitude: -81.3081,
+    geocodePrecision: 'city'
   },
 
   'green-leaf-roofing-llc': {
@@ -17206,7 +18973,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['dunedin']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.8961,
+    longitude: -82.7412,
+    geocodePrecision: 'city'
   },
 
   'fixd-roofing-llc': {
@@ -17232,7 +19002,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['pt-st-lucie']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 26.7056,
+    longitude: -80.0364,
+    geocodePrecision: 'county'
   },
 
   'mcenany-roofing-inc': {
@@ -17258,7 +19031,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['tampa']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.9506,
+    longitude: -82.4572,
+    geocodePrecision: 'city'
   },
 
   'mccurdy-walden-inc': {
@@ -17284,7 +19060,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['jacksonville']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 30.3322,
+    longitude: -81.6557,
+    geocodePrecision: 'city'
   },
 
   'mb-enterprises-roofing-sheet-metal-inc': {
@@ -17309,7 +19088,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['vero-beach']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.6936,
+    longitude: -80.4756,
+    geocodePrecision: 'county'
   },
 
   'mcdavid-roofing-inc': {
@@ -17334,7 +19116,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['alachua']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 29.6516,
+    longitude: -82.3248,
+    geocodePrecision: 'county'
   },
 
   'mcfadden-s-roofing-inc': {
@@ -17359,7 +19144,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['longwood']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.7178,
+    longitude: -81.3081,
+    geocodePrecision: 'city'
   },
 
   'maxxim-construction-rfg-llc': {
@@ -17384,7 +19172,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['fleming-island']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 29.9012,
+    longitude: -81.3124,
+    geocodePrecision: 'county'
   },
 
   'metal-roofing-of-florida-llc': {
@@ -17435,7 +19226,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['gainesville']
   },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 29.6516,
+    longitude: -82.3248,
+    geocodePrecision: 'city'
   },
 
   'story-roofing-llc': {
@@ -17461,7 +19255,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['st-cloud']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.3056,
+    longitude: -81.4165,
+    geocodePrecision: 'city'
   },
 
   'price-construction-roofing-inc': {
@@ -17485,7 +19282,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['bartow']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 28.0406,
+    longitude: -81.9498,
+    geocodePrecision: 'city'
   },
 
   'professional-roof-technology-llc': {
@@ -17517,7 +19317,10 @@ export const rooferData: Record<string, RooferData | any> = {
       cities: ['gulfport']
     },
     isPreferred: false,
-    isHidden: false
+    isHidden: false,
+    latitude: 27.8961,
+    longitude: -82.7412,
+    geocodePrecision: 'city'
   },
   '1-roof-llc': {
     id: '2',
@@ -17622,7 +19425,12 @@ export const rooferData: Record<string, RooferData | any> = {
     // Special programs
     specialPrograms: [
       'Refer a friend, earn $200',
-    ]
+    ],
+    latitude: 29.9012,
+    longitude: -81.3124,
+    ratingScore: 4.676,
+    ratingCount: 30,
+    geocodePrecision: 'county'
   },
   '360-degreez-consulting-llc': {
     id: '3',
@@ -17678,7 +19486,13 @@ export const rooferData: Record<string, RooferData | any> = {
       'Florida Certified Roofing Contractor',
     ],
     isPreferred: false,
-    isHidden: false, category: "sponsored" }
+    isHidden: false, category: "sponsored",
+    latitude: 29.6516,
+    longitude: -82.3248,
+    ratingScore: 4.549,
+    ratingCount: 3,
+    geocodePrecision: 'city'
+  }
   };
 
 // Helper to get all roofers
@@ -17827,6 +19641,11 @@ export function getRoofersByServiceArea(
     if (a.sortOverride !== undefined) return -1;
     if (b.sortOverride !== undefined) return 1;
     
+    // Then by rating score, highest first (unscored roofers last)
+    const scoreA = a.ratingScore ?? 0;
+    const scoreB = b.ratingScore ?? 0;
+    if (scoreA !== scoreB) return scoreB - scoreA;
+    
     // Finally by name
     return a.name.localeCompare(b.name);
   });
@@ -22,7 +22,9 @@ import { batchGeocode, type Coordinates } from '@/lib/geocoding';
 import { getCountyCoordinates } from '@/lib/county-coordinates';
 import { getRegionCoordinates } from '@/lib/region-coordinates';
 import { getRooferFastCoordinates, getFastCoordinates } from '@/lib/fast-coordinates';
-import { searchData } from '@/app/service-areas/data/search-data';
+import { loadClusterIndex, type ClusterIndex } from '@/lib/map-clusters';
+import { searchPlaces, useSearchIndex } from '@/lib/search-index';
+import { searchData, type SearchResult } from '@/app/service-areas/data/search-data';
 import { getCitiesForCounty, createCitySlug } from '@/app/service-areas/data/cities';
 
 // Dynamically import Leaflet components to avoid SSR issues
@@ -58,6 +60,10 @@ const ScaleControl = dynamic(
   () => import('react-leaflet').then((mod) => mod.ScaleControl),
   { ssr: false }
 );
+const RooferClusterLayer = dynamic(
+  () => import('@/components/RooferClusterLayer'),
+  { ssr: false }
+);
 
 // Import Leaflet CSS
 import 'leaflet/dist/leaflet.css';
@@ -405,11 +411,14 @@ function RoofersMapPageContent() {
   const [selectedCity, setSelectedCity] = useState<string | null>(null);
   const [mapZoom, setMapZoom] = useState(7);
   const [currentZoom, setCurrentZoom] = useState(7);
+  // Precomputed marker clusters (undefined while loading, null if not built)
+  const [clusterIndex, setClusterIndex] = useState<ClusterIndex | null | undefined>(undefined);
   const mapRef = useRef<any>(null);
   
   // Search and filter state
   const [searchQuery, setSearchQuery] = useState('');
   const [searchResults, setSearchResults] = useState<typeof searchData>([]);
+  const placeIndex = useSearchIndex<SearchResult>('places');
   const [selectedLocation, setSelectedLocation] = useState<typeof searchData[0] | null>(null);
   const [isSearchOpen, setIsSearchOpen] = useState(false);
   const [rooferFilter, setRooferFilter] = useState<'all' | 'preferred'>('all');
@@ -450,6 +459,13 @@ function RoofersMapPageContent() {
     }
   }, []);
 
+  useEffect(() => {
+    loadClusterIndex().then(setClusterIndex);
+  }, []);
+
+  // Statewide individual markers come from the precomputed cluster tiles
+  const useClusterTiles = showIndividualMarkers && !selectedCounty && !selectedCity && !!clusterIndex;
+
   // Load regions and counties immediately (no geocoding needed)
   useEffect(() => {
     const loadRegionsAndCounties = () => {
@@ -600,6 +616,9 @@ function RoofersMapPageContent() {
     if (!showIndividualMarkers && !selectedCounty && !selectedCity) {
       return; // Don't geocode if not showing individual markers
     }
+    if (!selectedCounty && !selectedCity && clusterIndex !== null) {
+      return; // Statewide view uses the cluster tiles (or waits for the index to load)
+    }
 
     const loadIndividualMarkers = async () => {
       try {
@@ -724,21 +743,18 @@ function RoofersMapPageContent() {
     };
 
     loadIndividualMarkers();
-  }, [showIndividualMarkers, selectedRegion, selectedCounty, selectedCity, rooferFilter, roofers]);
+  }, [showIndividualMarkers, selectedRegion, selectedCounty, selectedCity, rooferFilter, roofers, clusterIndex]);
 
   // Search functionality
   useEffect(() => {
     if (searchQuery.trim().length > 0) {
-      const filtered = searchData.filter(item =>
-        item.name.toLowerCase().includes(searchQuery.toLowerCase())
-      ).slice(0, 10);
-      setSearchResults(filtered);
+      setSearchResults(searchPlaces(placeIndex, searchQuery));
       setIsSearchOpen(true);
     } else {
       setSearchResults([]);
       setIsSearchOpen(false);
     }
-  }, [searchQuery]);
+  }, [searchQuery, placeIndex]);
 
   // Handle click outside search dropdown
   useEffect(() => {
@@ -1761,7 +1777,12 @@ function RoofersMapPageContent() {
             })}
             
             {/* Level 4: Individual roofer markers — show when Preferred Contractors filter or after drilling to city/county */}
-            {(showIndividualMarkers || rooferFilter === 'preferred') && leafletLoaded && roofersWithCoords
+            {/* Statewide: clustered markers loaded per viewport from precomputed tiles */}
+            {useClusterTiles && leafletLoaded && clusterIndex && (
+              <RooferClusterLayer leaflet={leafletLoaded} index={clusterIndex} layer={rooferFilter} />
+            )}
+
+            {(showIndividualMarkers || rooferFilter === 'preferred') && !useClusterTiles && leafletLoaded && roofersWithCoords
               .filter((roofer): roofer is typeof roofer & { coordinates: NonNullable<typeof roofer.coordinates> } => {
                 // Filter by selected city or county
                 if (!roofer.coordinates) return false;
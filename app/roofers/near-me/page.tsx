@@ -23,6 +23,7 @@ import {
 import { searchData } from '@/app/service-areas/data/search-data';
 import { getRooferFastCoordinates } from '@/lib/fast-coordinates';
 import type { Coordinates } from '@/lib/geocoding';
+import { loadNearMeLookups, getNearMeCandidates, type NearMeLookup } from '@/lib/near-me-lookup';
 import FavoriteButton from '@/components/FavoriteButton';
 
 // Region mapping for display
@@ -300,6 +301,12 @@ export default function NearMePage() {
   const [userCoords, setUserCoords] = useState<Coordinates | null>(null);
   const [locationLabel, setLocationLabel] = useState<string | null>(null);
   const [errorMessage, setErrorMessage] = useState<string | null>(null);
+  const [lookups, setLookups] = useState<NearMeLookup[] | null>(null);
+
+  // Precomputed nearest-roofer tables (falls back to a full scan if missing)
+  useEffect(() => {
+    loadNearMeLookups().then(setLookups);
+  }, []);
 
   useEffect(() => {
     if (typeof window === 'undefined' || !navigator.geolocation) {
@@ -339,8 +346,16 @@ export default function NearMePage() {
       return { nearestRoofers: [], distances: new Map<string, number>() };
     }
 
+    // Only rank the precomputed neighbours of the closest city/ZIP when available
+    let candidates = all;
+    const nearby = lookups ? getNearMeCandidates(lookups, userCoords) : null;
+    if (nearby) {
+      const ids = new Set([...nearby.preferred, ...nearby.sponsored, ...nearby.general]);
+      candidates = all.filter((roofer) => ids.has(roofer.id));
+    }
+
     const withDistance: Array<{ roofer: RooferData; distance: number }> = [];
-    for (const roofer of all) {
+    for (const roofer of candidates) {
       const coords = getRooferFastCoordinates(roofer);
       if (!coords) continue;
       const dist = distanceMiles(
@@ -371,7 +386,7 @@ export default function NearMePage() {
       nearestRoofers: combined.map((x) => x.roofer),
       distances: distMap,
     };
-  }, [userCoords]);
+  }, [userCoords, lookups]);
 
   return (
     <div className="min-h-screen bg-white">
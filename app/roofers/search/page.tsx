@@ -17,6 +17,7 @@ import {
 } from '@fortawesome/free-solid-svg-icons';
 import { getAllRoofers, getPreferredRoofers, getSponsoredRoofers, type RooferData } from '../data/roofers';
 import { searchData } from '@/app/service-areas/data/search-data';
+import { searchIndex, useSearchIndex, type RooferSearchDoc } from '@/lib/search-index';
 
 const regionNames: Record<string, string> = {
   'sun-coast': 'Sun Coast',
@@ -77,11 +78,20 @@ function SearchRoofersContent() {
 
   const allRoofers = useMemo(() => getAllRoofers(), []);
 
+  const rooferIndex = useSearchIndex<RooferSearchDoc>('roofers');
+  const rooferById = useMemo(() => new Map(allRoofers.map((roofer) => [String(roofer.id), roofer])), [allRoofers]);
+
   const filteredRoofers = useMemo(() => {
     const q = query.trim().toLowerCase();
     if (!q) return [];
+    if (rooferIndex) {
+      // Ranked by name, location, service areas, specialties and ZIP
+      return searchIndex(rooferIndex, q, rooferIndex.docs.length)
+        .map((doc) => rooferById.get(doc.id))
+        .filter((roofer): roofer is RooferData => roofer !== undefined);
+    }
     return allRoofers.filter((roofer) => roofer.name.toLowerCase().includes(q));
-  }, [allRoofers, query]);
+  }, [allRoofers, rooferById, rooferIndex, query]);
 
   const handleSearch = (e: React.FormEvent) => {
     e.preventDefault();
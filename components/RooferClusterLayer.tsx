@@ -0,0 +1,140 @@
+'use client';
+
+import { useEffect } from 'react';
+import { useMap } from 'react-leaflet';
+import {
+  isCluster,
+  loadClusterTiles,
+  type ClusterFeature,
+  type ClusterIndex,
+  type MapFeature,
+  type RooferMarkerFeature,
+} from '@/lib/map-clusters';
+
+interface RooferClusterLayerProps {
+  leaflet: any;
+  index: ClusterIndex;
+  layer: 'all' | 'preferred';
+}
+
+function escapeHtml(text: string): string {
+  return text
+    .replace(/&/g, '&amp;')
+    .replace(/</g, '&lt;')
+    .replace(/>/g, '&gt;')
+    .replace(/"/g, '&quot;');
+}
+
+function rooferLink(roofer: RooferMarkerFeature): string {
+  const badge = roofer.preferred ? ' <span style="color:#1e4a87;font-weight:600">(Preferred)</span>' : '';
+  return `<a href="/roofers/${encodeURIComponent(roofer.slug)}" style="color:#255eab">${escapeHtml(roofer.name)}</a>${badge}`;
+}
+
+function createRooferMarker(leaflet: any, roofer: RooferMarkerFeature) {
+  const size = roofer.preferred ? 30 : 25;
+  const icon = leaflet.divIcon({
+    className: 'custom-marker',
+    html: `<div style="
+      background-color: ${roofer.preferred ? '#1e4a87' : '#255eab'};
+      width: ${size}px;
+      height: ${size}px;
+      border-radius: 50% 50% 50% 0;
+      transform: rotate(-45deg);
+      border: ${roofer.preferred ? 3 : 2}px solid white;
+      box-shadow: 0 2px 8px rgba(37, 94, 171, 0.4);
+    "></div>`,
+    iconSize: [size, size],
+    iconAnchor: [size / 2, size],
+  });
+  return leaflet
+    .marker([roofer.lat, roofer.lng], { icon })
+    .bindTooltip(escapeHtml(roofer.name), { direction: 'top', offset: [0, -size] })
+    .bindPopup(`<div style="min-width:200px">${rooferLink(roofer)}</div>`);
+}
+
+function createClusterMarker(leaflet: any, map: any, cluster: ClusterFeature, maxZoom: number) {
+  const size = cluster.count >= 100 ? 52 : cluster.count >= 10 ? 44 : 36;
+  const icon = leaflet.divIcon({
+    className: 'custom-marker',
+    html: `<div style="
+      background-color: ${cluster.preferred > 0 ? '#1e4a87' : '#255eab'};
+      width: ${size}px;
+      height: ${size}px;
+      border-radius: 50%;
+      border: 3px solid white;
+      box-shadow: 0 2px 8px rgba(37, 94, 171, 0.4);
+      color: white;
+      font-weight: 700;
+      font-size: 14px;
+      display: flex;
+      align-items: center;
+      justify-content: center;
+    ">${cluster.count}</div>`,
+    iconSize: [size, size],
+    iconAnchor: [size / 2, size / 2],
+  });
+  const marker = leaflet.marker([cluster.lat, cluster.lng], { icon });
+
+  if (cluster.members && cluster.expand > maxZoom) {
+    // Roofers at the same spot never separate; list them instead of zooming
+    const items = cluster.members.map((roofer) => `<li style="margin:2px 0">${rooferLink(roofer)}</li>`).join('');
+    marker.bindPopup(
+      `<div style="max-height:240px;overflow-y:auto;min-width:220px">
+        <div style="font-weight:600;margin-bottom:4px">${cluster.count} roofers</div>
+        <ul style="margin:0;padding-left:16px">${items}</ul>
+      </div>`
+    );
+  } else {
+    marker.on('click', () => {
+      map.setView([cluster.lat, cluster.lng], Math.min(cluster.expand, map.getMaxZoom()));
+    });
+  }
+  return marker;
+}
+
+/**
+ * Roofer markers and clusters loaded per viewport from precomputed tiles
+ * Must be rendered inside a react-leaflet MapContainer
+ */
+export default function RooferClusterLayer({ leaflet, index, layer }: RooferClusterLayerProps) {
+  const map = useMap();
+
+  useEffect(() => {
+    if (!leaflet) return;
+    const group = leaflet.layerGroup().addTo(map);
+    let latestRequest = 0;
+    let active = true;
+
+    const render = async () => {
+      const request = ++latestRequest;
+      const bounds = map.getBounds();
+      const features: MapFeature[] = await loadClusterTiles(index, layer, map.getZoom(), {
+        north: bounds.getNorth(),
+        south: bounds.getSouth(),
+        east: bounds.getEast(),
+        west: bounds.getWest(),
+      });
+      // Skip stale responses after the map has moved again
+      if (!active || request !== latestRequest) return;
+
+      group.clearLayers();
+      features.forEach((feature) => {
+        group.addLayer(
+          isCluster(feature)
+            ? createClusterMarker(leaflet, map, feature, index.maxZoom)
+            : createRooferMarker(leaflet, feature)
+        );
+      });
+    };
+
+    render();
+    map.on('moveend', render);
+    return () => {
+      active = false;
+      map.off('moveend', render);
+      group.remove();
+    };
+  }, [map, leaflet, index, layer]);
+
+  return null;
+}
@@ -35,6 +35,9 @@ interface RooferLocationMapProps {
     city?: string;
     state?: string;
     zipCode?: string;
+    latitude?: number;
+    longitude?: number;
+    geocodePrecision?: string;
   };
 }
 
@@ -70,7 +73,20 @@ export default function RooferLocationMap({ roofer }: RooferLocationMapProps) {
   // Geocode the roofer's address
   useEffect(() => {
     const loadCoordinates = async () => {
+      const storedCoords = typeof roofer.latitude === 'number' && typeof roofer.longitude === 'number'
+        ? { lat: roofer.latitude, lng: roofer.longitude }
+        : null;
+
+      // Coordinates the data pipeline geocoded from the street address need no lookup;
+      // city and county centers are only a fallback for the lookups below
+      if (storedCoords && roofer.geocodePrecision === 'address') {
+        setCoordinates(storedCoords);
+        setLoading(false);
+        return;
+      }
+
       if (!roofer.address && !roofer.city) {
+        setCoordinates(storedCoords);
         setLoading(false);
         return;
       }
@@ -98,18 +114,17 @@ export default function RooferLocationMap({ roofer }: RooferLocationMapProps) {
           roofer.zipCode
         );
 
-        if (result.coordinates) {
-          setCoordinates(result.coordinates);
-        }
+        setCoordinates(result.coordinates ?? storedCoords);
       } catch (error) {
         console.error('Error geocoding roofer address:', error);
+        setCoordinates(storedCoords);
       } finally {
         setLoading(false);
       }
     };
 
     loadCoordinates();
-  }, [roofer.address, roofer.city, roofer.state, roofer.zipCode]);
+  }, [roofer.address, roofer.city, roofer.state, roofer.zipCode, roofer.latitude, roofer.longitude, roofer.geocodePrecision]);
 
   // Build full address string for directions
   const fullAddress = [
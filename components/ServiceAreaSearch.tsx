@@ -4,7 +4,8 @@ import { useState, useRef, useEffect } from 'react';
 import Link from 'next/link';
 import { FontAwesomeIcon } from '@fortawesome/react-fontawesome';
 import { faSearch, faMapLocationDot, faTimes } from '@fortawesome/free-solid-svg-icons';
-import { searchData, type SearchResult } from '@/app/service-areas/data/search-data';
+import { type SearchResult } from '@/app/service-areas/data/search-data';
+import { searchPlaces, useSearchIndex } from '@/lib/search-index';
 
 interface ServiceAreaSearchProps {
   variant?: 'sticky' | 'hero';
@@ -17,19 +18,17 @@ export default function ServiceAreaSearch({ variant = 'sticky', className = '' }
   const [isOpen, setIsOpen] = useState(false);
   const searchRef = useRef<HTMLDivElement>(null);
   const inputRef = useRef<HTMLInputElement>(null);
+  const placeIndex = useSearchIndex<SearchResult>('places');
 
   useEffect(() => {
     if (query.trim().length > 0) {
-      const filtered = searchData.filter(item =>
-        item.name.toLowerCase().includes(query.toLowerCase())
-      ).slice(0, 10);
-      setResults(filtered);
+      setResults(searchPlaces(placeIndex, query));
       setIsOpen(true);
     } else {
       setResults([]);
       setIsOpen(false);
     }
-  }, [query]);
+  }, [query, placeIndex]);
 
   useEffect(() => {
     function handleClickOutside(event: MouseEvent) {
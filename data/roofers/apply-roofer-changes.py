@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Apply the change set from convert-excel.py to app/roofers/data/roofers.ts
+Updated spreadsheet rows patch the matching roofer's contact fields, new rows
+are appended and deleted rows are hidden. Untouched roofers (and everything
+added by hand, like aboutText or reviews) are left exactly as they are.
+Once roofers.ts is written the import state is saved, so the next
+convert-excel.py run only reports rows changed after this one.
+
+Usage:
+  python3 apply-roofer-changes.py
+  python3 apply-roofer-changes.py --dry-run
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'scripts'))
+
+from roofer_pipeline import metrics
+from roofer_pipeline.ingest import CHANGES_FILE, IMPORT_STATE_FILE, apply_changes
+from roofer_pipeline.paths import ROOFERS_TS
+
+
+def main():
+    metrics.start_run()
+    parser = argparse.ArgumentParser(description='Apply roofers-changes.json to roofers.ts')
+    parser.add_argument('--changes', type=Path, default=CHANGES_FILE)
+    parser.add_argument('--file', type=Path, default=ROOFERS_TS)
+    parser.add_argument('--state', type=Path, default=IMPORT_STATE_FILE,
+                        help='Where to record the applied import (read by convert-excel.py)')
+    parser.add_argument('--dry-run', action='store_true')
+    args = parser.parse_args()
+
+    if not args.changes.exists():
+        print(f"Error: {args.changes} not found")
+        print("   Run: python3 data/roofers/convert-excel.py first")
+        sys.exit(1)
+
+    with open(args.changes, 'r', encoding='utf-8') as f:
+        changes = json.load(f)
+
+    result = apply_changes(changes, args.file, dry_run=args.dry_run, state_file=args.state)
+
+    for slug in result.inserted:
+        print(f"  ➕ Added: {slug}")
+    for slug in result.updated:
+        print(f"  ✏️  Updated: {slug}")
+    for slug in result.hidden:
+        print(f"  🙈 Hidden (removed from spreadsheet): {slug}")
+
+    print(f"\n✅ {len(result.inserted)} added, {len(result.updated)} updated, "
+          f"{len(result.hidden)} hidden, {len(result.skipped)} already up to date")
+    if result.inserted:
+        print("\n💡 New roofers have empty service areas. Run:")
+        print("   python3 scripts/assign-service-areas-by-zip.py")
+    if args.dry_run:
+        print("\n(dry run - roofers.ts was not modified)")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,69 +1,73 @@
 #!/usr/bin/env python3
 """
-Convert Excel roofer data to JSON format
-Requires: pip install pandas openpyxl
+Convert Excel roofer data to JSON format, capturing what changed since the last import
+Streams ROOFERS LIST FINAL.xlsx row by row, hashes each normalized row and
+compares it with the hashes saved by the last applied import. Only inserted,
+updated and deleted rows are written to roofers-changes.json for the next
+stage (apply-roofer-changes.py), which saves the new hashes once it has
+applied them; until then, re-running this script reports the same changes.
+roofers-data.json is still refreshed for the older scripts that read the
+whole list.
+
+Usage:
+  python3 convert-excel.py            # incremental import
+  python3 convert-excel.py --full     # report every row as inserted
+Requires: pip install openpyxl
 """
 
-import json
+import argparse
 import sys
 from pathlib import Path
 
-try:
-    import pandas as pd
-except ImportError:
-    print("Error: pandas is not installed.")
-    print("Install it with: pip install pandas openpyxl")
-    sys.exit(1)
-
-# Path to Excel file
-excel_file = Path(__file__).parent / "ROOFERS LIST FINAL.xlsx"
-output_json = Path(__file__).parent / "roofers-data.json"
-
-if not excel_file.exists():
-    print(f"Error: {excel_file} not found")
-    sys.exit(1)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'scripts'))
 
 try:
-    # Read Excel file
-    print(f"Reading {excel_file}...")
-    df = pd.read_excel(excel_file)
-    
-    # Show column names
-    print("\nColumns found in Excel file:")
-    for i, col in enumerate(df.columns, 1):
-        print(f"  {i}. {col}")
-    
-    # Show first few rows
-    print("\nFirst 3 rows:")
-    print(df.head(3).to_string())
-    
-    # Convert to JSON
-    records = df.to_dict('records')
-    
-    # Save to JSON
-    with open(output_json, 'w', encoding='utf-8') as f:
-        json.dump(records, f, indent=2, ensure_ascii=False, default=str)
-    
-    print(f"\n✓ Converted {len(records)} roofers to {output_json}")
-    print(f"\nNext step: Review the JSON file and let me know the column mapping.")
-    
-except Exception as e:
-    print(f"Error: {e}")
+    import openpyxl  # noqa: F401
+except ImportError:
+    print("Error: openpyxl is not installed.")
+    print("Install it with: pip install openpyxl")
     sys.exit(1)
 
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
+from roofer_pipeline import metrics
+from roofer_pipeline.ingest import CHANGES_FILE, IMPORT_STATE_FILE, ingest_excel
+from roofer_pipeline.paths import EXCEL_FILE, ROOFERS_JSON
+
+
+def main():
+    metrics.start_run()
+    parser = argparse.ArgumentParser(description='Import ROOFERS LIST FINAL.xlsx and capture changes')
+    parser.add_argument('--excel', type=Path, default=EXCEL_FILE)
+    parser.add_argument('--sheet', help='Worksheet name (defaults to the first sheet)')
+    parser.add_argument('--full', action='store_true', help='Ignore the previous import and emit every row')
+    parser.add_argument('--changes', type=Path, default=CHANGES_FILE)
+    parser.add_argument('--state', type=Path, default=IMPORT_STATE_FILE)
+    parser.add_argument('--output', type=Path, default=ROOFERS_JSON, help='Full JSON snapshot')
+    args = parser.parse_args()
+
+    if not args.excel.exists():
+        print(f"Error: {args.excel} not found")
+        sys.exit(1)
+
+    try:
+        print(f"Reading {args.excel}...")
+        changes = ingest_excel(args.excel, args.state, args.changes, args.output,
+                               sheet=args.sheet, full=args.full)
+    except Exception as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    print(f"\n✓ Inserted: {len(changes.inserted)}")
+    print(f"✓ Updated:  {len(changes.updated)}")
+    print(f"✓ Deleted:  {len(changes.deleted)}")
+    print(f"  Unchanged: {changes.unchanged}")
+
+    if changes:
+        print(f"\nChanges saved to: {args.changes}")
+        print(f"Snapshot saved to: {args.output}")
+        print(f"\nNext step: python3 data/roofers/apply-roofer-changes.py")
+    else:
+        print("\nNo changes since the last import - nothing to do downstream.")
+
+
+if __name__ == '__main__':
+    main()
@@ -5,6 +5,7 @@ Then analyzes reviews automatically
 """
 
 import json
+import sys
 import time
 import re
 from pathlib import Path
@@ -12,12 +13,19 @@ from typing import Dict, List, Optional
 import requests
 from bs4 import BeautifulSoup
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'scripts'))
+
+from roofer_pipeline import metrics
+from roofer_pipeline.http_client import session
+from roofer_pipeline.review_dedupe import ReviewIndex
+
 OUTPUT_FILE = Path(__file__).parent / "yelp-reviews-analysis.json"
 INPUT_FILE = Path(__file__).parent / "roofers-data.json"
 
 class YelpManualAnalyzer:
     def __init__(self):
-        self.session = requests.Session()
+        # Paced, retried and circuit-broken per host (roofer_pipeline/http_client.py)
+        self.session = session('yelp')
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
@@ -123,6 +131,7 @@ class YelpManualAnalyzer:
             
             # Extract reviews - look for review text
             reviews = []
+            seen = ReviewIndex(min_words=1)
             
             # Try to find review containers
             review_containers = soup.find_all(['div', 'span', 'p'], 
@@ -146,8 +155,8 @@ class YelpManualAnalyzer:
                             if rating_match:
                                 review_rating = int(rating_match.group(1))
                     
-                    # Avoid duplicates
-                    if not any(r['text'] == text for r in reviews):
+                    # Avoid duplicates (nested containers repeat the same text)
+                    if seen.add(len(reviews), text) is None:
                         reviews.append({
                             'text': text[:500],  # Limit length
                             'rating': review_rating
@@ -339,6 +348,7 @@ class YelpManualAnalyzer:
 
 
 def main():
+    metrics.start_run()
     import argparse
     
     parser = argparse.ArgumentParser(description='Manually enter Yelp URLs and analyze reviews')
@@ -2,21 +2,37 @@
 """
 Find each roofer on Yelp using Yelp Fusion API
 Requires Yelp API credentials (API key)
+
+Roofers are taken from a shared work queue (data/roofers/work-queue.sqlite),
+so several copies can run at once, here or on other machines sharing the
+file, each picking up roofers no other worker has.
+
+Every lookup records the rating and review count it saw. --refresh re-queues
+only the roofers that are due according to how often their numbers have
+changed (see roofer_pipeline/freshness.py), instead of the whole roster.
 """
 
 import json
-import time
+import sys
 import os
 from pathlib import Path
 from typing import Dict, List, Optional
 import requests
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'scripts'))
+
+from roofer_pipeline import metrics
+from roofer_pipeline.freshness import FreshnessSchedule, due_tasks, format_summary
+from roofer_pipeline.http_client import CircuitOpenError, session
+from roofer_pipeline.replay import service_url
+from roofer_pipeline.work_queue import WorkQueue, Worker, roster_tasks
+
 # Configuration
 YELP_API_KEY = os.getenv('YELP_API_KEY')
-YELP_API_BASE = 'https://api.yelp.com/v3'
-DELAY_BETWEEN_REQUESTS = 0.5  # Yelp API allows more frequent requests
+YELP_API_BASE = service_url('https://api.yelp.com/v3')
 OUTPUT_FILE = Path(__file__).parent / "yelp-reviews-analysis-api.json"
-PROGRESS_FILE = Path(__file__).parent / "yelp-progress-api.json"
+QUEUE = 'yelp-api'
+SOURCE = 'yelp'
 
 class YelpAPIAnalyzer:
     def __init__(self, api_key: str = None):
@@ -24,29 +40,14 @@ class YelpAPIAnalyzer:
         if not self.api_key:
             raise ValueError("Yelp API key required. Set YELP_API_KEY environment variable or pass as argument.")
         
-        self.session = requests.Session()
+        # Paced, retried and circuit-broken per host (roofer_pipeline/http_client.py)
+        self.session = session('yelp-fusion')
         self.session.headers.update({
             'Authorization': f'Bearer {self.api_key}'
         })
-        self.results = []
-        self.progress = self.load_progress()
+        self.work_queue = WorkQueue()
+        self.schedule = FreshnessSchedule()
         
-    def load_progress(self) -> Dict:
-        """Load progress from previous run"""
-        if PROGRESS_FILE.exists():
-            try:
-                with open(PROGRESS_FILE, 'r') as f:
-                    return json.load(f)
-            except:
-                return {'processed': [], 'last_index': 0}
-        return {'processed': [], 'last_index': 0}
-    
-    def save_progress(self, index: int):
-        """Save progress"""
-        self.progress['last_index'] = index
-        with open(PROGRESS_FILE, 'w') as f:
-            json.dump(self.progress, f, indent=2)
-    
     def search_business(self, name: str, city: str = None, state: str = "FL") -> Optional[Dict]:
         """Search for business using Yelp API"""
         url = f"{YELP_API_BASE}/businesses/search"
@@ -70,11 +71,12 @@ class YelpAPIAnalyzer:
             
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 429:
-                print("  Rate limit exceeded. Waiting 60 seconds...")
-                time.sleep(60)
-                return self.search_business(name, city, state)
+                # Still throttled after the session's retries: fail the task so the queue retries it later
+                raise
             print(f"  API Error: {e}")
             return None
+        except CircuitOpenError:
+            raise
         except Exception as e:
             print(f"  Error searching: {e}")
             return None
@@ -100,6 +102,8 @@ class YelpAPIAnalyzer:
             response.raise_for_status()
             data = response.json()
             return data.get('reviews', [])
+        except CircuitOpenError:
+            raise
         except Exception as e:
             print(f"  Error getting reviews: {e}")
             return []
@@ -211,13 +215,11 @@ class YelpAPIAnalyzer:
         else:
             print(f"  Not found on Yelp")
         
-        # Delay to avoid rate limiting
-        time.sleep(DELAY_BETWEEN_REQUESTS)
-        
         return result
     
-    def run(self, limit: Optional[int] = None):
-        """Run the analysis for all roofers"""
+    def run(self, limit: Optional[int] = None, worker_id: Optional[str] = None,
+            refresh: bool = False, budget: Optional[int] = None):
+        """Work through the shared queue of roofers; run several copies to split the roster"""
         data_file = Path(__file__).parent / "roofers-data.json"
         
         if not data_file.exists():
@@ -227,69 +229,77 @@ class YelpAPIAnalyzer:
         with open(data_file, 'r') as f:
             roofers = json.load(f)
         
-        total = len(roofers)
-        if limit:
-            total = min(limit, total)
-            roofers = roofers[:limit]
-        
-        print(f"Processing {total} roofers using Yelp API...")
-        print(f"Starting from index {self.progress['last_index']}")
+        tasks = list(roster_tasks(roofers))
+        if refresh:
+            print(format_summary(SOURCE, self.schedule.summary(SOURCE, (key for key, _ in tasks))))
+            added = self.work_queue.requeue(QUEUE, due_tasks(self.schedule, SOURCE, tasks, limit=budget))
+        else:
+            added = self.work_queue.enqueue(QUEUE, tasks)
+        counts = self.work_queue.counts(QUEUE)
+        total = sum(counts.values())
+        print(f"Processing {len(roofers)} roofers using Yelp API...")
+        print(f"Queue '{QUEUE}': {counts['done']} done, {counts['pending']} pending, "
+              f"{counts['leased']} in progress, {counts['failed']} failed "
+              f"({added} {'due for refresh' if refresh else 'new'})")
         
-        start_index = self.progress['last_index']
+        worker = Worker(self.work_queue, QUEUE, worker_id)
+        completed = 0
         
-        for i, roofer in enumerate(roofers[start_index:], start=start_index):
-            # Skip if already processed
-            if i in self.progress.get('processed', []):
-                continue
-            
-            try:
-                result = self.process_roofer(roofer, i, total)
-                self.results.append(result)
-                self.progress['processed'].append(i)
-                self.save_progress(i)
-                
-                # Save intermediate results every 10 roofers
-                if (i + 1) % 10 == 0:
-                    self.save_results()
-                    print(f"\n✓ Saved progress after {i + 1} roofers")
-                    
-            except KeyboardInterrupt:
-                print("\n\nInterrupted by user. Saving progress...")
+        def on_done(task, result):
+            nonlocal completed
+            completed += 1
+            self.schedule.record(SOURCE, task.key, result['star_rating'],
+                                 result['review_count'] if result['yelp_found'] else None)
+            # Save intermediate results every 10 roofers
+            if completed % 10 == 0:
                 self.save_results()
-                break
-            except Exception as e:
-                print(f"\n  Error processing roofer: {e}")
-                continue
+                print(f"\n✓ Saved progress after {completed} roofers")
+        
+        try:
+            handled = worker.run(lambda task: self.process_roofer(task.payload, task.position, total),
+                                 limit=limit, on_done=on_done)
+        except KeyboardInterrupt:
+            print("\n\nInterrupted by user. Saving progress...")
+            handled = None
         
         # Final save
-        self.save_results()
+        results = self.save_results()
         print(f"\n\n✓ Analysis complete! Results saved to {OUTPUT_FILE}")
-        print(f"  Total processed: {len(self.results)}")
-        print(f"  Found on Yelp: {sum(1 for r in self.results if r['yelp_found'])}")
+        if handled:
+            print(f"  This worker: {handled['done']} done, {handled['failed']} failed, {handled['pending']} to retry")
+        print(f"  Total processed: {len(results)}")
+        print(f"  Found on Yelp: {sum(1 for r in results if r['yelp_found'])}")
     
-    def save_results(self):
-        """Save results to JSON file"""
-        with open(OUTPUT_FILE, 'w') as f:
-            json.dump(self.results, f, indent=2)
+    def save_results(self) -> List[Dict]:
+        """Save every worker's results from the queue to the JSON file"""
+        return self.work_queue.export(QUEUE, OUTPUT_FILE, merge_on='name')
 
 
 def main():
     import argparse
+    metrics.start_run()
     
     parser = argparse.ArgumentParser(description='Find roofers on Yelp using API and analyze reviews')
     parser.add_argument('--api-key', help='Yelp API key (or set YELP_API_KEY env var)')
-    parser.add_argument('--limit', type=int, help='Limit number of roofers to process')
+    parser.add_argument('--limit', type=int, help='Process at most this many roofers in this worker')
     parser.add_argument('--reset', action='store_true', help='Reset progress and start from beginning')
+    parser.add_argument('--retry-failed', action='store_true', help='Queue roofers that failed every attempt again')
+    parser.add_argument('--worker-id', help='Name for this worker (default: host:pid)')
+    parser.add_argument('--refresh', action='store_true',
+                        help='Re-queue only roofers that are due for a re-fetch')
+    parser.add_argument('--budget', type=int, help='With --refresh, re-queue at most this many (most overdue first)')
     
     args = parser.parse_args()
     
-    if args.reset and PROGRESS_FILE.exists():
-        PROGRESS_FILE.unlink()
+    if args.reset:
+        WorkQueue().reset(QUEUE)
         print("Progress reset. Starting from beginning.")
+    if args.retry_failed:
+        print(f"Retrying {WorkQueue().retry_failed(QUEUE)} failed roofers.")
     
     try:
         analyzer = YelpAPIAnalyzer(api_key=args.api_key)
-        analyzer.run(limit=args.limit)
+        analyzer.run(limit=args.limit, worker_id=args.worker_id, refresh=args.refresh, budget=args.budget)
     except ValueError as e:
         print(f"Error: {e}")
         print("\nTo get a Yelp API key:")
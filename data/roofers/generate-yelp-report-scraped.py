@@ -8,6 +8,11 @@ import json
 from pathlib import Path
 from typing import Dict, List
 from datetime import datetime
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'scripts'))
+
+from roofer_pipeline import metrics
 
 def generate_report(input_file: str, output_file: str = None):
     """Generate a markdown report from Yelp scraping results"""
@@ -212,6 +217,8 @@ def generate_summary_csv(input_file: str, output_file: str = None):
 
 if __name__ == '__main__':
     import argparse
+
+    metrics.start_run()
     
     parser = argparse.ArgumentParser(description='Generate Yelp scraping analysis report')
     parser.add_argument('input', nargs='?', default='yelp-reviews-analysis.json',
@@ -6,63 +6,70 @@ Maps cities to counties/regions using existing city data from cities.ts
 
 import json
 import re
+import sys
 from pathlib import Path
 
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'scripts'))
+
+from roofer_pipeline import metrics
+from roofer_pipeline.normalize import SHEET_SOURCE_COLUMNS, normalize_frame
+
 # Read the JSON data
 json_file = Path(__file__).parent / "roofers-data.json"
 output_file = Path(__file__).parent.parent.parent / "app/roofers/data/roofers.ts"
 cities_file = Path(__file__).parent.parent.parent / "app/service-areas/data/cities.ts"
 
-with open(json_file, 'r', encoding='utf-8') as f:
-    roofers = json.load(f)
+def read_roofers():
+    """roofers-data.json as one record per row, with the contact columns normalized"""
+    with open(json_file, 'r', encoding='utf-8') as f:
+        roofers = json.load(f)
+    # Normalize the contact columns for the whole sheet at once
+    sheet = normalize_frame(pd.DataFrame(roofers), SHEET_SOURCE_COLUMNS)
+    text_columns = [c for c in ['Name', 'Phone Number', 'Address', 'City', 'State'] if c in sheet]
+    sheet[text_columns] = sheet[text_columns].apply(lambda column: column.astype('string').str.strip())
+    sheet = sheet.astype(object).where(sheet.notna(), None)
+    return sheet.to_dict('records')
 
 # Build city mapping from cities.ts
-city_to_location = {}
+def load_city_mapping():
+    city_to_location = {}
 
-if cities_file.exists():
-    with open(cities_file, 'r', encoding='utf-8') as f:
-        content = f.read()
+    if cities_file.exists():
+        with open(cities_file, 'r', encoding='utf-8') as f:
+            content = f.read()
         
-        # Extract city data using regex
-        # Look for patterns like: 'city-name': { name: 'City Name', countySlug: 'county', regionSlug: 'region' }
-        pattern = r"'([^']+)':\s*\{[^}]*name:\s*'([^']+)'[^}]*countySlug:\s*'([^']+)'[^}]*regionSlug:\s*'([^']+)'"
-        matches = re.finditer(pattern, content, re.DOTALL)
+            # Extract city data using regex
+            # Look for patterns like: 'city-name': { name: 'City Name', countySlug: 'county', regionSlug: 'region' }
+            pattern = r"'([^']+)':\s*\{[^}]*name:\s*'([^']+)'[^}]*countySlug:\s*'([^']+)'[^}]*regionSlug:\s*'([^']+)'"
+            matches = re.finditer(pattern, content, re.DOTALL)
         
-        for match in matches:
-            city_slug = match.group(1)
-            city_name = match.group(2)
-            county_slug = match.group(3)
-            region_slug = match.group(4)
+            for match in matches:
+                city_slug = match.group(1)
+                city_name = match.group(2)
+                county_slug = match.group(3)
+                region_slug = match.group(4)
             
-            # Normalize city name for matching
-            city_normalized = city_name.lower().strip()
-            city_to_location[city_normalized] = {
-                'county': county_slug,
-                'region': region_slug
-            }
+                # Normalize city name for matching
+                city_normalized = city_name.lower().strip()
+                city_to_location[city_normalized] = {
+                    'county': county_slug,
+                    'region': region_slug
+                }
             
-            # Also map by slug
-            city_to_location[city_slug.lower()] = {
-                'county': county_slug,
-                'region': region_slug
-            }
+                # Also map by slug
+                city_to_location[city_slug.lower()] = {
+                    'county': county_slug,
+                    'region': region_slug
+                }
 
-print(f"Loaded {len(city_to_location)} city mappings")
+    return city_to_location
 
 # Helper to create slug
 def create_slug(name):
     return re.sub(r'[^a-z0-9]+', '-', name.lower()).strip('-')
 
-# Helper to safely get string value from dict (handles NaN)
-def safe_str(value, default=''):
-    if value is None:
-        return default
-    if isinstance(value, float):
-        if str(value) == 'nan':
-            return default
-        return str(int(value)) if value == int(value) else str(value)
-    return str(value).strip() if value else default
-
 # Helper to normalize city name for matching
 def normalize_city_name(city):
     if not city:
@@ -138,82 +145,89 @@ def find_service_areas(city_name):
     return {'counties': [], 'regions': [], 'cities': []}
 
 # Convert roofers to TypeScript format
-ts_roofers = {}
-unmapped_cities = set()
-
-for idx, roofer in enumerate(roofers, 1):
-    name = roofer.get('Name', '').strip()
-    if not name:
-        continue
-    
-    slug = create_slug(name)
-    
-    # Ensure unique slug
-    original_slug = slug
-    counter = 1
-    while slug in ts_roofers:
-        slug = f"{original_slug}-{counter}"
-        counter += 1
+def convert_roofers(roofers):
+    ts_roofers = {}
+    unmapped_cities = set()
+
+    for idx, roofer in enumerate(roofers, 1):
+        name = roofer.get('Name') or ''
+        if not name:
+            continue
     
-    # Get service areas based on city
-    city = safe_str(roofer.get('City', ''))
-    service_areas = find_service_areas(city)
+        slug = create_slug(name)
     
-    if not service_areas['counties'] and city:
-        unmapped_cities.add(city)
+        # Ensure unique slug
+        original_slug = slug
+        counter = 1
+        while slug in ts_roofers:
+            slug = f"{original_slug}-{counter}"
+            counter += 1
     
-    # Format website URL
-    website = safe_str(roofer.get('website', ''))
-    if website:
-        website = website.replace('http://', '').replace('https://', '')
-        if website:
-            website = f"https://{website}"
-    else:
-        website = ''
+        # Get service areas based on city
+        city = roofer.get('City') or ''
+        service_areas = find_service_areas(city)
     
-    # Format phone
-    phone = safe_str(roofer.get('Phone Number', ''))
+        if not service_areas['counties'] and city:
+            unmapped_cities.add(city)
     
-    # Format email
-    email = safe_str(roofer.get('Email', ''))
+        website = roofer['website_url']
+        phone = roofer.get('Phone Number')
+        email = roofer['email_norm']
     
-    # Build roofer object
-    roofer_obj = {
-        'id': str(idx),
-        'name': name,
-        'slug': slug,
-        'isPreferred': False,
-        'isHidden': False,
-    }
+        # Build roofer object
+        roofer_obj = {
+            'id': str(idx),
+            'name': name,
+            'slug': slug,
+            'isPreferred': False,
+            'isHidden': False,
+        }
     
-    # Add optional fields only if they have values
-    if phone:
-        roofer_obj['phone'] = phone
-    if email:
-        roofer_obj['email'] = email
-    if website:
-        roofer_obj['websiteUrl'] = website
-    if service_areas['counties'] or service_areas['regions']:
-        roofer_obj['serviceAreas'] = service_areas
-    else:
-        roofer_obj['serviceAreas'] = {'counties': [], 'regions': [], 'cities': []}
+        # Add optional fields only if they have values
+        if phone:
+            roofer_obj['phone'] = phone
+        if email:
+            roofer_obj['email'] = email
+        if website:
+            roofer_obj['websiteUrl'] = website
+        if service_areas['counties'] or service_areas['regions']:
+            roofer_obj['serviceAreas'] = service_areas
+        else:
+            roofer_obj['serviceAreas'] = {'counties': [], 'regions': [], 'cities': []}
     
-    address = safe_str(roofer.get('Address', ''))
-    if address:
-        roofer_obj['address'] = address
+        address = roofer.get('Address')
+        if address:
+            roofer_obj['address'] = address
     
-    if city:
-        roofer_obj['city'] = city
+        if city:
+            roofer_obj['city'] = city
     
-    state = safe_str(roofer.get('State', 'FL'))
-    if state:
-        roofer_obj['state'] = state
+        state = roofer.get('State') or 'FL'
+        if state:
+            roofer_obj['state'] = state
     
-    zip_code = roofer.get('Zip Code', '')
-    if zip_code and not (isinstance(zip_code, float) and str(zip_code) == 'nan'):
-        roofer_obj['zipCode'] = str(int(zip_code)) if isinstance(zip_code, float) and zip_code == int(zip_code) else str(zip_code)
+        zip_code = roofer['zip5']
+        if zip_code:
+            roofer_obj['zipCode'] = zip_code
     
-    ts_roofers[slug] = roofer_obj
+        ts_roofers[slug] = roofer_obj
+
+    return ts_roofers, unmapped_cities
+
+metrics.start_run()
+
+with metrics.stage('read') as stage:
+    roofers = read_roofers()
+    stage.rows = len(roofers)
+
+with metrics.stage('load-cities') as stage:
+    city_to_location = load_city_mapping()
+    stage.rows = len(city_to_location)
+print(f"Loaded {len(city_to_location)} city mappings")
+
+with metrics.stage('convert') as stage:
+    ts_roofers, unmapped_cities = convert_roofers(roofers)
+    stage.rows = len(roofers)
 
 # Generate TypeScript file
 ts_content = '''// Roofer data structure
@@ -364,8 +378,10 @@ export function getRoofersByServiceArea(
 '''
 
 # Write the file
-with open(output_file, 'w', encoding='utf-8') as f:
-    f.write(ts_content)
+with metrics.stage('emit') as stage:
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write(ts_content)
+    stage.rows = len(ts_roofers)
 
 print(f"✓ Imported {len(ts_roofers)} roofers to {output_file}")
 print(f"\nUnmapped cities ({len(unmapped_cities)}):")
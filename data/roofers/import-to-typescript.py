@@ -6,12 +6,19 @@ Maps cities to counties/regions using existing city data
 
 import json
 import re
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'scripts'))
+
+from roofer_pipeline import metrics
+
 # Read the JSON data
 json_file = Path(__file__).parent / "roofers-data.json"
 output_file = Path(__file__).parent.parent.parent / "app/roofers/data/roofers.ts"
 
+metrics.start_run()
+
 with open(json_file, 'r', encoding='utf-8') as f:
     roofers = json.load(f)
 
@@ -7,6 +7,11 @@ Maps Yelp data to roofer IDs and generates TypeScript code
 import json
 from pathlib import Path
 from typing import Dict, List, Optional
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'scripts'))
+
+from roofer_pipeline import metrics
 
 YELP_DATA_FILE = Path(__file__).parent / "yelp-reviews-analysis.json"
 ROOFERS_DATA_FILE = Path(__file__).parent / "roofers-data.json"
@@ -166,6 +171,7 @@ def generate_typescript(yelp_data: List[Dict], roofers_map: Dict) -> str:
 
 def main():
     """Main function"""
+    metrics.start_run()
     if not YELP_DATA_FILE.exists():
         print(f"Error: {YELP_DATA_FILE} not found")
         print("Please run scrape-yelp-reviews.py first to generate Yelp data")
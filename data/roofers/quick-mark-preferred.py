@@ -1,16 +1,22 @@
 #!/usr/bin/env python3
 """
-Quick script to mark specific roofers as preferred by name
+Quick script to mark specific roofers as preferred by name, slug or id
 Usage: python3 quick-mark-preferred.py "Roofer Name 1" "Roofer Name 2" ...
 Or edit the PREFERRED_NAMES list below
 """
 
 import sys
-import re
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'scripts'))
+
+from roofer_pipeline import metrics
+from roofer_pipeline.roofer_index import set_flags
+
 roofers_file = Path(__file__).parent.parent.parent / "app/roofers/data/roofers.ts"
 
+metrics.start_run()
+
 # List of roofer names to mark as preferred
 # Add your roofer names here:
 PREFERRED_NAMES = [
@@ -30,73 +36,23 @@ if not PREFERRED_NAMES:
     print("Or edit the PREFERRED_NAMES list in the script.")
     sys.exit(1)
 
-# Read the TypeScript file
-with open(roofers_file, 'r', encoding='utf-8') as f:
-    content = f.read()
+# Resolve all names through one index and write the file once
+result = set_flags(PREFERRED_NAMES, roofers_file, isPreferred=True)
 
-marked_count = 0
-not_found = []
-
-for name in PREFERRED_NAMES:
-    # Create slug from name
-    slug = re.sub(r'[^a-z0-9]+', '-', name.lower()).strip('-')
-    
-    # Try to find the roofer entry
-    roofer_pattern = f"'{slug}':\\s*\\{{"
-    match = re.search(roofer_pattern, content)
-    
-    if match:
-        # Find the isPreferred field in this roofer's object
-        start = match.end()
-        # Look for "isPreferred": false within the next 2000 characters
-        pref_pattern = r'"isPreferred":\s*false'
-        pref_match = re.search(pref_pattern, content[start:start+2000])
-        
-        if pref_match:
-            pref_pos = start + pref_match.start()
-            # Replace false with true
-            content = content[:pref_pos] + content[pref_pos:].replace('"isPreferred": false', '"isPreferred": true', 1)
-            marked_count += 1
-            print(f"✓ Marked as preferred: {name}")
-        else:
-            # Check if already true
-            pref_true_pattern = r'"isPreferred":\s*true'
-            if re.search(pref_true_pattern, content[start:start+2000]):
-                print(f"⚠ Already marked as preferred: {name}")
-            else:
-                print(f"⚠ Could not find isPreferred field for: {name}")
-                not_found.append(name)
-    else:
-        print(f"✗ Could not find roofer: {name} (slug: {slug})")
-        not_found.append(name)
+for key in result.changed:
+    print(f"✓ Marked as preferred: {key}")
+for key in result.unchanged:
+    print(f"⚠ Already marked as preferred: {key}")
+for name in result.unresolved:
+    print(f"✗ Could not find roofer: {name}")
 
-# Write back to file
-if marked_count > 0:
-    with open(roofers_file, 'w', encoding='utf-8') as f:
-        f.write(content)
-    print(f"\n✓ Successfully marked {marked_count} roofer(s) as preferred")
+if result.changed:
+    print(f"\n✓ Successfully marked {len(result.changed)} roofer(s) as preferred")
     print(f"File updated: {roofers_file}")
     
-    if not_found:
-        print(f"\n⚠ Could not find {len(not_found)} roofer(s):")
-        for name in not_found:
+    if result.unresolved:
+        print(f"\n⚠ Could not find {len(result.unresolved)} roofer(s):")
+        for name in result.unresolved:
             print(f"  - {name}")
 else:
     print("\n⚠ No roofers were marked. Please check the names and try again.")
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
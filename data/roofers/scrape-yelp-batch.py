@@ -6,12 +6,17 @@ You can prepare a CSV file with roofer names and Yelp URLs, then process them al
 
 import json
 import csv
-import time
+import sys
 from pathlib import Path
-from typing import Dict, List, Optional
-import requests
-from bs4 import BeautifulSoup
-import re
+from typing import Dict, Iterable, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'scripts'))
+
+from roofer_pipeline import metrics
+from roofer_pipeline.analysis_cache import AnalysisCache
+from roofer_pipeline.http_client import session
+from roofer_pipeline.reviews import analyze_reviews
+from roofer_pipeline.yelp_pages import fetch_business
 
 OUTPUT_FILE = Path(__file__).parent / "yelp-reviews-analysis.json"
 INPUT_FILE = Path(__file__).parent / "roofers-data.json"
@@ -19,7 +24,8 @@ URLS_FILE = Path(__file__).parent / "yelp-urls.csv"  # Optional: CSV with roofer
 
 class YelpBatchScraper:
     def __init__(self):
-        self.session = requests.Session()
+        # Paced, retried and circuit-broken per host (roofer_pipeline/http_client.py)
+        self.session = session('yelp')
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
@@ -27,6 +33,7 @@ class YelpBatchScraper:
             'Accept-Encoding': 'gzip, deflate, br',
             'Connection': 'keep-alive',
         })
+        self.analysis_cache = AnalysisCache()
         self.results = []
         self.load_existing_results()
         self.url_mapping = self.load_url_mapping()
@@ -58,90 +65,26 @@ class YelpBatchScraper:
         return mapping
     
     def scrape_business_page(self, yelp_url: str) -> Optional[Dict]:
-        """Scrape business information from Yelp page"""
+        """Scrape business information from Yelp page; 'reviews' streams every review page"""
         try:
             print(f"  📥 Fetching: {yelp_url}")
-            response = self.session.get(yelp_url, timeout=15)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Extract star rating
-            rating = None
-            rating_elements = soup.find_all(['div', 'span'], {'aria-label': re.compile(r'(\d+\.?\d*)\s+star', re.I)})
-            for elem in rating_elements:
-                rating_match = re.search(r'(\d+\.?\d*)', elem.get('aria-label', ''))
-                if rating_match:
-                    try:
-                        rating = float(rating_match.group(1))
-                        if 0 <= rating <= 5:
-                            break
-                    except:
-                        continue
-            
-            # Try JSON-LD
-            if not rating:
-                json_scripts = soup.find_all('script', type='application/ld+json')
-                for script in json_scripts:
-                    try:
-                        data = json.loads(script.string)
-                        if isinstance(data, dict) and 'aggregateRating' in data:
-                            rating = float(data['aggregateRating'].get('ratingValue', 0))
-                            break
-                    except:
-                        continue
-            
-            # Extract review count
-            review_count = 0
-            review_count_patterns = [
-                r'(\d+)\s+review',
-                r'(\d+)\s+reviews',
-            ]
-            page_text = soup.get_text()
-            for pattern in review_count_patterns:
-                match = re.search(pattern, page_text, re.I)
-                if match:
-                    try:
-                        review_count = int(match.group(1))
-                        break
-                    except:
-                        continue
-            
-            # Extract reviews (simplified - just get text)
-            reviews = []
-            review_elements = soup.find_all('div', class_=re.compile(r'review|comment', re.I))
-            for review_elem in review_elements[:20]:
-                text = review_elem.get_text(strip=True)
-                if len(text) > 30 and len(text) < 2000:
-                    review_rating = None
-                    rating_elem = review_elem.find(['div', 'span'], {'aria-label': re.compile(r'(\d+)\s+star', re.I)})
-                    if rating_elem:
-                        rating_match = re.search(r'(\d+)', rating_elem.get('aria-label', ''))
-                        if rating_match:
-                            review_rating = int(rating_match.group(1))
-                    
-                    if not any(r['text'] == text for r in reviews):
-                        reviews.append({
-                            'text': text[:1000],
-                            'rating': review_rating
-                        })
-            
-            return {
-                'rating': rating,
-                'review_count': review_count,
-                'reviews': reviews[:20],
-                'url': yelp_url
-            }
-            
+            page = fetch_business(self.session, yelp_url)
         except Exception as e:
             print(f"  ❌ Error: {e}")
             return None
+        
+        if page.pages > 1:
+            print(f"  📚 {page.review_count} reviews on {page.pages} pages")
+        return {
+            'rating': page.rating,
+            'review_count': page.review_count,
+            'reviews': page.reviews,
+            'url': yelp_url
+        }
     
-    def analyze_reviews(self, reviews: List[Dict]) -> Dict:
+    def analyze_reviews(self, reviews: Iterable[Dict], roofer: Optional[str] = None) -> Dict:
         """Analyze reviews and categorize"""
-        from scrape_yelp_reviews import YelpScraper
-        scraper = YelpScraper()
-        return scraper.analyze_reviews(reviews)
+        return analyze_reviews(reviews, cache=self.analysis_cache, roofer=roofer)
     
     def process_roofer(self, roofer: Dict, yelp_url: Optional[str] = None) -> Dict:
         """Process a single roofer"""
@@ -190,19 +133,18 @@ class YelpBatchScraper:
                 result['star_rating'] = business_info.get('rating')
                 result['review_count'] = business_info.get('review_count', 0)
                 
-                reviews = business_info.get('reviews', [])
-                if reviews:
-                    review_analysis = self.analyze_reviews(reviews)
+                # A review set analyzed before comes from the analysis cache
+                review_analysis = self.analyze_reviews(business_info['reviews'], name)
+                if review_analysis['total_analyzed']:
                     result['review_analysis'] = review_analysis
                     result['synopsis'] = review_analysis.get('synopsis')
                     
                     print(f"  ✅ Rating: {result['star_rating']} stars")
-                    print(f"  ✅ Reviews: {result['review_count']} total")
+                    print(f"  ✅ Reviews: {result['review_count']} total, {review_analysis['total_analyzed']} analyzed")
                     print(f"  ✅ Analysis: {len(review_analysis['positive'])} positive, {len(review_analysis['negative'])} negative")
         else:
             print(f"  ⏭️  No Yelp URL provided - skipping")
         
-        time.sleep(1)  # Rate limiting
         return result
     
     def run(self, limit: Optional[int] = None, start_from: int = 0):
@@ -277,6 +219,7 @@ def create_urls_template():
 
 def main():
     import argparse
+    metrics.start_run()
     
     parser = argparse.ArgumentParser(description='Batch scrape Yelp reviews')
     parser.add_argument('--limit', type=int, help='Limit number of roofers')
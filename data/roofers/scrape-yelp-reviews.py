@@ -2,24 +2,45 @@
 """
 Scrape Yelp reviews, analyze them, and generate star ratings, synopsis, and positive/negative sections
 Works without API - uses web scraping
+
+Roofers come from a shared work queue (data/roofers/work-queue.sqlite), so
+progress survives restarts and several people can work through the roster at
+the same time without getting the same roofer.
+
+--refresh re-scrapes roofers whose Yelp URL is already known, but only the
+ones that are due according to how often their rating and review count have
+changed (see roofer_pipeline/freshness.py); no URLs are asked for.
+
+Review analyses are memoized in data/roofers/analysis-cache.sqlite (see
+roofer_pipeline/analysis_cache.py), so a roofer whose reviews have not
+changed is not analyzed again.
 """
 
 import json
-import time
-import re
+import sys
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 import requests
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin, urlparse
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'scripts'))
+
+from roofer_pipeline import metrics
+from roofer_pipeline.analysis_cache import AnalysisCache
+from roofer_pipeline.freshness import FreshnessSchedule, due_tasks, format_summary
+from roofer_pipeline.http_client import session
+from roofer_pipeline.reviews import analyze_reviews
+from roofer_pipeline.work_queue import WorkQueue, Worker, roster_tasks
+from roofer_pipeline.yelp_pages import fetch_business
 
 OUTPUT_FILE = Path(__file__).parent / "yelp-reviews-analysis.json"
 INPUT_FILE = Path(__file__).parent / "roofers-data.json"
-PROGRESS_FILE = Path(__file__).parent / "yelp-scrape-progress.json"
+QUEUE = 'yelp-scrape'
+SOURCE = 'yelp'
 
 class YelpScraper:
     def __init__(self):
-        self.session = requests.Session()
+        # Paced, retried and circuit-broken per host (roofer_pipeline/http_client.py)
+        self.session = session('yelp')
         # Use realistic browser headers
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -33,24 +54,20 @@ class YelpScraper:
             'Sec-Fetch-Site': 'none',
             'Cache-Control': 'max-age=0',
         })
-        self.results = []
-        self.progress = self.load_progress()
-        
-    def load_progress(self) -> Dict:
-        """Load progress from previous run"""
-        if PROGRESS_FILE.exists():
+        self.work_queue = WorkQueue()
+        self.schedule = FreshnessSchedule()
+        self.analysis_cache = AnalysisCache()
+        self.results = self.load_existing_results()
+        
+    def load_existing_results(self) -> List[Dict]:
+        """Results from earlier runs, so roofers already found are not asked for again"""
+        if OUTPUT_FILE.exists():
             try:
-                with open(PROGRESS_FILE, 'r') as f:
+                with open(OUTPUT_FILE, 'r') as f:
                     return json.load(f)
-            except:
-                return {'processed': [], 'last_index': 0}
-        return {'processed': [], 'last_index': 0}
-    
-    def save_progress(self, index: int):
-        """Save progress"""
-        self.progress['last_index'] = index
-        with open(PROGRESS_FILE, 'w') as f:
-            json.dump(self.progress, f, indent=2)
+            except (json.JSONDecodeError, OSError):
+                return []
+        return []
     
     def get_yelp_url_manual(self, roofer_name: str, city: str = None) -> Optional[str]:
         """Prompt user to enter Yelp URL manually"""
@@ -83,279 +100,41 @@ class YelpScraper:
         return url
     
     def scrape_business_page(self, yelp_url: str) -> Optional[Dict]:
-        """Scrape business information and reviews from Yelp page"""
+        """Scrape business information from the Yelp page; 'reviews' streams every review page"""
         try:
             print(f"  📥 Fetching: {yelp_url}")
-            response = self.session.get(yelp_url, timeout=15)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Extract star rating
-            rating = None
-            
-            # Method 1: Look for rating in aria-label
-            rating_elements = soup.find_all(['div', 'span'], {'aria-label': re.compile(r'(\d+\.?\d*)\s+star', re.I)})
-            for elem in rating_elements:
-                rating_match = re.search(r'(\d+\.?\d*)', elem.get('aria-label', ''))
-                if rating_match:
-                    try:
-                        rating = float(rating_match.group(1))
-                        if 0 <= rating <= 5:
-                            break
-                    except:
-                        continue
-            
-            # Method 2: Look in JSON-LD structured data
-            if not rating:
-                json_scripts = soup.find_all('script', type='application/ld+json')
-                for script in json_scripts:
-                    try:
-                        data = json.loads(script.string)
-                        if isinstance(data, dict):
-                            if 'aggregateRating' in data:
-                                rating = float(data['aggregateRating'].get('ratingValue', 0))
-                                break
-                        elif isinstance(data, list):
-                            for item in data:
-                                if isinstance(item, dict) and 'aggregateRating' in item:
-                                    rating = float(item['aggregateRating'].get('ratingValue', 0))
-                                    break
-                    except:
-                        continue
-            
-            # Method 3: Look for rating in text (e.g., "4.5 out of 5")
-            if not rating:
-                rating_text = soup.get_text()
-                rating_match = re.search(r'(\d+\.?\d*)\s*(?:out of|/)\s*5', rating_text, re.I)
-                if rating_match:
-                    try:
-                        rating = float(rating_match.group(1))
-                    except:
-                        pass
-            
-            # Extract review count
-            review_count = 0
-            review_count_patterns = [
-                r'(\d+)\s+review',
-                r'(\d+)\s+reviews',
-                r'reviewCount["\']?\s*:\s*(\d+)',
-            ]
-            
-            page_text = soup.get_text()
-            for pattern in review_count_patterns:
-                match = re.search(pattern, page_text, re.I)
-                if match:
-                    try:
-                        review_count = int(match.group(1))
-                        break
-                    except:
-                        continue
-            
-            # Extract reviews
-            reviews = []
-            
-            # Look for review containers - Yelp uses various class names
-            review_selectors = [
-                {'class': re.compile(r'review', re.I)},
-                {'data-review-id': True},
-                {'itemprop': 'review'},
-            ]
-            
-            for selector in review_selectors:
-                review_elements = soup.find_all('div', selector)
-                for review_elem in review_elements[:30]:  # Limit to 30 potential reviews
-                    # Extract review text
-                    text_elem = review_elem.find('p', class_=re.compile(r'comment|text|review', re.I))
-                    if not text_elem:
-                        text_elem = review_elem.find('span', class_=re.compile(r'comment|text|review', re.I))
-                    if not text_elem:
-                        # Try to get text from the element itself
-                        text_elem = review_elem
-                    
-                    review_text = text_elem.get_text(strip=True) if text_elem else ''
-                    
-                    # Filter for actual review text
-                    if (len(review_text) > 30 and 
-                        len(review_text) < 2000 and
-                        'review' not in review_text.lower()[:15] and
-                        'rating' not in review_text.lower()[:15]):
-                        
-                        # Extract rating from review
-                        review_rating = None
-                        
-                        # Look for rating in aria-label nearby
-                        rating_elem = review_elem.find(['div', 'span'], {'aria-label': re.compile(r'(\d+)\s+star', re.I)})
-                        if rating_elem:
-                            rating_match = re.search(r'(\d+)', rating_elem.get('aria-label', ''))
-                            if rating_match:
-                                review_rating = int(rating_match.group(1))
-                        
-                        # Avoid duplicates
-                        if not any(r['text'] == review_text for r in reviews):
-                            reviews.append({
-                                'text': review_text[:1000],  # Limit length
-                                'rating': review_rating
-                            })
-                
-                if reviews:
-                    break
-            
-            # Limit to 20 reviews
-            reviews = reviews[:20]
-            
-            return {
-                'rating': rating,
-                'review_count': review_count,
-                'reviews': reviews,
-                'url': yelp_url
-            }
-            
+            page = fetch_business(self.session, yelp_url)
         except requests.exceptions.RequestException as e:
             print(f"  ❌ Error fetching page: {e}")
             return None
         except Exception as e:
             print(f"  ❌ Error parsing page: {e}")
             return None
-    
-    def analyze_reviews(self, reviews: List[Dict]) -> Dict:
-        """Analyze reviews and categorize into positive/negative, generate synopsis"""
-        positive_reviews = []
-        negative_reviews = []
-        
-        # Enhanced keyword lists
-        positive_keywords = [
-            'excellent', 'great', 'amazing', 'wonderful', 'fantastic', 'outstanding',
-            'professional', 'quality', 'satisfied', 'happy', 'recommend', 'perfect',
-            'timely', 'clean', 'efficient', 'responsive', 'fair', 'honest', 'reliable',
-            'exceeded', 'pleased', 'impressed', 'awesome', 'terrific', 'superb',
-            'expert', 'skilled', 'knowledgeable', 'courteous', 'polite', 'helpful',
-            'thorough', 'complete', 'well done', 'top notch', 'best', 'love'
-        ]
-        
-        negative_keywords = [
-            'poor', 'terrible', 'awful', 'horrible', 'disappointed', 'unprofessional',
-            'delayed', 'messy', 'unresponsive', 'overpriced', 'shoddy', 'incomplete',
-            'rude', 'unreliable', 'problem', 'issue', 'complaint', 'unsatisfied',
-            'worst', 'bad', 'avoid', 'waste', 'ripoff', 'scam', 'incompetent',
-            'slow', 'late', 'damage', 'broken', 'failed', 'mistake', 'error',
-            'unhappy', 'frustrated', 'angry', 'disgusted'
-        ]
-        
-        all_positive_scores = []
-        all_negative_scores = []
-        
-        for review in reviews:
-            text = review.get('text', '').lower()
-            rating = review.get('rating')
-            
-            # Count keyword matches
-            positive_score = sum(1 for keyword in positive_keywords if keyword in text)
-            negative_score = sum(1 for keyword in negative_keywords if keyword in text)
-            
-            all_positive_scores.append(positive_score)
-            all_negative_scores.append(negative_score)
-            
-            # Determine sentiment
-            if rating is not None:
-                is_positive = rating >= 4
-            else:
-                is_positive = positive_score > negative_score or (positive_score == negative_score and positive_score > 0)
-            
-            review_data = {
-                'text': review.get('text', ''),
-                'rating': rating,
-                'sentiment_score': positive_score - negative_score
-            }
-            
-            if is_positive:
-                positive_reviews.append(review_data)
-            else:
-                negative_reviews.append(review_data)
-        
-        # Generate synopsis
-        synopsis = self.generate_synopsis(reviews, positive_reviews, negative_reviews, all_positive_scores, all_negative_scores)
         
+        if page.pages > 1:
+            print(f"  📚 {page.review_count} reviews on {page.pages} pages")
         return {
-            'positive': positive_reviews,
-            'negative': negative_reviews,
-            'total_analyzed': len(reviews),
-            'synopsis': synopsis
+            'rating': page.rating,
+            'review_count': page.review_count,
+            'reviews': page.reviews,
+            'url': yelp_url
         }
     
-    def generate_synopsis(self, reviews: List[Dict], positive: List[Dict], 
-                         negative: List[Dict], pos_scores: List[int], 
-                         neg_scores: List[int]) -> str:
-        """Generate a synopsis of the reviews"""
-        if not reviews:
-            return "No reviews available for analysis."
-        
-        total_reviews = len(reviews)
-        positive_count = len(positive)
-        negative_count = len(negative)
-        positive_pct = (positive_count / total_reviews * 100) if total_reviews > 0 else 0
-        
-        # Calculate average sentiment
-        avg_sentiment = (sum(pos_scores) - sum(neg_scores)) / total_reviews if total_reviews > 0 else 0
-        
-        # Common themes
-        themes = []
-        all_text = ' '.join([r.get('text', '').lower() for r in reviews])
-        
-        if any(word in all_text for word in ['professional', 'expert', 'skilled']):
-            themes.append('professionalism')
-        if any(word in all_text for word in ['timely', 'on time', 'schedule']):
-            themes.append('punctuality')
-        if any(word in all_text for word in ['clean', 'cleanup', 'mess']):
-            themes.append('cleanliness')
-        if any(word in all_text for word in ['price', 'cost', 'affordable', 'expensive']):
-            themes.append('pricing')
-        if any(word in all_text for word in ['communication', 'responsive', 'contact']):
-            themes.append('communication')
-        if any(word in all_text for word in ['quality', 'workmanship', 'craftsmanship']):
-            themes.append('work quality')
-        
-        # Build synopsis
-        synopsis_parts = []
-        
-        if positive_pct >= 80:
-            synopsis_parts.append(f"Highly rated with {positive_pct:.0f}% positive reviews.")
-        elif positive_pct >= 60:
-            synopsis_parts.append(f"Generally positive with {positive_pct:.0f}% positive reviews.")
-        elif positive_pct >= 40:
-            synopsis_parts.append(f"Mixed reviews with {positive_pct:.0f}% positive feedback.")
-        else:
-            synopsis_parts.append(f"More negative feedback with only {positive_pct:.0f}% positive reviews.")
-        
-        if themes:
-            synopsis_parts.append(f"Common themes include: {', '.join(themes[:3])}.")
-        
-        if avg_sentiment > 2:
-            synopsis_parts.append("Overall sentiment is very positive.")
-        elif avg_sentiment > 0:
-            synopsis_parts.append("Overall sentiment is positive.")
-        elif avg_sentiment > -2:
-            synopsis_parts.append("Overall sentiment is mixed.")
-        else:
-            synopsis_parts.append("Overall sentiment is negative.")
-        
-        if positive_count > negative_count * 2:
-            synopsis_parts.append("Customers frequently recommend this business.")
-        elif negative_count > positive_count:
-            synopsis_parts.append("Some customers have expressed concerns.")
-        
-        return ' '.join(synopsis_parts) if synopsis_parts else "Review analysis available."
+    def analyze_reviews(self, reviews: Iterable[Dict], roofer: Optional[str] = None) -> Dict:
+        """Analyze reviews and categorize into positive/negative, generate synopsis"""
+        return analyze_reviews(reviews, cache=self.analysis_cache, roofer=roofer)
     
-    def process_roofer(self, roofer: Dict, index: int, total: int) -> Dict:
-        """Process a single roofer"""
+    def process_roofer(self, roofer: Dict, index: int, total: int, key: Optional[str] = None) -> Dict:
+        """Process a single roofer; key records the scrape in the refresh schedule"""
         name = roofer.get('Name', '')
         city = roofer.get('City', '')
         state = roofer.get('State', 'FL')
         phone = roofer.get('Phone Number', '')
         
-        # Check if already processed
+        # Check if already processed (a scheduled refresh carries the known URL instead)
+        refresh_url = roofer.get('refresh_url')
         existing = next((r for r in self.results if r.get('name') == name), None)
-        if existing and existing.get('yelp_found'):
+        if existing and existing.get('yelp_found') and not refresh_url:
             print(f"\n[{index + 1}/{total}] {name} - Already processed, skipping...")
             return existing
         
@@ -379,43 +158,59 @@ class YelpScraper:
         }
         
         # Get Yelp URL from user
-        yelp_url = self.get_yelp_url_manual(name, city)
+        if refresh_url:
+            print(f"\n[{index + 1}/{total}] {name} - Refreshing")
+            yelp_url = refresh_url
+        else:
+            yelp_url = self.get_yelp_url_manual(name, city)
         
         if yelp_url:
             result['yelp_found'] = True
             result['yelp_url'] = yelp_url
             
             # Scrape business info
-            business_info = self.scrape_business_page(yelp_url)
+            with metrics.stage('scrape') as stage:
+                business_info = self.scrape_business_page(yelp_url)
+                stage.rows = 1 if business_info else 0
             
             if business_info:
                 result['star_rating'] = business_info.get('rating')
                 result['review_count'] = business_info.get('review_count', 0)
+                if key:
+                    self.schedule.record(SOURCE, key, result['star_rating'], result['review_count'])
                 
-                # Analyze reviews
-                reviews = business_info.get('reviews', [])
-                if reviews:
-                    review_analysis = self.analyze_reviews(reviews)
+                # Analyze reviews; a review set analyzed before comes from the analysis cache
+                with metrics.stage('analyze') as stage:
+                    review_analysis = self.analyze_reviews(business_info['reviews'], name)
+                    stage.rows = review_analysis['total_analyzed']
+                if review_analysis['total_analyzed']:
                     result['review_analysis'] = review_analysis
                     result['synopsis'] = review_analysis.get('synopsis')
                     
                     print(f"\n  ✅ Rating: {result['star_rating']} stars")
-                    print(f"  ✅ Reviews: {result['review_count']} total")
+                    print(f"  ✅ Reviews: {result['review_count']} total, {review_analysis['total_analyzed']} analyzed")
                     print(f"  ✅ Analysis: {len(review_analysis['positive'])} positive, {len(review_analysis['negative'])} negative")
                     print(f"  ✅ Synopsis: {result['synopsis'][:100]}...")
                 else:
                     print(f"  ⚠️  Rating: {result['star_rating']} stars, but no reviews extracted")
             else:
                 print(f"  ❌ Could not scrape business information")
+                if refresh_url and existing:
+                    return existing  # keep what the last successful scrape found
         else:
             print(f"  ⏭️  Skipped")
         
-        # Small delay
-        time.sleep(1)
-        
         return result
     
-    def run(self, limit: Optional[int] = None, start_from: int = 0):
+    def refresh_tasks(self, roofers: List[Dict]) -> List:
+        """Queue items for roofers with a known Yelp URL that are due for a re-scrape"""
+        urls = {r['name']: r['yelp_url'] for r in self.results if r.get('yelp_found') and r.get('yelp_url')}
+        tasks = [(key, {**row, 'refresh_url': urls[row.get('Name', '')]})
+                 for key, row in roster_tasks(roofers) if row.get('Name', '') in urls]
+        print(format_summary(SOURCE, self.schedule.summary(SOURCE, (key for key, _ in tasks))))
+        return due_tasks(self.schedule, SOURCE, tasks)
+    
+    def run(self, limit: Optional[int] = None, worker_id: Optional[str] = None, refresh: bool = False):
         """Run the scraping analysis"""
         if not INPUT_FILE.exists():
             print(f"Error: {INPUT_FILE} not found")
@@ -424,39 +219,32 @@ class YelpScraper:
         with open(INPUT_FILE, 'r') as f:
             roofers = json.load(f)
         
-        total = len(roofers)
-        if limit:
-            total = min(limit, total)
-            roofers = roofers[:limit]
-        
-        roofers = roofers[start_from:]
+        if refresh:
+            print(f"🔄 {self.work_queue.requeue(QUEUE, self.refresh_tasks(roofers))} roofers due for a re-scrape")
+        else:
+            self.work_queue.enqueue(QUEUE, roster_tasks(roofers))
+        counts = self.work_queue.counts(QUEUE)
+        total = sum(counts.values())
         
         print(f"\n{'='*70}")
         print(f"YELP REVIEW SCRAPING & ANALYSIS")
         print(f"{'='*70}")
-        print(f"Total roofers to process: {len(roofers)}")
-        print(f"Starting from index: {start_from}")
-        print(f"\nYou'll be prompted to enter Yelp URLs for each roofer.")
+        print(f"Total roofers: {total} ({counts['done']} done, {counts['leased']} being worked on elsewhere)")
+        if limit:
+            print(f"This session: up to {limit} roofers")
+        if not refresh:
+            print(f"\nYou'll be prompted to enter Yelp URLs for each roofer.")
         print(f"Press Ctrl+C at any time to save progress and exit.\n")
         
+        worker = Worker(self.work_queue, QUEUE, worker_id)
         try:
-            for i, roofer in enumerate(roofers, start=start_from):
-                result = self.process_roofer(roofer, i, total)
-                
-                # Update or add result
-                existing_index = next((idx for idx, r in enumerate(self.results) if r.get('name') == result['name']), None)
-                if existing_index is not None:
-                    self.results[existing_index] = result
-                else:
-                    self.results.append(result)
-                
-                # Save after each roofer
-                self.save_results()
-                self.save_progress(i)
-                
+            # Save after each roofer
+            worker.run(lambda task: self.process_roofer(task.payload, task.position, total, task.key),
+                       limit=limit, on_done=lambda task, result: self.save_results())
         except KeyboardInterrupt:
             print("\n\n⚠️  Interrupted by user. Progress saved.")
         
+        self.save_results()
         print(f"\n{'='*70}")
         print(f"Analysis complete!")
         print(f"Results saved to: {OUTPUT_FILE}")
@@ -464,22 +252,29 @@ class YelpScraper:
         print(f"{'='*70}\n")
     
     def save_results(self):
-        """Save results to JSON file"""
-        with open(OUTPUT_FILE, 'w') as f:
-            json.dump(self.results, f, indent=2)
+        """Save every worker's results from the queue to the JSON file, keeping earlier entries"""
+        with metrics.stage('emit') as stage:
+            self.results = self.work_queue.export(QUEUE, OUTPUT_FILE, merge_on='name')
+            stage.rows = len(self.results)
 
 
 def main():
     import argparse
+    metrics.start_run()
     
     parser = argparse.ArgumentParser(description='Scrape Yelp reviews and analyze them')
-    parser.add_argument('--limit', type=int, help='Limit number of roofers to process')
-    parser.add_argument('--start-from', type=int, default=0, help='Start from this index')
+    parser.add_argument('--limit', type=int, help='Limit number of roofers to process in this session')
+    parser.add_argument('--reset', action='store_true', help='Forget queue progress and start from the beginning')
+    parser.add_argument('--worker-id', help='Name for this worker (default: host:pid)')
+    parser.add_argument('--refresh', action='store_true',
+                        help='Re-scrape known Yelp URLs of roofers that are due for a refresh')
     
     args = parser.parse_args()
     
+    if args.reset:
+        WorkQueue().reset(QUEUE)
     scraper = YelpScraper()
-    scraper.run(limit=args.limit, start_from=args.start_from)
+    scraper.run(limit=args.limit, worker_id=args.worker_id, refresh=args.refresh)
 
 
 if __name__ == '__main__':
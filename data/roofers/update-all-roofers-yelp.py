@@ -9,6 +9,10 @@ from pathlib import Path
 from typing import Dict, List
 import sys
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'scripts'))
+
+from roofer_pipeline import metrics
+
 ROOFERS_DATA_FILE = Path(__file__).parent / "roofers-data.json"
 YELP_DATA_FILE = Path(__file__).parent / "yelp-reviews-analysis.json"
 ROOFERS_TS_FILE = Path(__file__).parent.parent.parent / "app/roofers/data/roofers.ts"
@@ -105,6 +109,7 @@ def generate_update_plan(roofers: List[Dict], yelp_data: Dict, id_mapping: Dict)
     return plan
 
 def main():
+    metrics.start_run()
     print("=" * 70)
     print("YELP REVIEWS - UPDATE ALL ROOFERS")
     print("=" * 70)
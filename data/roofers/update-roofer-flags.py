@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Batch update isPreferred / isHidden / sortOverride / category in roofers.ts
+Roofers can be given by name, slug or id, or taken from the ranked candidates
+file written by analyze-preferred.py. All changes are written in one pass.
+
+Usage:
+  python3 update-roofer-flags.py --preferred "1 ROOF LLC" 3mg-roofing-llc 17
+  python3 update-roofer-flags.py --from-candidates --top 20 --preferred
+  python3 update-roofer-flags.py --hide cf-handyman-llc
+  python3 update-roofer-flags.py --sort-override 1 1-roof-llc
+  python3 update-roofer-flags.py --clear-sort-override 1-roof-llc
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'scripts'))
+
+from roofer_pipeline import metrics
+from roofer_pipeline.paths import PREFERRED_CANDIDATES_JSON, ROOFERS_TS
+from roofer_pipeline.roofer_index import candidate_identifiers, update_roofer_flags
+
+
+def main():
+    metrics.start_run()
+    parser = argparse.ArgumentParser(description='Batch update roofer flags in roofers.ts')
+    parser.add_argument('roofers', nargs='*', help='Roofer names, slugs or ids')
+    parser.add_argument('--from-candidates', nargs='?', const=PREFERRED_CANDIDATES_JSON, type=Path,
+                        metavar='FILE', help='Also take roofers from a ranked candidates file')
+    parser.add_argument('--top', type=int, help='Only the first N candidates')
+    parser.add_argument('--min-score', type=float, help='Only candidates at or above this score')
+
+    flags = parser.add_argument_group('changes')
+    flags.add_argument('--preferred', dest='isPreferred', action='store_const', const=True)
+    flags.add_argument('--not-preferred', dest='isPreferred', action='store_const', const=False)
+    flags.add_argument('--hide', dest='isHidden', action='store_const', const=True)
+    flags.add_argument('--show', dest='isHidden', action='store_const', const=False)
+    flags.add_argument('--sort-override', dest='sortOverride', type=int)
+    flags.add_argument('--clear-sort-override', action='store_true')
+    flags.add_argument('--category', choices=['preferred', 'sponsored', 'general'])
+    flags.add_argument('--clear-category', action='store_true')
+
+    parser.add_argument('--file', type=Path, default=ROOFERS_TS)
+    parser.add_argument('--dry-run', action='store_true', help='Report changes without writing')
+    args = parser.parse_args()
+
+    changes = {key: getattr(args, key) for key in ('isPreferred', 'isHidden', 'sortOverride', 'category')
+               if getattr(args, key) is not None}
+    if args.clear_sort_override:
+        changes['sortOverride'] = None
+    if args.clear_category:
+        changes['category'] = None
+    if not changes:
+        parser.error('No changes given (use --preferred, --hide, --sort-override, ...)')
+
+    identifiers = list(args.roofers)
+    if args.from_candidates:
+        identifiers += candidate_identifiers(args.from_candidates, args.top, args.min_score)
+    if not identifiers:
+        parser.error('No roofers given')
+
+    result = update_roofer_flags({identifier: changes for identifier in identifiers},
+                                 args.file, dry_run=args.dry_run)
+
+    for key in result.changed:
+        print(f"✓ Updated: {key}")
+    for key in result.unchanged:
+        print(f"- Already set: {key}")
+    for identifier in result.unresolved:
+        print(f"✗ Could not find roofer: {identifier}")
+
+    verb = 'Would update' if args.dry_run else 'Updated'
+    print(f"\n{verb} {len(result.changed)} roofer(s), {len(result.unchanged)} unchanged, "
+          f"{len(result.unresolved)} not found")
+
+
+if __name__ == '__main__':
+    main()
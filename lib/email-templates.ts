@@ -444,6 +444,7 @@ export function getEstimateNotificationEmailHtml(data: {
   savedRoofers?: SavedRooferForEmail[];
   savedProducts?: SavedProductForEmail[];
   savedLocations?: SavedLocationForEmail[];
+  matchedRoofers?: SavedRooferForEmail[];
 }): string {
   const logoUrl = `${SITE_URL}/logo.svg`;
   const logoWhiteUrl = `${SITE_URL}/logo-white.svg`;
@@ -607,6 +608,7 @@ export function getEstimateNotificationEmailHtml(data: {
                 <tr><td style="padding: 6px 0; color: ${grayText}; font-size: 14px;">Preferred</td><td style="padding: 6px 0; color: ${bodyText}; font-size: 14px;">${data.preferredContact === 'phone' ? 'Phone' : data.preferredContact === 'email' ? 'Email' : 'Either'}</td></tr>
                 ${data.bestTimeToContact ? `<tr><td style="padding: 6px 0; color: ${grayText}; font-size: 14px;">Best Time</td><td style="padding: 6px 0; color: ${bodyText}; font-size: 14px;">${data.bestTimeToContact}</td></tr>` : ''}
                 ${roofersHtml}
+                ${matchedRoofersRows(data.matchedRoofers, data.zipCode)}
                 ${productsHtml}
                 ${locationsHtml}
               </table>
@@ -638,6 +640,29 @@ function escapeHtml(s: string): string {
     .replace(/\n/g, '<br>');
 }
 
+/** Rows listing the roofers a lead was routed to (from lib/lead-routing) */
+function matchedRoofersRows(roofers: SavedRooferForEmail[] | undefined, zipCode?: string): string {
+  if (!roofers || roofers.length === 0) return '';
+  const rifBlue = '#255eab';
+  const rifBlueDark = '#1e4a87';
+  const grayBorder = '#e5e7eb';
+  const grayText = '#666666';
+  const bodyText = '#333333';
+  const label = (t?: string) => (t === 'preferred' ? 'Preferred' : t === 'sponsored' ? 'Sponsored' : 'General');
+  return `
+    <tr><td colspan="2" style="padding: 20px 0 12px; color: ${rifBlueDark}; font-size: 18px; font-weight: 600; border-top: 1px solid ${grayBorder};">Roofers Serving ${escapeHtml(zipCode || 'This Area')}</td></tr>
+    ${roofers
+      .map(
+        (r, i) => `
+    <tr>
+      <td style="padding: 6px 0; color: ${bodyText}; font-size: 14px;">${i + 1}. <a href="${BASE_URL}/roofers/${encodeURIComponent(r.slug)}" style="color: ${rifBlue}; text-decoration: none;">${escapeHtml(r.name)}</a> <span style="color: ${grayText}; font-size: 12px;">(${label(r.listingType)})</span></td>
+      <td style="padding: 6px 0; text-align: right; font-size: 13px;">${r.phone ? `<a href="tel:${escapeHtml(r.phone)}" style="color: ${rifBlue}; text-decoration: none;">${escapeHtml(r.phone)}</a>` : ''}</td>
+    </tr>`
+      )
+      .join('')}
+  `;
+}
+
 /** Shared layout for internal notification emails (estimate-style HTML) */
 function notificationEmailLayout(title: string, subtitle: string, bodyRows: string): string {
   const logoWhiteUrl = `${SITE_URL}/logo-white.svg`;
@@ -711,6 +736,7 @@ export function getContactNotificationEmailHtml(body: {
   manufacturerPreferredSupplier?: string;
   manufacturerSponsoredListing?: string;
   manufacturerWebsite?: string;
+  matchedRoofers?: SavedRooferForEmail[];
 }): string {
   const rifBlueDark = '#1e4a87';
   const grayBorder = '#e5e7eb';
@@ -741,6 +767,7 @@ export function getContactNotificationEmailHtml(body: {
     ${body.roofSize ? `<tr><td style="padding: 6px 0; color: ${grayText}; font-size: 14px;">Roof Size</td><td style="padding: 6px 0; color: ${bodyText}; font-size: 14px;">${escapeHtml(body.roofSize)}</td></tr>` : ''}
     `;
   }
+  bodyRows += matchedRoofersRows(body.matchedRoofers, body.zipCode);
   if (body.userType === 'manufacturer' && (body.productName || body.productDescription || body.manufacturerWebsite)) {
     bodyRows += `
     <tr><td colspan="2" style="padding: 20px 0 12px; color: ${rifBlueDark}; font-size: 18px; font-weight: 600; border-top: 1px solid ${grayBorder};">Product / Partnership</td></tr>
@@ -5,6 +5,40 @@ import { Coordinates } from './geocoding';
 import { getCountyCoordinates } from './county-coordinates';
 import { cityData } from '@/app/service-areas/data/cities';
 
+function toSlug(value: string): string {
+  return value.toLowerCase().replace(/[^a-z0-9]+/g, '-').replace(/^-+|-+$/g, '');
+}
+
+interface CityLookupEntry {
+  coordinates: Coordinates | null;
+  countySlug: string;
+}
+
+// City slug -> coordinates/county, built once instead of scanning cityData on every call
+let cityLookup: Map<string, CityLookupEntry> | null = null;
+
+function getCityLookup(): Map<string, CityLookupEntry> {
+  if (!cityLookup) {
+    cityLookup = new Map();
+    for (const regionData of Object.values(cityData)) {
+      for (const countyData of Object.values(regionData)) {
+        for (const cityEntry of Object.values(countyData)) {
+          const slug = toSlug(cityEntry.name);
+          const existing = cityLookup.get(slug);
+          const coordinates = cityEntry.latitude && cityEntry.longitude
+            ? { lat: cityEntry.latitude, lng: cityEntry.longitude }
+            : null;
+          // Keep the first entry with coordinates when a city name repeats
+          if (!existing || (!existing.coordinates && coordinates)) {
+            cityLookup.set(slug, { coordinates, countySlug: cityEntry.countySlug });
+          }
+        }
+      }
+    }
+  }
+  return cityLookup;
+}
+
 /**
  * Get coordinates quickly using city/county data (no API call)
  * Returns null if city/county coordinates not available
@@ -13,24 +47,11 @@ export function getFastCoordinates(
   city?: string,
   countySlug?: string
 ): Coordinates | null {
+  const cityEntry = city ? getCityLookup().get(toSlug(city)) : undefined;
+
   // First try to get city coordinates (most accurate)
-  if (city) {
-    const citySlug = city.toLowerCase().replace(/[^a-z0-9]+/g, '-').replace(/^-+|-+$/g, '');
-    
-    // Search through all regions and counties for this city
-    for (const regionData of Object.values(cityData)) {
-      for (const countyData of Object.values(regionData)) {
-        for (const cityEntry of Object.values(countyData)) {
-          const entrySlug = cityEntry.name.toLowerCase().replace(/[^a-z0-9]+/g, '-').replace(/^-+|-+$/g, '');
-          if (entrySlug === citySlug && cityEntry.latitude && cityEntry.longitude) {
-            return {
-              lat: cityEntry.latitude,
-              lng: cityEntry.longitude,
-            };
-          }
-        }
-      }
-    }
+  if (cityEntry?.coordinates) {
+    return cityEntry.coordinates;
   }
   
   // Fall back to county coordinates
@@ -41,24 +62,9 @@ export function getFastCoordinates(
     }
   }
   
-  // Try to find county from city if we have city but no county slug
-  if (city && !countySlug) {
-    // Search for city in cityData to find its county
-    const citySlug = city.toLowerCase().replace(/[^a-z0-9]+/g, '-').replace(/^-+|-+$/g, '');
-    
-    for (const regionData of Object.values(cityData)) {
-      for (const [countySlugKey, countyData] of Object.entries(regionData)) {
-        for (const cityEntry of Object.values(countyData)) {
-          const entrySlug = cityEntry.name.toLowerCase().replace(/[^a-z0-9]+/g, '-').replace(/^-+|-+$/g, '');
-          if (entrySlug === citySlug) {
-            const countyCoords = getCountyCoordinates(cityEntry.countySlug);
-            if (countyCoords) {
-              return countyCoords;
-            }
-          }
-        }
-      }
-    }
+  // Try the city's county if we have city but no county slug
+  if (cityEntry && !countySlug) {
+    return getCountyCoordinates(cityEntry.countySlug);
   }
   
   return null;
@@ -66,18 +72,23 @@ export function getFastCoordinates(
 
 /**
  * Get approximate coordinates for a roofer (fast, no API call)
- * Uses city coordinates if available, otherwise county coordinates
+ * Uses coordinates precomputed by scripts/geocode-roofers.py when present,
+ * then city coordinates, then county coordinates
  */
 export function getRooferFastCoordinates(roofer: {
   city?: string;
+  latitude?: number;
+  longitude?: number;
   serviceAreas?: {
     counties?: string[];
   };
 }): Coordinates | null {
+  if (typeof roofer.latitude === 'number' && typeof roofer.longitude === 'number') {
+    return { lat: roofer.latitude, lng: roofer.longitude };
+  }
+
   const city = roofer.city;
   const countySlug = roofer.serviceAreas?.counties?.[0]; // Use first county
   
   return getFastCoordinates(city, countySlug);
 }
-
-
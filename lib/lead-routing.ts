@@ -0,0 +1,76 @@
+import fs from 'fs';
+import path from 'path';
+import { getAllRoofers, type RooferData } from '@/app/roofers/data/roofers';
+import type { SavedRooferForEmail } from '@/lib/email-templates';
+
+// ZIP -> ranked roofers for free-estimate and contact leads
+// Built by scripts/build-lead-routes.py (server-side only: reads from disk)
+const ROUTES_FILE = path.join(process.cwd(), 'public/data/lead-routing/routes.json');
+
+interface RouteEntry {
+  lat: number;
+  lng: number;
+  roofers: [number, number][]; // [position in roofers, score], best first
+}
+
+interface LeadRoutes {
+  roofers: string[];
+  zipPrefixes: Record<string, string>;
+  zips: Record<string, RouteEntry>;
+  counties: Record<string, RouteEntry>;
+}
+
+export interface RoutedRoofer {
+  roofer: RooferData;
+  score: number;
+}
+
+let routes: LeadRoutes | null | undefined;
+let rooferById: Map<string, RooferData> | undefined;
+
+function readRoutes(): LeadRoutes | null {
+  if (routes === undefined) {
+    try {
+      routes = fs.existsSync(ROUTES_FILE) ? JSON.parse(fs.readFileSync(ROUTES_FILE, 'utf-8')) : null;
+    } catch (error) {
+      console.error('Error reading lead routes:', error);
+      routes = null;
+    }
+  }
+  return routes ?? null;
+}
+
+/**
+ * Best roofers for a ZIP code (or an address containing one)
+ * ZIPs without their own entry use their county's ranking; empty if the table has not been built
+ */
+export function routeLead(zipOrAddress: string | undefined, limit = 5): RoutedRoofer[] {
+  const table = readRoutes();
+  const zip = zipOrAddress?.match(/\b(3[234]\d{3})(?:-\d{4})?\b/)?.[1];
+  if (!table || !zip) return [];
+
+  const county = table.zipPrefixes[zip.slice(0, 4)] ?? table.zipPrefixes[zip.slice(0, 3)];
+  const entry = table.zips[zip] ?? (county ? table.counties[county] : undefined);
+  if (!entry) return [];
+
+  rooferById ??= new Map(getAllRoofers().map((roofer) => [roofer.id, roofer]));
+  return entry.roofers
+    .map(([position, score]) => ({ roofer: rooferById!.get(table.roofers[position]), score }))
+    .filter((routed): routed is RoutedRoofer => routed.roofer !== undefined)
+    .slice(0, limit);
+}
+
+/**
+ * Routed roofers in the shape the notification emails list them
+ */
+export function routeLeadForEmail(zipOrAddress: string | undefined, limit = 5): SavedRooferForEmail[] {
+  return routeLead(zipOrAddress, limit).map(({ roofer }) => ({
+    id: roofer.id,
+    slug: roofer.slug,
+    name: roofer.name,
+    phone: roofer.phone,
+    email: roofer.email,
+    websiteUrl: roofer.websiteUrl,
+    listingType: roofer.category || (roofer.isPreferred ? 'preferred' : 'general'),
+  }));
+}
@@ -0,0 +1,117 @@
+// Precomputed roofer marker clusters for the map page
+// Built by scripts/build-map-clusters.py into public/data/map-clusters/
+
+const BASE_URL = '/data/map-clusters';
+
+export interface ClusterIndex {
+  minZoom: number;
+  maxZoom: number;
+  cellPixels: number;
+  tilePixels: number;
+  layers: Record<string, { roofers: number; tiles: Record<string, string[]> }>;
+}
+
+export interface RooferMarkerFeature {
+  lat: number;
+  lng: number;
+  id: string;
+  slug: string;
+  name: string;
+  preferred: boolean;
+}
+
+export interface ClusterFeature {
+  lat: number;
+  lng: number;
+  count: number;
+  preferred: number; // preferred roofers in the cluster
+  key: string;
+  expand: number; // zoom at which the cluster splits (> maxZoom: never)
+  members?: RooferMarkerFeature[]; // roofers at the same spot (clusters that never split)
+}
+
+export type MapFeature = RooferMarkerFeature | ClusterFeature;
+
+export interface ViewportBounds {
+  north: number;
+  south: number;
+  east: number;
+  west: number;
+}
+
+export function isCluster(feature: MapFeature): feature is ClusterFeature {
+  return 'count' in feature;
+}
+
+/**
+ * Load the tile index (null if the clusters have not been built)
+ */
+export async function loadClusterIndex(): Promise<ClusterIndex | null> {
+  try {
+    const res = await fetch(`${BASE_URL}/index.json`);
+    if (!res.ok) return null;
+    return await res.json();
+  } catch {
+    return null;
+  }
+}
+
+// Tiles are immutable for a build, so each one is fetched at most once
+const tileCache = new Map<string, Promise<MapFeature[]>>();
+
+function fetchTile(url: string): Promise<MapFeature[]> {
+  let tile = tileCache.get(url);
+  if (!tile) {
+    tile = fetch(url)
+      .then((res) => (res.ok ? res.json() : []))
+      .catch(() => {
+        tileCache.delete(url);
+        return [];
+      });
+    tileCache.set(url, tile);
+  }
+  return tile;
+}
+
+// Web Mercator pixel position at a zoom level (same projection as the map tiles)
+function worldPixel(lat: number, lng: number, zoom: number): { x: number; y: number } {
+  const size = 256 * Math.pow(2, zoom);
+  const sin = Math.sin((Math.max(-85.0511, Math.min(85.0511, lat)) * Math.PI) / 180);
+  return {
+    x: ((lng + 180) / 360) * size,
+    y: (0.5 - Math.log((1 + sin) / (1 - sin)) / (4 * Math.PI)) * size,
+  };
+}
+
+/**
+ * Markers and clusters for the visible part of the map at a zoom level
+ * Only the tiles that intersect the viewport (and exist) are fetched
+ */
+export async function loadClusterTiles(
+  index: ClusterIndex,
+  layer: string,
+  zoom: number,
+  bounds: ViewportBounds
+): Promise<MapFeature[]> {
+  const z = Math.max(index.minZoom, Math.min(index.maxZoom, Math.round(zoom)));
+  const available = new Set(index.layers[layer]?.tiles[String(z)] || []);
+  if (available.size === 0) return [];
+
+  const topLeft = worldPixel(bounds.north, bounds.west, z);
+  const bottomRight = worldPixel(bounds.south, bounds.east, z);
+  const x0 = Math.floor(topLeft.x / index.tilePixels);
+  const x1 = Math.floor(bottomRight.x / index.tilePixels);
+  const y0 = Math.floor(topLeft.y / index.tilePixels);
+  const y1 = Math.floor(bottomRight.y / index.tilePixels);
+
+  const requests: Promise<MapFeature[]>[] = [];
+  for (let x = x0; x <= x1; x++) {
+    for (let y = y0; y <= y1; y++) {
+      const key = `${x}-${y}`;
+      if (available.has(key)) {
+        requests.push(fetchTile(`${BASE_URL}/${layer}/${z}/${key}.json`));
+      }
+    }
+  }
+  return (await Promise.all(requests)).flat();
+}
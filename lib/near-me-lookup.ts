@@ -0,0 +1,73 @@
+// Precomputed nearest-roofer tables for the near-me page
+// Built by scripts/build-near-me-index.py into public/data/near-me/
+
+import type { Coordinates } from './geocoding';
+
+export type NearMeCategory = 'preferred' | 'sponsored' | 'general';
+
+interface NearMePoint {
+  name: string;
+  lat: number;
+  lng: number;
+  // [index into NearMeLookup.roofers, distance in miles] nearest first
+  nearest: Record<NearMeCategory, [number, number][]>;
+}
+
+export interface NearMeLookup {
+  k: number;
+  roofers: string[]; // roofer ids
+  points: Record<string, NearMePoint>;
+}
+
+const LOOKUP_FILES = ['/data/near-me/cities.json', '/data/near-me/zips.json'];
+
+/**
+ * Load the city and ZIP lookup tables (null if they have not been built)
+ */
+export async function loadNearMeLookups(): Promise<NearMeLookup[] | null> {
+  try {
+    const responses = await Promise.all(LOOKUP_FILES.map((file) => fetch(file)));
+    if (responses.some((res) => !res.ok)) return null;
+    return await Promise.all(responses.map((res) => res.json()));
+  } catch {
+    return null;
+  }
+}
+
+// Equirectangular approximation; only used to pick the closest lookup point
+function approxDistanceSq(a: Coordinates, lat: number, lng: number): number {
+  const x = (lng - a.lng) * Math.cos((a.lat * Math.PI) / 180);
+  const y = lat - a.lat;
+  return x * x + y * y;
+}
+
+/**
+ * Candidate roofer ids per category for a location: the precomputed
+ * neighbours of the closest city or ZIP centroid
+ */
+export function getNearMeCandidates(
+  lookups: NearMeLookup[],
+  coords: Coordinates
+): Record<NearMeCategory, string[]> | null {
+  let best: { lookup: NearMeLookup; point: NearMePoint } | null = null;
+  let bestDistance = Infinity;
+  for (const lookup of lookups) {
+    for (const point of Object.values(lookup.points)) {
+      const distance = approxDistanceSq(coords, point.lat, point.lng);
+      if (distance < bestDistance) {
+        bestDistance = distance;
+        best = { lookup, point };
+      }
+    }
+  }
+  if (!best) return null;
+
+  const { lookup, point } = best;
+  const ids = (category: NearMeCategory) =>
+    (point.nearest[category] || []).map(([index]) => lookup.roofers[index]);
+  return {
+    preferred: ids('preferred'),
+    sponsored: ids('sponsored'),
+    general: ids('general'),
+  };
+}
@@ -0,0 +1,143 @@
+// Prebuilt prefix search indexes for roofer search and service-area autocomplete
+// Built by scripts/build-search-index.py into public/data/search/
+
+import { useEffect, useState } from 'react';
+import { searchData, type SearchResult } from '@/app/service-areas/data/search-data';
+
+// As written by build-search-index.py: sorted tokens, front-coded
+interface SearchIndexFile<Doc> {
+  version: number;
+  docs: Doc[];
+  // characters each token shares with the previous one, and the rest of it
+  shared: number[];
+  suffixes: string[];
+  // per token: [docIndex, score, docIndex, score, ...] sorted by score
+  postings: number[][];
+}
+
+export interface SearchIndex<Doc> {
+  docs: Doc[];
+  terms: string[];
+  postings: number[][];
+}
+
+export interface RooferSearchDoc {
+  id: string;
+  name: string;
+}
+
+export type SearchIndexName = 'places' | 'roofers';
+
+// Not indexed as whole words; must match STOP_WORDS in scripts/roofer_pipeline/search_index.py
+const STOP_WORDS = new Set(['llc', 'inc', 'co', 'corp', 'corporation', 'company', 'the', 'of', 'and']);
+
+export function tokenize(text: string): string[] {
+  return text.toLowerCase().split(/[^a-z0-9]+/).filter(Boolean);
+}
+
+// Must match match_quality() in scripts/roofer_pipeline/search_index.py
+function matchQuality(prefixLength: number, tokenLength: number): number {
+  return prefixLength >= tokenLength ? 1 : 0.5 + (0.5 * prefixLength) / tokenLength;
+}
+
+function expandTerms<Doc>(file: SearchIndexFile<Doc>): SearchIndex<Doc> {
+  const terms: string[] = [];
+  let previous = '';
+  file.suffixes.forEach((suffix, i) => {
+    previous = previous.slice(0, file.shared[i]) + suffix;
+    terms.push(previous);
+  });
+  return { docs: file.docs, terms, postings: file.postings };
+}
+
+// First position whose term is not before value
+function lowerBound(terms: string[], value: string): number {
+  let lo = 0;
+  let hi = terms.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >> 1;
+    if (terms[mid] < value) lo = mid + 1;
+    else hi = mid;
+  }
+  return lo;
+}
+
+const indexCache = new Map<SearchIndexName, Promise<SearchIndex<any> | null>>();
+
+export function loadSearchIndex<Doc>(name: SearchIndexName): Promise<SearchIndex<Doc> | null> {
+  let index = indexCache.get(name);
+  if (!index) {
+    index = fetch(`/data/search/${name}.json`)
+      .then((res) => (res.ok ? res.json() : null))
+      .then((file: SearchIndexFile<any> | null) => (file ? expandTerms(file) : null))
+      .catch(() => null);
+    indexCache.set(name, index);
+  }
+  return index;
+}
+
+/**
+ * Load a search index once per page (null until loaded or if not built)
+ */
+export function useSearchIndex<Doc>(name: SearchIndexName): SearchIndex<Doc> | null {
+  const [index, setIndex] = useState<SearchIndex<Doc> | null>(null);
+  useEffect(() => {
+    let active = true;
+    loadSearchIndex<Doc>(name).then((loaded) => {
+      if (active) setIndex(loaded);
+    });
+    return () => {
+      active = false;
+    };
+  }, [name]);
+  return index;
+}
+
+/**
+ * Best matching documents for a query; every word must match as a prefix
+ * Stop words are optional ("co" may be the start of "coral")
+ */
+export function searchIndex<Doc>(index: SearchIndex<Doc>, query: string, limit = 10): Doc[] {
+  let scores: Map<number, number> | null = null;
+  for (const token of tokenize(query)) {
+    // Best score per document over every token the word is a prefix of
+    const hits = new Map<number, number>();
+    const end = lowerBound(index.terms, token + '~');
+    for (let t = lowerBound(index.terms, token); t < end; t++) {
+      const quality = matchQuality(token.length, index.terms[t].length);
+      const postings = index.postings[t];
+      for (let i = 0; i < postings.length; i += 2) {
+        const score = postings[i + 1] * quality;
+        if (score > (hits.get(postings[i]) ?? 0)) hits.set(postings[i], score);
+      }
+    }
+    const matched = new Map<number, number>();
+    hits.forEach((score, doc) => {
+      if (scores === null) {
+        matched.set(doc, score);
+      } else if (scores.has(doc)) {
+        matched.set(doc, (scores.get(doc) as number) + score);
+      }
+    });
+    if (matched.size > 0 || !STOP_WORDS.has(token)) {
+      scores = matched;
+    }
+    if (scores !== null && scores.size === 0) return [];
+  }
+  if (!scores) return [];
+
+  return Array.from(scores.entries())
+    .sort((a, b) => b[1] - a[1] || a[0] - b[0])
+    .slice(0, limit)
+    .map(([doc]) => index.docs[doc]);
+}
+
+/**
+ * Region, county and city suggestions for a query
+ * Falls back to a substring scan of searchData until the index has loaded
+ */
+export function searchPlaces(index: SearchIndex<SearchResult> | null, query: string, limit = 10): SearchResult[] {
+  if (index) return searchIndex(index, query, limit);
+  const q = query.toLowerCase();
+  return searchData.filter((item) => item.name.toLowerCase().includes(q)).slice(0, limit);
+}
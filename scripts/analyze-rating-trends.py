@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Compute rating trends from the rating history and write them into
+roofers.ts (ratingTrends, per source) and data/roofers/rating-alerts.json.
+
+Every fetch recorded by the Yelp and Google review fetchers is kept as a
+snapshot; this script first moves finished months into the columnar
+partitions under data/roofers/rating-history/, then analyzes the last
+ANALYSIS_DAYS for all roofers at once.
+
+Usage:
+  python scripts/analyze-rating-trends.py
+  python scripts/analyze-rating-trends.py --dry-run
+
+Requirements:
+- pip install -r scripts/requirements-pipeline.txt
+"""
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+from roofer_pipeline import metrics
+from roofer_pipeline.paths import ROOFERS_TS
+from roofer_pipeline.rating_history import (ANALYSIS_DAYS, DAY, DROP_THRESHOLD, HISTORY_DIR, RATING_ALERTS_JSON,
+                                            analyze_trends, compact, load_snapshots, write_trends)
+from roofer_pipeline.work_queue import WORK_QUEUE_DB
+
+
+def main():
+    metrics.start_run()
+    parser = argparse.ArgumentParser(description='Rating trends and drop alerts from the rating history')
+    parser.add_argument('--roofers', type=Path, default=ROOFERS_TS)
+    parser.add_argument('--history', type=Path, default=HISTORY_DIR)
+    parser.add_argument('--alerts', type=Path, default=RATING_ALERTS_JSON)
+    parser.add_argument('--dry-run', action='store_true', help='Report without writing roofers.ts or alerts')
+    args = parser.parse_args()
+
+    now = time.time()
+    if not args.dry_run:
+        with metrics.stage('compact') as stage:
+            stage.rows = compact(WORK_QUEUE_DB, args.history, now)
+        if stage.rows:
+            print(f"🗜️  Moved {stage.rows} snapshots into {args.history}")
+
+    with metrics.stage('load') as stage:
+        snapshots = load_snapshots(now - ANALYSIS_DAYS * DAY, WORK_QUEUE_DB, args.history)
+        stage.rows = len(snapshots)
+    if snapshots.empty:
+        print(f"⚠️  No rating snapshots in the last {ANALYSIS_DAYS} days; run a review fetcher first")
+        return
+    with metrics.stage('analyze') as stage:
+        trends = analyze_trends(snapshots, now)
+        stage.rows = len(trends)
+    counts = trends['trend'].value_counts()
+    print(f"📈 {len(snapshots)} snapshots, {len(trends)} roofer/source series: "
+          f"{counts.get('rising', 0)} rising, {counts.get('falling', 0)} falling, {counts.get('steady', 0)} steady")
+
+    with metrics.stage('emit') as stage:
+        by_roofer, changed, unresolved = write_trends(trends, args.roofers, args.dry_run)
+        stage.rows = len(changed)
+    action = 'Would update' if args.dry_run else 'Updated'
+    print(f"✅ {action} ratingTrends for {len(changed)} of {len(by_roofer)} roofers in {args.roofers}")
+    if unresolved:
+        print(f"⚠️  {len(unresolved)} keys match no roofer (e.g. {', '.join(map(str, unresolved[:5]))})")
+
+    drops = trends[trends['rating_drop']].reset_index()
+    drops['drop'] = drops['prior_average'] - drops['rating']
+    alerts = [{
+        'key': row['key'],
+        'source': row['source'],
+        'rating': round(float(row['rating']), 1),
+        'previousAverage': round(float(row['prior_average']), 2),
+        'drop': round(float(row['drop']), 2),
+        'fetchedAt': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(row['fetched_at'])),
+    } for _, row in drops.sort_values('drop', ascending=False).iterrows()]
+    metrics.count('rating_drop_alerts', len(alerts))
+    for alert in alerts:
+        print(f"🚨 {alert['key']} ({alert['source']}): {alert['rating']} stars, "
+              f"down {alert['drop']} from a {alert['previousAverage']} average")
+    if not args.dry_run:
+        args.alerts.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.alerts, 'w', encoding='utf-8') as f:
+            json.dump({'generatedAt': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(now)),
+                       'threshold': DROP_THRESHOLD, 'alerts': alerts}, f, indent=2)
+        print(f"   {len(alerts)} rating-drop alerts → {args.alerts}")
+
+
+if __name__ == '__main__':
+    main()
@@ -8,51 +8,12 @@ import re
 import sys
 from pathlib import Path
 
+from roofer_pipeline import metrics
+from roofer_pipeline.geography import ZIP_TO_COUNTY
+
 ROOFER_DATA_FILE = Path(__file__).parent.parent / 'app' / 'roofers' / 'data' / 'roofers.ts'
 SEARCH_DATA_FILE = Path(__file__).parent.parent / 'app' / 'service-areas' / 'data' / 'search-data.ts'
 
-# ZIP code to county/region mapping (first 3 digits of ZIP)
-ZIP_TO_COUNTY = {
-    # Sun Coast (Hillsborough, Pinellas, Pasco, Hernando)
-    '336': ('hillsborough', 'sun-coast'),  # Tampa area
-    '337': ('pinellas', 'sun-coast'),  # St. Pete, Clearwater, Pinellas Park
-    '346': ('pasco', 'sun-coast'),  # New Port Richey, Zephyrhills
-    '3460': ('hernando', 'sun-coast'),  # Brooksville
-    
-    # Central Florida (Orange, Seminole, Osceola, Polk, Lake)
-    '327': ('orange', 'central-florida'),  # Orlando, Winter Park, Apopka
-    '328': ('orange', 'central-florida'),  # Orlando
-    '3271': ('seminole', 'central-florida'),  # Sanford
-    '3467': ('osceola', 'central-florida'),  # Kissimmee
-    '338': ('polk', 'central-florida'),  # Lakeland, Winter Haven
-    '347': ('lake', 'central-florida'),  # Clermont, Tavares
-    
-    # South Florida (Miami-Dade, Broward, Palm Beach)
-    '331': ('miami-dade', 'south-florida'),  # Miami
-    '330': ('broward', 'south-florida'),  # Fort Lauderdale, Hollywood
-    '333': ('broward', 'south-florida'),  # Fort Lauderdale area
-    '334': ('palm-beach-south', 'south-florida'),  # West Palm Beach, Boynton Beach
-    '349': ('palm-beach-south', 'south-florida'),  # Port St. Lucie area
-    
-    # Southwest Florida (Sarasota, Charlotte, Lee, Collier)
-    '342': ('sarasota', 'southwest-florida'),  # Sarasota, Venice
-    '339': ('charlotte', 'southwest-florida'),  # Rotonda West, Punta Gorda
-    '341': ('collier', 'southwest-florida'),  # Naples, Marco Island
-    
-    # First Coast / North Florida (Duval, St. Johns, Clay, Nassau)
-    '322': ('duval-fc', 'first-coast'),  # Jacksonville
-    '320': ('st-johns-fc', 'first-coast'),  # St. Augustine, Ponte Vedra
-    '3208': ('st-johns-fc', 'first-coast'),  # Ponte Vedra
-    '3203': ('clay-fc', 'first-coast'),  # Orange Park
-    
-    # North Florida (Alachua, etc.)
-    '326': ('alachua', 'north-florida'),  # Gainesville
-    
-    # Panhandle
-    '324': ('bay', 'florida-panhandle'),  # Panama City Beach
-    '325': ('escambia', 'florida-panhandle'),  # Pensacola
-}
-
 def normalize_city_name(city):
     if not city:
         return ''
@@ -221,17 +182,20 @@ def update_service_areas_in_file(content, updates):
     return updated_content
 
 def main():
+    metrics.start_run()
     print("Loading service area mapping...")
     city_mapping = load_search_data_mapping()
     print(f"Loaded {len(city_mapping)} city mappings")
     
-    print(f"\nReading roofer data from {ROOFER_DATA_FILE}...")
-    with open(ROOFER_DATA_FILE, 'r', encoding='utf-8') as f:
-        content = f.read()
+    with metrics.stage('parse') as stage:
+        print(f"\nReading roofer data from {ROOFER_DATA_FILE}...")
+        with open(ROOFER_DATA_FILE, 'r', encoding='utf-8') as f:
+            content = f.read()
     
-    print("Extracting roofer information...")
-    roofers = extract_roofer_data(content)
-    print(f"Found {len(roofers)} roofers with city information")
+        print("Extracting roofer information...")
+        roofers = extract_roofer_data(content)
+        print(f"Found {len(roofers)} roofers with city information")
+        stage.rows = len(roofers)
     
     updates = {}
     updated_count = 0
@@ -239,51 +203,53 @@ def main():
     unmapped_cities = set()
     
     print("\nProcessing roofers...")
-    for roofer in roofers:
-        slug = roofer['slug']
-        city = roofer.get('city', '')
-        zip_code = roofer.get('zipCode', '')
+    with metrics.stage('assign') as stage:
+        for roofer in roofers:
+            slug = roofer['slug']
+            city = roofer.get('city', '')
+            zip_code = roofer.get('zipCode', '')
         
-        existing_regions = roofer.get('existing_regions', [])
-        existing_counties = roofer.get('existing_counties', [])
-        existing_cities = roofer.get('existing_cities', [])
+            existing_regions = roofer.get('existing_regions', [])
+            existing_counties = roofer.get('existing_counties', [])
+            existing_cities = roofer.get('existing_cities', [])
         
-        has_complete_service_areas = existing_regions and existing_counties
+            has_complete_service_areas = existing_regions and existing_counties
         
-        # Try to find service areas by city first
-        service_areas = find_service_areas_for_city(city, city_mapping)
+            # Try to find service areas by city first
+            service_areas = find_service_areas_for_city(city, city_mapping)
         
-        # If not found, try ZIP code
-        if not service_areas and zip_code:
-            service_areas = find_service_areas_by_zip(zip_code)
+            # If not found, try ZIP code
+            if not service_areas and zip_code:
+                service_areas = find_service_areas_by_zip(zip_code)
         
-        if service_areas:
-            # Build updated service areas
-            new_regions = list(set(existing_regions + [service_areas['region_slug']]))
-            new_counties = list(set(existing_counties + [service_areas['county_slug']]))
-            new_cities = existing_cities[:]  # Keep existing cities
-            if service_areas.get('city_slug') and service_areas['city_slug'] not in new_cities:
-                new_cities.append(service_areas['city_slug'])
+            if service_areas:
+                # Build updated service areas
+                new_regions = list(set(existing_regions + [service_areas['region_slug']]))
+                new_counties = list(set(existing_counties + [service_areas['county_slug']]))
+                new_cities = existing_cities[:]  # Keep existing cities
+                if service_areas.get('city_slug') and service_areas['city_slug'] not in new_cities:
+                    new_cities.append(service_areas['city_slug'])
             
-            # Check if we need to update (missing regions/counties)
-            missing_regions = not existing_regions or service_areas['region_slug'] not in existing_regions
-            missing_counties = not existing_counties or service_areas['county_slug'] not in existing_counties
+                # Check if we need to update (missing regions/counties)
+                missing_regions = not existing_regions or service_areas['region_slug'] not in existing_regions
+                missing_counties = not existing_counties or service_areas['county_slug'] not in existing_counties
             
-            if missing_regions or missing_counties:
-                updates[slug] = {
-                    'regions': new_regions,
-                    'counties': new_counties,
-                    'cities': new_cities
-                }
-                updated_count += 1
-                if not has_complete_service_areas:
-                    missing_areas_count += 1
-                    source = f"via ZIP {zip_code}" if not service_areas.get('city_slug') else f"via city {city}"
-                    print(f"  ✅ Assigning service areas to: {slug} ({city}) - {source}")
-        else:
-            if not existing_regions and not existing_counties:
-                unmapped_cities.add((city, zip_code))
-                print(f"  ⚠️  Could not find service areas for: {slug} ({city}, ZIP: {zip_code})")
+                if missing_regions or missing_counties:
+                    updates[slug] = {
+                        'regions': new_regions,
+                        'counties': new_counties,
+                        'cities': new_cities
+                    }
+                    updated_count += 1
+                    if not has_complete_service_areas:
+                        missing_areas_count += 1
+                        source = f"via ZIP {zip_code}" if not service_areas.get('city_slug') else f"via city {city}"
+                        print(f"  ✅ Assigning service areas to: {slug} ({city}) - {source}")
+            else:
+                if not existing_regions and not existing_counties:
+                    unmapped_cities.add((city, zip_code))
+                    print(f"  ⚠️  Could not find service areas for: {slug} ({city}, ZIP: {zip_code})")
+        stage.rows = len(roofers)
     
     if updates:
         print(f"\nUpdating {updated_count} roofers ({missing_areas_count} were missing service areas)...")
@@ -294,11 +260,13 @@ def main():
         with open(backup_file, 'w', encoding='utf-8') as f:
             f.write(content)
         
-        # Update
-        updated_content = update_service_areas_in_file(content, updates)
-        print(f"Writing updates to {ROOFER_DATA_FILE}...")
-        with open(ROOFER_DATA_FILE, 'w', encoding='utf-8') as f:
-            f.write(updated_content)
+        with metrics.stage('emit') as stage:
+            # Update
+            updated_content = update_service_areas_in_file(content, updates)
+            print(f"Writing updates to {ROOFER_DATA_FILE}...")
+            with open(ROOFER_DATA_FILE, 'w', encoding='utf-8') as f:
+                f.write(updated_content)
+            stage.rows = len(updates)
         
         print(f"\n✅ Successfully updated {updated_count} roofers!")
         print(f"   - {missing_areas_count} roofers that were missing service areas now have them")
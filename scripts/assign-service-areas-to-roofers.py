@@ -9,6 +9,8 @@ import json
 import sys
 from pathlib import Path
 
+from roofer_pipeline import metrics
+
 # Path to roofer data file
 ROOFER_DATA_FILE = Path(__file__).parent.parent / 'app' / 'roofers' / 'data' / 'roofers.ts'
 SEARCH_DATA_FILE = Path(__file__).parent.parent / 'app' / 'service-areas' / 'data' / 'search-data.ts'
@@ -188,6 +190,7 @@ def update_service_areas_in_file(content, updates):
     return updated_content
 
 def main():
+    metrics.start_run()
     print("Loading service area mapping...")
     city_mapping = load_search_data_mapping()
     print(f"Loaded {len(city_mapping)} city mappings")
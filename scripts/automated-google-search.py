@@ -10,6 +10,8 @@ from pathlib import Path
 from typing import Dict, List, Optional
 import time
 
+from roofer_pipeline import metrics
+
 # Note: This script requires manual intervention or integration with a web scraping service
 # For now, it creates a structured format for batch processing
 
@@ -66,6 +68,7 @@ def process_roofer_batch(roofers: List[Dict], batch_num: int) -> List[Dict]:
 
 def main():
     """Main function."""
+    metrics.start_run()
     print("🤖 Automated Google Business Profile Finder\n")
     
     # Load all roofers
@@ -10,6 +10,8 @@ import re
 from pathlib import Path
 from typing import Dict, List
 
+from roofer_pipeline import metrics
+
 def update_roofer_google_url(roofers_file: Path, updates: List[Dict[str, str]]):
     """Update Google Business URLs for roofers in the TypeScript file."""
     content = roofers_file.read_text()
@@ -56,6 +58,7 @@ def update_roofer_google_url(roofers_file: Path, updates: List[Dict[str, str]]):
 
 def main():
     """Main function."""
+    metrics.start_run()
     print("🔄 Batch updating Google Business URLs...\n")
     
     # Paths
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Benchmark the roofer data pipeline on synthetic fixtures.
+Generates roofers.ts / roofers-data.json / review fixtures at each scale
+(cached in data/benchmarks/fixtures/), times the parse, resolve, patch,
+analyze and emit stages, and appends the results to
+data/benchmarks/history.json. Each stage is compared with the previous run
+at the same scale and flagged when it is more than 20% slower.
+
+Usage:
+  python scripts/benchmark-pipeline.py                          # 1k, 10k, 100k roofers; 1M reviews
+  python scripts/benchmark-pipeline.py --quick                  # 1k roofers, 100k reviews
+  python scripts/benchmark-pipeline.py --scales 10000 --stages parse,patch --repeat 3
+  python scripts/benchmark-pipeline.py --fail-on-regression     # exit 1 if a stage regressed
+
+Requirements:
+- pip install -r scripts/requirements-pipeline.txt
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from roofer_pipeline import metrics
+from roofer_pipeline.benchmark import (DEFAULT_REVIEWS, DEFAULT_SCALES, FIXTURES_DIR, HISTORY_FILE,
+                                       REGRESSION_THRESHOLD, STAGES, append_history, compare, ensure_fixtures,
+                                       load_history, previous_run, run_benchmark)
+
+
+def parse_list(text: str):
+    return [item.strip() for item in text.split(',') if item.strip()]
+
+
+def main():
+    metrics.start_run()
+    parser = argparse.ArgumentParser(description='Benchmark pipeline stages on synthetic fixtures')
+    parser.add_argument('--scales', default=','.join(str(s) for s in DEFAULT_SCALES),
+                        help='Comma-separated roofer counts')
+    parser.add_argument('--reviews', type=int, default=DEFAULT_REVIEWS, help='Reviews in the review fixture')
+    parser.add_argument('--stages', default=','.join(STAGES), help=f"Comma-separated stages ({', '.join(STAGES)})")
+    parser.add_argument('--repeat', type=int, default=1, help='Runs per stage (best time is recorded)')
+    parser.add_argument('--quick', action='store_true', help='Small run: 1k roofers, 100k reviews')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--fixtures-dir', type=Path, default=FIXTURES_DIR)
+    parser.add_argument('--history', type=Path, default=HISTORY_FILE)
+    parser.add_argument('--no-history', action='store_true', help='Do not record this run')
+    parser.add_argument('--fail-on-regression', action='store_true',
+                        help=f'Exit 1 if a stage is more than {REGRESSION_THRESHOLD:.0%} slower than the last run')
+    args = parser.parse_args()
+
+    stages = parse_list(args.stages)
+    unknown = set(stages) - set(STAGES)
+    if unknown:
+        parser.error(f"Unknown stage(s): {', '.join(sorted(unknown))}")
+    scales = [1000] if args.quick else [int(s.replace('_', '')) for s in parse_list(args.scales)]
+    reviews = 100_000 if args.quick else args.reviews
+
+    history = load_history(args.history)
+    regressed = []
+    for roofers in scales:
+        print(f"\n📊 {roofers:,} roofers, {reviews:,} reviews")
+        fixtures = ensure_fixtures(roofers, reviews, args.fixtures_dir, args.seed)
+
+        def log(name, result):
+            print(f"   {name:<8} {result.seconds:9.3f}s  {result.per_second:12,.0f} items/s  ({result.items:,} items)")
+
+        run = run_benchmark(fixtures, stages, args.repeat, args.fixtures_dir, log)
+        record = run.to_dict()
+        for name, (ratio, slower) in compare(record, previous_run(history, roofers, reviews)).items():
+            marker = '⚠️ ' if slower else '  '
+            print(f" {marker} {name:<8} {ratio - 1:+.0%} vs previous run")
+            if slower:
+                regressed.append(f"{name} @ {roofers:,}")
+        history.append(record)
+        if not args.no_history:
+            append_history(record, args.history)
+
+    if not args.no_history:
+        print(f"\n✅ Results appended to {args.history}")
+    if regressed:
+        print(f"⚠️  Slower than the previous run: {', '.join(regressed)}")
+        if args.fail_on_regression:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
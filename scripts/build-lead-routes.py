@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Build the ZIP -> ranked roofer table used to route free-estimate and
+contact leads. Writes public/data/lead-routing/routes.json.
+
+Re-runs are incremental: roofers are compared with the previous build by
+fingerprint (service areas, coordinates, listing, rating) and only the ZIPs
+and counties they affect are re-ranked. Run after importing roofers,
+assigning service areas or geocoding.
+
+Usage:
+  python scripts/build-lead-routes.py
+  python scripts/build-lead-routes.py --full
+  python scripts/build-lead-routes.py --route 33602
+  python scripts/build-lead-routes.py --zip-centroids 2020_Gaz_zcta_national.txt
+
+Requirements:
+- pip install -r scripts/requirements-pipeline.txt
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+from roofer_pipeline import metrics
+from roofer_pipeline.lead_routing import (DEFAULT_K, ROUTES_FILE, LeadRouter, build_routes, load_inputs,
+                                          load_routes, write_routes)
+from roofer_pipeline.near_me import ZIP_CENTROIDS_FILE
+from roofer_pipeline.paths import ROOFERS_TS
+
+
+def main():
+    metrics.start_run()
+    parser = argparse.ArgumentParser(description='Build the lead-routing table for free-estimate and contact leads')
+    parser.add_argument('--k', type=int, default=DEFAULT_K, help='Roofers kept per ZIP and county')
+    parser.add_argument('--full', action='store_true', help='Re-rank every ZIP instead of only the affected ones')
+    parser.add_argument('--zip-centroids', type=Path, default=ZIP_CENTROIDS_FILE,
+                        help='Census ZCTA gazetteer or zip,lat,lng CSV (default: ZIPs on the roster)')
+    parser.add_argument('--roofers', type=Path, default=ROOFERS_TS)
+    parser.add_argument('--output', type=Path, default=ROUTES_FILE)
+    parser.add_argument('--route', metavar='ZIP_OR_ADDRESS', help='Print the routing for a ZIP code or address')
+    args = parser.parse_args()
+
+    print(f"📖 Reading roofers from: {args.roofers}")
+    inputs = load_inputs(args.roofers, centroids_file=args.zip_centroids)
+    zips = (inputs.points['table'] == 'zips').sum()
+    print(f"   {len(inputs.roofers)} visible roofers with coordinates, {zips} ZIPs, "
+          f"{len(inputs.points) - zips} counties")
+    if not args.zip_centroids.exists():
+        print(f"💡 {args.zip_centroids.name} not found, using the ZIP codes on the roster")
+
+    start = time.perf_counter()
+    previous = None if args.full else load_routes(args.output)
+    document, stats = build_routes(inputs, previous, k=args.k)
+    write_routes(document, args.output)
+    elapsed = (time.perf_counter() - start) * 1000
+    size = args.output.stat().st_size / 1024
+
+    if stats.full_rebuild:
+        print(f"✅ Ranked all {stats.points} points → {args.output} ({size:.0f} KB, {elapsed:.0f} ms)")
+    else:
+        print(f"✅ {len(stats.changed_roofers)} roofer(s) changed, re-ranked {stats.rescored} of "
+              f"{stats.points} points → {args.output} ({size:.0f} KB, {elapsed:.0f} ms)")
+
+    if args.route:
+        names = dict(zip(inputs.roofers['id'], inputs.roofers['name']))
+        query = args.route.strip()
+        router = LeadRouter(document)
+        matches = router.route(zip_code=query) if query.isdigit() else router.route(address=query)
+        if not matches:
+            print(f"⚠️  No roofers found for {query}")
+        for roofer_id, score in matches:
+            print(f"   {score:.3f}  {names.get(roofer_id, roofer_id)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Precompute roofer marker clusters for every zoom level of /roofers/map.
+Writes small per-zoom JSON tiles to public/data/map-clusters/ ('all' and
+'preferred' layers plus index.json); the map fetches only the tiles in the
+current viewport instead of loading and clustering every roofer in the
+browser. Run after scripts/geocode-roofers.py.
+
+Usage:
+  python scripts/build-map-clusters.py
+  python scripts/build-map-clusters.py --min-zoom 6 --max-zoom 15
+
+Requirements:
+- pip install -r scripts/requirements-pipeline.txt
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+from roofer_pipeline import metrics
+from roofer_pipeline.map_clusters import MAP_CLUSTERS_DIR, MAX_ZOOM, MIN_ZOOM, build_cluster_tiles
+from roofer_pipeline.paths import ROOFERS_TS
+from roofer_pipeline.spatial import load_roofer_points
+
+
+def main():
+    metrics.start_run()
+    parser = argparse.ArgumentParser(description='Build per-zoom marker cluster tiles for /roofers/map')
+    parser.add_argument('--min-zoom', type=int, default=MIN_ZOOM)
+    parser.add_argument('--max-zoom', type=int, default=MAX_ZOOM)
+    parser.add_argument('--roofers', type=Path, default=ROOFERS_TS)
+    parser.add_argument('--output-dir', type=Path, default=MAP_CLUSTERS_DIR)
+    args = parser.parse_args()
+    if args.min_zoom > args.max_zoom:
+        parser.error('--min-zoom must not be greater than --max-zoom')
+
+    print(f"📖 Reading roofers from: {args.roofers}")
+    roofers = load_roofer_points(args.roofers)
+    print(f"   {len(roofers)} visible roofers with coordinates")
+
+    start = time.perf_counter()
+    index = build_cluster_tiles(roofers, args.output_dir, args.min_zoom, args.max_zoom)
+    elapsed = time.perf_counter() - start
+
+    for layer, info in index['layers'].items():
+        tiles = sum(len(keys) for keys in info['tiles'].values())
+        print(f"   {layer:<10} {info['roofers']:>6} roofers  {tiles:>5} tiles")
+    print(f"✅ Wrote cluster tiles for zoom {args.min_zoom}-{args.max_zoom} to {args.output_dir} ({elapsed:.1f}s)")
+
+
+if __name__ == '__main__':
+    main()
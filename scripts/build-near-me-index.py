@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Precompute the nearest roofers for every city and ZIP code.
+Writes public/data/near-me/cities.json and zips.json, which /roofers/near-me
+reads instead of measuring the distance to every roofer in the browser.
+Run after scripts/geocode-roofers.py so stored coordinates are used.
+
+Usage:
+  python scripts/build-near-me-index.py
+  python scripts/build-near-me-index.py --k 20 --zip-centroids 2020_Gaz_zcta_national.txt
+
+Requirements:
+- pip install -r scripts/requirements-pipeline.txt
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+from roofer_pipeline import metrics
+from roofer_pipeline.near_me import (DEFAULT_K, NEAR_ME_DIR, ZIP_CENTROIDS_FILE, build_lookup, city_points,
+                                     write_lookup, zip_points)
+from roofer_pipeline.paths import ROOFERS_TS
+from roofer_pipeline.spatial import load_roofer_points
+
+
+def main():
+    metrics.start_run()
+    parser = argparse.ArgumentParser(description='Build nearest-roofer lookup tables for /roofers/near-me')
+    parser.add_argument('--k', type=int, default=DEFAULT_K, help='Roofers kept per category at each point')
+    parser.add_argument('--zip-centroids', type=Path, default=ZIP_CENTROIDS_FILE,
+                        help='Census ZCTA gazetteer or zip,lat,lng CSV (default: ZIPs on the roster)')
+    parser.add_argument('--roofers', type=Path, default=ROOFERS_TS)
+    parser.add_argument('--output-dir', type=Path, default=NEAR_ME_DIR)
+    args = parser.parse_args()
+
+    print(f"📖 Reading roofers from: {args.roofers}")
+    roofers = load_roofer_points(args.roofers)
+    print(f"   {len(roofers)} visible roofers with coordinates "
+          f"({', '.join(f'{n} {c}' for c, n in roofers['category'].value_counts().items())})")
+
+    if not args.zip_centroids.exists():
+        print(f"💡 {args.zip_centroids.name} not found, using the ZIP codes on the roster")
+
+    for name, points in (('cities', city_points()), ('zips', zip_points(roofers, args.zip_centroids))):
+        start = time.perf_counter()
+        document = build_lookup(points, roofers, args.k)
+        output = args.output_dir / f'{name}.json'
+        write_lookup(document, output)
+        elapsed = (time.perf_counter() - start) * 1000
+        size = output.stat().st_size / 1024
+        print(f"✅ {len(points)} {name} → {output} ({size:.0f} KB, {elapsed:.0f} ms)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Build the columnar review store (data/roofers/review-store.npz) from every
+imported review: Google reviews in reviews.ts, the Yelp analysis files and
+any manual-import CSVs. Repeated reviews are dropped per roofer (see
+find-duplicate-reviews.py). Prints the per-roofer rating summary, computed
+from the rating column without touching text.
+
+Usage:
+  python scripts/build-review-store.py
+  python scripts/build-review-store.py --csv data/roofers/manual-reviews.csv
+  python scripts/build-review-store.py --summary-only
+  python scripts/build-review-store.py --roofer 2
+
+Requirements:
+- pip install -r scripts/requirements-pipeline.txt
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+from roofer_pipeline import metrics
+from roofer_pipeline.paths import REVIEWS_TS, ROOFERS_TS
+from roofer_pipeline.review_dedupe import dedupe_reviews
+from roofer_pipeline.review_store import (DICTIONARY_SIZE, REVIEW_STORE, YELP_ANALYSIS_FILES, ReviewStore,
+                                          load_reviews)
+
+
+def main():
+    metrics.start_run()
+    parser = argparse.ArgumentParser(description='Build the compressed columnar review store')
+    parser.add_argument('--csv', type=Path, action='append', default=[], help='Manual-import CSV (repeatable)')
+    parser.add_argument('--reviews', type=Path, default=REVIEWS_TS)
+    parser.add_argument('--roofers', type=Path, default=ROOFERS_TS)
+    parser.add_argument('--output', type=Path, default=REVIEW_STORE)
+    parser.add_argument('--dictionary-size', type=int, default=DICTIONARY_SIZE,
+                        help='Trained zstd dictionary size in bytes (0 to disable)')
+    parser.add_argument('--summary-only', action='store_true', help='Print the summary of the existing store')
+    parser.add_argument('--roofer', help='Print the stored reviews for one roofer id')
+    args = parser.parse_args()
+
+    if (args.summary_only or args.roofer) and not args.output.exists():
+        print(f"❌ No review store at {args.output}; build it first")
+        sys.exit(1)
+
+    try:
+        if args.summary_only or args.roofer:
+            store = ReviewStore.load(args.output)
+        else:
+            with metrics.stage('load_reviews') as timer:
+                reviews = load_reviews(args.reviews, args.roofers, args.csv)
+                timer.rows = len(reviews)
+            by_roofer: Dict[str, List[Dict]] = {}
+            for review in reviews:
+                by_roofer.setdefault(review['roofer'], []).append(review)
+            unique = [kept for roofer_reviews in by_roofer.values() for kept in dedupe_reviews(roofer_reviews)[0]]
+            print(f"📖 {len(reviews)} reviews for {len(by_roofer)} roofers, "
+                  f"{len(reviews) - len(unique)} repeats dropped")
+
+            with metrics.stage('build_store') as timer:
+                store = ReviewStore.build(unique, dictionary_size=args.dictionary_size)
+                store.save(args.output)
+                timer.rows = len(store)
+            source_files = [args.reviews, *YELP_ANALYSIS_FILES, *args.csv]
+            source_bytes = sum(path.stat().st_size for path in source_files if path.exists())
+            text_bytes = int(store.text_size.sum())
+            print(f"✅ {len(store)} reviews → {args.output} ({args.output.stat().st_size / 1024:.1f} KB; "
+                  f"sources {source_bytes / 1024:.1f} KB, text {text_bytes / 1024:.1f} KB raw, "
+                  f"{store.frames.nbytes / 1024:.1f} KB compressed"
+                  f"{f', {store.dictionary.nbytes // 1024} KB dictionary' if store.dictionary.size else ''})")
+    except ImportError as e:
+        print(f"❌ Missing dependency: {e}")
+        print("💡 Install with: pip install -r scripts/requirements-pipeline.txt")
+        sys.exit(1)
+
+    if args.roofer:
+        for review in store.reviews(args.roofer):
+            stars = '★' * (review['rating'] or 0)
+            print(f"   {stars:5s} {review['source']:>14s}  {review['text'][:100]}")
+        return
+
+    summary = store.rating_summary().sort_values(['average_rating', 'reviews'], ascending=False)
+    print(f"\n   {'roofer':>8s}  reviews  average  5★ 4★ 3★ 2★ 1★")
+    for roofer_id, row in summary.head(20).iterrows():
+        stars = ' '.join(f"{int(row[f'stars_{n}']):2d}" for n in range(5, 0, -1))
+        print(f"   {roofer_id:>8s}  {int(row['reviews']):7d}  {row['average_rating']:7.2f}  {stars}")
+
+
+if __name__ == '__main__':
+    main()
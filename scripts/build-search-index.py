@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Build the prefix search indexes used by roofer search and the service-area
+autocomplete. Writes public/data/search/places.json and roofers.json, which
+lib/search-index.ts queries instead of scanning every name in the browser.
+Re-run after importing roofers or editing search-data.ts.
+
+Usage:
+  python scripts/build-search-index.py
+  python scripts/build-search-index.py --query "tampa metal"
+
+Requirements:
+- pip install -r scripts/requirements-pipeline.txt
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+from roofer_pipeline import metrics
+from roofer_pipeline.paths import ROOFERS_TS
+from roofer_pipeline.search_index import (PLACE_FIELD_WEIGHTS, ROOFER_FIELD_WEIGHTS, SEARCH_INDEX_DIR, build_index,
+                                          place_documents, roofer_documents, search, write_index)
+
+
+def main():
+    metrics.start_run()
+    parser = argparse.ArgumentParser(description='Build prefix search indexes for roofers and service areas')
+    parser.add_argument('--roofers', type=Path, default=ROOFERS_TS)
+    parser.add_argument('--output-dir', type=Path, default=SEARCH_INDEX_DIR)
+    parser.add_argument('--query', help='Print the top matches for a query from each index')
+    args = parser.parse_args()
+
+    print(f"📖 Reading roofers from: {args.roofers}")
+    sources = (
+        ('places', place_documents, PLACE_FIELD_WEIGHTS),
+        ('roofers', lambda: roofer_documents(args.roofers), ROOFER_FIELD_WEIGHTS),
+    )
+    for name, documents, weights in sources:
+        start = time.perf_counter()
+        index = build_index(documents(), weights)
+        output = args.output_dir / f'{name}.json'
+        write_index(index, output)
+        elapsed = (time.perf_counter() - start) * 1000
+        size = output.stat().st_size / 1024
+        print(f"✅ {len(index['docs'])} {name}, {len(index['suffixes'])} tokens → {output} "
+              f"({size:.0f} KB, {elapsed:.0f} ms)")
+
+        if args.query:
+            for doc, score in search(index, args.query, limit=5):
+                print(f"   {score:7.2f}  {doc['name']}")
+
+
+if __name__ == '__main__':
+    main()
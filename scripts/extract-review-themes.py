@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Fit the review theme model (data/roofers/review-themes.npz) on every
+imported review, and print each roofer's most distinctive review phrases.
+
+Reviews come from the same sources as build-review-store.py, with repeats
+dropped per roofer so a review imported twice does not count twice. The
+Yelp scrapers use the saved model for the themes in their synopses (see
+roofer_pipeline.review_themes).
+
+Usage:
+  python scripts/extract-review-themes.py
+  python scripts/extract-review-themes.py --csv data/roofers/manual-reviews.csv --show 50
+
+Requirements:
+- pip install -r scripts/requirements-pipeline.txt
+"""
+
+import argparse
+from pathlib import Path
+from typing import Dict, List
+
+from roofer_pipeline import metrics
+from roofer_pipeline.paths import REVIEWS_TS, ROOFERS_TS
+from roofer_pipeline.review_dedupe import dedupe_reviews
+from roofer_pipeline.review_store import load_reviews
+from roofer_pipeline.review_themes import MIN_DF, REVIEW_THEMES, TOP_THEMES, ThemeModel
+from roofer_pipeline.roofers_ts import load_roofers
+
+
+def main():
+    metrics.start_run()
+    parser = argparse.ArgumentParser(description='Fit the review theme model and list roofer themes')
+    parser.add_argument('--csv', type=Path, action='append', default=[], help='Manual-import CSV (repeatable)')
+    parser.add_argument('--reviews', type=Path, default=REVIEWS_TS)
+    parser.add_argument('--roofers', type=Path, default=ROOFERS_TS)
+    parser.add_argument('--output', type=Path, default=REVIEW_THEMES)
+    parser.add_argument('--min-df', type=int, default=MIN_DF, help='Reviews a phrase must appear in to be kept')
+    parser.add_argument('--top', type=int, default=TOP_THEMES, help='Themes per roofer')
+    parser.add_argument('--show', type=int, default=20, help='Roofers to print')
+    args = parser.parse_args()
+
+    with metrics.stage('load_reviews') as timer:
+        reviews = load_reviews(args.reviews, args.roofers, args.csv)
+        timer.rows = len(reviews)
+    by_roofer: Dict[str, List[Dict]] = {}
+    for review in reviews:
+        by_roofer.setdefault(review['roofer'], []).append(review)
+    texts = {roofer_id: [review['text'] for review in dedupe_reviews(roofer_reviews)[0]]
+             for roofer_id, roofer_reviews in by_roofer.items()}
+    corpus = [text for roofer_texts in texts.values() for text in roofer_texts]
+    print(f"📖 {len(corpus)} reviews for {len(texts)} roofers ({len(reviews) - len(corpus)} repeats dropped)")
+
+    with metrics.stage('fit') as timer:
+        model = ThemeModel.fit(corpus, min_df=args.min_df)
+        model.save(args.output)
+        timer.rows = len(corpus)
+    print(f"✅ {len(model)} phrases in {args.min_df}+ reviews → {args.output}")
+
+    with metrics.stage('themes') as timer:
+        themes = model.themes(texts, top=args.top)
+        timer.rows = len(themes)
+    names = {str(roofer.get('id')): roofer.get('name') for roofer in load_roofers(args.roofers)}
+    ranked = sorted(themes, key=lambda roofer_id: len(texts[roofer_id]), reverse=True)
+    for roofer_id in ranked[:args.show]:
+        print(f"\n   {names.get(roofer_id, roofer_id)} ({len(texts[roofer_id])} reviews)")
+        print(f"     {', '.join(themes[roofer_id]) or '(no recurring phrases)'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -8,6 +8,13 @@ Setup:
 2. Get your API key from dashboard
 3. Set OUTSCRAPER_API_KEY in .env.local
 4. Run: python3 scripts/fetch-google-reviews-free.py
+
+Each run spends the free-tier budget on the roofers most due for a re-fetch
+(never fetched first, then those whose rating and review count change most
+often - see roofer_pipeline/freshness.py) rather than the first ten. The
+fetched reviews are merged into reviews.ts (same rules as
+import-google-reviews.py); re-fetched reviews keep their original import
+time, so a fetch that finds nothing new leaves the file unchanged.
 """
 
 import os
@@ -17,10 +24,21 @@ import requests
 from pathlib import Path
 from datetime import datetime
 
+from roofer_pipeline import metrics
+from roofer_pipeline.freshness import FreshnessSchedule, format_summary
+from roofer_pipeline.http_client import session
+from roofer_pipeline.replay import service_url
+from roofer_pipeline.reviews_ts import merge_reviews, read_reviews, write_reviews_ts
+from roofer_pipeline.roofers_ts import read_roofers
+
 # Paths
 ROOFERS_FILE = Path(__file__).parent.parent / 'app' / 'roofers' / 'data' / 'roofers.ts'
 REVIEWS_FILE = Path(__file__).parent.parent / 'app' / 'roofers' / 'data' / 'reviews.ts'
 
+SOURCE = 'google'
+OUTSCRAPER = session('outscraper')
+FREE_TIER_ROOFERS = 10
+
 def get_api_key():
     """Get API key from environment"""
     api_key = os.getenv('OUTSCRAPER_API_KEY')
@@ -33,32 +51,13 @@ def get_api_key():
 
 def extract_roofers():
     """Extract roofer data from roofers.ts"""
-    content = ROOFERS_FILE.read_text()
-    roofers = []
-    
-    # Extract roofer entries
-    import re
-    pattern = r"'([^']+)':\s*\{([^}]+(?:\{[^}]*\}[^}]*)*)\}"
-    matches = re.finditer(pattern, content, re.DOTALL)
-    
-    for match in matches:
-        slug = match.group(1)
-        roofer_data = match.group(2)
-        
-        # Extract fields
-        id_match = re.search(r'"id":\s*"([^"]+)"', roofer_data)
-        name_match = re.search(r'"name":\s*"([^"]+)"', roofer_data)
-        google_url_match = re.search(r'"googleBusinessUrl":\s*"([^"]+)"', roofer_data)
-        
-        if id_match and name_match:
-            roofers.append({
-                'id': id_match.group(1),
-                'slug': slug,
-                'name': name_match.group(1),
-                'googleBusinessUrl': google_url_match.group(1) if google_url_match else None,
-            })
-    
-    return roofers
+    _, entries = read_roofers(ROOFERS_FILE)
+    return [{
+        'id': entry.id,
+        'slug': entry.key,
+        'name': entry.fields['name'],
+        'googleBusinessUrl': entry.fields.get('googleBusinessUrl'),
+    } for entry in entries if entry.id and entry.fields.get('name')]
 
 def extract_place_id_from_url(url):
     """Extract Place ID from Google Maps URL"""
@@ -83,7 +82,7 @@ def extract_place_id_from_url(url):
 
 def fetch_reviews_from_outscraper(place_id, api_key):
     """Fetch reviews using Outscraper API"""
-    url = "https://api.outscraper.com/maps/reviews-v3"
+    url = service_url("https://api.outscraper.com/maps/reviews-v3")
     
     params = {
         'query': place_id,
@@ -97,7 +96,7 @@ def fetch_reviews_from_outscraper(place_id, api_key):
     }
     
     try:
-        response = requests.get(url, params=params, headers=headers, timeout=30)
+        response = OUTSCRAPER.get(url, params=params, headers=headers, timeout=30)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as e:
@@ -111,7 +110,7 @@ def convert_outscraper_review(review_data, roofer_id):
         'rooferId': roofer_id,
         'reviewerName': review_data.get('reviewer_name', 'Anonymous'),
         'rating': int(review_data.get('rating', 5)),
-        'reviewText': review_data.get('review_text', ''),
+        'reviewText': review_data.get('review_text') or '',
         'reviewDate': review_data.get('review_datetime_utc', datetime.now().isoformat()),
         'googleReviewUrl': review_data.get('review_url', ''),
         'reviewerPhotoUrl': review_data.get('reviewer_photo', ''),
@@ -121,6 +120,7 @@ def convert_outscraper_review(review_data, roofer_id):
     }
 
 def main():
+    metrics.start_run()
     print("🔍 Free Google Reviews Fetcher")
     print("=" * 50)
     
@@ -141,29 +141,42 @@ def main():
         print("   Add Google Business URLs to roofers in app/roofers/data/roofers.ts")
         return
     
+    # Pick the roofers most due for a re-fetch, limited to 10 for free tier
+    schedule = FreshnessSchedule()
+    by_slug = {r['slug']: r for r in roofers_with_urls}
+    print(format_summary(SOURCE, schedule.summary(SOURCE, by_slug)))
+    due = [by_slug[slug] for slug in schedule.due(SOURCE, by_slug, limit=FREE_TIER_ROOFERS)]
+    if not due:
+        print("✅ Every roofer's Google reviews are fresh; nothing to fetch")
+        return
+    print()
+    
     # Fetch reviews
     all_reviews = {}
     success_count = 0
     
-    for i, roofer in enumerate(roofers_with_urls[:10], 1):  # Limit to 10 for free tier
-        print(f"[{i}/{min(10, len(roofers_with_urls))}] {roofer['name']}")
+    for i, roofer in enumerate(due, 1):
+        print(f"[{i}/{len(due)}] {roofer['name']}")
         
         place_id = extract_place_id_from_url(roofer['googleBusinessUrl'])
         if not place_id:
             print(f"  ⚠️  Could not extract Place ID from URL")
+            schedule.record(SOURCE, roofer['slug'], None, None)  # don't let it hold a slot every run
             continue
         
         result = fetch_reviews_from_outscraper(place_id, api_key)
         if not result:
             continue
         
-        # Parse results
+        # Parse results ('reviews' is the place's review count, the reviews are in 'reviews_data';
+        # a query with no match comes back as an empty list)
         reviews = []
-        if 'data' in result and len(result['data']) > 0:
-            for place_data in result['data']:
-                if 'reviews' in place_data:
-                    for review in place_data['reviews']:
-                        reviews.append(convert_outscraper_review(review, roofer['id']))
+        places = [p for p in result.get('data') or [] if isinstance(p, dict)]
+        for place_data in places:
+            for review in place_data.get('reviews_data') or []:
+                reviews.append(convert_outscraper_review(review, roofer['id']))
+        place = places[0] if places else {}
+        schedule.record(SOURCE, roofer['slug'], place.get('rating'), place.get('reviews'))
         
         if reviews:
             all_reviews[roofer['id']] = reviews
@@ -172,11 +185,18 @@ def main():
         else:
             print(f"  ⚠️  No reviews found")
     
-    # Write to reviews.ts
+    # Merge into reviews.ts
     if all_reviews:
-        print(f"\n💾 Writing {sum(len(r) for r in all_reviews.values())} reviews to reviews.ts...")
-        # This would need to merge with existing reviews
-        print("   (Manual merge required - see GET-GOOGLE-REVIEWS-GUIDE.md)")
+        fetched = [review for reviews in all_reviews.values() for review in reviews]
+        existing = read_reviews(REVIEWS_FILE)
+        imported_at = {review['id']: review.get('importedAt') for review in existing}
+        for review in fetched:
+            review['importedAt'] = imported_at.get(review['id']) or review['importedAt']
+        reviews_dict, duplicates = merge_reviews(existing, fetched)
+        total = sum(len(reviews) for reviews in reviews_dict.values())
+        write_reviews_ts(reviews_dict, REVIEWS_FILE)
+        print(f"\n💾 Merged {len(fetched)} reviews into reviews.ts: {total - len(existing)} new, "
+              f"{len(duplicates)} duplicates dropped")
     
     print(f"\n✅ Complete! Fetched reviews for {success_count} roofers")
     print(f"\n💡 Tip: Outscraper free tier allows 500 reviews/month")
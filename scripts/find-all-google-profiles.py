@@ -11,6 +11,8 @@ from pathlib import Path
 from typing import Dict, List
 import urllib.parse
 
+from roofer_pipeline import metrics
+
 def extract_all_roofers(file_path: Path) -> List[Dict]:
     """Extract all roofer data from TypeScript file."""
     content = file_path.read_text()
@@ -79,6 +81,7 @@ def generate_google_search_url(roofer: Dict) -> str:
 
 def main():
     """Main function."""
+    metrics.start_run()
     print("🔍 Finding Google Business Profiles for all roofers...\n")
     
     roofers_file = Path('app/roofers/data/roofers.ts')
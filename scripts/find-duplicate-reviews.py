@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Report reviews that appear more than once for the same roofer, within and
+across sources: Google reviews in reviews.ts, Yelp reviews kept in the Yelp
+analysis files, and manual-import CSVs. Exact repeats, truncations and
+whitespace/punctuation variants are found with the SimHash index in
+roofer_pipeline.review_dedupe, in one pass over all reviews.
+
+Nothing is changed; import-google-reviews.py and the Yelp scrapers drop
+repeats as they import.
+
+Usage:
+  python scripts/find-duplicate-reviews.py
+  python scripts/find-duplicate-reviews.py --csv data/roofers/manual-reviews.csv --show 20
+
+Requirements:
+- pip install -r scripts/requirements-pipeline.txt
+"""
+
+import argparse
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List
+
+from roofer_pipeline import metrics
+from roofer_pipeline.paths import REVIEWS_TS, ROOFERS_TS
+from roofer_pipeline.review_dedupe import dedupe_reviews
+from roofer_pipeline.review_store import load_reviews
+
+
+def main():
+    metrics.start_run()
+    parser = argparse.ArgumentParser(description='Report repeated reviews per roofer across review sources')
+    parser.add_argument('--csv', type=Path, action='append', default=[], help='Manual-import CSV (repeatable)')
+    parser.add_argument('--reviews', type=Path, default=REVIEWS_TS)
+    parser.add_argument('--roofers', type=Path, default=ROOFERS_TS)
+    parser.add_argument('--show', type=int, default=10, help='Duplicates to print')
+    args = parser.parse_args()
+
+    with metrics.stage('load_reviews') as timer:
+        reviews = load_reviews(args.reviews, args.roofers, args.csv)
+        timer.rows = len(reviews)
+    by_roofer: Dict[str, List[Dict]] = {}
+    for review in reviews:
+        by_roofer.setdefault(review['roofer'], []).append(review)
+    print(f"📖 {len(reviews)} reviews for {len(by_roofer)} roofers")
+
+    duplicates = []
+    with metrics.stage('dedupe_reviews') as timer:
+        timer.rows = len(reviews)
+        for roofer_reviews in by_roofer.values():
+            duplicates.extend(dedupe_reviews(roofer_reviews)[1])
+    metrics.count('duplicate_reviews', len(duplicates))
+
+    if not duplicates:
+        print("✅ No repeated reviews")
+        return
+    kinds = Counter(match.kind for _, _, match in duplicates)
+    pairs = Counter(' / '.join(sorted({review['source'], original['source']})) for review, original, _ in duplicates)
+    print(f"⚠️  {len(duplicates)} repeated reviews: " + ', '.join(f"{n} {kind}" for kind, n in kinds.most_common()))
+    for pair, n in pairs.most_common():
+        print(f"   {n:5d}  {pair}")
+    for review, original, match in duplicates[:args.show]:
+        print(f"\n   roofer {review['roofer']}: {review['source']} {review['id']} repeats "
+              f"{original['source']} {original['id']} ({match.kind})")
+        print(f"     {(review['text'] or '')[:100]}")
+
+
+if __name__ == '__main__':
+    main()
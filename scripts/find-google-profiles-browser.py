@@ -10,6 +10,8 @@ import re
 from pathlib import Path
 from typing import Dict, List
 
+from roofer_pipeline import metrics
+
 def extract_clean_google_url(full_url: str) -> str:
     """Extract clean Google Business Profile URL from full URL."""
     # Remove query parameters after the place ID
@@ -22,6 +24,7 @@ def extract_clean_google_url(full_url: str) -> str:
 
 def main():
     """Main function - this is a template for browser automation."""
+    metrics.start_run()
     print("🌐 Browser-based Google Business Profile Finder\n")
     print("This script is designed to work with browser automation tools.")
     print("For manual processing, use the search URLs in all-google-profiles-search.json\n")
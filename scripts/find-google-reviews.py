@@ -11,6 +11,8 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import urllib.parse
 
+from roofer_pipeline import metrics
+
 def extract_roofers_from_ts(file_path: Path) -> List[Dict]:
     """Extract roofer data from TypeScript file."""
     content = file_path.read_text()
@@ -115,6 +117,7 @@ def create_search_results_file(roofers: List[Dict], output_file: Path):
 
 def main():
     """Main function."""
+    metrics.start_run()
     print("🔍 Finding Google Business Profiles for roofers...\n")
     
     # Paths
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Geocode every roofer once and store latitude/longitude in roofers.ts, with
+geocodePrecision saying whether they are the address or a city/county center.
+Answers from remote geocoders are cached in data/roofers/geocode-cache.sqlite
+(keyed by normalized address), so re-runs only look up new or changed
+addresses. The map, near-me and profile pages read the stored coordinates
+instead of geocoding in the browser.
+
+Usage:
+  python scripts/geocode-roofers.py                              # Nominatim, then city/county centers
+  python scripts/geocode-roofers.py --providers centroid         # offline only
+  python scripts/geocode-roofers.py --providers static --static-file fixtures.json --dry-run
+
+Requirements:
+- pip install -r scripts/requirements-pipeline.txt
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from roofer_pipeline import metrics
+from roofer_pipeline.geocode import GEOCODE_CACHE, PROVIDERS, GeocodeCache, backfill_coordinates, make_providers
+from roofer_pipeline.paths import ROOFERS_TS
+
+
+def main():
+    metrics.start_run()
+    parser = argparse.ArgumentParser(description='Backfill roofer coordinates from a geocoding cache')
+    parser.add_argument('--providers', default='nominatim,centroid',
+                        help=f"Comma-separated lookup order ({', '.join(PROVIDERS)})")
+    parser.add_argument('--static-file', type=Path, help='JSON of {address: [lat, lng]} for the static provider')
+    parser.add_argument('--cache', type=Path, default=GEOCODE_CACHE)
+    parser.add_argument('--roofers', type=Path, default=ROOFERS_TS)
+    parser.add_argument('--refresh', action='store_true', help='Ignore cached answers and look every address up again')
+    parser.add_argument('--dry-run', action='store_true', help='Geocode and report without writing roofers.ts')
+    args = parser.parse_args()
+
+    names = [n.strip() for n in args.providers.split(',') if n.strip()]
+    if 'static' in names and not args.static_file:
+        parser.error('--static-file is required with the static provider')
+    try:
+        providers = make_providers(names, args.static_file)
+    except ImportError as e:
+        print(f"❌ Missing dependency: {e}")
+        print("💡 Install with: pip install -r scripts/requirements-pipeline.txt")
+        sys.exit(1)
+    except ValueError as e:
+        parser.error(str(e))
+
+    def progress(current, total):
+        if current % 25 == 0 or current == total:
+            print(f"   {current}/{total} addresses", end='\r' if current < total else '\n')
+
+    print(f"📖 Geocoding roofers in: {args.roofers}")
+    print(f"   Providers: {' → '.join(p.name for p in providers)}")
+    with GeocodeCache(args.cache) as cache:
+        result = backfill_coordinates(providers, args.roofers, cache, args.refresh, args.dry_run, progress)
+
+    stats = result.stats
+    print(f"\n   {stats.cached} cached, {stats.fetched} geocoded, {stats.local} from service-area centers, "
+          f"{stats.missed} not found")
+    for error in stats.errors[:10]:
+        print(f"⚠️  {error}")
+    if len(stats.errors) > 10:
+        print(f"⚠️  ... and {len(stats.errors) - 10} more errors")
+    if result.missing:
+        print(f"⚠️  No coordinates for {len(result.missing)} roofers (e.g. {', '.join(result.missing[:5])})")
+
+    action = 'Would update' if args.dry_run else 'Updated'
+    print(f"✅ {action} coordinates for {len(result.updated)} roofers ({len(result.unchanged)} already current)")
+
+
+if __name__ == '__main__':
+    main()
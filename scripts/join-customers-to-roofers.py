@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Connect the PRP customer list to nearby roofers.
+Streams data/customers/PRP Customer List.csv.xls, geocodes each customer
+through the shared cache (data/roofers/geocode-cache.sqlite) and joins them
+to the roster with a KD-tree. Customer addresses are personal data, so by
+default they are only matched against the cache and city/county centers;
+sending them to a remote geocoder (Nominatim) needs --remote-geocoding.
+Writes, next to the customer file:
+  customer-roofer-assignments.csv  nearest roofer and nearest preferred roofer per customer
+  roofer-customer-counts.csv       customers nearest to / within --radius of each roofer
+
+Usage:
+  python scripts/join-customers-to-roofers.py
+  python scripts/join-customers-to-roofers.py --radius 15
+  python scripts/join-customers-to-roofers.py --remote-geocoding --providers nominatim,centroid
+  python scripts/join-customers-to-roofers.py --customers customers.csv
+
+Requirements:
+- pip install -r scripts/requirements-pipeline.txt
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from roofer_pipeline import metrics
+from roofer_pipeline.customers import (ASSIGNMENTS_CSV, CHUNK_ROWS, CUSTOMER_FILE, DEFAULT_RADIUS_MILES,
+                                       ROOFER_COUNTS_CSV, run_join, write_results)
+from roofer_pipeline.geocode import GEOCODE_CACHE, PROVIDERS, GeocodeCache, make_providers
+from roofer_pipeline.paths import ROOFERS_TS
+from roofer_pipeline.spatial import load_roofer_points
+
+
+def main():
+    metrics.start_run()
+    parser = argparse.ArgumentParser(description='Spatially join PRP customers to roofers')
+    parser.add_argument('--customers', type=Path, default=CUSTOMER_FILE)
+    parser.add_argument('--providers', default='centroid',
+                        help=f"Comma-separated geocoder lookup order ({', '.join(PROVIDERS)}); "
+                             "cached answers are always used")
+    parser.add_argument('--remote-geocoding', action='store_true',
+                        help='Allow sending customer addresses to remote providers (nominatim)')
+    parser.add_argument('--static-file', type=Path, help='JSON of {address: [lat, lng]} for the static provider')
+    parser.add_argument('--cache', type=Path, default=GEOCODE_CACHE)
+    parser.add_argument('--refresh', action='store_true', help='Ignore cached answers and look every address up again')
+    parser.add_argument('--radius', type=float, default=DEFAULT_RADIUS_MILES,
+                        help='Radius in miles for the per-roofer customer count')
+    parser.add_argument('--chunk-rows', type=int, default=CHUNK_ROWS)
+    parser.add_argument('--roofers', type=Path, default=ROOFERS_TS)
+    parser.add_argument('--assignments', type=Path, default=ASSIGNMENTS_CSV)
+    parser.add_argument('--counts', type=Path, default=ROOFER_COUNTS_CSV)
+    args = parser.parse_args()
+
+    if not args.customers.exists():
+        print(f"❌ Customer file not found: {args.customers}")
+        sys.exit(1)
+
+    names = [n.strip() for n in args.providers.split(',') if n.strip()]
+    if 'static' in names and not args.static_file:
+        parser.error('--static-file is required with the static provider')
+    try:
+        providers = make_providers(names, args.static_file)
+    except ImportError as e:
+        print(f"❌ Missing dependency: {e}")
+        print("💡 Install with: pip install -r scripts/requirements-pipeline.txt")
+        sys.exit(1)
+    except ValueError as e:
+        parser.error(str(e))
+    remote = [p.name for p in providers if p.remote]
+    if remote and not args.remote_geocoding:
+        parser.error(f"{', '.join(remote)} would receive customer addresses; "
+                     "pass --remote-geocoding to allow it")
+
+    roofers = load_roofer_points(args.roofers)
+    print(f"📖 {len(roofers)} visible roofers with coordinates")
+    print(f"📖 Reading customers from: {args.customers}")
+    print(f"   Providers: {' → '.join(p.name for p in providers)}")
+
+    def progress(rows):
+        print(f"   {rows} customers geocoded", end='\r')
+
+    start = time.perf_counter()
+    try:
+        with GeocodeCache(args.cache) as cache:
+            result = run_join(providers, roofers, args.customers, cache, args.radius, args.refresh,
+                              args.chunk_rows, progress)
+    except ImportError as e:
+        print(f"❌ Missing dependency: {e}")
+        print("💡 Install with: pip install -r scripts/requirements-pipeline.txt")
+        sys.exit(1)
+    elapsed = time.perf_counter() - start
+
+    stats = result.stats
+    located = int(result.assignments['lat'].notna().sum())
+    print(f"\n   {stats.cached} cached, {stats.fetched} geocoded, {stats.local} from service-area centers, "
+          f"{stats.missed} not found")
+    for error in stats.errors[:10]:
+        print(f"⚠️  {error}")
+    print(f"   {located}/{result.rows} customers located ({elapsed:.1f}s)")
+
+    write_results(result, args.assignments, args.counts)
+    top = result.counts[result.counts['nearest_customers'] > 0].head(10)
+    for row in top.itertuples(index=False):
+        print(f"   {row.nearest_customers:5d} nearest, {row.customers_within_radius:5d} within "
+              f"{args.radius:g} mi  {row.name}")
+    print(f"✅ Assignments → {args.assignments}")
+    print(f"✅ Per-roofer counts → {args.counts}")
+
+
+if __name__ == '__main__':
+    main()
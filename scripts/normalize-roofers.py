@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Build the canonical contact columns for every roofer.
+Cleans phone (E.164), email, website (registrable domain) and ZIP (ZIP5) for
+the whole roster in one vectorized pass and saves them to
+data/roofers/roofers-normalized.csv, which matchers and exporters load
+through roofer_pipeline.normalize.NormalizedIndex.
+
+Requirements:
+- pip install -r scripts/requirements-pipeline.txt
+"""
+
+import argparse
+from pathlib import Path
+
+from roofer_pipeline import metrics
+from roofer_pipeline.normalize import CANONICAL_COLUMNS, NORMALIZED_CSV, build_normalized_roster, save_normalized
+from roofer_pipeline.paths import ROOFERS_TS
+
+
+def main():
+    metrics.start_run()
+    parser = argparse.ArgumentParser(description='Normalize roofer contact fields')
+    parser.add_argument('--roofers', type=Path, default=ROOFERS_TS)
+    parser.add_argument('--output', type=Path, default=NORMALIZED_CSV)
+    args = parser.parse_args()
+
+    print(f"📖 Reading roofers from: {args.roofers}")
+    df = build_normalized_roster(args.roofers)
+    print(f"   Found {len(df)} roofers\n")
+
+    for column in CANONICAL_COLUMNS:
+        valid = df[column].notna().sum()
+        duplicates = df[column].dropna().duplicated().sum()
+        print(f"   {column:<15} {valid:>6} valid  {duplicates:>5} shared with another roofer")
+
+    save_normalized(df, args.output)
+    print(f"\n✅ Saved canonical columns to: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -3,6 +3,10 @@
 Direct Outscraper API integration for finding Google Business Profiles.
 This script uses the Outscraper API to search for all roofers in bulk.
 
+Usage:
+  python3 scripts/outscraper-api-search.py
+  python3 scripts/outscraper-api-search.py --no-update   # only save the results JSON
+
 Requirements:
 - pip install requests
 - Outscraper API key (get from https://outscraper.com/api-keys)
@@ -11,13 +15,18 @@ Requirements:
 import json
 import csv
 import os
-import time
 import requests
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from roofer_pipeline import metrics
+from roofer_pipeline.http_client import session
+from roofer_pipeline.replay import service_url
+
 # Outscraper API endpoint
-OUTSCRAPER_API_URL = "https://api.outscraper.com/maps/search-v3"
+OUTSCRAPER_API_URL = service_url("https://api.outscraper.com/maps/search-v3")
+# Paced, retried and circuit-broken per host (roofer_pipeline/http_client.py)
+OUTSCRAPER = session('outscraper')
 
 def load_roofers_from_csv(csv_file: Path) -> List[Dict]:
     """Load roofers from the prepared CSV file."""
@@ -67,19 +76,18 @@ def search_with_outscraper(queries: List[str], api_key: str, location: str = "Fl
         }
         
         try:
-            response = requests.post(OUTSCRAPER_API_URL, json=params, headers=headers)
+            response = OUTSCRAPER.post(OUTSCRAPER_API_URL, json=params, headers=headers, timeout=300)
             response.raise_for_status()
             
             data = response.json()
             if 'data' in data:
-                all_results.extend(data['data'])
-                print(f"   ✅ Found {len(data['data'])} results")
+                # One list of places per query
+                places = [place for group in data['data']
+                          for place in (group if isinstance(group, list) else [group])]
+                all_results.extend(places)
+                print(f"   ✅ Found {len(places)} results")
             else:
                 print(f"   ⚠️  No results in response")
-            
-            # Rate limiting - wait between batches
-            if i + batch_size < len(queries):
-                time.sleep(2)  # 2 second delay between batches
                 
         except requests.exceptions.RequestException as e:
             print(f"   ❌ Error: {e}")
@@ -90,34 +98,28 @@ def search_with_outscraper(queries: List[str], api_key: str, location: str = "Fl
     return all_results
 
 def match_results_to_roofers(results: List[Dict], roofers: List[Dict]) -> List[Dict]:
-    """Match API results to roofers by name/phone."""
-    updates = []
+    """Match API results to roofers by canonical phone, then website domain."""
+    from roofer_pipeline.normalize import NormalizedIndex
     
-    # Create lookup by phone number (most reliable)
-    phone_lookup = {}
-    for roofer in roofers:
-        phone = roofer.get('phone', '').strip()
-        if phone:
-            # Normalize phone number
-            phone_normalized = phone.replace('-', '').replace('(', '').replace(')', '').replace(' ', '')
-            phone_lookup[phone_normalized] = roofer
+    index = NormalizedIndex.load()
+    wanted = {roofer.get('slug') for roofer in roofers}
+    updates = []
+    seen = set()
     
-    # Match results to roofers
     for result in results:
-        result_phone = result.get('phone', '').strip()
-        if result_phone:
-            # Normalize phone number
-            result_phone_normalized = result_phone.replace('-', '').replace('(', '').replace(')', '').replace(' ', '')
-            
-            if result_phone_normalized in phone_lookup:
-                roofer = phone_lookup[result_phone_normalized]
-                google_url = result.get('url') or result.get('google_maps_url')
-                
-                if google_url:
-                    updates.append({
-                        'slug': roofer.get('slug'),
-                        'googleBusinessUrl': google_url
-                    })
+        google_url = result.get('url') or result.get('google_maps_url')
+        if not google_url:
+            continue
+        
+        # Phone is the most reliable key; fall back to the website domain
+        slugs = index.by_phone(result.get('phone')) or index.by_website(result.get('site'))
+        for slug in slugs:
+            if slug in wanted and slug not in seen:
+                seen.add(slug)
+                updates.append({
+                    'slug': slug,
+                    'googleBusinessUrl': google_url
+                })
     
     return updates
 
@@ -126,6 +128,7 @@ def main():
     import sys
     
     print("🚀 Outscraper API Google Business Profile Search\n")
+    metrics.start_run()
     
     # Check for API key
     api_key = os.getenv('OUTSCRAPER_API_KEY')
@@ -172,8 +175,8 @@ def main():
     output_file.write_text(json.dumps(updates, indent=2))
     print(f"✅ Saved results to: {output_file}")
     
-    # Update roofer data
-    if updates:
+    # Update roofer data (run-pipeline.py leaves this to process-bulk-results.py)
+    if updates and '--no-update' not in sys.argv:
         print("\n🔄 Updating roofer data...")
         from batch_update_google_urls import update_roofer_google_url
         
@@ -10,6 +10,8 @@ import csv
 from pathlib import Path
 from typing import Dict, List
 
+from roofer_pipeline import metrics
+
 def extract_all_roofers(file_path: Path) -> List[Dict]:
     """Extract all roofer data from TypeScript file."""
     content = file_path.read_text()
@@ -148,6 +150,7 @@ def create_manual_csv(roofers: List[Dict], output_file: Path):
 
 def main():
     """Main function."""
+    metrics.start_run()
     print("📦 Preparing roofer data for bulk Google Business Profile search...\n")
     
     roofers_file = Path('app/roofers/data/roofers.ts')
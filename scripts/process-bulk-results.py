@@ -10,6 +10,8 @@ import re
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from roofer_pipeline import metrics
+
 def extract_google_url_from_result(result: Dict) -> Optional[str]:
     """Extract Google Business Profile URL from result data."""
     # Try different possible field names
@@ -141,6 +143,7 @@ def update_roofer_data(roofers_file: Path, updates: List[Dict]):
 def main():
     """Main function."""
     import sys
+    metrics.start_run()
     
     print("🔄 Processing bulk Google Business Profile results...\n")
     
@@ -171,12 +174,14 @@ def main():
     print(f"   Format: {format_type}\n")
     
     # Process based on format
-    if format_type == 'outscraper':
-        updates = process_outscraper_results(results_file)
-    elif format_type == 'apify':
-        updates = process_apify_results(results_file)
-    else:  # manual
-        updates = process_manual_csv(results_file)
+    with metrics.stage('read') as stage:
+        if format_type == 'outscraper':
+            updates = process_outscraper_results(results_file)
+        elif format_type == 'apify':
+            updates = process_apify_results(results_file)
+        else:  # manual
+            updates = process_manual_csv(results_file)
+        stage.rows = len(updates)
     
     if not updates:
         print("❌ No updates found in results file")
@@ -186,7 +191,9 @@ def main():
     print(f"✅ Found {len(updates)} Google Business URLs to update\n")
     
     # Update roofer data
-    update_roofer_data(roofers_file, updates)
+    with metrics.stage('emit') as stage:
+        update_roofer_data(roofers_file, updates)
+        stage.rows = len(updates)
     
     print("\n✅ Done!")
     print("\n💡 Next steps:")
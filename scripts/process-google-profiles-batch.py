@@ -2,65 +2,133 @@
 """
 Batch processor for finding Google Business Profiles.
 This script helps process roofers in manageable batches.
+
+Batches are checked out from a shared work queue (data/roofers/work-queue.sqlite)
+instead of fixed slices, so several people can work at once without getting
+the same roofers. A checked-out batch is held for a few days; roofers from an
+abandoned batch go back to the pool when that time runs out.
+
+Usage:
+  python3 scripts/process-google-profiles-batch.py                # check out 20 roofers
+  python3 scripts/process-google-profiles-batch.py --size 50
+  python3 scripts/process-google-profiles-batch.py --complete     # after updating found-google-urls.json
+  python3 scripts/process-google-profiles-batch.py --status
 """
 
+import argparse
+import getpass
 import json
+import socket
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Set
+
+from roofer_pipeline import metrics
+from roofer_pipeline.paths import DATA_DIR, GOOGLE_PROFILES_SEARCH_JSON
+from roofer_pipeline.work_queue import PENDING, WorkQueue
+
+QUEUE = 'google-profiles'
+FOUND_URLS_FILE = DATA_DIR / 'found-google-urls.json'
+# People work a batch by hand, so leases last days rather than minutes
+BATCH_LEASE_SECONDS = 3 * 24 * 3600
 
 def load_roofers_needing_urls() -> List[Dict]:
     """Load all roofers that need Google Business URLs."""
-    search_file = Path('data/roofers/all-google-profiles-search.json')
+    search_file = GOOGLE_PROFILES_SEARCH_JSON
     if not search_file.exists():
         print(f"❌ Error: {search_file} not found")
         print("   Run: python3 scripts/find-all-google-profiles.py")
         return []
-    
+
     roofers_data = json.loads(search_file.read_text())
     return [r for r in roofers_data if not r.get('hasGoogleUrl')]
 
-def create_batch_file(batch_num: int, batch_size: int = 20) -> Path:
-    """Create a batch file for processing."""
-    roofers = load_roofers_needing_urls()
-    
-    if not roofers:
-        print("✅ All roofers already have Google Business URLs!")
+def load_found_slugs() -> Set[str]:
+    """Slugs that already have a URL in found-google-urls.json."""
+    if not FOUND_URLS_FILE.exists():
+        return set()
+    return {entry['slug'] for entry in json.loads(FOUND_URLS_FILE.read_text())
+            if entry.get('slug') and (entry.get('googleBusinessUrl') or '').strip()}
+
+def batch_file_for(worker: str) -> Path:
+    safe = ''.join(c if c.isalnum() or c in '-_' else '-' for c in worker)
+    return DATA_DIR / f'batch-{safe}-to-process.json'
+
+def check_out_batch(queue: WorkQueue, worker: str, batch_size: int) -> Optional[Path]:
+    """Write this worker's batch file, claiming new roofers only if none are checked out."""
+    tasks = queue.held(QUEUE, worker)
+    if tasks:
+        print(f"ℹ️  You still have {len(tasks)} roofers checked out; renewing them instead of taking more")
+        for task in tasks:
+            queue.heartbeat(task)
+    else:
+        queue.enqueue(QUEUE, ((r['slug'], r) for r in load_roofers_needing_urls()))
+        while len(tasks) < batch_size:
+            task = queue.claim(QUEUE, worker)
+            if task is None:
+                break
+            tasks.append(task)
+
+    if not tasks:
         return None
-    
-    start_idx = (batch_num - 1) * batch_size
-    end_idx = start_idx + batch_size
-    batch = roofers[start_idx:end_idx]
-    
-    if not batch:
-        print(f"❌ Batch {batch_num} is empty (all roofers processed)")
-        return None
-    
-    batch_file = Path(f'data/roofers/batch-{batch_num}-to-process.json')
-    batch_file.parent.mkdir(parents=True, exist_ok=True)
-    batch_file.write_text(json.dumps(batch, indent=2))
-    
+
+    batch_file = batch_file_for(worker)
+    batch_file.write_text(json.dumps([task.payload for task in tasks], indent=2))
     return batch_file
 
+def complete_batch(queue: WorkQueue, worker: str):
+    """Mark roofers with a found URL done; the rest go back for someone else to try."""
+    found = load_found_slugs()
+    tasks = queue.held(QUEUE, worker)
+    if not tasks:
+        print("ℹ️  No roofers checked out")
+        return
+
+    done = returned = 0
+    for task in tasks:
+        if task.key in found:
+            queue.complete(task, {'slug': task.key})
+            done += 1
+        elif queue.fail(task, f'not found by {worker}') == PENDING:
+            returned += 1
+    print(f"✅ {done} roofers done, {returned} returned to the queue, "
+          f"{len(tasks) - done - returned} given up on after {queue.max_attempts} tries")
+    batch_file_for(worker).unlink(missing_ok=True)
+
+def print_status(queue: WorkQueue):
+    counts = queue.counts(QUEUE)
+    print(f"📊 Queue '{QUEUE}': {counts['done']} done, {counts['pending']} waiting, "
+          f"{counts['leased']} checked out, {counts['failed']} given up")
+    for key, attempts, error in queue.failures(QUEUE):
+        print(f"   ❌ {key} ({attempts} tries): {error}")
+
 def main():
     """Main function."""
-    import sys
-    
+    metrics.start_run()
     print("📦 Google Business Profile Batch Processor\n")
-    
-    if len(sys.argv) < 2:
-        print("Usage: python3 process-google-profiles-batch.py <batch_number> [batch_size]")
-        print("\nExample:")
-        print("  python3 process-google-profiles-batch.py 1    # Process batch 1 (20 roofers)")
-        print("  python3 process-google-profiles-batch.py 2 50 # Process batch 2 (50 roofers)")
+
+    parser = argparse.ArgumentParser(description='Check out batches of roofers to find Google Business Profiles for')
+    parser.add_argument('--size', type=int, default=20, help='Roofers per batch')
+    parser.add_argument('--worker', default=f"{getpass.getuser()}@{socket.gethostname()}",
+                        help='Who is working the batch (default: user@host)')
+    parser.add_argument('--complete', action='store_true',
+                        help='Finish your batch using data/roofers/found-google-urls.json')
+    parser.add_argument('--status', action='store_true', help='Show queue progress')
+    args = parser.parse_args()
+
+    queue = WorkQueue(lease_seconds=BATCH_LEASE_SECONDS, retry_backoff=0)
+
+    if args.status:
+        print_status(queue)
         return
-    
-    batch_num = int(sys.argv[1])
-    batch_size = int(sys.argv[2]) if len(sys.argv) > 2 else 20
-    
-    print(f"Creating batch {batch_num} with {batch_size} roofers...\n")
-    
-    batch_file = create_batch_file(batch_num, batch_size)
-    
+    if args.complete:
+        complete_batch(queue, args.worker)
+        print_status(queue)
+        return
+
+    print(f"Checking out up to {args.size} roofers for {args.worker}...\n")
+
+    batch_file = check_out_batch(queue, args.worker, args.size)
+
     if batch_file:
         print(f"✅ Created: {batch_file}")
         print(f"\n📋 Instructions:")
@@ -74,24 +142,10 @@ def main():
         print(f"      }}")
         print(f"   5. After processing the batch, run:")
         print(f"      python3 scripts/batch-update-google-urls.py")
-        print(f"   6. Then process the next batch: batch {batch_num + 1}")
+        print(f"      python3 scripts/process-google-profiles-batch.py --complete")
+        print(f"   6. Then check out the next batch: python3 scripts/process-google-profiles-batch.py")
+    else:
+        print("✅ No roofers left to check out (all done or checked out by others)")
 
 if __name__ == '__main__':
     main()
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
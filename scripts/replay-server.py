@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Run a local stand-in for Yelp, Yelp Fusion and Outscraper.
+Serves deterministic business pages, Fusion search/details/reviews and
+Outscraper search/reviews for every roofer in roofers.ts (or a synthetic
+catalog), with optional latency, injected 429/503 responses and a per-service
+rate limit, so the fetchers can be exercised and benchmarked offline.
+
+Point the fetchers at it with:
+  export REPLAY_SERVER_URL=http://127.0.0.1:8765
+  export YELP_API_KEY=replay OUTSCRAPER_API_KEY=replay
+
+Usage:
+  python scripts/replay-server.py
+  python scripts/replay-server.py --latency-ms 150 --jitter-ms 100 --throttle-rate 0.05
+  python scripts/replay-server.py --rate-limit 5 --burst 10 --synthetic 10000
+  python scripts/replay-server.py --recordings data/roofers/yelp-pages   # serve captured Yelp pages
+
+Requirements:
+- pip install -r scripts/requirements-pipeline.txt
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from roofer_pipeline import metrics
+from roofer_pipeline.paths import ROOFERS_TS
+from roofer_pipeline.replay import DEFAULT_HOST, DEFAULT_PORT, REPLAY_ENV, Catalog, ReplayConfig, make_server
+
+
+def main():
+    metrics.start_run()
+    parser = argparse.ArgumentParser(description='Local replay server for Yelp, Yelp Fusion and Outscraper')
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='Delay added to every response')
+    parser.add_argument('--jitter-ms', type=float, default=0.0, help='Extra uniform random delay, 0..N ms')
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help='Fraction of requests answered with 429')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests answered with 503')
+    parser.add_argument('--rate-limit', type=float, default=0.0,
+                        help='Requests per second allowed per service before 429 (0 = unlimited)')
+    parser.add_argument('--burst', type=int, default=10, help='Burst size for --rate-limit')
+    parser.add_argument('--retry-after', type=float, default=1.0, help='Retry-After seconds sent with 429s')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--roofers', type=Path, default=ROOFERS_TS)
+    parser.add_argument('--synthetic', type=int, help='Serve N synthetic businesses instead of the roster')
+    parser.add_argument('--recordings', type=Path, help='Directory with captured Yelp pages (biz/<alias>.html)')
+    parser.add_argument('--no-auth', action='store_true', help='Accept API requests without a key')
+    parser.add_argument('--verbose', action='store_true', help='Log every request')
+    args = parser.parse_args()
+
+    for name in ('throttle_rate', 'error_rate'):
+        if not 0 <= getattr(args, name) <= 1:
+            parser.error(f"--{name.replace('_', '-')} must be between 0 and 1")
+    if args.recordings and not args.recordings.is_dir():
+        print(f"❌ Recordings directory not found: {args.recordings}")
+        sys.exit(1)
+
+    if args.synthetic:
+        catalog = Catalog.synthetic(args.synthetic, args.seed)
+        print(f"📖 {len(catalog.businesses):,} synthetic businesses")
+    else:
+        catalog = Catalog.from_roster(args.roofers, args.seed)
+        print(f"📖 {len(catalog.businesses):,} businesses from {args.roofers}")
+
+    config = ReplayConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        throttle_rate=args.throttle_rate,
+        error_rate=args.error_rate,
+        rate_limit=args.rate_limit,
+        burst=args.burst,
+        retry_after=args.retry_after,
+        seed=args.seed,
+        require_keys=not args.no_auth,
+        recordings=args.recordings,
+        verbose=args.verbose,
+    )
+    try:
+        server = make_server(catalog, config, args.host, args.port)
+    except OSError as e:
+        print(f"❌ Could not listen on {args.host}:{args.port}: {e}")
+        sys.exit(1)
+
+    sample = catalog.businesses[0] if catalog.businesses else None
+    print(f"✅ Listening on {server.base_url}")
+    print(f"   Latency {args.latency_ms:g} ms + 0..{args.jitter_ms:g} ms, "
+          f"429 rate {args.throttle_rate:.0%}, 503 rate {args.error_rate:.0%}, "
+          f"rate limit {f'{args.rate_limit:g}/s' if args.rate_limit else 'off'}")
+    if sample:
+        print(f"   Example: {server.base_url}{sample.yelp_path}")
+        print(f"            {server.base_url}/v3/businesses/{sample.id}/reviews")
+    print(f"💡 export {REPLAY_ENV}={server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\n📊 {server.stats.to_dict()}")
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
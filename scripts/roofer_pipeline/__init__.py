@@ -0,0 +1,7 @@
+"""
+Shared building blocks for the roofer data pipeline scripts.
+
+The hyphenated scripts in scripts/ and data/roofers/ are the entry points;
+the modules in this package hold the logic they have in common so that each
+stage parses, normalizes and writes roofer data the same way.
+"""
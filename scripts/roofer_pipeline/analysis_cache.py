@@ -0,0 +1,65 @@
+"""
+On-disk memo of review analysis results.
+
+A scraper run fetches every roofer's reviews again, but most roofers have
+the same reviews as last time. analyze_reviews() (reviews.py) keeps one
+entry per roofer: the result together with review_set_key(), a hash of the
+review ids it was computed from, and the analyzer version
+(reviews.analyzer_version(): ANALYZER_VERSION plus the theme model in use).
+A lookup only hits when both still match; otherwise the roofer is analyzed
+again and its entry replaced, so the cache never holds more than one row
+per roofer. Changing the analyzer therefore needs only a version bump, and
+never a cache purge.
+
+Entries live in data/roofers/analysis-cache.sqlite (git-ignored). Every
+operation uses its own short transaction, so the scraper workers can share
+one cache across threads and processes.
+"""
+
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+from .paths import DATA_DIR
+from .work_queue import transaction
+
+ANALYSIS_CACHE = DATA_DIR / 'analysis-cache.sqlite'
+
+
+def review_set_key(reviews: Iterable[Dict]) -> str:
+    """Hash of the review ids (the text, for reviews without one), in any order."""
+    ids = sorted(str(review.get('id') or review.get('text') or '') for review in reviews)
+    return hashlib.sha256('\n'.join(ids).encode('utf-8')).hexdigest()
+
+
+class AnalysisCache:
+    """The latest analysis result per roofer, valid for one review set and analyzer version."""
+
+    def __init__(self, path: Path = ANALYSIS_CACHE):
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with transaction(path) as conn:
+            # Rows keyed by review set alone were never replaced
+            conn.execute('DROP TABLE IF EXISTS analysis')
+            conn.execute('CREATE TABLE IF NOT EXISTS roofer_analysis ('
+                         ' roofer TEXT PRIMARY KEY, review_set TEXT NOT NULL, version TEXT NOT NULL,'
+                         ' result TEXT NOT NULL, updated_at REAL)')
+
+    def get(self, roofer: str, review_set: str, version: str) -> Optional[Dict]:
+        """The roofer's cached result, or None if missing or computed from other reviews or another version."""
+        with transaction(self.path) as conn:
+            row = conn.execute('SELECT result FROM roofer_analysis WHERE roofer = ? AND review_set = ? AND version = ?',
+                               (roofer, review_set, version)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, roofer: str, review_set: str, version: str, result: Dict):
+        """Store the roofer's result, replacing whatever it had before."""
+        with transaction(self.path) as conn:
+            conn.execute('INSERT OR REPLACE INTO roofer_analysis VALUES (?, ?, ?, ?, ?)',
+                         (roofer, review_set, version, json.dumps(result, ensure_ascii=False), time.time()))
+
+    def __len__(self) -> int:
+        with transaction(self.path) as conn:
+            return conn.execute('SELECT COUNT(*) FROM roofer_analysis').fetchone()[0]
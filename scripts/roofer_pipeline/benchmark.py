@@ -0,0 +1,351 @@
+"""
+Pipeline benchmarks over synthetic fixtures.
+
+Fixtures are generated deterministically from a seed at any scale: a
+roofers.ts with N entries in the real file's layout, the matching
+roofers-data.json (Excel export shape) and a JSON-lines review file. The
+hot paths are timed stage by stage:
+
+  parse     read_roofers() on roofers.ts
+  resolve   RooferIndex over the entries, resolving every Excel record name
+  patch     field_edits() + apply_edits() on 10% of the entries
+  analyze   load the reviews and run analyze_reviews() per roofer
+  emit      render every entry back to roofers.ts source and write it
+
+Each run is appended to data/benchmarks/history.json and compared with the
+last run at the same scale, so a slower hot path shows up as a number.
+"""
+
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .geography import cities
+from .paths import REPO_ROOT
+from .reviews import NEGATIVE_KEYWORDS, POSITIVE_KEYWORDS, analyze_reviews
+from .roofer_index import RooferIndex, create_slug
+from .roofers_ts import apply_edits, field_edits, read_roofers, render_entry
+
+BENCHMARK_DIR = REPO_ROOT / 'data' / 'benchmarks'
+FIXTURES_DIR = BENCHMARK_DIR / 'fixtures'
+HISTORY_FILE = BENCHMARK_DIR / 'history.json'
+
+STAGES = ('parse', 'resolve', 'patch', 'analyze', 'emit')
+DEFAULT_SCALES = (1_000, 10_000, 100_000)
+DEFAULT_REVIEWS = 1_000_000
+
+# Share of entries touched by the patch stage
+PATCH_FRACTION = 0.1
+
+# A stage this much slower than the previous run at the same scale is flagged
+REGRESSION_THRESHOLD = 0.20
+
+# Stages faster than this are too noisy to flag
+MIN_COMPARE_SECONDS = 0.05
+
+ROOFERS_TS_HEADER = """// Synthetic benchmark fixture (scripts/benchmark-pipeline.py)
+
+export const rooferData: Record<string, RooferData | any> = {
+
+"""
+ROOFERS_TS_FOOTER = """
+};
+
+export function getAllRoofers(): RooferData[] {
+  return Object.values(rooferData);
+}
+"""
+
+NAME_WORDS = ('Coastal', 'Sunshine', 'Premier', 'Gulf', 'Atlantic', 'Elite', 'Tropical', 'Summit',
+              'Bay', 'Palm', 'Legacy', 'Pinnacle', 'Family', 'Quality', 'Storm', 'Harbor')
+NAME_SUFFIXES = ('Roofing LLC', 'Roofing Inc', 'Roofing & Sheet Metal', 'Construction Co', 'Roof Systems')
+SPECIALTIES = ('Residential Roofing', 'Commercial Roofing', 'Roof Installation', 'Roof Replacement',
+               'Roof Repair', 'Roof Maintenance', 'Metal Roofing', 'Tile Roofing', 'Shingle Roofing')
+ABOUT_TEXT = ('<h3 class="text-2xl font-semibold text-rif-black mb-4 mt-0">Professional Roofing Services in {city}, FL</h3>\n'
+              '<p class="mb-6">{name} is a professional roofing contractor serving {city}, FL and surrounding '
+              'areas, providing installation, replacement, and repair services for roofing systems '
+              'suited to Florida\'s climate.</p>')
+REVIEW_FRAGMENTS = (
+    'The crew showed up on time and finished in two days.',
+    'They replaced our roof after the storm and handled the insurance claim.',
+    'Pricing was fair and the estimate matched the final invoice.',
+    'Communication could have been better during the permit process.',
+    'Cleanup was thorough and the yard was spotless afterwards.',
+    'We had a leak a month later and they came back to fix it.',
+    'The project manager answered every question we had.',
+    'Scheduling took weeks and nobody returned my calls.',
+    'Metal roof looks great and the house is noticeably cooler.',
+    'They found rotten decking and showed us photos before replacing it.',
+)
+
+
+@dataclass
+class StageResult:
+    seconds: float          # best of the repeats
+    median: float
+    items: int
+
+    @property
+    def per_second(self) -> float:
+        return self.items / self.seconds if self.seconds > 0 else 0.0
+
+    def to_dict(self) -> Dict:
+        return {'seconds': round(self.seconds, 4), 'median': round(self.median, 4),
+                'items': self.items, 'per_second': round(self.per_second, 1)}
+
+
+@dataclass
+class Fixtures:
+    roofers: int
+    reviews: int
+    roofers_ts: Path
+    roofers_json: Path
+    reviews_jsonl: Path
+
+
+@dataclass
+class BenchmarkRun:
+    roofers: int
+    reviews: int
+    repeat: int
+    stages: Dict[str, StageResult] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict:
+        return {
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'commit': git_commit(),
+            'python': platform.python_version(),
+            'machine': f"{platform.system()} {platform.machine()}",
+            'roofers': self.roofers,
+            'reviews': self.reviews,
+            'repeat': self.repeat,
+            'stages': {name: result.to_dict() for name, result in self.stages.items()},
+        }
+
+
+def git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT,
+                             capture_output=True, text=True, timeout=10)
+        return out.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def synthetic_roofers(n: int, seed: int = 0) -> List[Tuple[str, Dict]]:
+    """N (slug, fields) entries shaped like roofers.ts, over the real service-area cities."""
+    rng = np.random.default_rng(seed)
+    places = cities()
+    words = rng.integers(0, len(NAME_WORDS), size=(n, 2))
+    suffixes = rng.integers(0, len(NAME_SUFFIXES), size=n)
+    place_idx = rng.integers(0, len(places), size=n)
+    preferred = rng.random(n) < 0.05
+
+    entries = []
+    for i in range(n):
+        place = places[place_idx[i]]
+        name = f"{NAME_WORDS[words[i, 0]]} {NAME_WORDS[words[i, 1]]} {NAME_SUFFIXES[suffixes[i]]} {i + 1}".upper()
+        slug = create_slug(name)
+        specialties = [SPECIALTIES[j] for j in sorted(rng.choice(len(SPECIALTIES), size=4, replace=False))]
+        entries.append((slug, {
+            'id': str(i + 1),
+            'name': name,
+            'slug': slug,
+            'phone': f"{rng.integers(200, 999)}-{rng.integers(200, 999)}-{rng.integers(1000, 9999)}",
+            'email': f"info@{slug[:30]}.com",
+            'websiteUrl': f"https://{slug[:30]}.com",
+            'address': f"{rng.integers(100, 9999)} Main St",
+            'city': place.name,
+            'state': 'FL',
+            'zipCode': f"3{rng.integers(2000, 4999)}",
+            'aboutText': ABOUT_TEXT.format(name=name, city=place.name),
+            'specialties': specialties,
+            'serviceAreas': {'regions': [place.region_slug], 'counties': [place.county_slug],
+                             'cities': [place.slug]},
+            'isPreferred': bool(preferred[i]),
+            'isHidden': False,
+        }))
+    return entries
+
+
+def write_roofers_ts(entries: List[Tuple[str, Dict]], path: Path):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(ROOFERS_TS_HEADER)
+        f.write(',\n\n'.join(render_entry(slug, fields) for slug, fields in entries))
+        f.write(ROOFERS_TS_FOOTER)
+
+
+def write_roofers_json(entries: List[Tuple[str, Dict]], path: Path):
+    """The Excel export shape of roofers-data.json."""
+    records = [{
+        'Name': fields['name'],
+        'Address': fields['address'],
+        'City': fields['city'],
+        'State': 'FL',
+        'Zip Code': int(fields['zipCode']),
+        'Phone Number': fields['phone'],
+        'Email': fields['email'],
+        'website': fields['websiteUrl'].replace('https://', ''),
+    } for _, fields in entries]
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(records, f)
+
+
+def write_reviews(n: int, path: Path, seed: int = 0):
+    """
+    N reviews as JSON lines of {roofer, rating, text}.
+
+    `roofer` is a plain number; the analyze stage maps it onto the roster
+    (roofer % size), so one review file serves every scale.
+    """
+    rng = np.random.default_rng(seed + 1)
+    keywords = POSITIVE_KEYWORDS + NEGATIVE_KEYWORDS
+    ratings = rng.choice([1, 2, 3, 4, 5], size=n, p=[0.08, 0.05, 0.07, 0.2, 0.6])
+    fragments = rng.integers(0, len(REVIEW_FRAGMENTS), size=(n, 3))
+    keyword_idx = rng.integers(0, len(keywords), size=(n, 2))
+    roofer = rng.integers(0, 2 ** 31 - 1, size=n)
+    with open(path, 'w', encoding='utf-8') as f:
+        for i in range(n):
+            text = (f"{REVIEW_FRAGMENTS[fragments[i, 0]]} {keywords[keyword_idx[i, 0]].capitalize()} work. "
+                    f"{REVIEW_FRAGMENTS[fragments[i, 1]]} {REVIEW_FRAGMENTS[fragments[i, 2]]} "
+                    f"Would say {keywords[keyword_idx[i, 1]]}.")
+            f.write(json.dumps({'roofer': int(roofer[i]), 'rating': int(ratings[i]), 'text': text}) + '\n')
+
+
+def ensure_fixtures(roofers: int, reviews: int, directory: Path = FIXTURES_DIR, seed: int = 0,
+                    log: Callable[[str], None] = print) -> Fixtures:
+    """Generate the fixture files for a scale unless they already exist."""
+    directory.mkdir(parents=True, exist_ok=True)
+    fixtures = Fixtures(
+        roofers, reviews,
+        directory / f'roofers-{roofers}-s{seed}.ts',
+        directory / f'roofers-data-{roofers}-s{seed}.json',
+        directory / f'reviews-{reviews}-s{seed}.jsonl',
+    )
+    if not fixtures.roofers_ts.exists() or not fixtures.roofers_json.exists():
+        log(f"   generating {roofers:,} roofers")
+        entries = synthetic_roofers(roofers, seed)
+        write_roofers_ts(entries, fixtures.roofers_ts)
+        write_roofers_json(entries, fixtures.roofers_json)
+    if not fixtures.reviews_jsonl.exists():
+        log(f"   generating {reviews:,} reviews")
+        write_reviews(reviews, fixtures.reviews_jsonl, seed)
+    return fixtures
+
+
+def time_stage(fn: Callable[[], int], repeat: int = 1) -> StageResult:
+    """Run a stage `repeat` times; fn returns the number of items it processed."""
+    timings, items = [], 0
+    for _ in range(max(1, repeat)):
+        gc.collect()
+        start = time.perf_counter()
+        items = fn()
+        timings.append(time.perf_counter() - start)
+    return StageResult(min(timings), statistics.median(timings), items)
+
+
+def stage_functions(fixtures: Fixtures, output_dir: Path) -> Dict[str, Callable[[], int]]:
+    """The benchmarked stages, closed over one parse of the fixture for the later stages."""
+    content, entries = read_roofers(fixtures.roofers_ts)
+    with open(fixtures.roofers_json, 'r', encoding='utf-8') as f:
+        records = json.load(f)
+    ids = [entry.id for entry in entries]
+
+    def parse() -> int:
+        return len(read_roofers(fixtures.roofers_ts)[1])
+
+    def resolve() -> int:
+        index = RooferIndex(entries)
+        index.resolve_many(record['Name'] for record in records)
+        return len(records)
+
+    def patch() -> int:
+        step = max(1, int(round(1 / PATCH_FRACTION)))
+        edits = []
+        for i, entry in enumerate(entries[::step]):
+            edits.extend(field_edits(content, entry, {'isPreferred': True, 'sortOverride': i}))
+        apply_edits(content, edits)
+        return len(entries[::step])
+
+    def analyze() -> int:
+        by_roofer: Dict[str, List[Dict]] = {}
+        count = 0
+        with open(fixtures.reviews_jsonl, 'r', encoding='utf-8') as f:
+            for line in f:
+                review = json.loads(line)
+                by_roofer.setdefault(ids[review['roofer'] % len(ids)], []).append(review)
+                count += 1
+        for reviews in by_roofer.values():
+            analyze_reviews(reviews)
+        return count
+
+    def emit() -> int:
+        output = output_dir / f'emit-{fixtures.roofers}.ts'
+        with open(output, 'w', encoding='utf-8') as f:
+            f.write(ROOFERS_TS_HEADER)
+            f.write(',\n\n'.join(render_entry(entry.key, entry.fields) for entry in entries))
+            f.write(ROOFERS_TS_FOOTER)
+        output.unlink()
+        return len(entries)
+
+    return {'parse': parse, 'resolve': resolve, 'patch': patch, 'analyze': analyze, 'emit': emit}
+
+
+def run_benchmark(fixtures: Fixtures, stages: Sequence[str] = STAGES, repeat: int = 1,
+                  output_dir: Path = FIXTURES_DIR,
+                  log: Optional[Callable[[str, StageResult], None]] = None) -> BenchmarkRun:
+    functions = stage_functions(fixtures, output_dir)
+    run = BenchmarkRun(fixtures.roofers, fixtures.reviews, repeat)
+    for name in stages:
+        run.stages[name] = time_stage(functions[name], repeat)
+        if log:
+            log(name, run.stages[name])
+    return run
+
+
+def load_history(path: Path = HISTORY_FILE) -> List[Dict]:
+    if not path.exists():
+        return []
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def append_history(record: Dict, path: Path = HISTORY_FILE):
+    history = load_history(path)
+    history.append(record)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(history, f, indent=2)
+        f.write('\n')
+
+
+def previous_run(history: List[Dict], roofers: int, reviews: int) -> Optional[Dict]:
+    """Most recent recorded run at the same scale."""
+    for record in reversed(history):
+        if record.get('roofers') == roofers and record.get('reviews') == reviews:
+            return record
+    return None
+
+
+def compare(record: Dict, previous: Optional[Dict],
+            threshold: float = REGRESSION_THRESHOLD) -> Dict[str, Tuple[float, bool]]:
+    """Stage -> (time ratio vs previous run, regressed?) for stages present in both."""
+    if not previous:
+        return {}
+    changes = {}
+    for name, stage in record['stages'].items():
+        before = previous['stages'].get(name, {}).get('seconds')
+        if before:
+            ratio = stage['seconds'] / before
+            noisy = max(stage['seconds'], before) < MIN_COMPARE_SECONDS
+            changes[name] = (ratio, ratio > 1 + threshold and not noisy)
+    return changes
@@ -0,0 +1,209 @@
+"""
+Customer-to-roofer spatial join for the PRP customer list.
+
+The customer file is read in chunks (CSV, .xls or .xlsx, detected from the
+file itself since the list is exported as "*.csv.xls"). Each chunk is
+geocoded through the shared geocode cache, then all located customers are
+joined to the roster in one batch: a KD-tree query for every customer's
+nearest roofer (and nearest preferred roofer), and a KD-tree over the
+customers to count how many are within a radius of each roofer.
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .geocode import AddressQuery, GeocodeCache, GeocodeStats, Provider, geocode_batch
+from .normalize import zip5
+from .paths import REPO_ROOT
+from .spatial import PointTree
+
+CUSTOMERS_DIR = REPO_ROOT / 'data' / 'customers'
+CUSTOMER_FILE = CUSTOMERS_DIR / 'PRP Customer List.csv.xls'
+ASSIGNMENTS_CSV = CUSTOMERS_DIR / 'customer-roofer-assignments.csv'
+ROOFER_COUNTS_CSV = CUSTOMERS_DIR / 'roofer-customer-counts.csv'
+
+CHUNK_ROWS = 5000
+DEFAULT_RADIUS_MILES = 25.0
+
+# Canonical column -> accepted headers (first match wins)
+CUSTOMER_COLUMNS = {
+    'name': ['Name', 'Customer', 'Customer Name', 'Company name', 'Company'],
+    'address': ['Street Address', 'Address', 'Billing Address', 'Billing street'],
+    'city': ['City', 'Billing city'],
+    'state': ['State', 'Billing state'],
+    'zip': ['Zip', 'ZIP', 'Zip Code', 'Postal Code', 'Billing ZIP'],
+}
+
+STATE_NAMES = {'florida': 'FL', 'fla': 'FL'}
+
+
+@dataclass
+class JoinResult:
+    assignments: pd.DataFrame
+    counts: pd.DataFrame
+    stats: GeocodeStats = field(default_factory=GeocodeStats)
+    rows: int = 0
+
+
+def _file_kind(path: Path) -> str:
+    with open(path, 'rb') as f:
+        magic = f.read(8)
+    if magic.startswith(b'\xd0\xcf\x11\xe0'):
+        return 'xls'
+    if magic.startswith(b'PK'):
+        return 'xlsx'
+    return 'csv'
+
+
+def _iter_raw_chunks(path: Path, chunk_rows: int) -> Iterator[pd.DataFrame]:
+    kind = _file_kind(path)
+    if kind == 'csv':
+        yield from pd.read_csv(path, dtype=str, chunksize=chunk_rows, keep_default_na=False)
+        return
+
+    if kind == 'xls':
+        import xlrd
+
+        # .xls cannot be read row by row from disk; xlrd loads one sheet on demand
+        book = xlrd.open_workbook(str(path), on_demand=True)
+        try:
+            sheet = book.sheet_by_index(0)
+            header = [str(v).strip() for v in sheet.row_values(0)] if sheet.nrows else []
+            rows = (sheet.row_values(i) for i in range(1, sheet.nrows))
+            yield from _chunked(rows, header, chunk_rows)
+        finally:
+            book.release_resources()
+        return
+
+    from .ingest import iter_excel_rows
+    chunk: List[Dict] = []
+    for row in iter_excel_rows(path):
+        chunk.append(row)
+        if len(chunk) >= chunk_rows:
+            yield pd.DataFrame(chunk, dtype=object)
+            chunk = []
+    if chunk:
+        yield pd.DataFrame(chunk, dtype=object)
+
+
+def _chunked(rows, header: List[str], chunk_rows: int) -> Iterator[pd.DataFrame]:
+    chunk = []
+    for values in rows:
+        chunk.append(values)
+        if len(chunk) >= chunk_rows:
+            yield pd.DataFrame(chunk, columns=header, dtype=object)
+            chunk = []
+    if chunk:
+        yield pd.DataFrame(chunk, columns=header, dtype=object)
+
+
+def _column(df: pd.DataFrame, names: List[str]) -> pd.Series:
+    for name in names:
+        if name in df:
+            text = df[name].astype('string').str.replace(r'\s+', ' ', regex=True).str.strip()
+            return text.mask(text == '')
+    return pd.Series(pd.NA, index=df.index, dtype='string')
+
+
+def iter_customer_chunks(path: Path = CUSTOMER_FILE, chunk_rows: int = CHUNK_ROWS) -> Iterator[pd.DataFrame]:
+    """Customer rows as frames of name, address, city, state, zip (blank rows dropped)."""
+    for raw in _iter_raw_chunks(path, chunk_rows):
+        df = pd.DataFrame({column: _column(raw, names) for column, names in CUSTOMER_COLUMNS.items()})
+        df['zip'] = zip5(df['zip'])
+        state = df['state'].str.strip('.')
+        df['state'] = state.str.lower().map(STATE_NAMES).fillna(state.str.upper())
+        df = df.dropna(how='all')
+        if not df.empty:
+            yield df
+
+
+def geocode_customers(chunks: Iterator[pd.DataFrame], providers: List[Provider],
+                      cache: Optional[GeocodeCache] = None, refresh: bool = False,
+                      progress: Optional[Callable[[int], None]] = None) -> Tuple[pd.DataFrame, GeocodeStats]:
+    """Add lat, lng and precision to every customer chunk (NaN where no provider found them)."""
+    frames, stats = [], GeocodeStats()
+    rows = 0
+    for chunk in chunks:
+        queries = [AddressQuery(a, c, s if isinstance(s, str) else 'FL', z)
+                   for a, c, s, z in zip(*(chunk[col].astype(object).where(chunk[col].notna(), None)
+                                           for col in ('address', 'city', 'state', 'zip')))]
+        results, chunk_stats = geocode_batch(queries, providers, cache, refresh)
+        for name in ('cached', 'fetched', 'local', 'missed'):
+            setattr(stats, name, getattr(stats, name) + getattr(chunk_stats, name))
+        stats.errors.extend(chunk_stats.errors)
+
+        found = [results.get(q.key) for q in queries]
+        frames.append(chunk.assign(
+            lat=[r.lat if r else np.nan for r in found],
+            lng=[r.lng if r else np.nan for r in found],
+            precision=[r.precision if r else None for r in found],
+        ))
+        rows += len(chunk)
+        if progress:
+            progress(rows)
+
+    columns = list(CUSTOMER_COLUMNS) + ['lat', 'lng', 'precision']
+    customers = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=columns)
+    return customers, stats
+
+
+def join_customers(customers: pd.DataFrame, roofers: pd.DataFrame,
+                   radius_miles: float = DEFAULT_RADIUS_MILES) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Nearest-roofer assignment for every customer and customer counts per roofer.
+
+    `roofers` is a load_roofer_points() frame. Customers without
+    coordinates keep empty assignment columns.
+    """
+    located = customers['lat'].notna().to_numpy()
+    lat = customers['lat'].to_numpy(dtype=float)[located]
+    lng = customers['lng'].to_numpy(dtype=float)[located]
+    assignments = customers.copy()
+
+    groups = {'nearest': np.ones(len(roofers), dtype=bool),
+              'nearest_preferred': roofers['category'].to_numpy() == 'preferred'}
+    nearest_rows = np.full(len(lat), -1)
+    for prefix, mask in groups.items():
+        members = np.flatnonzero(mask)
+        ids = np.full(len(customers), None, dtype=object)
+        names = np.full(len(customers), None, dtype=object)
+        miles = np.full(len(customers), np.nan)
+        if len(members) and len(lat):
+            idx, dist = PointTree(roofers['lat'].to_numpy()[members], roofers['lng'].to_numpy()[members]).query(lat, lng, 1)
+            rows = members[idx[:, 0]]
+            ids[located] = roofers['id'].to_numpy()[rows]
+            names[located] = roofers['name'].to_numpy()[rows]
+            miles[located] = dist[:, 0].round(1)
+            if prefix == 'nearest':
+                nearest_rows = rows
+        assignments[f'{prefix}_roofer_id'] = ids
+        assignments[f'{prefix}_roofer'] = names
+        assignments[f'{prefix}_miles'] = miles
+
+    counts = roofers[['id', 'slug', 'name', 'category']].copy()
+    counts['nearest_customers'] = np.bincount(nearest_rows[nearest_rows >= 0], minlength=len(roofers))
+    counts['customers_within_radius'] = PointTree(lat, lng).count_within(
+        roofers['lat'].to_numpy(), roofers['lng'].to_numpy(), radius_miles)
+    counts = counts.sort_values(['nearest_customers', 'customers_within_radius', 'name'],
+                                ascending=[False, False, True], kind='mergesort').reset_index(drop=True)
+    return assignments, counts
+
+
+def run_join(providers: List[Provider], roofers: pd.DataFrame, path: Path = CUSTOMER_FILE,
+             cache: Optional[GeocodeCache] = None, radius_miles: float = DEFAULT_RADIUS_MILES,
+             refresh: bool = False, chunk_rows: int = CHUNK_ROWS,
+             progress: Optional[Callable[[int], None]] = None) -> JoinResult:
+    """Stream, geocode and join the customer file."""
+    customers, stats = geocode_customers(iter_customer_chunks(path, chunk_rows), providers, cache, refresh, progress)
+    assignments, counts = join_customers(customers, roofers, radius_miles)
+    return JoinResult(assignments, counts, stats, len(customers))
+
+
+def write_results(result: JoinResult, assignments_file: Path = ASSIGNMENTS_CSV,
+                  counts_file: Path = ROOFER_COUNTS_CSV):
+    result.assignments.to_csv(assignments_file, index=False)
+    result.counts.to_csv(counts_file, index=False)
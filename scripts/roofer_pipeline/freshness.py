@@ -0,0 +1,172 @@
+"""
+Freshness-driven re-fetch schedule for review sources.
+
+For every (source, roofer) the schedule keeps the last fetch time and the
+last rating and review count seen. New reviews are treated as a Poisson
+process: the rate is estimated from the reviews that appeared between
+fetches, shrunk towards a prior of PRIOR_EVENTS per PRIOR_DAYS so roofers
+with little history get a sensible default. The next fetch is due when the
+chance that something changed since the last one reaches CHANGE_PROBABILITY:
+
+  rate     = (events + PRIOR_EVENTS) / (observed_days + PRIOR_DAYS)
+  interval = -ln(1 - CHANGE_PROBABILITY) / rate     clamped to [MIN, MAX] days
+
+so a roofer collecting a review a week is revisited every few days, while
+one whose numbers have not moved for months is checked every MAX_INTERVAL
+days. Each interval is jittered by a stable per-roofer amount so a roster
+fetched in one go spreads out over the following days instead of coming
+due all at once.
+
+The table lives in the work-queue database so every worker sharing the
+queue also shares the schedule; the refresh scripts enqueue only the
+roofers that are due. Every recorded fetch is also appended to the rating
+history (rating_history.py).
+"""
+
+import hashlib
+import math
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from . import metrics
+from .rating_history import append_snapshot, create_snapshot_table
+from .work_queue import WORK_QUEUE_DB, transaction
+
+DAY = 86400.0
+PRIOR_EVENTS = 1.0
+PRIOR_DAYS = 30.0
+CHANGE_PROBABILITY = 0.5
+MIN_INTERVAL_DAYS = 1.0
+MAX_INTERVAL_DAYS = 90.0
+JITTER = 0.15
+
+
+@dataclass
+class Freshness:
+    source: str
+    key: str
+    fetched_at: float
+    rating: Optional[float]
+    review_count: Optional[int]
+    events: float
+    observed_days: float
+    fetches: int
+    next_due: float
+
+    @property
+    def rate_per_day(self) -> float:
+        return (self.events + PRIOR_EVENTS) / (self.observed_days + PRIOR_DAYS)
+
+
+def observed_events(previous: Optional[Freshness], rating: Optional[float], review_count: Optional[int]) -> float:
+    """Changes seen since the previous fetch: new reviews, or 1 for any other change in the numbers."""
+    if previous is None:
+        return 0.0
+    if review_count is not None and previous.review_count is not None and review_count > previous.review_count:
+        return float(review_count - previous.review_count)
+    if (rating, review_count) != (previous.rating, previous.review_count):
+        return 1.0  # rating moved, reviews removed, or the listing appeared / disappeared
+    return 0.0
+
+
+def refresh_interval(rate_per_day: float, key: str = '') -> float:
+    """Seconds until the chance of a change reaches CHANGE_PROBABILITY, with stable per-key jitter."""
+    days = -math.log(1 - CHANGE_PROBABILITY) / rate_per_day
+    days = min(MAX_INTERVAL_DAYS, max(MIN_INTERVAL_DAYS, days))
+    spread = int(hashlib.sha1(key.encode('utf-8')).hexdigest()[:8], 16) / 0xFFFFFFFF
+    return days * (1 + JITTER * (2 * spread - 1)) * DAY
+
+
+class FreshnessSchedule:
+    """When each roofer is next due for each source."""
+
+    def __init__(self, path: Path = WORK_QUEUE_DB):
+        self.path = path
+        with transaction(self.path) as conn:
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS freshness ('
+                ' source TEXT NOT NULL, key TEXT NOT NULL, fetched_at REAL NOT NULL,'
+                ' rating REAL, review_count INTEGER, events REAL NOT NULL, observed_days REAL NOT NULL,'
+                ' fetches INTEGER NOT NULL, next_due REAL NOT NULL,'
+                ' PRIMARY KEY (source, key))'
+            )
+            create_snapshot_table(conn)
+
+    def load(self, source: str) -> Dict[str, Freshness]:
+        with transaction(self.path) as conn:
+            rows = conn.execute('SELECT source, key, fetched_at, rating, review_count, events, observed_days,'
+                                ' fetches, next_due FROM freshness WHERE source = ?', (source,)).fetchall()
+        return {row[1]: Freshness(*row) for row in rows}
+
+    def record(self, source: str, key: str, rating: Optional[float], review_count: Optional[int],
+               fetched_at: Optional[float] = None) -> Freshness:
+        """Store a fetch result and schedule the next one."""
+        now = time.time() if fetched_at is None else fetched_at
+        with transaction(self.path) as conn:
+            row = conn.execute('SELECT source, key, fetched_at, rating, review_count, events, observed_days,'
+                               ' fetches, next_due FROM freshness WHERE source = ? AND key = ?',
+                               (source, key)).fetchone()
+            previous = Freshness(*row) if row else None
+            events = observed_events(previous, rating, review_count)
+            entry = Freshness(
+                source, key, now, rating, review_count,
+                events=(previous.events if previous else 0.0) + events,
+                observed_days=(previous.observed_days + max(0.0, now - previous.fetched_at) / DAY
+                               if previous else 0.0),
+                fetches=(previous.fetches if previous else 0) + 1,
+                next_due=0.0)
+            entry.next_due = now + refresh_interval(entry.rate_per_day, key)
+            conn.execute('INSERT OR REPLACE INTO freshness VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                         (entry.source, entry.key, entry.fetched_at, entry.rating, entry.review_count,
+                          entry.events, entry.observed_days, entry.fetches, entry.next_due))
+            append_snapshot(conn, source, key, now, rating, review_count)
+        metrics.count('freshness_changed' if events else 'freshness_unchanged', source=source)
+        return entry
+
+    def due(self, source: str, keys: Iterable[str], now: Optional[float] = None,
+            limit: Optional[int] = None) -> List[str]:
+        """
+        Keys to fetch now: never fetched first (in the given order), then
+        overdue ones, most overdue first.
+        """
+        now = time.time() if now is None else now
+        known = self.load(source)
+        keys = list(dict.fromkeys(keys))
+        never = [key for key in keys if key not in known]
+        overdue = sorted((known[key].next_due, key) for key in keys
+                         if key in known and known[key].next_due <= now)
+        selected = never + [key for _, key in overdue]
+        return selected[:limit] if limit is not None else selected
+
+    def summary(self, source: str, keys: Iterable[str], now: Optional[float] = None) -> Dict[str, int]:
+        """How many roofers are never fetched, due now, and due within a day and a week."""
+        now = time.time() if now is None else now
+        known = self.load(source)
+        counts = {'never': 0, 'due': 0, 'day': 0, 'week': 0, 'later': 0}
+        for key in dict.fromkeys(keys):
+            entry = known.get(key)
+            if entry is None:
+                counts['never'] += 1
+            elif entry.next_due <= now:
+                counts['due'] += 1
+            elif entry.next_due <= now + DAY:
+                counts['day'] += 1
+            elif entry.next_due <= now + 7 * DAY:
+                counts['week'] += 1
+            else:
+                counts['later'] += 1
+        return counts
+
+
+def format_summary(source: str, counts: Dict[str, int]) -> str:
+    return (f"📅 {source}: {counts['never']} never fetched, {counts['due']} due now, "
+            f"{counts['day']} due within a day, {counts['week']} within a week, {counts['later']} later")
+
+
+def due_tasks(schedule: FreshnessSchedule, source: str, items: Iterable[Tuple[str, Dict]],
+              limit: Optional[int] = None) -> List[Tuple[str, Dict]]:
+    """The (key, payload) work-queue items that are due for source."""
+    items = dict(items)
+    return [(key, items[key]) for key in schedule.due(source, items, limit=limit)]
@@ -0,0 +1,390 @@
+"""
+Offline batch geocoding with a persistent cache.
+
+Roofer addresses are geocoded once by the pipeline and the coordinates are
+written into roofers.ts (latitude/longitude, with geocodePrecision), so the
+map, near-me and profile pages never have to geocode in the browser. Only
+'address' precision pins the roofer itself; city and county centers are
+good enough for clustering and distances but not for a profile map.
+
+Lookups go through a chain of providers. Remote providers (Nominatim) are
+rate limited and their answers, including misses, are kept in a SQLite
+cache keyed by the normalized address; local providers (service-area
+centroids, a static JSON file for tests and fixtures) are cheap and are
+consulted on every run.
+"""
+
+import json
+import re
+import sqlite3
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from . import metrics
+from .geography import city_lookup, county_for_zip, load_county_coordinates
+from .normalize import normalize_zip
+from .paths import DATA_DIR, ROOFERS_TS
+from .roofer_index import create_slug, load_index
+from .roofers_ts import apply_edits, field_edits
+
+GEOCODE_CACHE = DATA_DIR / 'geocode-cache.sqlite'
+# Bumped when cached answers need looking up again (1: Nominatim places are no longer addresses)
+CACHE_VERSION = 1
+
+# Decimal places written to roofers.ts (~0.1 m)
+COORDINATE_PRECISION = 6
+
+# Words shortened in cache keys so "123 North Main Street" == "123 N Main St"
+ADDRESS_ABBREVIATIONS = {
+    'street': 'st', 'avenue': 'ave', 'road': 'rd', 'drive': 'dr', 'boulevard': 'blvd',
+    'lane': 'ln', 'court': 'ct', 'place': 'pl', 'parkway': 'pkwy', 'highway': 'hwy',
+    'circle': 'cir', 'terrace': 'ter', 'trail': 'trl', 'suite': 'ste',
+    'north': 'n', 'south': 's', 'east': 'e', 'west': 'w',
+    'northeast': 'ne', 'northwest': 'nw', 'southeast': 'se', 'southwest': 'sw',
+}
+
+
+@dataclass(frozen=True)
+class AddressQuery:
+    address: Optional[str] = None
+    city: Optional[str] = None
+    state: Optional[str] = 'FL'
+    zip_code: Optional[str] = None
+
+    @property
+    def key(self) -> str:
+        return normalize_address(self.address, self.city, self.state, self.zip_code)
+
+    @property
+    def text(self) -> str:
+        """Free-form query, built the same way as lib/geocoding.ts."""
+        parts = [self.address, self.city, self.state or 'FL', self.zip_code, 'USA']
+        return ', '.join(str(p).strip() for p in parts if p and str(p).strip())
+
+    @property
+    def is_empty(self) -> bool:
+        return not any((self.address, self.city, self.zip_code))
+
+
+@dataclass
+class GeocodeResult:
+    lat: float
+    lng: float
+    precision: str      # 'address', 'street', 'city', 'county' or 'static'
+    provider: str
+    formatted: Optional[str] = None
+
+
+def _clean(value: Optional[str]) -> str:
+    text = re.sub(r'[^\w\s]', ' ', str(value or '').lower())
+    words = [ADDRESS_ABBREVIATIONS.get(w, w) for w in text.split()]
+    return ' '.join(words)
+
+
+def normalize_address(address: Optional[str], city: Optional[str],
+                      state: Optional[str] = 'FL', zip_code: Optional[str] = None) -> str:
+    """Cache key for an address: lowercased, punctuation-free, abbreviated, ZIP5."""
+    return '|'.join([
+        _clean(address),
+        _clean(city),
+        _clean(state or 'FL'),
+        normalize_zip(zip_code) or '',
+    ])
+
+
+class GeocodeCache:
+    """SQLite cache of geocoding answers; a row with NULL lat/lng records a miss."""
+
+    def __init__(self, path: Path = GEOCODE_CACHE):
+        self.path = path
+        self.conn = sqlite3.connect(str(path))
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS geocode ('
+            ' key TEXT PRIMARY KEY, lat REAL, lng REAL, precision TEXT,'
+            ' provider TEXT, formatted TEXT, updated_at TEXT)'
+        )
+        if self.conn.execute('PRAGMA user_version').fetchone()[0] < CACHE_VERSION:
+            # Towns and cities were cached as 'address' before version 1
+            self.conn.execute("DELETE FROM geocode WHERE provider = 'nominatim' AND precision = 'address'")
+            self.conn.execute(f'PRAGMA user_version = {CACHE_VERSION}')
+        self.conn.commit()
+
+    def __enter__(self) -> 'GeocodeCache':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Optional[GeocodeResult]]:
+        """Cached answers for the keys that are present (None values are cached misses)."""
+        keys = list(dict.fromkeys(keys))
+        found: Dict[str, Optional[GeocodeResult]] = {}
+        for i in range(0, len(keys), 500):
+            chunk = keys[i:i + 500]
+            rows = self.conn.execute(
+                f"SELECT key, lat, lng, precision, provider, formatted FROM geocode "
+                f"WHERE key IN ({','.join('?' * len(chunk))})", chunk)
+            for key, lat, lng, precision, provider, formatted in rows:
+                found[key] = (GeocodeResult(lat, lng, precision, provider, formatted)
+                              if lat is not None and lng is not None else None)
+        return found
+
+    def put(self, key: str, result: Optional[GeocodeResult], provider: str = ''):
+        now = datetime.now(timezone.utc).isoformat()
+        if result is None:
+            row = (key, None, None, None, provider, None, now)
+        else:
+            row = (key, result.lat, result.lng, result.precision, result.provider, result.formatted, now)
+        self.conn.execute('INSERT OR REPLACE INTO geocode VALUES (?, ?, ?, ?, ?, ?, ?)', row)
+
+    def __len__(self) -> int:
+        return self.conn.execute('SELECT COUNT(*) FROM geocode').fetchone()[0]
+
+
+class Provider:
+    """A geocoding backend; `remote` providers are cached and rate limited."""
+
+    name = 'provider'
+    remote = False
+
+    def geocode(self, query: AddressQuery) -> Optional[GeocodeResult]:
+        raise NotImplementedError
+
+
+class NominatimProvider(Provider):
+    """OpenStreetMap Nominatim (free, 1 request per second; paced by http_client.HOST_LIMITS)."""
+
+    name = 'nominatim'
+    remote = True
+    URL = 'https://nominatim.openstreetmap.org/search'
+
+    def __init__(self, user_agent: str = 'RoofersInFlorida/1.0', timeout: float = 10):
+        from .http_client import session
+        self.session = session(self.name)
+        self.session.headers['User-Agent'] = user_agent
+        self.timeout = timeout
+
+    def geocode(self, query: AddressQuery) -> Optional[GeocodeResult]:
+        response = self.session.get(self.URL, timeout=self.timeout, params={
+            'q': query.text, 'format': 'json', 'limit': 1, 'countrycodes': 'us',
+        })
+        response.raise_for_status()
+        results = response.json()
+        if not results:
+            return None
+        best = results[0]
+        # class 'place' is also every city, town and village; only its houses are addresses
+        if best.get('class') == 'building' or best.get('type') in ('house', 'building'):
+            precision = 'address'
+        elif best.get('class') == 'highway':
+            precision = 'street'
+        else:
+            precision = 'city'
+        return GeocodeResult(float(best['lat']), float(best['lon']), precision, self.name,
+                             best.get('display_name'))
+
+
+class CentroidProvider(Provider):
+    """Service-area centers: the roofer's city if it is on the site, else its ZIP's county."""
+
+    name = 'centroid'
+
+    def __init__(self):
+        self.cities = city_lookup()
+        self.counties = load_county_coordinates()
+
+    def geocode(self, query: AddressQuery) -> Optional[GeocodeResult]:
+        place = self.cities.get(create_slug(query.city)) if query.city else None
+        if place and place.lat is not None:
+            return GeocodeResult(place.lat, place.lng, 'city', self.name, place.name)
+        county = county_for_zip(normalize_zip(query.zip_code))
+        if county and county[0] in self.counties:
+            lat, lng = self.counties[county[0]]
+            return GeocodeResult(lat, lng, 'county', self.name, county[0])
+        return None
+
+
+class StaticProvider(Provider):
+    """
+    Fixed answers from a JSON file of {address key or query text: [lat, lng]}.
+
+    Stands in for a remote geocoder in tests, benchmarks and offline runs.
+    """
+
+    name = 'static'
+
+    def __init__(self, mapping: Optional[Dict[str, Sequence[float]]] = None, path: Optional[Path] = None):
+        mapping = dict(mapping or {})
+        if path:
+            with open(path, 'r', encoding='utf-8') as f:
+                mapping.update(json.load(f))
+        self.mapping = {(k if '|' in k else self._key_for_text(k)): v for k, v in mapping.items()}
+
+    @staticmethod
+    def _key_for_text(text: str) -> str:
+        parts = [p.strip() for p in text.split(',')]
+        if parts and parts[-1].upper() == 'USA':
+            parts = parts[:-1]
+        return normalize_address(*(parts + [None] * 4)[:4])
+
+    def geocode(self, query: AddressQuery) -> Optional[GeocodeResult]:
+        coords = self.mapping.get(query.key)
+        if coords is None:
+            return None
+        return GeocodeResult(float(coords[0]), float(coords[1]), 'static', self.name)
+
+
+PROVIDERS = {
+    'nominatim': NominatimProvider,
+    'centroid': CentroidProvider,
+    'static': StaticProvider,
+}
+
+
+def make_providers(names: Iterable[str], static_file: Optional[Path] = None) -> List[Provider]:
+    """Instantiate providers by name, in lookup order."""
+    providers = []
+    for name in names:
+        if name not in PROVIDERS:
+            raise ValueError(f"Unknown geocoding provider: {name} (choose from {', '.join(PROVIDERS)})")
+        providers.append(StaticProvider(path=static_file) if name == 'static' else PROVIDERS[name]())
+    return providers
+
+
+@dataclass
+class GeocodeStats:
+    cached: int = 0
+    fetched: int = 0
+    local: int = 0
+    missed: int = 0
+    errors: List[str] = field(default_factory=list)
+
+
+def geocode_batch(queries: Iterable[AddressQuery], providers: List[Provider],
+                  cache: Optional[GeocodeCache] = None, refresh: bool = False,
+                  progress=None) -> Tuple[Dict[str, GeocodeResult], GeocodeStats]:
+    """
+    Geocode distinct addresses; returns ({address key: result}, stats).
+
+    Each address key is looked up once however many queries share it. A
+    cached answer (or cached miss) from a remote provider is reused unless
+    `refresh` is set; local providers fill in whatever is still missing.
+    """
+    unique: Dict[str, AddressQuery] = {}
+    for query in queries:
+        if not query.is_empty:
+            unique.setdefault(query.key, query)
+
+    stats = GeocodeStats()
+    cached = cache.get_many(unique) if cache and not refresh else {}
+    results: Dict[str, GeocodeResult] = {}
+
+    for i, (key, query) in enumerate(unique.items(), 1):
+        if cached.get(key) is not None:
+            results[key] = cached[key]
+            stats.cached += 1
+            continue
+        remote_done = key in cached
+        result = None
+        for provider in providers:
+            if provider.remote and remote_done:
+                continue
+            try:
+                result = provider.geocode(query)
+            except Exception as e:
+                stats.errors.append(f"{provider.name}: {query.text}: {e}")
+                continue
+            if provider.remote:
+                remote_done = True
+                if cache:
+                    cache.put(key, result, provider.name)
+            if result is not None:
+                if provider.remote:
+                    stats.fetched += 1
+                else:
+                    stats.local += 1
+                break
+        if result is None:
+            stats.missed += 1
+        else:
+            results[key] = result
+        if progress:
+            progress(i, len(unique))
+        if cache and i % 50 == 0:
+            cache.conn.commit()
+
+    if cache:
+        cache.conn.commit()
+    metrics.cache('geocode', hits=stats.cached, misses=len(unique) - stats.cached)
+    return results, stats
+
+
+def roofer_query(fields: Dict) -> AddressQuery:
+    return AddressQuery(fields.get('address'), fields.get('city'), fields.get('state') or 'FL',
+                        fields.get('zipCode'))
+
+
+@dataclass
+class BackfillResult:
+    updated: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+    missing: List[str] = field(default_factory=list)
+    stats: GeocodeStats = field(default_factory=GeocodeStats)
+
+
+def backfill_coordinates(providers: List[Provider], path: Path = ROOFERS_TS,
+                         cache: Optional[GeocodeCache] = None, refresh: bool = False,
+                         dry_run: bool = False, progress=None) -> BackfillResult:
+    """
+    Geocode every roofer and write latitude/longitude and geocodePrecision
+    into roofers.ts in one pass.
+
+    Roofers whose address cannot be placed fall back to the center of their
+    first service-area county ('county' precision), as
+    getRooferFastCoordinates() does.
+    """
+    with metrics.stage('parse') as stage:
+        content, index = load_index(path)
+        stage.rows = len(index.entries)
+    queries = {entry.key: roofer_query(entry.fields) for entry in index.entries}
+    with metrics.stage('geocode') as stage:
+        found, stats = geocode_batch(queries.values(), providers, cache, refresh, progress)
+        stage.rows = len(queries)
+    county_centers = load_county_coordinates()
+
+    outcome = BackfillResult(stats=stats)
+    edits = []
+    for entry in index.entries:
+        result = found.get(queries[entry.key].key)
+        if result is not None:
+            lat, lng, precision = result.lat, result.lng, result.precision
+        else:
+            counties = (entry.fields.get('serviceAreas') or {}).get('counties') or []
+            if not counties or counties[0] not in county_centers:
+                outcome.missing.append(entry.key)
+                continue
+            lat, lng = county_centers[counties[0]]
+            precision = 'county'
+        coords = {
+            'latitude': round(lat, COORDINATE_PRECISION),
+            'longitude': round(lng, COORDINATE_PRECISION),
+            'geocodePrecision': precision,
+        }
+        pending = {k: v for k, v in coords.items() if entry.fields.get(k) != v}
+        if pending:
+            edits.extend(field_edits(content, entry, pending))
+            outcome.updated.append(entry.key)
+        else:
+            outcome.unchanged.append(entry.key)
+
+    if edits and not dry_run:
+        with metrics.stage('emit') as stage:
+            path.write_text(apply_edits(content, edits), encoding='utf-8')
+            stage.rows = len(outcome.updated)
+    return outcome
@@ -0,0 +1,180 @@
+"""
+Florida service-area geography shared by the pipeline.
+
+Cities, counties and regions come from the site's own data files
+(search-data.ts, cities.ts, lib/county-coordinates.ts) so the pipeline
+and the pages agree on slugs and coordinates. ZIP codes are mapped to a
+county through their 3- or 4-digit prefix.
+"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .paths import CITIES_TS, REPO_ROOT, SEARCH_DATA_TS
+from .roofer_index import create_slug
+from .roofers_ts import parse_exported_object
+
+COUNTY_COORDINATES_TS = REPO_ROOT / 'lib' / 'county-coordinates.ts'
+
+# ZIP code prefix -> (county slug, region slug); 4-digit prefixes win over 3-digit ones
+ZIP_TO_COUNTY = {
+    # Sun Coast (Hillsborough, Pinellas, Pasco, Hernando)
+    '336': ('hillsborough', 'sun-coast'),  # Tampa area
+    '337': ('pinellas', 'sun-coast'),  # St. Pete, Clearwater, Pinellas Park
+    '346': ('pasco', 'sun-coast'),  # New Port Richey, Zephyrhills
+    '3460': ('hernando', 'sun-coast'),  # Brooksville
+
+    # Central Florida (Orange, Seminole, Osceola, Polk, Lake)
+    '327': ('orange', 'central-florida'),  # Orlando, Winter Park, Apopka
+    '328': ('orange', 'central-florida'),  # Orlando
+    '3271': ('seminole', 'central-florida'),  # Sanford
+    '3467': ('osceola', 'central-florida'),  # Kissimmee
+    '338': ('polk', 'central-florida'),  # Lakeland, Winter Haven
+    '347': ('lake', 'central-florida'),  # Clermont, Tavares
+
+    # South Florida (Miami-Dade, Broward, Palm Beach)
+    '331': ('miami-dade', 'south-florida'),  # Miami
+    '330': ('broward', 'south-florida'),  # Fort Lauderdale, Hollywood
+    '333': ('broward', 'south-florida'),  # Fort Lauderdale area
+    '334': ('palm-beach-south', 'south-florida'),  # West Palm Beach, Boynton Beach
+    '349': ('palm-beach-south', 'south-florida'),  # Port St. Lucie area
+
+    # Southwest Florida (Sarasota, Charlotte, Lee, Collier)
+    '342': ('sarasota', 'southwest-florida'),  # Sarasota, Venice
+    '339': ('charlotte', 'southwest-florida'),  # Rotonda West, Punta Gorda
+    '341': ('collier', 'southwest-florida'),  # Naples, Marco Island
+
+    # First Coast / North Florida (Duval, St. Johns, Clay, Nassau)
+    '322': ('duval-fc', 'first-coast'),  # Jacksonville
+    '320': ('st-johns-fc', 'first-coast'),  # St. Augustine, Ponte Vedra
+    '3208': ('st-johns-fc', 'first-coast'),  # Ponte Vedra
+    '3203': ('clay-fc', 'first-coast'),  # Orange Park
+
+    # North Florida (Alachua, etc.)
+    '326': ('alachua', 'north-florida'),  # Gainesville
+
+    # Panhandle
+    '324': ('bay', 'florida-panhandle'),  # Panama City Beach
+    '325': ('escambia', 'florida-panhandle'),  # Pensacola
+}
+
+REGION_PATTERN = re.compile(
+    r"type: 'region', name: '((?:[^'\\]|\\.)+)', slug: '([^']+)'"
+)
+CITY_PATTERN = re.compile(
+    r"type: 'city', name: '((?:[^'\\]|\\.)+)', slug: '([^']+)', "
+    r"path: cityPath\('([^']+)', '([^']+)'.*?county: '([^']+)', region: '([^']+)'"
+)
+COUNTY_PATTERN = re.compile(
+    r"type: 'county', name: '((?:[^'\\]|\\.)+)', slug: '([^']+)', "
+    r"path: countyPath\('([^']+)', '([^']+)'\), region: '([^']+)'"
+)
+
+
+@dataclass
+class Place:
+    type: str                  # 'region', 'county' or 'city'
+    name: str
+    slug: str
+    county_slug: str
+    region_slug: str
+    county: str = ''
+    region: str = ''
+    lat: Optional[float] = None
+    lng: Optional[float] = None
+
+    @property
+    def key(self) -> str:
+        """Unique key; city slugs repeat across counties (e.g. 'st-augustine')."""
+        if self.type == 'city':
+            return f"{self.region_slug}/{self.county_slug}/{self.slug}"
+        return self.county_slug if self.type == 'county' else self.region_slug
+
+    @property
+    def path(self) -> str:
+        """Service-area page, built like cityPath()/countyPath() in search-data.ts."""
+        if self.type == 'region':
+            return f"/service-areas/{self.region_slug}"
+        if self.type == 'county':
+            return f"/service-areas/{self.region_slug}/{self.county_slug}"
+        return f"/service-areas/{self.region_slug}/{self.county_slug}/{create_slug(self.name)}"
+
+
+def load_county_coordinates(path: Path = COUNTY_COORDINATES_TS) -> Dict[str, Tuple[float, float]]:
+    """County slug -> (lat, lng) from lib/county-coordinates.ts."""
+    data = parse_exported_object(path.read_text(encoding='utf-8'), 'countyCoordinates')
+    return {slug: (float(c['lat']), float(c['lng'])) for slug, c in data.items()}
+
+
+def load_city_coordinates(path: Path = CITIES_TS) -> Dict[str, Tuple[float, float]]:
+    """City slug -> (lat, lng) for the cities in cities.ts that carry coordinates."""
+    data = parse_exported_object(path.read_text(encoding='utf-8'), 'cityData')
+    coordinates = {}
+    for counties in data.values():
+        for cities in counties.values():
+            for slug, city in cities.items():
+                if city.get('latitude') is not None and city.get('longitude') is not None:
+                    coordinates[slug] = (float(city['latitude']), float(city['longitude']))
+    return coordinates
+
+
+@lru_cache(maxsize=None)
+def load_places(search_data: Path = SEARCH_DATA_TS, cities_file: Path = CITIES_TS,
+                county_file: Path = COUNTY_COORDINATES_TS) -> Tuple[Place, ...]:
+    """
+    Every searchable region, county and city, with coordinates for counties
+    and cities.
+
+    Cities listed in cities.ts use their own coordinates; the rest fall back
+    to their county's center.
+    """
+    content = search_data.read_text(encoding='utf-8')
+    county_coords = load_county_coordinates(county_file) if county_file.exists() else {}
+    city_coords = load_city_coordinates(cities_file) if cities_file.exists() else {}
+
+    places = []
+    for m in REGION_PATTERN.finditer(content):
+        name, slug = m.groups()
+        places.append(Place('region', name, slug, '', slug, region=name))
+    for m in COUNTY_PATTERN.finditer(content):
+        name, slug, region_slug, _, region = m.groups()
+        lat, lng = county_coords.get(slug, (None, None))
+        places.append(Place('county', name, slug, slug, region_slug, name, region, lat, lng))
+    for m in CITY_PATTERN.finditer(content):
+        name, slug, region_slug, county_slug, county, region = m.groups()
+        lat, lng = city_coords.get(slug) or county_coords.get(county_slug, (None, None))
+        places.append(Place('city', name.replace("\\'", "'"), slug, county_slug, region_slug,
+                            county, region, lat, lng))
+    return tuple(places)
+
+
+def cities(places: Optional[Tuple[Place, ...]] = None) -> List[Place]:
+    return [p for p in (places or load_places()) if p.type == 'city']
+
+
+def regions(places: Optional[Tuple[Place, ...]] = None) -> List[Place]:
+    return [p for p in (places or load_places()) if p.type == 'region']
+
+
+def counties(places: Optional[Tuple[Place, ...]] = None) -> List[Place]:
+    return [p for p in (places or load_places()) if p.type == 'county']
+
+
+def city_lookup(places: Optional[Tuple[Place, ...]] = None) -> Dict[str, Place]:
+    """City name or slug (slugified) -> Place; the first listing wins for repeated names."""
+    lookup: Dict[str, Place] = {}
+    for place in cities(places):
+        lookup.setdefault(create_slug(place.name), place)
+        lookup.setdefault(place.slug, place)
+    return lookup
+
+
+def county_for_zip(zip_code: Optional[str]) -> Optional[Tuple[str, str]]:
+    """(county slug, region slug) for a ZIP code, or None if the prefix is unknown."""
+    if not zip_code:
+        return None
+    text = str(zip_code).strip()
+    return ZIP_TO_COUNTY.get(text[:4]) or ZIP_TO_COUNTY.get(text[:3])
@@ -0,0 +1,264 @@
+"""
+Shared HTTP layer for the scrapers and API clients.
+
+session('yelp-fusion') returns a requests.Session that every request goes
+through three per-host controls, shared by all sessions in the process:
+
+  rate        AIMD: the request rate grows linearly (INCREASE_STEP of the
+              host's ceiling per second of healthy responses) and halves on
+              429, 5xx or a connection error, so throughput settles at what
+              the upstream allows instead of a hard-coded sleep. A
+              Retry-After header pauses the host for that long.
+  retry       429, 5xx, timeouts and connection errors are retried up to
+              RetryPolicy.attempts times with exponential backoff and full
+              jitter. When attempts run out the last response is returned
+              (or the error raised) as if there were no retries. Only
+              idempotent methods get all of these: a POST (a paid API call)
+              that timed out or hit a 5xx may have been processed, so it is
+              retried only on 429 or when no connection was ever made.
+  breaker     After BREAKER_THRESHOLD consecutive failures (5xx or no
+              response) the host is skipped for BREAKER_COOLDOWN seconds:
+              requests raise CircuitOpenError, a RequestException, without
+              touching the network. One probe is then let through and its
+              outcome closes or re-opens the circuit. A Retry-After longer
+              than MAX_RETRY_AFTER (an exhausted daily quota) opens it for
+              that long.
+
+Starting rates and ceilings per host are in HOST_LIMITS. Loopback hosts (the
+replay server) start fast with a high ceiling, so a replay run with
+--rate-limit shows the controller converging.
+"""
+
+import random
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from urllib3.exceptions import NewConnectionError
+
+from . import metrics
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Safe to send twice; other methods are retried only when they cannot have run
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE', 'TRACE'})
+DECREASE_FACTOR = 0.5
+# Share of a host's max_rate added per second of healthy responses
+INCREASE_STEP = 0.05
+MIN_RATE = 1 / 60
+MAX_RETRY_AFTER = 300.0
+BREAKER_THRESHOLD = 5
+BREAKER_COOLDOWN = 60.0
+
+
+@dataclass(frozen=True)
+class HostLimits:
+    rate: float         # requests per second to start at
+    max_rate: float     # ceiling the additive increase stops at
+
+
+DEFAULT_LIMITS = HostLimits(rate=1.0, max_rate=5.0)
+LOCAL_HOSTS = frozenset({'127.0.0.1', 'localhost', '::1'})
+LOCAL_LIMITS = HostLimits(rate=20.0, max_rate=200.0)
+HOST_LIMITS = {
+    'api.yelp.com': HostLimits(rate=2.0, max_rate=10.0),
+    'www.yelp.com': HostLimits(rate=0.5, max_rate=1.0),
+    'api.outscraper.com': HostLimits(rate=0.5, max_rate=2.0),
+    # Usage policy: at most one request per second
+    'nominatim.openstreetmap.org': HostLimits(rate=0.9, max_rate=0.9),
+}
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    attempts: int = 4
+    base_delay: float = 1.0
+    max_delay: float = 30.0
+    methods: frozenset = IDEMPOTENT_METHODS  # retried on any retryable failure
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter delay before retry number `attempt` (1-based)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+
+def not_sent(error: requests.exceptions.RequestException) -> bool:
+    """The request failed before any connection was made, so the server never saw it."""
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    if not isinstance(error, requests.exceptions.ConnectionError):
+        return False
+    reason = error.args[0] if error.args else None
+    return isinstance(getattr(reason, 'reason', reason), NewConnectionError)
+
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """The host has been failing; requests to it are refused until the cooldown ends."""
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or an HTTP date)."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class RateController:
+    """Paces requests to one host: additive increase, multiplicative decrease."""
+
+    def __init__(self, limits: HostLimits):
+        self.limits = limits
+        self.rate = limits.rate
+        self._next = 0.0
+        self._hold_until = 0.0
+        self._last_decrease = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Wait for this request's slot; returns the seconds waited."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._hold_until, self._next)
+            self._next = start + 1 / self.rate
+        wait = start - now
+        if wait > 0:
+            time.sleep(wait)
+        return max(0.0, wait)
+
+    def success(self):
+        with self._lock:
+            # Each response covers 1/rate seconds of traffic
+            self.rate = min(self.limits.max_rate, self.rate + INCREASE_STEP * self.limits.max_rate / self.rate)
+
+    def throttled(self, retry_after: Optional[float] = None):
+        with self._lock:
+            now = time.monotonic()
+            if retry_after:
+                self._hold_until = max(self._hold_until, now + min(retry_after, MAX_RETRY_AFTER))
+            # Responses to requests already in flight report the same overload; decrease once per slot
+            if now - self._last_decrease >= 1 / self.rate:
+                self.rate = max(MIN_RATE, self.rate * DECREASE_FACTOR)
+                self._last_decrease = now
+
+
+class CircuitBreaker:
+    """Closed -> open after repeated failures -> half-open probe -> closed or open again."""
+
+    def __init__(self, host: str, threshold: int = BREAKER_THRESHOLD, cooldown: float = BREAKER_COOLDOWN):
+        self.host = host
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self._open_until: Optional[float] = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def before(self):
+        """Raise CircuitOpenError unless a request may go out now."""
+        with self._lock:
+            if self._open_until is None:
+                return
+            remaining = self._open_until - time.monotonic()
+            if remaining <= 0 and not self._probing:
+                self._probing = True
+                return
+        metrics.count('http_circuit_rejected', host=self.host)
+        raise CircuitOpenError(f"{self.host} is failing; not retrying for another {max(0, remaining):.0f}s")
+
+    def success(self):
+        with self._lock:
+            self.failures = 0
+            self._open_until = None
+            self._probing = False
+
+    def failure(self):
+        with self._lock:
+            self.failures += 1
+            if self._probing or self.failures >= self.threshold:
+                self._open(self.cooldown)
+
+    def trip(self, seconds: float):
+        with self._lock:
+            self._open(seconds)
+
+    def _open(self, seconds: float):
+        if self._open_until is None:
+            metrics.count('http_circuit_opened', host=self.host)
+        self._open_until = time.monotonic() + seconds
+        self._probing = False
+
+
+_hosts: Dict[str, Tuple[RateController, CircuitBreaker]] = {}
+_hosts_lock = threading.Lock()
+
+
+def host_controls(host: str) -> Tuple[RateController, CircuitBreaker]:
+    """The process-wide rate controller and circuit breaker for a host."""
+    with _hosts_lock:
+        if host not in _hosts:
+            limits = LOCAL_LIMITS if host in LOCAL_HOSTS else HOST_LIMITS.get(host, DEFAULT_LIMITS)
+            _hosts[host] = (RateController(limits), CircuitBreaker(host))
+        return _hosts[host]
+
+
+class RateLimitedSession(requests.Session):
+    """A requests.Session whose requests are paced, retried and circuit-broken per host."""
+
+    def __init__(self, retry: RetryPolicy = RetryPolicy()):
+        super().__init__()
+        self.retry = retry
+
+    def request(self, method, url, *args, **kwargs):
+        host = (urlsplit(str(url)).hostname or '').lower()
+        control, breaker = host_controls(host)
+        idempotent = str(method).upper() in self.retry.methods
+        for attempt in range(1, self.retry.attempts + 1):
+            breaker.before()
+            control.acquire()
+            try:
+                response = super().request(method, url, *args, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                control.throttled()
+                breaker.failure()
+                if attempt == self.retry.attempts or not (idempotent or not_sent(e)):
+                    raise
+                reason = type(e).__name__
+            else:
+                if response.status_code not in RETRY_STATUSES:
+                    control.success()
+                    breaker.success()
+                    return response
+                retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                control.throttled(retry_after)
+                if retry_after is not None and retry_after > MAX_RETRY_AFTER:
+                    breaker.trip(retry_after)
+                    return response
+                if response.status_code >= 500:
+                    breaker.failure()
+                else:
+                    breaker.success()  # throttled, but the host is up
+                if attempt == self.retry.attempts or not (idempotent or response.status_code == 429):
+                    return response
+                response.close()
+                reason = str(response.status_code)
+            metrics.count('http_retries', host=host, reason=reason)
+            time.sleep(self.retry.backoff(attempt))
+
+
+def session(service: str, retry: RetryPolicy = RetryPolicy()) -> RateLimitedSession:
+    """A rate-limited session whose responses are recorded in the run metrics under `service`."""
+    client = RateLimitedSession(retry)
+    client.hooks['response'].append(metrics.response_hook(service))
+    return client
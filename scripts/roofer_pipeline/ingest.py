@@ -0,0 +1,376 @@
+"""
+Streaming Excel ingest with change-data-capture.
+
+Rows are read one at a time from the workbook (openpyxl read-only mode), normalized,
+keyed by slug and hashed. The hashes are compared with those saved by the
+previous import, so downstream stages only receive the rows that were
+inserted, updated or deleted since then. The new hashes travel with the
+change set and are saved as the import state only once apply_changes() has
+written them to roofers.ts, so an import that is never applied (or fails
+to apply) is captured again by the next run instead of being lost.
+"""
+
+import hashlib
+import json
+import os
+import re
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+from . import metrics
+from .normalize import SHEET_SOURCE_COLUMNS, normalize_frame
+from .paths import DATA_DIR, EXCEL_FILE, ROOFERS_JSON, ROOFERS_TS
+from .roofer_index import create_slug, load_index
+from .roofers_ts import RooferEntry, append_entries_edit, apply_edits, field_edits
+
+IMPORT_STATE_FILE = DATA_DIR / 'import-state.json'
+CHANGES_FILE = DATA_DIR / 'roofers-changes.json'
+
+
+@dataclass
+class ChangeSet:
+    inserted: List[Dict[str, Any]] = field(default_factory=list)
+    updated: List[Dict[str, Any]] = field(default_factory=list)
+    deleted: List[Dict[str, Any]] = field(default_factory=list)
+    unchanged: int = 0
+    # Import state to save once the changes are applied
+    state: Dict[str, Any] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        return bool(self.inserted or self.updated or self.deleted)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'generatedAt': datetime.now(timezone.utc).isoformat(),
+            'inserted': self.inserted,
+            'updated': self.updated,
+            'deleted': self.deleted,
+            'unchanged': self.unchanged,
+            'importState': self.state,
+        }
+
+
+def iter_excel_rows(path: Path = EXCEL_FILE, sheet: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """Yield each data row of the sheet as a {header: value} dict without loading the workbook."""
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        worksheet = workbook[sheet] if sheet else workbook.worksheets[0]
+        rows = worksheet.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        columns = [str(h).strip() if h is not None else f'Column {i + 1}' for i, h in enumerate(header)]
+        for values in rows:
+            if values is None or all(v is None or v == '' for v in values):
+                continue
+            yield dict(zip(columns, values))
+    finally:
+        workbook.close()
+
+
+def normalize_value(value: Any) -> Any:
+    """Canonical form of a cell: trimmed strings, integral floats as ints, blanks as None."""
+    if value is None:
+        return None
+    if isinstance(value, float):
+        if value != value:  # NaN
+            return None
+        return int(value) if value.is_integer() else value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, str):
+        value = re.sub(r'\s+', ' ', value).strip()
+        return value or None
+    return value
+
+
+def normalize_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: normalize_value(value) for key, value in row.items()}
+
+
+def row_hash(row: Dict[str, Any]) -> str:
+    payload = json.dumps(row, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def load_state(path: Path = IMPORT_STATE_FILE) -> Dict[str, Any]:
+    if path.exists():
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return {'rows': {}}
+
+
+def save_state(state: Dict[str, Any], path: Path = IMPORT_STATE_FILE):
+    tmp = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=2, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+def keyed_rows(rows: Iterator[Dict[str, Any]], name_column: str = 'Name') -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Attach a stable key to each normalized row.
+
+    The key is the slug of the company name; repeated names get -1, -2, ...
+    suffixes in sheet order, the same rule import-to-typescript-v2.py uses.
+    Rows whose name has no letters or digits (stray '\\' or '}' cells) are
+    not roofers and are skipped.
+    """
+    seen = set()
+    for row in rows:
+        row = normalize_row(row)
+        name = row.get(name_column)
+        if not name or not create_slug(name):
+            continue
+        yield unique_key(name, seen), row
+
+
+def unique_key(name: str, seen: set) -> str:
+    """Slug of the name, suffixed -1, -2, ... if already in seen (which is updated)."""
+    base = create_slug(name)
+    key, counter = base, 1
+    while key in seen:
+        key = f"{base}-{counter}"
+        counter += 1
+    seen.add(key)
+    return key
+
+
+def _read_snapshot(path: Optional[Path]) -> Dict[str, Dict[str, Any]]:
+    """Previous import's rows by key, used to tell which columns of an updated row changed."""
+    if not path or not path.exists():
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return dict(keyed_rows(json.load(f)))
+
+
+def capture_changes(rows: Iterator[Dict[str, Any]], previous: Dict[str, str],
+                    snapshot: Optional[Path] = ROOFERS_JSON) -> Tuple[ChangeSet, Dict[str, str]]:
+    """
+    Diff streamed rows against the previous import's {key: hash} map.
+
+    Only changed rows are kept in memory; for updated rows the previous
+    snapshot is consulted to list which columns changed. When `snapshot` is
+    given the full normalized sheet is streamed to it as a JSON array
+    (through a temp file, replaced only if something changed) for the
+    scripts that still read it.
+    """
+    changes = ChangeSet()
+    current: Dict[str, str] = {}
+    before: Optional[Dict[str, Dict[str, Any]]] = None
+    tmp = snapshot.with_suffix(snapshot.suffix + '.tmp') if snapshot else None
+    out = open(tmp, 'w', encoding='utf-8') if tmp else None
+    try:
+        if out:
+            out.write('[')
+        for i, (key, row) in enumerate(keyed_rows(rows)):
+            digest = row_hash(row)
+            current[key] = digest
+            if out:
+                out.write(('\n  ' if i == 0 else ',\n  ') + json.dumps(row, ensure_ascii=False, default=str))
+            old = previous.get(key)
+            if old is None:
+                changes.inserted.append({'key': key, 'record': row})
+            elif old != digest:
+                if before is None:
+                    before = _read_snapshot(snapshot)
+                previous_row = before.get(key)
+                # The snapshot may be from a later import that was never applied;
+                # without the applied row, every column counts as changed
+                changed = ([col for col in row if row.get(col) != previous_row.get(col)]
+                           if previous_row is not None and row_hash(previous_row) == old else None)
+                changes.updated.append({'key': key, 'record': row, 'changed': changed})
+            else:
+                changes.unchanged += 1
+        if out:
+            out.write('\n]\n')
+    finally:
+        if out:
+            out.close()
+
+    changes.deleted = [{'key': key} for key in previous if key not in current]
+
+    if tmp:
+        if changes or not snapshot.exists():
+            os.replace(tmp, snapshot)
+        else:
+            tmp.unlink()
+    return changes, current
+
+
+def ingest_excel(excel_file: Path = EXCEL_FILE, state_file: Path = IMPORT_STATE_FILE,
+                 changes_file: Optional[Path] = CHANGES_FILE, snapshot: Optional[Path] = ROOFERS_JSON,
+                 sheet: Optional[str] = None, full: bool = False) -> ChangeSet:
+    """
+    Stream the workbook and write the change set.
+
+    The new row hashes are written into the change set; apply_changes()
+    saves them to `state_file` after roofers.ts has been patched. Without a
+    `changes_file` nothing downstream applies the changes, so the state is
+    saved right away. With `full=True` the previous hashes are ignored and
+    every row is reported as inserted (useful to seed a fresh downstream
+    target).
+    """
+    state = load_state(state_file)
+    previous = {} if full else state.get('rows', {})
+    with metrics.stage('read') as stage:
+        changes, current = capture_changes(iter_excel_rows(excel_file, sheet), previous, snapshot)
+        stage.rows = len(current)
+
+    with metrics.stage('emit') as stage:
+        changes.state = {
+            'source': excel_file.name,
+            'importedAt': datetime.now(timezone.utc).isoformat(),
+            'rows': current,
+        }
+        if changes_file:
+            with open(changes_file, 'w', encoding='utf-8') as f:
+                json.dump(changes.to_dict(), f, indent=2, ensure_ascii=False, default=str)
+        else:
+            save_state(changes.state, state_file)
+        stage.rows = len(changes.inserted) + len(changes.updated) + len(changes.deleted)
+    return changes
+
+
+# Spreadsheet column -> roofers.ts field
+COLUMN_FIELDS = {
+    'Name': 'name',
+    'Phone Number': 'phone',
+    'Email': 'email',
+    'website': 'websiteUrl',
+    'Address': 'address',
+    'City': 'city',
+    'State': 'state',
+    'Zip Code': 'zipCode',
+}
+
+
+def sheet_roofer_fields(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Map spreadsheet rows to roofers.ts contact fields (same rules as
+    import-to-typescript-v2.py). The rows are normalized as one frame; the
+    website and ZIP come from its website_url and zip5 columns.
+    """
+    if not records:
+        return []
+    sheet = normalize_frame(pd.DataFrame(records, columns=list(COLUMN_FIELDS)), SHEET_SOURCE_COLUMNS)
+    text = sheet[['Name', 'Phone Number', 'Address', 'City', 'State']].apply(
+        lambda column: column.astype('string').str.strip().replace('', pd.NA))
+    fields = pd.DataFrame({
+        'name': text['Name'],
+        'phone': text['Phone Number'],
+        'email': sheet['email_norm'],
+        'websiteUrl': sheet['website_url'],
+        'address': text['Address'],
+        'city': text['City'],
+        'state': text['State'].fillna('FL'),
+        'zipCode': sheet['zip5'],
+    })
+    return [{k: (None if pd.isna(v) else str(v)) for k, v in row.items()}
+            for row in fields.astype(object).to_dict('records')]
+
+
+@dataclass
+class ApplyResult:
+    updated: List[str] = field(default_factory=list)
+    inserted: List[str] = field(default_factory=list)
+    hidden: List[str] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+
+
+def apply_changes(changes: Dict[str, Any], path: Path = ROOFERS_TS, dry_run: bool = False,
+                  state_file: Optional[Path] = IMPORT_STATE_FILE) -> ApplyResult:
+    """
+    Apply a change set to roofers.ts in a single write, then save its
+    import state to `state_file`.
+
+    Updated rows patch only the contact fields whose columns changed (blank
+    cells never erase data that was added by hand), inserted rows are appended with
+    empty service areas, and deleted rows are hidden rather than removed so
+    their enriched content is kept. An inserted row for a roofer that is
+    already in roofers.ts (every row of a first or --full import) only fills
+    in the fields it is missing, so seeding the import state never
+    overwrites curated contact details. Rows that resolve to the same roofer
+    (repeated names in the sheet) are merged into one patch.
+    """
+    with metrics.stage('parse') as stage:
+        content, index = load_index(path)
+        stage.rows = len(index.entries)
+    result = ApplyResult()
+    edits = []
+    new_entries = []
+    next_id = max((int(e.id) for e in index.entries if e.id and e.id.isdigit()), default=0) + 1
+    taken = set(index.by_slug)
+    patches: Dict[str, Tuple[RooferEntry, Dict[str, Any]]] = {}
+    hide = set()
+
+    rows = changes.get('inserted', []) + changes.get('updated', [])
+    for change, row in zip(rows, sheet_roofer_fields([change['record'] for change in rows])):
+        fields = {k: v for k, v in row.items() if v is not None}
+        if not change['key'] or not create_slug(fields.get('name') or ''):
+            # Junk sheet row recorded before keyed_rows skipped them
+            result.skipped.append(change['key'])
+            continue
+        changed = change.get('changed')
+        if changed is not None:
+            wanted = {COLUMN_FIELDS[col] for col in changed if col in COLUMN_FIELDS}
+            patch = {k: v for k, v in fields.items() if k in wanted}
+        else:
+            patch = fields
+        entry = index.resolve(change['key']) or index.resolve(fields.get('name'))
+        if entry is None:
+            slug, counter = change['key'], 1
+            while slug in taken:
+                slug = f"{change['key']}-{counter}"
+                counter += 1
+            taken.add(slug)
+            new_entries.append((slug, {
+                'id': str(next_id),
+                'name': fields.pop('name'),
+                'slug': slug,
+                **fields,
+                'serviceAreas': {'regions': [], 'counties': [], 'cities': []},
+                'isPreferred': False,
+                'isHidden': False,
+            }))
+            next_id += 1
+            result.inserted.append(slug)
+            continue
+        if 'changed' not in change:
+            patch = {k: v for k, v in patch.items() if entry.fields.get(k) in (None, '')}
+        patches.setdefault(entry.key, (entry, {}))[1].update(patch)
+
+    for change in changes.get('deleted', []):
+        entry = index.resolve(change['key'])
+        if entry is None or entry.fields.get('isHidden'):
+            result.skipped.append(change['key'])
+            continue
+        patches.setdefault(entry.key, (entry, {}))[1]['isHidden'] = True
+        hide.add(entry.key)
+
+    for key, (entry, patch) in patches.items():
+        pending = {k: v for k, v in patch.items() if entry.fields.get(k) != v}
+        if pending:
+            edits.extend(field_edits(content, entry, pending))
+            (result.hidden if key in hide else result.updated).append(key)
+        else:
+            result.skipped.append(key)
+
+    if new_entries:
+        edits.append(append_entries_edit(content, index.entries, new_entries))
+    if edits and not dry_run:
+        with metrics.stage('emit') as stage:
+            path.write_text(apply_edits(content, edits), encoding='utf-8')
+            stage.rows = len(edits)
+    if state_file and changes.get('importState') and not dry_run:
+        save_state(changes['importState'], state_file)
+    metrics.count('roofers_changed', len(result.inserted), change='inserted')
+    metrics.count('roofers_changed', len(result.updated), change='updated')
+    metrics.count('roofers_changed', len(result.hidden), change='hidden')
+    return result
@@ -0,0 +1,401 @@
+"""
+Lead routing: which roofers should receive a free-estimate or contact lead.
+
+Every routing point (ZIP centroids, plus every county center as the fallback
+for ZIPs without a centroid) gets a ranked list of roofers, scored as a
+weighted sum of 0..1 features:
+
+  service_area  the roofer lists the point's city or county (1.0) or only
+                its region (0.8)
+  proximity     exp(-miles / PROXIMITY_MILES) from the roofer's coordinates
+  listing       preferred 1.0, sponsored 0.5, general 0.0
+  rating        Yelp rating shrunk towards RATING_PRIOR by review count
+
+A roofer is eligible at a point if it serves the area or is within
+UNLISTED_RADIUS_MILES. The table is written to
+public/data/lead-routing/routes.json; a lookup is one dictionary access.
+
+Feature values only depend on the roofer and the point (never on the rest
+of the roster), so when some roofers change only the points where they
+were or become eligible have to be re-ranked (see build_routes()).
+"""
+
+import hashlib
+import json
+import re
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .geography import ZIP_TO_COUNTY, city_lookup, counties, county_for_zip, load_county_coordinates
+from .near_me import ZIP_CENTROIDS_FILE, city_points, zip_points
+from .paths import PUBLIC_DATA_DIR, ROOFERS_TS, YELP_ANALYSIS_JSON
+from .ranking import load_roster
+from .roofers_ts import load_roofers
+from .spatial import PointTree, fast_coordinates, haversine_miles, roofer_category
+
+LEAD_ROUTING_DIR = PUBLIC_DATA_DIR / 'lead-routing'
+ROUTES_FILE = LEAD_ROUTING_DIR / 'routes.json'
+
+# Bump when the scoring changes so the next build re-ranks every point
+ROUTING_VERSION = 1
+
+DEFAULT_WEIGHTS = {
+    'service_area': 0.40,
+    'proximity': 0.30,
+    'listing': 0.20,
+    'rating': 0.10,
+}
+
+LISTING_SCORE = {'preferred': 1.0, 'sponsored': 0.5, 'general': 0.0}
+REGION_ONLY_SCORE = 0.8
+PROXIMITY_MILES = 25.0
+UNLISTED_RADIUS_MILES = 15.0
+
+# A ZIP centroid within this distance of a service-area city counts as that city
+CITY_SNAP_MILES = 8.0
+
+# Ratings are shrunk towards RATING_PRIOR as if it came from RATING_PRIOR_REVIEWS reviews
+RATING_PRIOR = 4.0
+RATING_PRIOR_REVIEWS = 5
+
+# Roofers kept per routing point
+DEFAULT_K = 10
+
+# Points scored per block (bounds the points x roofers matrices)
+CHUNK_POINTS = 512
+
+
+@dataclass
+class RoutingInputs:
+    """Roofers and routing points in the shape the scorer needs."""
+    roofers: pd.DataFrame      # id, name, category, zip, lat, lng, rating, review_count, fingerprint
+    areas: Dict[str, np.ndarray]   # 'cities'/'counties'/'regions' -> bool (roofers, slugs)
+    slugs: Dict[str, List[str]]    # column labels of the area matrices
+    points: pd.DataFrame       # key, table, lat, lng, city, county, region
+
+
+@dataclass
+class RoutingStats:
+    points: int = 0
+    rescored: int = 0
+    changed_roofers: List[str] = field(default_factory=list)
+    full_rebuild: bool = True
+
+
+def fingerprint(fields: Dict) -> str:
+    """Short hash of everything a roofer's routing depends on."""
+    payload = json.dumps(fields, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:12]
+
+
+def settings_fingerprint(weights: Dict[str, float], k: int) -> str:
+    return fingerprint({'version': ROUTING_VERSION, 'weights': weights, 'k': k,
+                        'proximity': PROXIMITY_MILES, 'radius': UNLISTED_RADIUS_MILES})
+
+
+def load_inputs(roofers_file: Path = ROOFERS_TS, yelp_file: Optional[Path] = YELP_ANALYSIS_JSON,
+                centroids_file: Optional[Path] = ZIP_CENTROIDS_FILE) -> RoutingInputs:
+    """Visible roofers with coordinates, their service areas and ratings, and the routing points."""
+    cities_by_slug, county_coords = city_lookup(), load_county_coordinates()
+    ratings = load_roster(roofers_file, yelp_file).assign(id=lambda df: df['id'].astype(str))
+    ratings = ratings.drop_duplicates('id').set_index('id')[['rating', 'review_count']]
+
+    rows, area_lists = [], {'cities': [], 'counties': [], 'regions': []}
+    for fields in load_roofers(roofers_file):
+        if fields.get('isHidden'):
+            continue
+        coords = fast_coordinates(fields, cities_by_slug, county_coords)
+        if coords is None:
+            continue
+        roofer_id = str(fields.get('id'))
+        areas = fields.get('serviceAreas') or {}
+        for kind in area_lists:
+            area_lists[kind].append(sorted(set(areas.get(kind) or [])))
+        rating = ratings['rating'].get(roofer_id, np.nan)
+        review_count = int(ratings['review_count'].get(roofer_id, 0))
+        category = roofer_category(fields)
+        rows.append({
+            'id': roofer_id,
+            'name': fields.get('name'),
+            'category': category,
+            'zip': fields.get('zipCode'),
+            'lat': coords[0],
+            'lng': coords[1],
+            'rating': rating,
+            'review_count': review_count,
+            'fingerprint': fingerprint({
+                'areas': [area_lists[kind][-1] for kind in ('cities', 'counties', 'regions')],
+                'lat': round(coords[0], 5), 'lng': round(coords[1], 5), 'category': category,
+                'rating': None if pd.isna(rating) else float(rating), 'review_count': review_count,
+            }),
+        })
+    roofers = pd.DataFrame(rows, columns=['id', 'name', 'category', 'zip', 'lat', 'lng', 'rating',
+                                          'review_count', 'fingerprint'])
+
+    slugs, areas = {}, {}
+    for kind, lists in area_lists.items():
+        slugs[kind] = sorted({s for values in lists for s in values})
+        column = {s: i for i, s in enumerate(slugs[kind])}
+        matrix = np.zeros((len(lists), len(slugs[kind])), dtype=bool)
+        for row, values in enumerate(lists):
+            matrix[row, [column[s] for s in values]] = True
+        areas[kind] = matrix
+
+    return RoutingInputs(roofers, areas, slugs, routing_points(roofers, centroids_file))
+
+
+def routing_points(roofers: pd.DataFrame, centroids_file: Optional[Path] = ZIP_CENTROIDS_FILE) -> pd.DataFrame:
+    """ZIP points (with their county, region and nearest city) followed by county centers."""
+    zips = zip_points(roofers, centroids_file)
+    located = zips['key'].map(county_for_zip)
+    zips = zips.assign(
+        table='zips',
+        county=located.map(lambda c: c[0] if c else ''),
+        region=located.map(lambda c: c[1] if c else ''),
+        city=nearest_city_slugs(zips['lat'].to_numpy(dtype=float), zips['lng'].to_numpy(dtype=float)),
+    )
+    county_rows = [{'key': c.slug, 'table': 'counties', 'lat': c.lat, 'lng': c.lng,
+                    'county': c.slug, 'region': c.region_slug, 'city': ''}
+                   for c in counties() if c.lat is not None]
+    columns = ['key', 'table', 'lat', 'lng', 'city', 'county', 'region']
+    points = pd.concat([zips[columns], pd.DataFrame(county_rows, columns=columns)], ignore_index=True)
+    return points.assign(lat=points['lat'].astype(float).round(5), lng=points['lng'].astype(float).round(5))
+
+
+def nearest_city_slugs(lat: np.ndarray, lng: np.ndarray) -> np.ndarray:
+    """Slug of the nearest service-area city within CITY_SNAP_MILES of each point ('' if none)."""
+    places = city_points()
+    slugs = np.array([key.rsplit('/', 1)[-1] for key in places['key']] + [''], dtype=object)
+    if len(lat) == 0 or places.empty:
+        return np.full(len(lat), '', dtype=object)
+    idx, miles = PointTree(places['lat'].to_numpy(), places['lng'].to_numpy()).query(lat, lng, 1)
+    return np.where(miles[:, 0] <= CITY_SNAP_MILES, slugs[idx[:, 0]], '')
+
+
+def rating_scores(roofers: pd.DataFrame) -> np.ndarray:
+    """Review rating shrunk towards the prior, scaled to 0..1."""
+    count = roofers['review_count'].to_numpy(dtype=float)
+    rating = roofers['rating'].to_numpy(dtype=float)
+    rating = np.where(np.isnan(rating), RATING_PRIOR, rating)
+    shrunk = (rating * count + RATING_PRIOR * RATING_PRIOR_REVIEWS) / (count + RATING_PRIOR_REVIEWS)
+    return np.clip(shrunk / 5, 0, 1)
+
+
+def area_membership(inputs: RoutingInputs, kind: str, point_slugs: pd.Series,
+                    roofer_rows: np.ndarray) -> np.ndarray:
+    """(points, roofers) bool: does each roofer list each point's city/county/region."""
+    column = {s: i for i, s in enumerate(inputs.slugs[kind])}
+    cols = point_slugs.map(column).to_numpy(dtype=float)
+    known = ~np.isnan(cols)
+    matrix = np.zeros((len(cols), len(roofer_rows)), dtype=bool)
+    if known.any():
+        matrix[known] = inputs.areas[kind][np.ix_(roofer_rows, cols[known].astype(int))].T
+    return matrix
+
+
+def score_block(inputs: RoutingInputs, point_rows: np.ndarray, roofer_rows: np.ndarray,
+                weights: Dict[str, float]) -> np.ndarray:
+    """
+    Scores of roofer_rows at point_rows, shape (points, roofers).
+
+    Ineligible pairs are -inf.
+    """
+    points = inputs.points.iloc[point_rows]
+    roofers = inputs.roofers.iloc[roofer_rows]
+
+    local = (area_membership(inputs, 'cities', points['city'], roofer_rows)
+             | area_membership(inputs, 'counties', points['county'], roofer_rows))
+    regional = area_membership(inputs, 'regions', points['region'], roofer_rows)
+    service_area = np.where(local, 1.0, np.where(regional, REGION_ONLY_SCORE, 0.0))
+
+    miles = haversine_miles(points['lat'].to_numpy()[:, None], points['lng'].to_numpy()[:, None],
+                            roofers['lat'].to_numpy()[None, :], roofers['lng'].to_numpy()[None, :])
+    proximity = np.exp(-miles / PROXIMITY_MILES)
+    listing = roofers['category'].map(LISTING_SCORE).to_numpy(dtype=float)[None, :]
+    rating = rating_scores(roofers)[None, :]
+
+    weights = {**DEFAULT_WEIGHTS, **weights}
+    total = sum(weights.values())
+    score = (weights['service_area'] * service_area + weights['proximity'] * proximity
+             + weights['listing'] * listing + weights['rating'] * rating) / total
+    eligible = (service_area > 0) | (miles <= UNLISTED_RADIUS_MILES)
+    return np.where(eligible, score, -np.inf)
+
+
+def rank_points(inputs: RoutingInputs, point_rows: np.ndarray, weights: Dict[str, float],
+                k: int = DEFAULT_K) -> Dict[int, List[Tuple[str, float]]]:
+    """Top-k (roofer id, score) per point row, best first."""
+    all_roofers = np.arange(len(inputs.roofers))
+    ids = inputs.roofers['id'].to_numpy()
+    ranked = {}
+    for start in range(0, len(point_rows), CHUNK_POINTS):
+        rows = point_rows[start:start + CHUNK_POINTS]
+        scores = score_block(inputs, rows, all_roofers, weights)
+        keep = min(k, scores.shape[1])
+        if keep == 0:
+            ranked.update({int(r): [] for r in rows})
+            continue
+        top = np.argpartition(-scores, keep - 1, axis=1)[:, :keep]
+        top_scores = np.take_along_axis(scores, top, axis=1)
+        order = np.lexsort((top, -top_scores), axis=1)
+        top, top_scores = np.take_along_axis(top, order, axis=1), np.take_along_axis(top_scores, order, axis=1)
+        for row, members, member_scores in zip(rows, top, top_scores):
+            ranked[int(row)] = [(ids[m], round(float(s), 4))
+                                for m, s in zip(members, member_scores) if np.isfinite(s)]
+    return ranked
+
+
+def affected_points(inputs: RoutingInputs, previous: Dict[str, Dict[str, Dict]],
+                    changed: List[str], weights: Dict[str, float]) -> np.ndarray:
+    """
+    Point rows whose ranking can differ after `changed` roofers were added,
+    edited or removed: points that listed one of them before, points where
+    one of them is eligible now, and points that are new or have moved.
+    """
+    changed_set = set(changed)
+    points = inputs.points
+    stale = np.zeros(len(points), dtype=bool)
+    for row, (key, table, lat, lng) in enumerate(zip(points['key'], points['table'], points['lat'], points['lng'])):
+        entry = previous.get(table, {}).get(key)
+        stale[row] = (entry is None or (entry['lat'], entry['lng']) != (lat, lng)
+                      or any(i in changed_set for i, _ in entry['roofers']))
+
+    roofer_rows = np.flatnonzero(inputs.roofers['id'].isin(changed_set).to_numpy())
+    if len(roofer_rows):
+        for start in range(0, len(points), CHUNK_POINTS):
+            rows = np.arange(start, min(start + CHUNK_POINTS, len(points)))
+            stale[rows] |= np.isfinite(score_block(inputs, rows, roofer_rows, weights)).any(axis=1)
+    return np.flatnonzero(stale)
+
+
+def load_routes(path: Path = ROUTES_FILE) -> Optional[Dict]:
+    if not path.exists():
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def decode_tables(document: Dict) -> Dict[str, Dict[str, Dict]]:
+    """Routing tables with roofer positions resolved to ids."""
+    ids = document['roofers']
+    return {
+        table: {key: {'lat': entry['lat'], 'lng': entry['lng'],
+                      'roofers': [(ids[i], s) for i, s in entry['roofers']]}
+                for key, entry in document[table].items()}
+        for table in ('zips', 'counties')
+    }
+
+
+def build_routes(inputs: RoutingInputs, previous: Optional[Dict] = None,
+                 weights: Optional[Dict[str, float]] = None, k: int = DEFAULT_K) -> Tuple[Dict, RoutingStats]:
+    """
+    Build the routing document, reusing `previous` where it is still valid.
+
+    Roofers are compared by fingerprint; only the points affected by added,
+    changed or removed roofers are re-ranked. A change of weights, k or
+    ROUTING_VERSION re-ranks everything.
+    """
+    weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+    settings = settings_fingerprint(weights, k)
+    current = dict(zip(inputs.roofers['id'], inputs.roofers['fingerprint']))
+    stats = RoutingStats(points=len(inputs.points))
+
+    if previous and previous.get('settings') == settings:
+        before = dict(zip(previous['roofers'], previous['fingerprints']))
+        stats.changed_roofers = sorted(
+            {i for i, fp in current.items() if before.get(i) != fp} | (set(before) - set(current)))
+        tables = decode_tables(previous)
+        rows = affected_points(inputs, tables, stats.changed_roofers, weights)
+        stats.full_rebuild = False
+    else:
+        tables = {'zips': {}, 'counties': {}}
+        rows = np.arange(len(inputs.points))
+
+    stats.rescored = len(rows)
+    points = inputs.points
+    for row, entries in rank_points(inputs, rows, weights, k).items():
+        point = points.iloc[row]
+        tables[point['table']][point['key']] = {'lat': float(point['lat']), 'lng': float(point['lng']),
+                                                'roofers': entries}
+
+    # Drop points that no longer exist
+    wanted = set(zip(points['table'], points['key']))
+    tables = {t: {key: v for key, v in sorted(entries.items()) if (t, key) in wanted}
+              for t, entries in tables.items()}
+    return encode_routes(tables, current, settings, k), stats
+
+
+def encode_routes(tables: Dict[str, Dict[str, Dict]], fingerprints: Dict[str, str],
+                  settings: str, k: int) -> Dict:
+    """Compact document: roofer ids listed once, entries hold [position, score] pairs."""
+    ids = sorted(fingerprints, key=lambda i: (len(i), i))
+    position = {i: n for n, i in enumerate(ids)}
+    return {
+        'generatedAt': datetime.now(timezone.utc).isoformat(),
+        'version': ROUTING_VERSION,
+        'settings': settings,
+        'k': k,
+        'roofers': ids,
+        'fingerprints': [fingerprints[i] for i in ids],
+        # ZIP prefix -> county, for ZIPs that have no entry of their own
+        'zipPrefixes': {prefix: county for prefix, (county, _) in sorted(ZIP_TO_COUNTY.items())},
+        **{
+            table: {key: {'lat': entry['lat'], 'lng': entry['lng'],
+                          'roofers': [[position[i], s] for i, s in entry['roofers'] if i in position]}
+                    for key, entry in entries.items()}
+            for table, entries in tables.items()
+        },
+    }
+
+
+def write_routes(document: Dict, path: Path = ROUTES_FILE):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(document, f, separators=(',', ':'), ensure_ascii=False)
+
+
+ZIP_IN_ADDRESS = re.compile(r'\b(3[234]\d{3})(?:-\d{4})?\b')
+
+
+class LeadRouter:
+    """
+    Constant-time lead routing from a built routes.json.
+
+        router = LeadRouter.load()
+        router.route(zip_code='33602')
+        router.route(address='123 Main St, Tampa, FL 33602')
+    """
+
+    def __init__(self, document: Dict):
+        self.tables = decode_tables(document)
+
+    @classmethod
+    def load(cls, path: Path = ROUTES_FILE) -> 'LeadRouter':
+        document = load_routes(path)
+        if document is None:
+            raise FileNotFoundError(f"{path} not found; run scripts/build-lead-routes.py first")
+        return cls(document)
+
+    def route(self, zip_code: Optional[str] = None, address: Optional[str] = None,
+              limit: int = 5) -> List[Tuple[str, float]]:
+        """
+        Ranked (roofer id, score) pairs for a ZIP code or a free-text address.
+
+        Unknown ZIPs fall back to their county's table via the ZIP prefix.
+        """
+        if not zip_code and address:
+            match = ZIP_IN_ADDRESS.search(address)
+            zip_code = match.group(1) if match else None
+        zip_code = str(zip_code or '').strip()[:5]
+        if not zip_code:
+            return []
+        entry = self.tables['zips'].get(zip_code)
+        if entry is None:
+            located = county_for_zip(zip_code)
+            entry = self.tables['counties'].get(located[0]) if located else None
+        return entry['roofers'][:limit] if entry else []
@@ -0,0 +1,180 @@
+"""
+Per-zoom marker clusters for /roofers/map.
+
+Roofers are projected to Web Mercator and snapped to a grid whose cells are
+CELL_PIXELS wide at each zoom level. Cell sizes halve from one zoom to the
+next, so every cluster at zoom z is exactly the union of up to four
+clusters at zoom z + 1 and the hierarchy is consistent while zooming.
+Grouping is a pandas groupby per zoom, so the cost is a few vector passes
+per level.
+
+Clusters are written as small JSON tiles ({layer}/{z}/{x}-{y}.json, each
+covering TILE_PIXELS square at its zoom) plus an index of the tiles that
+exist, so the map only fetches what is inside the current viewport.
+"""
+
+import json
+import shutil
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from .paths import PUBLIC_DATA_DIR
+
+MAP_CLUSTERS_DIR = PUBLIC_DATA_DIR / 'map-clusters'
+
+MIN_ZOOM = 5
+MAX_ZOOM = 14
+
+# Width of the world in pixels at zoom 0 (Leaflet/OSM map tiles)
+WORLD_PIXELS = 256
+
+# Cluster cell width in screen pixels (a power of two keeps cells nested)
+CELL_PIXELS = 64
+
+# Clusters are stored in 1024px tiles (4x4 map tiles), so a typical viewport
+# needs one to four files per zoom
+TILE_PIXELS = 1024
+CELLS_PER_TILE = TILE_PIXELS // CELL_PIXELS
+
+# Marker sets the page can show
+LAYERS = {
+    'all': lambda df: pd.Series(True, index=df.index),
+    'preferred': lambda df: df['category'] == 'preferred',
+}
+
+
+def mercator(lat, lng):
+    """Web Mercator x, y in 0..1 (y grows southward, like tile rows)."""
+    lat = np.clip(np.asarray(lat, dtype=float), -85.0511, 85.0511)
+    x = (np.asarray(lng, dtype=float) + 180) / 360
+    y = 0.5 - np.log(np.tan(np.pi / 4 + np.radians(lat) / 2)) / (2 * np.pi)
+    return x, y
+
+
+def inverse_mercator(x, y):
+    lng = np.asarray(x) * 360 - 180
+    lat = np.degrees(2 * np.arctan(np.exp((0.5 - np.asarray(y)) * 2 * np.pi)) - np.pi / 2)
+    return lat, lng
+
+
+def cluster_levels(roofers: pd.DataFrame, min_zoom: int = MIN_ZOOM,
+                   max_zoom: int = MAX_ZOOM) -> Dict[int, pd.DataFrame]:
+    """
+    Cluster the roofers at every zoom level.
+
+    Returns {zoom: frame} with one row per cluster: cell coordinates,
+    member-weighted centroid, count, preferred count and the zoom at which
+    the cluster splits (`expand`). Clusters of one roofer carry its
+    id/slug/name; clusters that never split (roofers at the same spot) carry
+    the list of their `members` so the map can show them without zooming.
+    """
+    x, y = mercator(roofers['lat'].to_numpy(), roofers['lng'].to_numpy())
+    base = pd.DataFrame({
+        'x': x,
+        'y': y,
+        'preferred': (roofers['category'] == 'preferred').to_numpy().astype(int),
+        'row': np.arange(len(roofers)),
+    })
+    never_splits = max_zoom + 1
+
+    levels: Dict[int, pd.DataFrame] = {}
+    child_cells = None
+    for zoom in range(max_zoom, min_zoom - 1, -1):
+        scale = (WORLD_PIXELS << zoom) // CELL_PIXELS  # grid cells across the world
+        cells = base.assign(cx=np.floor(base['x'] * scale).astype(np.int64),
+                            cy=np.floor(base['y'] * scale).astype(np.int64))
+        level = cells.groupby(['cx', 'cy'], sort=False).agg(
+            x=('x', 'mean'), y=('y', 'mean'), count=('row', 'size'),
+            preferred=('preferred', 'sum'), row=('row', 'first')).reset_index()
+
+        # A cluster splits at the next zoom if its members fall into several
+        # child cells; otherwise it inherits its single child's split zoom.
+        if child_cells is None:
+            level['expand'] = np.where(level['count'] > 1, never_splits, 0)
+        else:
+            children = child_cells.assign(cx=child_cells['cx'] // 2, cy=child_cells['cy'] // 2)
+            per_parent = children.groupby(['cx', 'cy']).agg(n=('expand', 'size'), expand=('expand', 'first'))
+            level = level.join(per_parent, on=['cx', 'cy'])
+            level['expand'] = np.where(level['n'] > 1, zoom + 1, level['expand']).astype(int)
+            level = level.drop(columns='n')
+        child_cells = level[['cx', 'cy', 'expand']]
+
+        stacked = level[level['expand'] == never_splits][['cx', 'cy']]
+        members = (cells.merge(stacked, on=['cx', 'cy']).groupby(['cx', 'cy'])['row'].agg(list)
+                   if len(stacked) else pd.Series(dtype=object))
+        level['members'] = level.join(members.rename('members'), on=['cx', 'cy'])['members'] if len(stacked) else None
+        levels[zoom] = level
+    return levels
+
+
+def _marker(roofer: Dict) -> Dict:
+    return {'id': roofer['id'], 'slug': roofer['slug'], 'name': roofer['name'],
+            'preferred': roofer['category'] == 'preferred'}
+
+
+def level_features(level: pd.DataFrame, records: List[Dict]) -> List[Dict]:
+    """Marker/cluster dicts for one zoom level, in the level's row order."""
+    lat, lng = inverse_mercator(level['x'].to_numpy(), level['y'].to_numpy())
+    lat, lng = np.round(lat, 5).tolist(), np.round(lng, 5).tolist()
+    members = level['members'] if 'members' in level else pd.Series(None, index=level.index)
+    features = []
+    for i, (cx, cy, count, preferred, row, expand, stacked) in enumerate(zip(
+            level['cx'].tolist(), level['cy'].tolist(), level['count'].tolist(), level['preferred'].tolist(),
+            level['row'].tolist(), level['expand'].tolist(), members.tolist())):
+        if count == 1:
+            features.append({'lat': lat[i], 'lng': lng[i], **_marker(records[row])})
+            continue
+        feature = {'lat': lat[i], 'lng': lng[i], 'count': count, 'preferred': preferred,
+                   'key': f'{cx}-{cy}', 'expand': expand}
+        if isinstance(stacked, list):
+            feature['members'] = [_marker(records[m]) for m in stacked]
+        features.append(feature)
+    return features
+
+
+def write_tiles(levels: Dict[int, pd.DataFrame], roofers: pd.DataFrame, output_dir: Path) -> Dict[str, List[str]]:
+    """Write one JSON file per non-empty tile; returns {zoom: [tile keys]}."""
+    if output_dir.exists():
+        shutil.rmtree(output_dir)
+    written: Dict[str, List[str]] = {}
+    records = roofers[['id', 'slug', 'name', 'category']].to_dict('records')
+    for zoom, level in sorted(levels.items()):
+        tiles: Dict[str, List[Dict]] = {}
+        tx = (level['cx'] // CELLS_PER_TILE).tolist()
+        ty = (level['cy'] // CELLS_PER_TILE).tolist()
+        for x, y, feature in zip(tx, ty, level_features(level, records)):
+            tiles.setdefault(f'{x}-{y}', []).append(feature)
+
+        (output_dir / str(zoom)).mkdir(parents=True, exist_ok=True)
+        for key, features in tiles.items():
+            with open(output_dir / str(zoom) / f'{key}.json', 'w', encoding='utf-8') as f:
+                json.dump(features, f, separators=(',', ':'), ensure_ascii=False)
+        written[str(zoom)] = sorted(tiles)
+    return written
+
+
+def build_cluster_tiles(roofers: pd.DataFrame, output_dir: Path = MAP_CLUSTERS_DIR,
+                        min_zoom: int = MIN_ZOOM, max_zoom: int = MAX_ZOOM) -> Dict:
+    """Cluster and write every layer, then the index the map reads first."""
+    index = {
+        'generatedAt': datetime.now(timezone.utc).isoformat(),
+        'minZoom': min_zoom,
+        'maxZoom': max_zoom,
+        'cellPixels': CELL_PIXELS,
+        'tilePixels': TILE_PIXELS,
+        'layers': {},
+    }
+    for layer, select in LAYERS.items():
+        members = roofers[select(roofers)].reset_index(drop=True)
+        levels = cluster_levels(members, min_zoom, max_zoom) if len(members) else {}
+        tiles = write_tiles(levels, members, output_dir / layer)
+        index['layers'][layer] = {'roofers': len(members), 'tiles': tiles}
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    with open(output_dir / 'index.json', 'w', encoding='utf-8') as f:
+        json.dump(index, f, separators=(',', ':'))
+    return index
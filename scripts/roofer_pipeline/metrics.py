@@ -0,0 +1,370 @@
+"""
+Run metrics for the pipeline scripts.
+
+An entry point calls start_run() once; pipeline code then records into the
+current run through the module-level helpers, which do nothing when no run
+was started (so library code can always call them):
+
+  stage('parse')               wall time, calls and rows per stage
+  count('pages', 3)            plain counters, optionally labelled
+  request('yelp', 0.21, 200)   request counts by status and latency histograms
+  cache('geocode', hits, misses)
+
+When the process exits the run is written to data/metrics/ as
+<script>-<timestamp>.json and .prom (OpenMetrics text). Set
+PIPELINE_METRICS_DIR to write elsewhere, or to "off" to disable.
+
+Passing --profile (or setting PIPELINE_PROFILE) also profiles the run,
+stage by stage; see profiling.py.
+"""
+
+import atexit
+import json
+import os
+import re
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from .paths import REPO_ROOT
+from .profiling import Profiler, requested, start_profiler
+
+METRICS_DIR = REPO_ROOT / 'data' / 'metrics'
+METRICS_ENV = 'PIPELINE_METRICS_DIR'
+
+# Upper bounds (seconds) of the request latency histogram buckets
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """Peak resident set size of this process so far (None where unavailable)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+@dataclass
+class StageMetrics:
+    seconds: float = 0.0
+    calls: int = 0
+    rows: int = 0
+    peak_rss_bytes: Optional[int] = None
+
+    def to_dict(self) -> Dict:
+        return {'seconds': round(self.seconds, 6), 'calls': self.calls, 'rows': self.rows,
+                'peak_rss_bytes': self.peak_rss_bytes}
+
+
+@dataclass
+class LatencyHistogram:
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+    buckets: List[int] = field(default_factory=lambda: [0] * len(LATENCY_BUCKETS))
+
+    def observe(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                self.buckets[i] += 1
+                break
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate from the buckets, interpolating linearly inside the bucket
+        holding the q-th observation (as Prometheus' histogram_quantile), so
+        memory stays constant however many requests a run makes.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen, lower = 0, 0.0
+        for bound, n in zip(LATENCY_BUCKETS, self.buckets):
+            if n and seen + n >= rank:
+                return round(min(self.max, lower + (bound - lower) * (rank - seen) / n), 6)
+            seen += n
+            lower = bound
+        return round(self.max, 6)
+
+    def to_dict(self) -> Dict:
+        return {
+            'count': self.count,
+            'sum': round(self.total, 6),
+            'mean': round(self.total / self.count, 6) if self.count else None,
+            'p50': self.quantile(0.5),
+            'p95': self.quantile(0.95),
+            'max': round(self.max, 6),
+        }
+
+
+class StageTimer:
+    """Handle yielded by Run.stage(); set `rows` to record how much the stage processed."""
+
+    def __init__(self):
+        self.rows = 0
+
+
+class Run:
+    def __init__(self, name: str):
+        self.name = name
+        self.started = datetime.now(timezone.utc)
+        self._start = time.perf_counter()
+        self.stages: Dict[str, StageMetrics] = {}
+        self.counters: Dict[Tuple[str, Labels], float] = {}
+        self.requests: Dict[Tuple[str, str], int] = {}
+        self.latency: Dict[str, LatencyHistogram] = {}
+        self.caches: Dict[str, List[int]] = {}
+        self.profiler: Optional[Profiler] = None
+        self._stacks: Dict[int, List[str]] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[StageTimer]:
+        """Time a block. Repeated stages accumulate; nested ones are named outer.inner."""
+        stack = self._stacks.setdefault(threading.get_ident(), [])
+        full = '.'.join(stack + [name])
+        top_level = not stack
+        stack.append(name)
+        if self.profiler:
+            self.profiler.enter(full, top_level)
+        timer = StageTimer()
+        start = time.perf_counter()
+        try:
+            yield timer
+        finally:
+            elapsed = time.perf_counter() - start
+            if self.profiler:
+                self.profiler.exit(full, top_level)
+            stack.pop()
+            with self._lock:
+                metrics = self.stages.setdefault(full, StageMetrics())
+                metrics.seconds += elapsed
+                metrics.calls += 1
+                metrics.rows += timer.rows
+                metrics.peak_rss_bytes = peak_rss_bytes()
+
+    def stage_of(self, thread_id: int) -> str:
+        """The stage a thread is currently in ('' outside any stage)."""
+        return '.'.join(self._stacks.get(thread_id, ()))
+
+    def count(self, name: str, value: float = 1, **labels):
+        key = (name, tuple(sorted((k, str(v)) for k, v in labels.items())))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def request(self, service: str, seconds: float, status: Optional[int] = None):
+        status_label = str(status) if status is not None else 'error'
+        with self._lock:
+            self.requests[(service, status_label)] = self.requests.get((service, status_label), 0) + 1
+            self.latency.setdefault(service, LatencyHistogram()).observe(seconds)
+
+    def cache(self, name: str, hits: int = 0, misses: int = 0):
+        with self._lock:
+            totals = self.caches.setdefault(name, [0, 0])
+            totals[0] += hits
+            totals[1] += misses
+
+    @property
+    def slug(self) -> str:
+        return _metric_name(self.name).replace('_', '-')
+
+    @property
+    def seconds(self) -> float:
+        return time.perf_counter() - self._start
+
+    def to_dict(self) -> Dict:
+        services = sorted({service for service, _ in self.requests})
+        return {
+            'run': self.name,
+            'started': self.started.isoformat(),
+            'seconds': round(self.seconds, 6),
+            'peak_rss_bytes': peak_rss_bytes(),
+            'argv': sys.argv[1:],
+            'stages': {name: stage.to_dict() for name, stage in self.stages.items()},
+            'counters': [{'name': name, 'labels': dict(labels), 'value': value}
+                         for (name, labels), value in sorted(self.counters.items())],
+            'requests': {
+                service: {
+                    'statuses': {status: n for (s, status), n in sorted(self.requests.items()) if s == service},
+                    'latency_seconds': self.latency[service].to_dict(),
+                }
+                for service in services
+            },
+            'caches': {
+                name: {'hits': hits, 'misses': misses,
+                       'hit_rate': round(hits / (hits + misses), 4) if hits + misses else None}
+                for name, (hits, misses) in sorted(self.caches.items())
+            },
+        }
+
+    def to_openmetrics(self) -> str:
+        run = _label_value(self.name)
+        lines: List[str] = []
+
+        def family(name: str, kind: str, help_text: str, samples: List[Tuple[str, str, float]]):
+            if not samples:
+                return
+            lines.append(f"# TYPE {name} {kind}")
+            lines.append(f"# HELP {name} {help_text}")
+            for suffix, labels, value in samples:
+                lines.append(f"{name}{suffix}{{run=\"{run}\"{labels}}} {_number(value)}")
+
+        family('pipeline_run_seconds', 'gauge', 'Wall time of the run.', [('', '', self.seconds)])
+        rss = peak_rss_bytes()
+        if rss is not None:
+            family('pipeline_peak_rss_bytes', 'gauge', 'Peak resident set size.', [('', '', rss)])
+        stages = sorted(self.stages.items())
+        family('pipeline_stage_seconds', 'gauge', 'Wall time per stage.',
+               [('', f',stage="{_label_value(n)}"', s.seconds) for n, s in stages])
+        family('pipeline_stage_calls', 'counter', 'Times each stage ran.',
+               [('_total', f',stage="{_label_value(n)}"', s.calls) for n, s in stages])
+        family('pipeline_stage_rows', 'counter', 'Rows processed per stage.',
+               [('_total', f',stage="{_label_value(n)}"', s.rows) for n, s in stages])
+        family('pipeline_requests', 'counter', 'HTTP requests by service and status.',
+               [('_total', f',service="{_label_value(svc)}",status="{status}"', n)
+                for (svc, status), n in sorted(self.requests.items())])
+
+        histogram = []
+        for service, hist in sorted(self.latency.items()):
+            labels = f',service="{_label_value(service)}"'
+            cumulative = 0
+            for bound, n in zip(LATENCY_BUCKETS, hist.buckets):
+                cumulative += n
+                histogram.append(('_bucket', f'{labels},le="{bound:g}"', cumulative))
+            histogram.append(('_bucket', f'{labels},le="+Inf"', hist.count))
+            histogram.append(('_count', labels, hist.count))
+            histogram.append(('_sum', labels, hist.total))
+        family('pipeline_request_duration_seconds', 'histogram', 'HTTP request latency.', histogram)
+
+        caches = sorted(self.caches.items())
+        family('pipeline_cache_hits', 'counter', 'Cache hits.',
+               [('_total', f',cache="{_label_value(n)}"', h) for n, (h, _) in caches])
+        family('pipeline_cache_misses', 'counter', 'Cache misses.',
+               [('_total', f',cache="{_label_value(n)}"', m) for n, (_, m) in caches])
+
+        counters: Dict[str, List[Tuple[str, str, float]]] = {}
+        for (name, labels), value in sorted(self.counters.items()):
+            extra = ''.join(f',{_metric_name(k)}="{_label_value(v)}"' for k, v in labels)
+            counters.setdefault(f"pipeline_{_metric_name(name)}", []).append(('_total', extra, value))
+        for name, samples in counters.items():
+            family(name, 'counter', f"Counter {name[len('pipeline_'):]}.", samples)
+
+        lines.append('# EOF')
+        return '\n'.join(lines) + '\n'
+
+    def write(self, directory: Path) -> Tuple[Path, Path]:
+        directory.mkdir(parents=True, exist_ok=True)
+        stem = f"{self.slug}-{self.started.strftime('%Y%m%dT%H%M%S')}"
+        json_path = directory / f"{stem}.json"
+        prom_path = directory / f"{stem}.prom"
+        json_path.write_text(json.dumps(self.to_dict(), indent=2) + '\n', encoding='utf-8')
+        prom_path.write_text(self.to_openmetrics(), encoding='utf-8')
+        return json_path, prom_path
+
+
+def _metric_name(name: str) -> str:
+    return re.sub(r'[^a-zA-Z0-9_]', '_', name).strip('_') or 'unnamed'
+
+
+def _label_value(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else f"{value:.6g}"
+
+
+# The run of the current process
+
+_current: Optional[Run] = None
+
+
+def metrics_dir() -> Optional[Path]:
+    value = os.getenv(METRICS_ENV)
+    if value is None:
+        return METRICS_DIR
+    if value.strip().lower() in ('', '0', 'off', 'false', 'no'):
+        return None
+    return Path(value)
+
+
+def start_run(name: Optional[str] = None) -> Run:
+    """
+    Start recording for this process; the run is written when the process exits.
+
+    Call it before parsing arguments: it consumes --profile from sys.argv.
+    """
+    global _current
+    if _current is None:
+        _current = Run(name or Path(sys.argv[0]).stem)
+        profile_dir = requested()
+        if profile_dir is not None:
+            _current.profiler = start_profiler(profile_dir, _current.slug, _current.stage_of)
+        atexit.register(finish)
+    return _current
+
+
+def current() -> Optional[Run]:
+    return _current
+
+
+def finish() -> Optional[Tuple[Path, Path]]:
+    """Write the current run (once) and stop recording."""
+    global _current
+    run, _current = _current, None
+    if run is not None and run.profiler is not None:
+        print(f"🔬 Profile → {run.profiler.stop()}")
+    directory = metrics_dir()
+    if run is None or directory is None:
+        return None
+    try:
+        paths = run.write(directory)
+    except OSError as e:
+        print(f"⚠️  Could not write metrics: {e}")
+        return None
+    print(f"📊 Metrics → {paths[0]}")
+    return paths
+
+
+@contextmanager
+def stage(name: str) -> Iterator[StageTimer]:
+    if _current is None:
+        yield StageTimer()
+        return
+    with _current.stage(name) as timer:
+        yield timer
+
+
+def count(name: str, value: float = 1, **labels):
+    if _current is not None:
+        _current.count(name, value, **labels)
+
+
+def request(service: str, seconds: float, status: Optional[int] = None):
+    if _current is not None:
+        _current.request(service, seconds, status)
+
+
+def cache(name: str, hits: int = 0, misses: int = 0):
+    if _current is not None:
+        _current.cache(name, hits, misses)
+
+
+def response_hook(service: str) -> Callable:
+    """A requests response hook recording each response's status and latency under `service`."""
+    def hook(response, *args, **kwargs):
+        request(service, response.elapsed.total_seconds(), response.status_code)
+    return hook
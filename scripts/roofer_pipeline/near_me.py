@@ -0,0 +1,115 @@
+"""
+Precomputed nearest-roofer tables for /roofers/near-me.
+
+For every service-area city and every ZIP centroid, the k nearest roofers of
+each listing category are found with one batched KD-tree query per
+category and written to small JSON files under public/data/near-me/. The
+page snaps the visitor to the closest lookup point and only has to rank that
+point's short candidate list, instead of measuring the distance to every
+roofer.
+"""
+
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .geography import cities
+from .normalize import zip5
+from .paths import DATA_DIR, PUBLIC_DATA_DIR
+from .spatial import CATEGORIES, PointTree
+
+NEAR_ME_DIR = PUBLIC_DATA_DIR / 'near-me'
+
+# Optional ZIP centroid file: a Census ZCTA gazetteer (GEOID/INTPTLAT/INTPTLONG)
+# or a CSV with zip,lat,lng columns
+ZIP_CENTROIDS_FILE = DATA_DIR / 'zip-centroids.csv'
+
+# Candidates kept per category at each lookup point. The page shows 3/3/5, the
+# extra candidates cover visitors who are not exactly at the snapped point.
+DEFAULT_K = 10
+
+# Florida ZIP codes start with 32, 33 or 34
+FLORIDA_ZIP_PATTERN = r'^3[234]\d{3}$'
+
+
+def city_points() -> pd.DataFrame:
+    """Lookup points for every city in the service-area data."""
+    rows = [{'key': p.key, 'name': p.name, 'lat': p.lat, 'lng': p.lng}
+            for p in cities() if p.lat is not None]
+    return pd.DataFrame(rows, columns=['key', 'name', 'lat', 'lng'])
+
+
+def load_zip_centroids(path: Path) -> pd.DataFrame:
+    """Florida ZIP centroids from a gazetteer file or a zip,lat,lng CSV."""
+    sep = '\t' if path.suffix == '.txt' else ','
+    df = pd.read_csv(path, sep=sep, dtype={'GEOID': str, 'zip': str})
+    df.columns = [c.strip() for c in df.columns]
+    if 'GEOID' in df:
+        df = df.rename(columns={'GEOID': 'zip', 'INTPTLAT': 'lat', 'INTPTLONG': 'lng'})
+    df['zip'] = zip5(df['zip'])
+    df = df.dropna(subset=['zip', 'lat', 'lng'])
+    return df[df['zip'].str.match(FLORIDA_ZIP_PATTERN)][['zip', 'lat', 'lng']]
+
+
+def zip_points(roofers: pd.DataFrame, centroids_file: Optional[Path] = ZIP_CENTROIDS_FILE) -> pd.DataFrame:
+    """
+    Lookup points for ZIP codes.
+
+    A centroid file is used when present; otherwise each ZIP that appears on
+    the roster is placed at the mean position of its roofers.
+    """
+    if centroids_file and centroids_file.exists():
+        df = load_zip_centroids(centroids_file)
+    else:
+        df = roofers.assign(zip=zip5(roofers['zip'])).dropna(subset=['zip'])
+        df = df.groupby('zip', as_index=False)[['lat', 'lng']].mean()
+    return df.assign(key=df['zip'], name=df['zip'])[['key', 'name', 'lat', 'lng']]
+
+
+def nearest_tables(points: pd.DataFrame, roofers: pd.DataFrame,
+                   k: int = DEFAULT_K) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+    """
+    The k nearest roofers of each category for every point.
+
+    Returns {category: (indices, miles)} with arrays of shape (points, k);
+    indices are row positions in `roofers`.
+    """
+    tables = {}
+    for category in CATEGORIES:
+        members = np.flatnonzero(roofers['category'].to_numpy() == category)
+        tree = PointTree(roofers['lat'].to_numpy()[members], roofers['lng'].to_numpy()[members])
+        idx, miles = tree.query(points['lat'].to_numpy(), points['lng'].to_numpy(), k)
+        tables[category] = (members[idx], miles)
+    return tables
+
+
+def build_lookup(points: pd.DataFrame, roofers: pd.DataFrame, k: int = DEFAULT_K) -> Dict:
+    """Compact lookup document: roofer ids are listed once and referenced by position."""
+    tables = nearest_tables(points, roofers, k)
+    entries = {}
+    for row, point in enumerate(points.itertuples(index=False)):
+        entries[point.key] = {
+            'name': point.name,
+            'lat': round(float(point.lat), 5),
+            'lng': round(float(point.lng), 5),
+            'nearest': {
+                category: [[int(i), round(float(d), 1)] for i, d in zip(idx[row], miles[row])]
+                for category, (idx, miles) in tables.items()
+            },
+        }
+    return {
+        'generatedAt': datetime.now(timezone.utc).isoformat(),
+        'k': k,
+        'roofers': roofers['id'].tolist(),
+        'points': entries,
+    }
+
+
+def write_lookup(document: Dict, path: Path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(document, f, separators=(',', ':'), ensure_ascii=False)
@@ -0,0 +1,203 @@
+"""
+Canonical contact fields for matching and export.
+
+Phones, emails, websites and ZIP codes are cleaned for a whole column at
+once with pandas string operations:
+
+  phone_e164      +1XXXXXXXXXX (NANP numbers only)
+  email_norm      lowercased and syntax-checked
+  website_domain  lowercased registrable domain (no scheme, www or path)
+  website_url     the site as https://host/path, for display
+  zip5            five-digit, zero-padded ZIP (ASCII digits only)
+
+The result is saved once per run (roofers-normalized.csv) and loaded by the
+matchers and exporters through NormalizedIndex, so no script has to clean
+these values again. Scalar helpers apply the same rules to single values,
+e.g. an API result being matched against the index.
+"""
+
+import re
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from .paths import DATA_DIR, ROOFERS_TS
+from .roofers_ts import load_roofers
+
+NORMALIZED_CSV = DATA_DIR / 'roofers-normalized.csv'
+
+CANONICAL_COLUMNS = ['phone_e164', 'email_norm', 'website_domain', 'zip5']
+
+# Public suffixes with two labels that show up in contractor websites; the
+# registrable domain is one label more than these.
+MULTI_LABEL_SUFFIXES = ('co.uk', 'org.uk', 'com.au', 'com.mx', 'com.br', 'co.nz', 'fl.us')
+
+EMAIL_PATTERN = r"^[a-z0-9!#$%&'*+/=?^_`{|}~.-]+@[a-z0-9](?:[a-z0-9-]*[a-z0-9])?(?:\.[a-z0-9](?:[a-z0-9-]*[a-z0-9])?)*\.[a-z]{2,}$"
+_SUFFIXES = '|'.join(re.escape(s) for s in MULTI_LABEL_SUFFIXES)
+DOMAIN_PATTERN = rf'([a-z0-9-]+\.(?:{_SUFFIXES}|[a-z][a-z0-9-]*[a-z]))$'
+ZIP_PATTERN = r'^([0-9]{5})(?:-?[0-9]{4})?$'
+# A bare 3-4 digit number is a ZIP whose leading zeros Excel dropped (02134 -> 2134)
+STRIPPED_ZIP_PATTERN = r'^([0-9]{3,4})$'
+
+
+def _text(series: pd.Series) -> pd.Series:
+    return series.astype('string').str.strip()
+
+
+def phone_e164(series: pd.Series) -> pd.Series:
+    """US/NANP phone numbers as +1XXXXXXXXXX; anything else becomes NA."""
+    digits = _text(series).str.replace(r'\.0+$', '', regex=True)
+    digits = digits.str.replace(r'(?:ext\.?|x)\s*\d+$', '', regex=True, case=False)
+    digits = digits.str.replace(r'\D', '', regex=True)
+    digits = digits.where(~((digits.str.len() == 11) & digits.str.startswith('1')), digits.str[1:])
+    valid = digits.str.fullmatch(r'[2-9]\d{2}[2-9]\d{6}').fillna(False).astype(bool)
+    return ('+1' + digits).where(valid)
+
+
+def email_norm(series: pd.Series) -> pd.Series:
+    """Lowercased email addresses; invalid ones become NA."""
+    emails = _text(series).str.lower().str.replace(r'^mailto:', '', regex=True)
+    valid = emails.str.fullmatch(EMAIL_PATTERN).fillna(False).astype(bool)
+    return emails.where(valid)
+
+
+def website_domain(series: pd.Series) -> pd.Series:
+    """Registrable domain of a website URL (https://www.Foo.com/bar -> foo.com)."""
+    host = _text(series).str.lower()
+    host = host.str.replace(r'^[a-z][a-z0-9+.-]*://', '', regex=True)
+    host = host.str.replace(r'^[^/@]*@', '', regex=True)
+    host = host.str.split(r'[/?#:\s]', n=1, regex=True).str[0].str.rstrip('.')
+    return host.str.extract(DOMAIN_PATTERN, expand=False)
+
+
+def website_url(series: pd.Series) -> pd.Series:
+    """Website as https://host/path (any scheme replaced); blanks become NA."""
+    rest = _text(series).str.replace(r'^(?:https?:)?//', '', regex=True, case=False)
+    return ('https://' + rest).where(rest.str.len() > 0)
+
+
+def zip5(series: pd.Series) -> pd.Series:
+    """
+    Five-digit ZIP codes (ZIP+4 and float cells are accepted); 3-4 digit
+    numbers are zero-padded. Only ASCII digits count; anything else,
+    including longer digit runs, becomes NA rather than truncated or padded.
+    """
+    text = _text(series).str.replace(r'\.0+$', '', regex=True)
+    stripped = text.str.extract(STRIPPED_ZIP_PATTERN, expand=False).str.zfill(5)
+    return text.str.extract(ZIP_PATTERN, expand=False).fillna(stripped)
+
+
+NORMALIZERS = {
+    'phone_e164': phone_e164,
+    'email_norm': email_norm,
+    'website_domain': website_domain,
+    'website_url': website_url,
+    'zip5': zip5,
+}
+
+# Canonical column -> source field in roofers.ts
+ROOFER_SOURCE_FIELDS = {
+    'phone_e164': 'phone',
+    'email_norm': 'email',
+    'website_domain': 'websiteUrl',
+    'zip5': 'zipCode',
+}
+
+# Canonical column -> column of the roofer spreadsheet (roofers-data.json)
+SHEET_SOURCE_COLUMNS = {
+    'phone_e164': 'Phone Number',
+    'email_norm': 'Email',
+    'website_domain': 'website',
+    'website_url': 'website',
+    'zip5': 'Zip Code',
+}
+
+
+def normalize_frame(df: pd.DataFrame, sources: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+    """Add the canonical columns to a frame; `sources` maps canonical column -> source column."""
+    sources = sources or ROOFER_SOURCE_FIELDS
+    out = df.copy()
+    for column, source in sources.items():
+        if source in out:
+            out[column] = NORMALIZERS[column](out[source])
+        else:
+            out[column] = pd.Series(pd.NA, index=out.index, dtype='string')
+    return out
+
+
+def _scalar(normalizer, value) -> Optional[str]:
+    if value is None:
+        return None
+    result = normalizer(pd.Series([value], dtype=object)).iloc[0]
+    return None if pd.isna(result) else str(result)
+
+
+def normalize_phone(value) -> Optional[str]:
+    return _scalar(phone_e164, value)
+
+
+def normalize_email(value) -> Optional[str]:
+    return _scalar(email_norm, value)
+
+
+def normalize_website(value) -> Optional[str]:
+    return _scalar(website_domain, value)
+
+
+def normalize_zip(value) -> Optional[str]:
+    return _scalar(zip5, value)
+
+
+def build_normalized_roster(roofers_file: Path = ROOFERS_TS) -> pd.DataFrame:
+    """Roster keyed by slug with raw contact fields and their canonical forms."""
+    roofers = load_roofers(roofers_file)
+    fields = ['id', 'slug', 'name', 'phone', 'email', 'websiteUrl', 'address', 'city', 'state', 'zipCode']
+    df = pd.DataFrame([{f: r.get(f) for f in fields} for r in roofers], columns=fields)
+    return normalize_frame(df)
+
+
+def save_normalized(df: pd.DataFrame, path: Path = NORMALIZED_CSV):
+    df.to_csv(path, index=False)
+
+
+def load_normalized(path: Path = NORMALIZED_CSV) -> pd.DataFrame:
+    return pd.read_csv(path, dtype='string', keep_default_na=False, na_values=[''])
+
+
+class NormalizedIndex:
+    """Lookups from canonical phone / email / domain / ZIP to roofer slugs."""
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        self._lookups: Dict[str, Dict[str, List[str]]] = {}
+        for column in CANONICAL_COLUMNS:
+            if column in df:
+                present = df[[column, 'slug']].dropna()
+                self._lookups[column] = present.groupby(column)['slug'].agg(list).to_dict()
+
+    @classmethod
+    def load(cls, path: Path = NORMALIZED_CSV, roofers_file: Path = ROOFERS_TS) -> 'NormalizedIndex':
+        """Load the saved canonical columns, building them if the file is missing or stale."""
+        if path.exists() and (not roofers_file.exists() or path.stat().st_mtime >= roofers_file.stat().st_mtime):
+            return cls(load_normalized(path))
+        df = build_normalized_roster(roofers_file)
+        save_normalized(df, path)
+        return cls(df)
+
+    def lookup(self, column: str, canonical_value: Optional[str]) -> List[str]:
+        if not canonical_value:
+            return []
+        return self._lookups.get(column, {}).get(canonical_value, [])
+
+    def by_phone(self, phone) -> List[str]:
+        return self.lookup('phone_e164', normalize_phone(phone))
+
+    def by_email(self, email) -> List[str]:
+        return self.lookup('email_norm', normalize_email(email))
+
+    def by_website(self, url) -> List[str]:
+        return self.lookup('website_domain', normalize_website(url))
+
+    def by_zip(self, zip_code) -> List[str]:
+        return self.lookup('zip5', normalize_zip(zip_code))
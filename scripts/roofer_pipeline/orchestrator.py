@@ -0,0 +1,358 @@
+"""
+Dependency-aware runner for the roofer data pipeline.
+
+Each stage declares the script it runs and the files it reads and writes.
+Dependencies are derived from those files: a stage waits for the stage that
+last wrote each of its inputs, and a stage that rewrites a file (several
+stages patch roofers.ts in place) also waits for everyone still reading the
+previous version.
+
+A stage's fingerprint hashes its command and the content of its inputs. For
+an input written by an earlier stage, the hash recorded when that stage last
+finished is used rather than the file on disk, so later in-place edits to
+roofers.ts do not make the earlier readers look stale. A stage is skipped
+when its fingerprint matches the last successful run and its outputs are
+still in place, so a refresh only re-runs what changed, and a stage whose
+re-run produces identical output leaves everything downstream skipped.
+Independent stages run in parallel.
+
+State is kept in data/roofers/pipeline-state.json.
+"""
+
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from . import metrics
+from .ingest import CHANGES_FILE, IMPORT_STATE_FILE
+from .paths import (BULK_SEARCH_DIR, DATA_DIR, EXCEL_FILE, GOOGLE_PROFILES_SEARCH_JSON,
+                    OUTSCRAPER_INPUT_CSV, OUTSCRAPER_RESULTS_JSON, REPO_ROOT, REVIEWS_TS, ROOFERS_JSON,
+                    ROOFERS_TS, SEARCH_DATA_TS, YELP_REVIEWS_TS)
+from .rating_history import RATING_ALERTS_JSON
+from .review_themes import REVIEW_THEMES
+
+PIPELINE_STATE_FILE = DATA_DIR / 'pipeline-state.json'
+MISSING = 'missing'
+CHUNK_SIZE = 1 << 20
+OUTPUT_TAIL_LINES = 5
+
+# Stage outcomes
+RAN = 'ran'
+FRESH = 'fresh'
+STALE = 'stale'
+PENDING = 'pending'
+FAILED = 'failed'
+BLOCKED = 'blocked'
+UNAVAILABLE = 'unavailable'
+EXCLUDED = 'excluded'
+
+
+@dataclass
+class Stage:
+    name: str
+    command: List[str]  # script relative to the repo root, then its arguments
+    inputs: List[Path]
+    outputs: List[Path]
+    requires_env: Tuple[str, ...] = ()
+    description: str = ''
+
+
+PIPELINE: List[Stage] = [
+    Stage('convert-excel', ['data/roofers/convert-excel.py'],
+          inputs=[EXCEL_FILE],
+          outputs=[ROOFERS_JSON, CHANGES_FILE],
+          description='Excel roster -> roofers-data.json'),
+    # Patches roofers.ts in place; import-to-typescript-v2.py would rebuild it
+    # and lose everything added by hand. On a first run every sheet row is
+    # new and only fills in what roofers.ts is missing; the import state is
+    # saved once the patch is written
+    Stage('apply-changes', ['data/roofers/apply-roofer-changes.py'],
+          inputs=[CHANGES_FILE],
+          outputs=[ROOFERS_TS, IMPORT_STATE_FILE],
+          description='roofers-changes.json -> roofers.ts'),
+    Stage('assign-service-areas', ['scripts/assign-service-areas-by-zip.py'],
+          inputs=[ROOFERS_TS, SEARCH_DATA_TS],
+          outputs=[ROOFERS_TS, ROOFERS_TS.with_name(ROOFERS_TS.name + '.backup')],
+          description='Service areas from city and ZIP code'),
+    Stage('find-google-profiles', ['scripts/find-all-google-profiles.py'],
+          inputs=[ROOFERS_TS],
+          outputs=[GOOGLE_PROFILES_SEARCH_JSON],
+          description='Google Business Profile search list'),
+    Stage('prepare-bulk-search', ['scripts/prepare-bulk-search.py'],
+          inputs=[ROOFERS_TS],
+          outputs=[OUTSCRAPER_INPUT_CSV, BULK_SEARCH_DIR / 'apify-input.json', BULK_SEARCH_DIR / 'manual-input.csv'],
+          description='Outscraper / Apify input files'),
+    Stage('outscraper', ['scripts/outscraper-api-search.py', '--no-update'],
+          inputs=[OUTSCRAPER_INPUT_CSV],
+          outputs=[OUTSCRAPER_RESULTS_JSON],
+          requires_env=('OUTSCRAPER_API_KEY',),
+          description='Google Business Profile URLs via the Outscraper API'),
+    Stage('process-bulk-results',
+          ['scripts/process-bulk-results.py', str(OUTSCRAPER_RESULTS_JSON.relative_to(REPO_ROOT)), 'apify'],
+          inputs=[OUTSCRAPER_RESULTS_JSON, ROOFERS_TS],
+          outputs=[ROOFERS_TS],
+          description='Google Business URLs -> roofers.ts'),
+    # Merges fetched reviews into reviews.ts; a fetch with nothing new leaves it unchanged
+    Stage('reviews', ['scripts/fetch-google-reviews-free.py'],
+          inputs=[ROOFERS_TS],
+          outputs=[REVIEWS_TS],
+          requires_env=('OUTSCRAPER_API_KEY',),
+          description='Google reviews -> reviews.ts'),
+    # Rating history lives in the work-queue database, whose bytes change on
+    # every queue operation. A new rating or review count comes with new
+    # reviews, which the reviews stage merges into reviews.ts, so that file
+    # stands in for the history
+    Stage('rating-trends', ['scripts/analyze-rating-trends.py'],
+          inputs=[REVIEWS_TS, ROOFERS_TS],
+          outputs=[ROOFERS_TS, RATING_ALERTS_JSON],
+          description='Rating history -> ratingTrends in roofers.ts, rating-alerts.json'),
+    Stage('review-themes', ['scripts/extract-review-themes.py'],
+          inputs=[REVIEWS_TS, ROOFERS_TS],
+          outputs=[REVIEW_THEMES],
+          description='Reviews -> TF-IDF theme model for synopses'),
+    Stage('rating-score', ['scripts/score-roofer-ratings.py'],
+          inputs=[ROOFERS_TS, REVIEWS_TS, YELP_REVIEWS_TS],
+          outputs=[ROOFERS_TS],
+          description='Google + Yelp ratings -> ratingScore in roofers.ts'),
+]
+
+
+def _rel(path: Path) -> str:
+    try:
+        return str(path.relative_to(REPO_ROOT))
+    except ValueError:
+        return str(path)
+
+
+def file_digest(path: Path) -> str:
+    """sha1 of the file's content, or 'missing'."""
+    digest = hashlib.sha1()
+    try:
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+                digest.update(chunk)
+    except FileNotFoundError:
+        return MISSING
+    return digest.hexdigest()
+
+
+def load_pipeline_state(path: Path = PIPELINE_STATE_FILE) -> Dict[str, Any]:
+    if path.exists():
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return {'stages': {}}
+
+
+def save_pipeline_state(state: Dict[str, Any], path: Path = PIPELINE_STATE_FILE):
+    tmp = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+    os.replace(tmp, path)
+
+
+@dataclass
+class Graph:
+    stages: Dict[str, Stage]
+    deps: Dict[str, List[str]]
+    # (stage, input) -> the stage that wrote the version of the file it reads
+    producers: Dict[Tuple[str, str], str]
+    # file -> every stage that writes it, in pipeline order
+    writers: Dict[str, List[str]]
+
+
+def build_graph(stages: List[Stage] = PIPELINE) -> Graph:
+    """Derive stage dependencies from declared inputs and outputs, in declaration order."""
+    by_name = {stage.name: stage for stage in stages}
+    deps: Dict[str, List[str]] = {}
+    producers: Dict[Tuple[str, str], str] = {}
+    writers: Dict[str, List[str]] = {}
+    readers: Dict[str, List[str]] = {}
+
+    for stage in stages:
+        needs = []
+        for path in stage.inputs:
+            key = _rel(path)
+            if key in writers:
+                producers[(stage.name, key)] = writers[key][-1]
+                needs.append(writers[key][-1])
+            readers.setdefault(key, []).append(stage.name)
+        for path in stage.outputs:
+            key = _rel(path)
+            # Rewriting a file: wait for the previous writer and its other readers
+            if key in writers:
+                needs.append(writers[key][-1])
+            needs.extend(r for r in readers.get(key, []) if r != stage.name)
+            writers.setdefault(key, []).append(stage.name)
+            readers[key] = []
+        deps[stage.name] = sorted(set(needs), key=list(by_name).index)
+
+    return Graph(by_name, deps, producers, writers)
+
+
+def fingerprint(stage: Stage, graph: Graph, state: Dict[str, Any]) -> str:
+    """Hash of the stage's command and the content of its inputs."""
+    recorded = state.get('stages', {})
+    digest = hashlib.sha1(json.dumps(stage.command).encode('utf-8'))
+    for path in sorted(stage.inputs, key=_rel):
+        key = _rel(path)
+        producer = graph.producers.get((stage.name, key))
+        value = recorded.get(producer, {}).get('outputs', {}).get(key) if producer else None
+        digest.update(f"{key}={value or file_digest(path)}\n".encode('utf-8'))
+    return digest.hexdigest()
+
+
+def outputs_intact(stage: Stage, graph: Graph, record: Dict[str, Any]) -> bool:
+    """
+    Outputs exist, and files no other stage writes still match what this
+    stage produced. Files several stages patch in place (roofers.ts) are
+    also edited by hand and by other scripts, so only their presence counts.
+    """
+    for path in stage.outputs:
+        key = _rel(path)
+        if not path.exists():
+            return False
+        if graph.writers[key] == [stage.name] and record.get('outputs', {}).get(key) != file_digest(path):
+            return False
+    return True
+
+
+@dataclass
+class Outcome:
+    stage: str
+    status: str
+    reason: str = ''
+    seconds: float = 0.0
+    output: str = ''
+
+
+@dataclass
+class Orchestrator:
+    stages: List[Stage] = field(default_factory=lambda: list(PIPELINE))
+    state_file: Path = PIPELINE_STATE_FILE
+    jobs: int = 4
+    force: Tuple[str, ...] = ()
+    only: Tuple[str, ...] = ()
+    dry_run: bool = False
+    report: Optional[Callable[[Outcome], None]] = None
+
+    def __post_init__(self):
+        self.graph = build_graph(self.stages)
+        unknown = [n for n in (*self.force, *self.only) if n != 'all' and n not in self.graph.stages]
+        if unknown:
+            raise ValueError(f"Unknown stage(s): {', '.join(unknown)}")
+        self.state = load_pipeline_state(self.state_file)
+        self.state.setdefault('stages', {})
+        self._lock = threading.Lock()
+
+    # Decisions
+
+    def check(self, stage: Stage, outcomes: Dict[str, Outcome]) -> Outcome:
+        """Decide whether a stage must run, once everything it depends on has settled."""
+        if self.only and stage.name not in self.only:
+            return Outcome(stage.name, EXCLUDED, 'not selected')
+        for dep in self.graph.deps[stage.name]:
+            if outcomes[dep].status in (FAILED, BLOCKED):
+                return Outcome(stage.name, BLOCKED, f"{dep} {outcomes[dep].status}")
+        if self.dry_run:
+            changed = [d for d in self.graph.deps[stage.name] if outcomes[d].status in (STALE, PENDING)]
+            if changed:
+                return Outcome(stage.name, PENDING, f"after {', '.join(changed)}")
+
+        missing_env = [name for name in stage.requires_env if not os.getenv(name)]
+        missing_inputs = [_rel(p) for p in stage.inputs if not p.exists()]
+        record = self.state['stages'].get(stage.name)
+        forced = 'all' in self.force or stage.name in self.force
+
+        if forced:
+            reason = 'forced'
+        elif not record:
+            reason = 'never run'
+        elif record.get('fingerprint') != fingerprint(stage, self.graph, self.state):
+            reason = 'inputs changed'
+        elif self._rewritten(stage, outcomes):
+            reason = f"{self._rewritten(stage, outcomes)} replaced its output"
+        elif not outputs_intact(stage, self.graph, record):
+            reason = 'outputs missing or modified'
+        else:
+            return Outcome(stage.name, FRESH, 'up to date')
+
+        # Nothing to do without credentials; downstream stages carry on with existing files
+        if missing_env:
+            return Outcome(stage.name, UNAVAILABLE, f"{reason}, but {', '.join(missing_env)} not set")
+        if missing_inputs:
+            return Outcome(stage.name, BLOCKED, f"missing {', '.join(missing_inputs)}")
+        return Outcome(stage.name, STALE, reason)
+
+    def _rewritten(self, stage: Stage, outcomes: Dict[str, Outcome]) -> Optional[str]:
+        """An earlier stage that re-ran and replaced a file this stage patches."""
+        for path in stage.outputs:
+            names = self.graph.writers[_rel(path)]
+            for name in names[:names.index(stage.name)]:
+                if outcomes[name].status == RAN:
+                    return name
+        return None
+
+    # Execution
+
+    def execute(self, stage: Stage, reason: str) -> Outcome:
+        script, *args = stage.command
+        started = time.perf_counter()
+        with metrics.stage(stage.name):
+            result = subprocess.run([sys.executable, str(REPO_ROOT / script), *args], cwd=REPO_ROOT,
+                                    stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                                    stderr=subprocess.STDOUT, text=True)
+        seconds = time.perf_counter() - started
+        if result.returncode != 0:
+            return Outcome(stage.name, FAILED, f"exit code {result.returncode}", seconds, result.stdout)
+
+        with self._lock:
+            self.state['stages'][stage.name] = {
+                'fingerprint': fingerprint(stage, self.graph, self.state),
+                'outputs': {_rel(p): file_digest(p) for p in stage.outputs},
+                'finishedAt': datetime.now(timezone.utc).isoformat(),
+                'seconds': round(seconds, 3),
+            }
+            save_pipeline_state(self.state, self.state_file)
+        return Outcome(stage.name, RAN, reason, seconds, result.stdout)
+
+    def _settle(self, outcome: Outcome, outcomes: Dict[str, Outcome]):
+        outcomes[outcome.stage] = outcome
+        metrics.count('stages', status=outcome.status)
+        if self.report:
+            self.report(outcome)
+
+    def run(self) -> Dict[str, Outcome]:
+        """Run every stale stage, dependencies first, up to `jobs` at a time."""
+        outcomes: Dict[str, Outcome] = {}
+        waiting = [stage.name for stage in self.stages]
+        running = {}
+
+        with ThreadPoolExecutor(max_workers=max(1, self.jobs)) as pool:
+            while waiting or running:
+                for name in list(waiting):
+                    if any(dep not in outcomes for dep in self.graph.deps[name]):
+                        continue
+                    waiting.remove(name)
+                    decision = self.check(self.graph.stages[name], outcomes)
+                    if decision.status == STALE and not self.dry_run:
+                        running[pool.submit(self.execute, self.graph.stages[name], decision.reason)] = name
+                    else:
+                        self._settle(decision, outcomes)
+                if not running:
+                    if waiting and all(any(dep not in outcomes for dep in self.graph.deps[n]) for n in waiting):
+                        raise RuntimeError(f"Dependency cycle among: {', '.join(waiting)}")
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    running.pop(future)
+                    self._settle(future.result(), outcomes)
+        return outcomes
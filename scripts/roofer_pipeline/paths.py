@@ -0,0 +1,32 @@
+"""
+File locations used across the roofer data pipeline.
+"""
+
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+
+# Site data (generated TypeScript)
+APP_ROOFERS_DIR = REPO_ROOT / 'app' / 'roofers' / 'data'
+ROOFERS_TS = APP_ROOFERS_DIR / 'roofers.ts'
+REVIEWS_TS = APP_ROOFERS_DIR / 'reviews.ts'
+YELP_REVIEWS_TS = APP_ROOFERS_DIR / 'yelp-reviews.ts'
+CITIES_TS = REPO_ROOT / 'app' / 'service-areas' / 'data' / 'cities.ts'
+SEARCH_DATA_TS = REPO_ROOT / 'app' / 'service-areas' / 'data' / 'search-data.ts'
+
+# Source data and intermediate files
+DATA_DIR = REPO_ROOT / 'data' / 'roofers'
+EXCEL_FILE = DATA_DIR / 'ROOFERS LIST FINAL.xlsx'
+ROOFERS_JSON = DATA_DIR / 'roofers-data.json'
+YELP_ANALYSIS_JSON = DATA_DIR / 'yelp-reviews-analysis.json'
+PREFERRED_CANDIDATES_JSON = DATA_DIR / 'preferred-candidates.json'
+PREFERRED_RANKING_CSV = DATA_DIR / 'preferred-ranking.csv'
+GOOGLE_PROFILES_SEARCH_JSON = DATA_DIR / 'all-google-profiles-search.json'
+
+# Bulk Google Business Profile search (Outscraper / Apify)
+BULK_SEARCH_DIR = DATA_DIR / 'bulk-search'
+OUTSCRAPER_INPUT_CSV = BULK_SEARCH_DIR / 'outscraper-input.csv'
+OUTSCRAPER_RESULTS_JSON = BULK_SEARCH_DIR / 'outscraper-api-results.json'
+
+# Lookup files served to the site from /public
+PUBLIC_DATA_DIR = REPO_ROOT / 'public' / 'data'
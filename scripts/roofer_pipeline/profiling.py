@@ -0,0 +1,184 @@
+"""
+Opt-in profiling for the pipeline entry points.
+
+Enabled with --profile on any script that calls metrics.start_run(), or
+with PIPELINE_PROFILE=1 (or PIPELINE_PROFILE=<directory>). A run then
+writes to data/profiles/<script>-<timestamp>/:
+
+  <stage>.pstats      cProfile stats per metrics stage ("run" = outside any stage)
+  profile.txt         top functions by cumulative time for each stage
+  tracemalloc.txt     top allocation sites per stage and for the whole run
+  stacks.collapsed    sampled stacks rooted at the stage name, for
+                      flamegraph.pl, speedscope or inferno
+
+cProfile follows the main thread only; the stack sampler covers every
+thread and tags each sample with the stage that thread was in.
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import tracemalloc
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from .paths import REPO_ROOT
+
+PROFILES_DIR = REPO_ROOT / 'data' / 'profiles'
+PROFILE_ENV = 'PIPELINE_PROFILE'
+PROFILE_FLAG = '--profile'
+
+SAMPLE_INTERVAL = 0.005
+TRACEMALLOC_FRAMES = 10
+TOP_FUNCTIONS = 30
+TOP_ALLOCATIONS = 20
+
+RUN_STAGE = 'run'
+
+
+def requested(argv: Optional[List[str]] = None) -> Optional[Path]:
+    """
+    Directory to profile into, or None when profiling is off.
+
+    Removes --profile / --profile=DIR from argv (sys.argv by default) so the
+    script's own argument parsing never sees it.
+    """
+    argv = sys.argv if argv is None else argv
+    directory = None
+    for arg in list(argv[1:]):
+        if arg == PROFILE_FLAG or arg.startswith(PROFILE_FLAG + '='):
+            argv.remove(arg)
+            directory = Path(arg.split('=', 1)[1]) if '=' in arg else PROFILES_DIR
+    if directory is not None:
+        return directory
+
+    value = os.getenv(PROFILE_ENV, '').strip()
+    if value.lower() in ('', '0', 'off', 'false', 'no'):
+        return None
+    if value.lower() in ('1', 'on', 'true', 'yes'):
+        return PROFILES_DIR
+    return Path(value)
+
+
+def _frame_label(code) -> str:
+    return f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+
+
+class Profiler:
+    """cProfile per stage, tracemalloc snapshots per stage and a tagged stack sampler."""
+
+    def __init__(self, directory: Path, name: str, stage_of: Callable[[int], str]):
+        stamp = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S')
+        self.directory = directory / f"{name}-{stamp}"
+        self.stage_of = stage_of
+        self.profiles: Dict[str, cProfile.Profile] = {}
+        self.allocations: Dict[str, List[tracemalloc.StatisticDiff]] = {}
+        self.samples: Counter = Counter()
+        self._active: List[cProfile.Profile] = []
+        self._snapshots: Dict[str, tracemalloc.Snapshot] = {}
+        self._main = threading.main_thread().ident
+        self._stop = threading.Event()
+        self._sampler = threading.Thread(target=self._sample, name='profile-sampler', daemon=True)
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        self._enable(RUN_STAGE)
+        self._sampler.start()
+
+    # Stage hooks (called by metrics.Run.stage)
+
+    # Snapshots are taken while no profile is enabled so their cost is not
+    # charged to any stage
+
+    def enter(self, stage: str, top_level: bool):
+        if threading.get_ident() != self._main:
+            return
+        if self._active:
+            self._active[-1].disable()
+        if top_level:
+            self._snapshots[stage] = tracemalloc.take_snapshot()
+        self._enable(stage)
+
+    def exit(self, stage: str, top_level: bool):
+        if threading.get_ident() != self._main:
+            return
+        self._active.pop().disable()
+        before = self._snapshots.pop(stage, None) if top_level else None
+        if before is not None:
+            diff = tracemalloc.take_snapshot().compare_to(before, 'lineno')
+            self.allocations[stage] = diff[:TOP_ALLOCATIONS]
+        if self._active:
+            self._active[-1].enable()
+
+    def _enable(self, stage: str):
+        profile = self.profiles.setdefault(stage, cProfile.Profile())
+        profile.enable()
+        self._active.append(profile)
+
+    def _sample(self):
+        own = threading.get_ident()
+        while not self._stop.wait(SAMPLE_INTERVAL):
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                stack = []
+                while frame is not None:
+                    if frame.f_code.co_filename == __file__:
+                        break  # the profiler's own bookkeeping
+                    stack.append(_frame_label(frame.f_code))
+                    frame = frame.f_back
+                if frame is not None:
+                    continue
+                stack.append(f"stage {self.stage_of(ident) or RUN_STAGE}")
+                self.samples[';'.join(reversed(stack))] += 1
+
+    # Output
+
+    def stop(self) -> Path:
+        self._stop.set()
+        self._sampler.join()
+        while self._active:
+            self._active.pop().disable()
+        final = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        report = io.StringIO()
+        for stage, profile in self.profiles.items():
+            safe = stage.replace('/', '_')
+            profile.dump_stats(str(self.directory / f"{safe}.pstats"))
+            try:
+                stats = pstats.Stats(profile, stream=report)
+            except TypeError:
+                continue  # stage never ran on the main thread
+            report.write(f"==== stage {stage} ====\n")
+            stats.sort_stats('cumulative').print_stats(TOP_FUNCTIONS)
+        (self.directory / 'profile.txt').write_text(report.getvalue(), encoding='utf-8')
+
+        lines = [f"traced memory: current {current / 1e6:.1f} MB, peak {peak / 1e6:.1f} MB", '']
+        for stage, diff in self.allocations.items():
+            lines.append(f"==== stage {stage}: top allocations (net change) ====")
+            lines.extend(str(stat) for stat in diff)
+            lines.append('')
+        lines.append('==== whole run: top live allocations at exit ====')
+        lines.extend(str(stat) for stat in final.statistics('lineno')[:TOP_ALLOCATIONS])
+        (self.directory / 'tracemalloc.txt').write_text('\n'.join(lines) + '\n', encoding='utf-8')
+
+        with open(self.directory / 'stacks.collapsed', 'w', encoding='utf-8') as f:
+            for stack, count in sorted(self.samples.items()):
+                f.write(f"{stack} {count}\n")
+        return self.directory
+
+
+def start_profiler(directory: Path, name: str, stage_of: Callable[[int], str]) -> Profiler:
+    profiler = Profiler(directory, name, stage_of)
+    profiler.start()
+    print(f"🔬 Profiling → {profiler.directory}")
+    return profiler
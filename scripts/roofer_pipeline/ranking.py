@@ -0,0 +1,173 @@
+"""
+Weighted preferred-roofer ranking.
+
+Every feature is computed as a column operation over the whole roster and
+scaled to 0..1, so scoring cost is a handful of vector passes no matter how
+many roofers there are. The final score is the weighted mean of the
+features; weights are plain dicts so they can come from a JSON file or the
+command line.
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .normalize import normalize_frame
+from .paths import PREFERRED_CANDIDATES_JSON, PREFERRED_RANKING_CSV, ROOFERS_TS, YELP_ANALYSIS_JSON
+from .roofers_ts import load_roofers
+
+FREE_EMAIL_DOMAINS = frozenset([
+    'gmail.com', 'yahoo.com', 'hotmail.com', 'aol.com', 'outlook.com',
+    'icloud.com', 'live.com', 'msn.com', 'comcast.net', 'bellsouth.net',
+    'att.net', 'me.com', 'ymail.com', 'protonmail.com',
+])
+
+DEFAULT_WEIGHTS = {
+    'contact_completeness': 0.25,
+    'business_email': 0.15,
+    'has_website': 0.15,
+    'review_rating': 0.20,
+    'review_volume': 0.10,
+    'service_area_breadth': 0.10,
+    'preferred_in_name': 0.05,
+}
+
+FEATURE_LABELS = {
+    'contact_completeness': 'Complete contact info',
+    'business_email': 'Business email domain',
+    'has_website': 'Has website',
+    'review_rating': 'Strong review rating',
+    'review_volume': 'Well reviewed',
+    'service_area_breadth': 'Broad service area',
+    'preferred_in_name': 'Has "Preferred" in company name',
+}
+
+# A feature at or above this value is listed in the candidate's reasons
+REASON_THRESHOLD = 0.5
+
+# Review count at which review_volume saturates at 1.0
+REVIEW_VOLUME_CAP = 100
+
+
+def load_roster(roofers_file: Path = ROOFERS_TS,
+                yelp_file: Optional[Path] = YELP_ANALYSIS_JSON) -> pd.DataFrame:
+    """Build the roster frame from roofers.ts (with email_norm), joined with Yelp ratings by name."""
+    roofers = load_roofers(roofers_file)
+    areas = [r.get('serviceAreas') or {} for r in roofers]
+    df = pd.DataFrame({
+        'id': [r.get('id') for r in roofers],
+        'slug': [r.get('slug') for r in roofers],
+        'name': [r.get('name') for r in roofers],
+        'phone': [r.get('phone') for r in roofers],
+        'email': [r.get('email') for r in roofers],
+        'website': [r.get('websiteUrl') for r in roofers],
+        'address': [r.get('address') for r in roofers],
+        'city': [r.get('city') for r in roofers],
+        'is_preferred': [bool(r.get('isPreferred')) for r in roofers],
+        'regions': [len(a.get('regions') or []) for a in areas],
+        'counties': [len(a.get('counties') or []) for a in areas],
+        'cities': [len(a.get('cities') or []) for a in areas],
+    })
+    df = normalize_frame(df, {'email_norm': 'email'})
+
+    df['rating'] = np.nan
+    df['review_count'] = 0
+    if yelp_file and yelp_file.exists():
+        with open(yelp_file, 'r', encoding='utf-8') as f:
+            yelp = pd.DataFrame(json.load(f))
+        if not yelp.empty:
+            yelp = (yelp.assign(key=yelp['name'].str.strip().str.upper())
+                        .drop_duplicates('key', keep='last')
+                        .set_index('key'))
+            key = df['name'].str.strip().str.upper()
+            df['rating'] = key.map(yelp['star_rating']).astype(float)
+            df['review_count'] = key.map(yelp['review_count']).fillna(0).astype(int)
+    return df
+
+
+def compute_features(df: pd.DataFrame) -> pd.DataFrame:
+    """Compute the 0..1 scoring features for every row of a roster frame."""
+    def present(column: str) -> pd.Series:
+        values = df[column].astype('string').str.strip()
+        return values.notna() & (values != '')
+
+    domain = df['email_norm'].str.split('@').str[-1]
+
+    area_count = df['regions'] * 3 + df['counties'] + df['cities']
+    max_areas = area_count.max() if len(area_count) else 0
+
+    features = pd.DataFrame(index=df.index)
+    features['contact_completeness'] = (
+        present('phone').astype(float) + present('email') + present('website') + present('address')
+    ) / 4
+    features['business_email'] = (domain.notna() & ~domain.isin(FREE_EMAIL_DOMAINS)).astype(float)
+    features['has_website'] = present('website').astype(float)
+    features['review_rating'] = (df['rating'] / 5).clip(0, 1).fillna(0)
+    features['review_volume'] = (
+        np.log1p(df['review_count'].clip(lower=0)) / np.log1p(REVIEW_VOLUME_CAP)
+    ).clip(0, 1)
+    features['service_area_breadth'] = (
+        np.log1p(area_count) / np.log1p(max_areas) if max_areas else area_count * 0.0
+    )
+    features['preferred_in_name'] = (
+        df['name'].str.contains('preferred', case=False, na=False).astype(float)
+    )
+    return features
+
+
+def score_features(features: pd.DataFrame, weights: Optional[Dict[str, float]] = None) -> pd.Series:
+    """Combine feature columns into a single 0..1 weighted score."""
+    weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+    unknown = set(weights) - set(features.columns)
+    if unknown:
+        raise ValueError(f"Unknown ranking feature(s): {', '.join(sorted(unknown))}")
+
+    vector = pd.Series(weights, dtype=float).reindex(features.columns).fillna(0)
+    total = vector.sum()
+    if total <= 0:
+        raise ValueError("Ranking weights must sum to a positive number")
+    return pd.Series(features.to_numpy(dtype=float) @ (vector.to_numpy() / total), index=features.index)
+
+
+def explain(features: pd.DataFrame, weights: Optional[Dict[str, float]] = None) -> pd.Series:
+    """List the contributing features for each row as a '; '-joined reason string."""
+    weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+    reasons = pd.Series('', index=features.index)
+    for column in features.columns:
+        if weights.get(column, 0) <= 0:
+            continue
+        hit = features[column].to_numpy() >= REASON_THRESHOLD
+        reasons = reasons + np.where(hit, FEATURE_LABELS.get(column, column) + '; ', '')
+    return reasons.str.rstrip('; ')
+
+
+def rank_roofers(df: pd.DataFrame, weights: Optional[Dict[str, float]] = None,
+                 min_score: float = 0.0, include_preferred: bool = False) -> pd.DataFrame:
+    """Score and sort a roster frame, best candidates first."""
+    features = compute_features(df)
+    ranked = pd.concat([df, features.add_prefix('f_')], axis=1)
+    ranked['score'] = score_features(features, weights).round(4)
+    ranked['reason'] = explain(features, weights)
+
+    if not include_preferred and 'is_preferred' in ranked:
+        ranked = ranked[~ranked['is_preferred']]
+    ranked = ranked[ranked['score'] >= min_score]
+    ranked = ranked.sort_values(['score', 'name'], ascending=[False, True], kind='mergesort')
+    ranked.insert(0, 'rank', np.arange(1, len(ranked) + 1))
+    return ranked.reset_index(drop=True)
+
+
+def write_ranking(ranked: pd.DataFrame, json_file: Path = PREFERRED_CANDIDATES_JSON,
+                  csv_file: Optional[Path] = PREFERRED_RANKING_CSV) -> List[Dict]:
+    """Write the ranked candidate table to JSON (and optionally CSV)."""
+    columns = ['rank', 'id', 'slug', 'name', 'score', 'reason', 'phone', 'email', 'website']
+    out = ranked[columns].astype(object).where(ranked[columns].notna(), None)
+    records = out.to_dict('records')
+    with open(json_file, 'w', encoding='utf-8') as f:
+        json.dump(records, f, indent=2, ensure_ascii=False)
+    if csv_file:
+        ranked.to_csv(csv_file, index=False)
+    return records
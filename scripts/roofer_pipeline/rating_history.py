@@ -0,0 +1,238 @@
+"""
+Rating history: every rating and review count ever fetched, and the trends
+computed from it.
+
+FreshnessSchedule.record() appends a snapshot (source, roofer key, time,
+rating, review count) to the rating_snapshots table in the work-queue
+database in the same transaction that updates the schedule, so concurrent
+workers append safely and nothing is overwritten. compact() moves snapshots
+from finished months into one columnar partition per month
+(data/roofers/rating-history/YYYY-MM.npz): key and source codes, float64
+times, float32 ratings, int32 review counts. Partitions are never rewritten
+except to absorb late rows.
+
+analyze_trends() works on all roofers at once with grouped pandas
+operations, and only ever reads the trailing ANALYSIS_DAYS of partitions,
+so its cost follows the size of the roster rather than years of history:
+
+  average_30d        mean rating over the last AVERAGE_DAYS
+  change_90d         latest rating minus the rating TREND_DAYS ago (or the
+                     oldest snapshot in the window)
+  reviews_per_month  review count growth over the same span
+  trend              rising / falling / steady by TREND_THRESHOLD stars
+  rating_drop        latest rating at least DROP_THRESHOLD stars below the
+                     mean of the previous TREND_DAYS of snapshots
+"""
+
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .paths import DATA_DIR, ROOFERS_TS
+from .roofer_index import load_index
+from .roofers_ts import apply_edits, field_edits
+from .work_queue import WORK_QUEUE_DB, transaction
+
+HISTORY_DIR = DATA_DIR / 'rating-history'
+RATING_ALERTS_JSON = DATA_DIR / 'rating-alerts.json'
+DAY = 86400.0
+ANALYSIS_DAYS = 180
+AVERAGE_DAYS = 30
+TREND_DAYS = 90
+TREND_THRESHOLD = 0.1
+DROP_THRESHOLD = 0.3
+
+KEYS = ['source', 'key']
+COLUMNS = ['source', 'key', 'fetched_at', 'rating', 'review_count']
+
+
+def create_snapshot_table(conn: sqlite3.Connection):
+    """Create rating_snapshots; a new table is seeded with the last fetch of every roofer in freshness."""
+    new = conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'rating_snapshots'").fetchone() is None
+    conn.execute('CREATE TABLE IF NOT EXISTS rating_snapshots ('
+                 ' source TEXT NOT NULL, key TEXT NOT NULL, fetched_at REAL NOT NULL,'
+                 ' rating REAL, review_count INTEGER)')
+    conn.execute('CREATE INDEX IF NOT EXISTS rating_snapshots_time ON rating_snapshots (fetched_at)')
+    if new and conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'freshness'").fetchone():
+        conn.execute('INSERT INTO rating_snapshots SELECT source, key, fetched_at, rating, review_count FROM freshness')
+
+
+def append_snapshot(conn: sqlite3.Connection, source: str, key: str, fetched_at: float,
+                    rating: Optional[float], review_count: Optional[int]):
+    conn.execute('INSERT INTO rating_snapshots VALUES (?, ?, ?, ?, ?)', (source, key, fetched_at, rating, review_count))
+
+
+def month_of(timestamp: float) -> str:
+    return time.strftime('%Y-%m', time.gmtime(timestamp))
+
+
+def month_start(timestamp: float) -> float:
+    """Epoch seconds at the start of the UTC month containing timestamp."""
+    t = time.gmtime(timestamp)
+    return float(pd.Timestamp(year=t.tm_year, month=t.tm_mon, day=1, tz='UTC').timestamp())
+
+
+def _frame(rows: List[Tuple]) -> pd.DataFrame:
+    frame = pd.DataFrame(rows, columns=COLUMNS)
+    return frame.astype({'fetched_at': 'float64', 'rating': 'float64', 'review_count': 'float64'})
+
+
+def _write_partition(path: Path, frame: pd.DataFrame):
+    frame = frame.sort_values(KEYS + ['fetched_at'])
+    source_codes, sources = pd.factorize(frame['source'], sort=True)
+    key_codes, keys = pd.factorize(frame['key'], sort=True)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp, 'wb') as f:
+        np.savez_compressed(
+            f,
+            sources=np.asarray(sources, dtype=str),
+            keys=np.asarray(keys, dtype=str),
+            source=source_codes.astype(np.uint8),
+            key=key_codes.astype(np.int32),
+            fetched_at=frame['fetched_at'].to_numpy(np.float64),
+            rating=frame['rating'].to_numpy(np.float32),
+            review_count=frame['review_count'].fillna(-1).to_numpy(np.int32),
+        )
+    os.replace(tmp, path)
+
+
+def _read_partition(path: Path) -> pd.DataFrame:
+    with np.load(path, allow_pickle=False) as part:
+        counts = part['review_count'].astype(np.float64)
+        counts[counts < 0] = np.nan
+        return pd.DataFrame({
+            'source': part['sources'][part['source']],
+            'key': part['keys'][part['key']],
+            'fetched_at': part['fetched_at'],
+            'rating': part['rating'].astype(np.float64),
+            'review_count': counts,
+        })
+
+
+def compact(path: Path = WORK_QUEUE_DB, directory: Path = HISTORY_DIR, now: Optional[float] = None) -> int:
+    """Move snapshots from finished months into the monthly partitions; returns the rows moved."""
+    cutoff = month_start(time.time() if now is None else now)
+    with transaction(path) as conn:
+        create_snapshot_table(conn)
+        rows = conn.execute('SELECT source, key, fetched_at, rating, review_count FROM rating_snapshots'
+                            ' WHERE fetched_at < ?', (cutoff,)).fetchall()
+        if not rows:
+            return 0
+        frame = _frame(rows)
+        for month, part in frame.groupby(frame['fetched_at'].map(month_of)):
+            target = directory / f'{month}.npz'
+            if target.exists():
+                part = pd.concat([_read_partition(target), part]).drop_duplicates(KEYS + ['fetched_at'])
+            _write_partition(target, part)
+        # Deleted only once the partitions are written; a failure above rolls back
+        conn.execute('DELETE FROM rating_snapshots WHERE fetched_at < ?', (cutoff,))
+    return len(rows)
+
+
+def load_snapshots(since: float, path: Path = WORK_QUEUE_DB, directory: Path = HISTORY_DIR) -> pd.DataFrame:
+    """Snapshots fetched at or after `since`, from the partitions it overlaps and the database."""
+    frames = [_read_partition(part) for part in sorted(directory.glob('*.npz')) if part.stem >= month_of(since)]
+    if path.exists():
+        with transaction(path) as conn:
+            create_snapshot_table(conn)
+            rows = conn.execute('SELECT source, key, fetched_at, rating, review_count FROM rating_snapshots'
+                                ' WHERE fetched_at >= ?', (since,)).fetchall()
+        frames.append(_frame(rows))
+    frame = pd.concat(frames, ignore_index=True) if frames else _frame([])
+    frame = frame[frame['fetched_at'] >= since].drop_duplicates(KEYS + ['fetched_at'])
+    return frame.sort_values(KEYS + ['fetched_at'], ignore_index=True)
+
+
+def analyze_trends(snapshots: pd.DataFrame, now: Optional[float] = None) -> pd.DataFrame:
+    """Trend fields per (source, key) from a snapshot frame (load_snapshots)."""
+    now = time.time() if now is None else now
+    df = snapshots.sort_values(KEYS + ['fetched_at'], ignore_index=True)
+    df['time'] = pd.to_datetime(df['fetched_at'], unit='s')
+    groups = df.groupby(KEYS, sort=False)
+
+    latest = groups.tail(1).set_index(KEYS)
+    index = latest.index
+    # Rolling means at each roofer's latest snapshot
+    average = groups.rolling(f'{AVERAGE_DAYS}D', on='time')['rating'].mean()
+    average = average.groupby(level=KEYS).tail(1).droplevel(-1)
+    prior = groups.rolling(f'{TREND_DAYS}D', on='time', closed='left')['rating'].mean()
+    prior = prior.groupby(level=KEYS).tail(1).droplevel(-1)
+
+    # Baseline: the last snapshot at least TREND_DAYS old, else the oldest one loaded
+    base = groups.head(1).set_index(KEYS).reindex(index)
+    old = df[df['fetched_at'] <= now - TREND_DAYS * DAY].groupby(KEYS).tail(1).set_index(KEYS)
+    has_old = index.isin(old.index)
+    base.loc[has_old] = old.loc[index[has_old]]
+    days = (latest['fetched_at'] - base['fetched_at']) / DAY
+    span = days.where(days >= 1)
+    change = (latest['rating'] - base['rating']).where(span.notna())
+
+    trends = pd.DataFrame({
+        'rating': latest['rating'],
+        'review_count': latest['review_count'],
+        'fetched_at': latest['fetched_at'],
+        'snapshots': groups.size(),
+        'average_30d': average.reindex(index),
+        'change_90d': change,
+        'reviews_per_month': (latest['review_count'] - base['review_count']) / span * 30,
+        'trend': pd.Series(np.select([change >= TREND_THRESHOLD, change <= -TREND_THRESHOLD],
+                                     ['rising', 'falling'], 'steady'), index=index).where(change.notna()),
+        'prior_average': prior.reindex(index),
+    }, index=index)
+    trends['rating_drop'] = (trends['prior_average'] - trends['rating']) >= DROP_THRESHOLD
+    return trends
+
+
+def _round(value: Any, digits: int) -> Optional[float]:
+    return None if pd.isna(value) else round(float(value), digits)
+
+
+def trend_fields(row: pd.Series) -> Dict[str, Any]:
+    """One source's ratingTrends entry for roofers.ts (unknown values left out)."""
+    fields = {
+        'rating': _round(row['rating'], 1),
+        'reviewCount': None if pd.isna(row['review_count']) else int(row['review_count']),
+        'average30d': _round(row['average_30d'], 2),
+        'change90d': _round(row['change_90d'], 2),
+        'reviewsPerMonth': _round(row['reviews_per_month'], 1),
+        'trend': None if pd.isna(row['trend']) else row['trend'],
+        'ratingDrop': True if row['rating_drop'] else None,
+        'updated': time.strftime('%Y-%m-%d', time.gmtime(row['fetched_at'])),
+    }
+    return {name: value for name, value in fields.items() if value is not None}
+
+
+def write_trends(trends: pd.DataFrame, path: Path = ROOFERS_TS,
+                 dry_run: bool = False) -> Tuple[Dict[str, Dict[str, Dict[str, Any]]], List[str], List[Any]]:
+    """
+    Set ratingTrends ({source: fields}) on every roofer with history, in one
+    pass over roofers.ts. Returns ({roofer key: ratingTrends}, [changed
+    roofer keys], [unresolved keys]).
+    """
+    content, index = load_index(path)
+    by_roofer: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    entries = {}
+    unresolved = []
+    for (source, key), row in trends.iterrows():
+        entry = index.resolve(key)
+        if entry is None:
+            unresolved.append(key)
+            continue
+        entries[entry.key] = entry
+        by_roofer.setdefault(entry.key, {})[source] = trend_fields(row)
+
+    edits, changed = [], []
+    for roofer_key, value in by_roofer.items():
+        value = dict(sorted(value.items()))
+        if entries[roofer_key].fields.get('ratingTrends') != value:
+            edits.extend(field_edits(content, entries[roofer_key], {'ratingTrends': value}))
+            changed.append(roofer_key)
+    if edits and not dry_run:
+        path.write_text(apply_edits(content, edits), encoding='utf-8')
+    return by_roofer, changed, unresolved
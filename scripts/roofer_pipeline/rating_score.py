@@ -0,0 +1,118 @@
+"""
+One comparable rating per roofer across review sources.
+
+Google (reviews.ts) and Yelp (yelp-reviews.ts) ratings are shown separately,
+and a raw average ranks a single 5-star review above 4.8 stars from 300
+reviews. rating_scores() combines every source's review count and average
+with a Bayesian prior: each roofer starts with PRIOR_WEIGHT reviews at the
+roster-wide mean rating, and its own reviews pull the score away from it.
+
+  score = (PRIOR_WEIGHT * mean + sum(count * average)) / (PRIOR_WEIGHT + sum(count))
+
+Per source, the most complete figures win: the rating and review count last
+fetched from the live profile (ratingTrends in roofers.ts, see
+rating_history) over the overall Yelp starRating/reviewCount, over the
+average of the reviews imported into reviews.ts. The whole roster is scored
+at once as a roofer x source matrix, and written as ratingScore/ratingCount,
+which getRoofersByServiceArea() sorts on. Roofers without reviews get no
+ratingScore, so they sort after every rated roofer.
+"""
+
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .paths import REVIEWS_TS, ROOFERS_TS, YELP_REVIEWS_TS
+from .review_store import google_reviews
+from .roofer_index import load_index
+from .roofers_ts import apply_edits, field_edits, parse_exported_object
+
+# Reviews' worth of confidence in the roster-wide mean
+PRIOR_WEIGHT = 10.0
+COLUMNS = ['roofer', 'source', 'average', 'count']
+
+
+def imported_ratings(path: Path = REVIEWS_TS) -> pd.DataFrame:
+    """Average and count of the Google reviews in reviews.ts (as getRatingSummary computes them)."""
+    reviews = pd.DataFrame(google_reviews(path), columns=['roofer', 'rating'])
+    reviews['rating'] = pd.to_numeric(reviews['rating'], errors='coerce')
+    reviews = reviews[reviews['rating'].between(1, 5)]
+    ratings = reviews.groupby('roofer')['rating'].agg(average='mean', count='size').reset_index()
+    ratings['source'] = 'google'
+    return ratings[COLUMNS]
+
+
+def yelp_ratings(path: Path = YELP_REVIEWS_TS) -> pd.DataFrame:
+    """Overall starRating and reviewCount per roofer from yelp-reviews.ts."""
+    data = parse_exported_object(path.read_text(encoding='utf-8'), 'yelpReviews') if path.exists() else {}
+    return pd.DataFrame([(str(roofer_id), 'yelp', yelp.get('starRating'), yelp.get('reviewCount'))
+                         for roofer_id, yelp in data.items()], columns=COLUMNS)
+
+
+def fetched_ratings(roofers: List[Dict]) -> pd.DataFrame:
+    """Latest fetched rating and review count per source, from ratingTrends."""
+    return pd.DataFrame([(str(roofer.get('id')), source, trend.get('rating'), trend.get('reviewCount'))
+                         for roofer in roofers
+                         for source, trend in (roofer.get('ratingTrends') or {}).items()], columns=COLUMNS)
+
+
+def source_ratings(roofers: List[Dict], reviews_ts: Path = REVIEWS_TS,
+                   yelp_reviews_ts: Path = YELP_REVIEWS_TS) -> pd.DataFrame:
+    """One (roofer, source, average, count) row per roofer and source, most complete figures first."""
+    frames = [fetched_ratings(roofers), yelp_ratings(yelp_reviews_ts), imported_ratings(reviews_ts)]
+    ratings = pd.concat([frame for frame in frames if not frame.empty] or [frames[0]], ignore_index=True)
+    ratings['average'] = pd.to_numeric(ratings['average'], errors='coerce')
+    ratings['count'] = pd.to_numeric(ratings['count'], errors='coerce')
+    ratings = ratings[ratings['average'].between(1, 5) & (ratings['count'] > 0)]
+    return ratings.drop_duplicates(['roofer', 'source'], keep='first').reset_index(drop=True)
+
+
+def rating_scores(roster: List[str], ratings: pd.DataFrame, prior_weight: float = PRIOR_WEIGHT,
+                  prior_mean: Optional[float] = None) -> pd.DataFrame:
+    """
+    Bayesian score for every roofer id in `roster`, indexed by id, with the
+    columns score, count (reviews across sources) and one average column per
+    source. prior_mean defaults to the review-weighted mean of `ratings`.
+    """
+    ratings = ratings[ratings['roofer'].isin(roster)]
+    counts = ratings.pivot(index='roofer', columns='source', values='count').reindex(roster).fillna(0.0)
+    averages = ratings.pivot(index='roofer', columns='source', values='average').reindex(
+        index=roster, columns=counts.columns)
+    n = counts.to_numpy(np.float64)
+    stars = np.nan_to_num(averages.to_numpy(np.float64)) * n
+    total = n.sum(axis=1)
+    if prior_mean is None:
+        prior_mean = stars.sum() / total.sum() if total.sum() else 0.0
+    scores = pd.DataFrame({'score': (prior_weight * prior_mean + stars.sum(axis=1)) / (prior_weight + total),
+                           'count': total.astype(np.int64)}, index=pd.Index(roster, name='roofer'))
+    return scores.join(averages.add_prefix('average_'))
+
+
+def write_scores(scores: pd.DataFrame, path: Path = ROOFERS_TS,
+                 dry_run: bool = False) -> Tuple[List[str], List[str]]:
+    """
+    Set ratingScore and ratingCount on every roofer with reviews in
+    roofers.ts, and remove them from roofers without, in one pass. Returns
+    ([changed roofer keys], [roofer ids with no entry]).
+    """
+    content, index = load_index(path)
+    edits, changed, unresolved = [], [], []
+    for roofer_id, row in scores.iterrows():
+        entry = index.by_id.get(roofer_id)
+        if entry is None:
+            unresolved.append(roofer_id)
+            continue
+        # A roofer with no reviews would score the prior and outrank reviewed
+        # roofers below the mean; it gets no score and sorts after them
+        rated = row['count'] > 0
+        fields = {'ratingScore': round(float(row['score']), 3) if rated else None,
+                  'ratingCount': int(row['count']) if rated else None}
+        pending = {k: v for k, v in fields.items() if entry.fields.get(k) != v}
+        if pending:
+            edits.extend(field_edits(content, entry, pending))
+            changed.append(entry.key)
+    if edits and not dry_run:
+        path.write_text(apply_edits(content, edits), encoding='utf-8')
+    return changed, unresolved
@@ -0,0 +1,692 @@
+"""
+Local stand-in for the Yelp website, the Yelp Fusion API and Outscraper.
+
+A threaded HTTP server that answers the same paths as the real services
+from a deterministic catalog of businesses (the roster in roofers.ts or a
+synthetic one), so the fetchers can be run, load-tested and benchmarked
+without network access or API keys:
+
+  GET /biz/{alias}?start=N                 Yelp business page (10 reviews per page)
+  GET /search?find_desc=&find_loc=         Yelp search results page
+  GET /v3/businesses/search                Fusion search (term, location, limit, offset)
+  GET /v3/businesses/{id}                  Fusion business details
+  GET /v3/businesses/{id}/reviews          Fusion reviews (limit, offset)
+  GET|POST /maps/search-v3                 Outscraper places search (query, limit, skip)
+  GET /maps/reviews-v3                     Outscraper reviews (query, reviewsLimit, lastPaginationId)
+  GET /__stats, POST /__reset              request counters for the current run
+
+Recorded Yelp pages are served instead of synthetic ones when present as
+<recordings>/biz/<alias>.html (and <alias>.start-<N>.html for later pages).
+
+Latency, injected 429/503 responses and the per-service rate limit are
+configured with ReplayConfig. Injected latency and faults are drawn from
+(seed, request, attempt number), so the same sequence of requests sees the
+same responses on every run regardless of thread scheduling.
+
+Fetchers are pointed at the server by setting REPLAY_SERVER_URL; see
+service_url().
+"""
+
+import base64
+import hashlib
+import html
+import json
+import os
+import random
+import re
+import socket
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit, urlunsplit
+
+REPLAY_ENV = 'REPLAY_SERVER_URL'
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+
+# Hosts whose URLs service_url() rewrites
+SERVICE_HOSTS = ('www.yelp.com', 'yelp.com', 'm.yelp.com', 'api.yelp.com', 'api.outscraper.com')
+
+YELP_PAGE_SIZE = 10
+FUSION_DEFAULT_LIMIT = 20
+FUSION_MAX_LIMIT = 50
+FUSION_MAX_RESULTS = 1000
+OUTSCRAPER_DEFAULT_REVIEWS = 10
+
+# Reviews written between this date and MAX_REVIEW_AGE_DAYS before it
+REVIEW_EPOCH = datetime(2026, 1, 1, tzinfo=timezone.utc)
+MAX_REVIEW_AGE_DAYS = 6 * 365
+
+GENERIC_NAME_WORDS = {'roofing', 'roof', 'roofers', 'llc', 'inc', 'co', 'corp', 'company', 'the', 'and',
+                      'of', 'services', 'construction', 'contractors', 'contracting'}
+
+REVIEWER_FIRST = ('Maria', 'James', 'Linda', 'Robert', 'Patricia', 'Michael', 'Jennifer', 'David', 'Susan',
+                  'Carlos', 'Karen', 'Thomas', 'Nancy', 'Daniel', 'Lisa', 'Kevin')
+REVIEWER_LAST = 'ABCDEFGHJKLMNPRSTW'
+
+
+def service_url(url: str) -> str:
+    """
+    Point a Yelp or Outscraper URL at the replay server when REPLAY_SERVER_URL is set.
+
+    Other URLs, and every URL when the variable is unset, are returned unchanged.
+    """
+    base = os.getenv(REPLAY_ENV)
+    if not base:
+        return url
+    parts = urlsplit(url if '://' in url else 'https://' + url)
+    if (parts.hostname or '').lower() not in SERVICE_HOSTS:
+        return url
+    target = urlsplit(base)
+    return urlunsplit((target.scheme, target.netloc, parts.path, parts.query, parts.fragment))
+
+
+@dataclass
+class ReplayConfig:
+    latency_ms: float = 0.0        # added to every response
+    jitter_ms: float = 0.0         # plus a uniform 0..jitter_ms
+    throttle_rate: float = 0.0     # probability of an injected 429
+    error_rate: float = 0.0        # probability of an injected 503
+    rate_limit: float = 0.0        # requests per second per service (0 = unlimited)
+    burst: int = 10                # token bucket size for rate_limit
+    retry_after: float = 1.0       # Retry-After seconds sent with 429s
+    seed: int = 0
+    require_keys: bool = True      # 401 for Fusion / Outscraper requests without a key
+    recordings: Optional[Path] = None
+    verbose: bool = False
+
+
+@dataclass
+class Business:
+    key: str
+    id: str
+    alias: str
+    place_id: str
+    name: str
+    phone: str
+    address: str
+    city: str
+    state: str
+    zip_code: str
+    website: str
+    review_total: int
+    quality: float
+    tokens: frozenset = frozenset()
+
+    @property
+    def yelp_path(self) -> str:
+        return f"/biz/{self.alias}"
+
+
+@dataclass
+class ReplayStats:
+    requests: Counter = field(default_factory=Counter)
+    statuses: Counter = field(default_factory=Counter)
+    started: float = field(default_factory=time.time)
+
+    def to_dict(self) -> Dict:
+        return {
+            'uptime': round(time.time() - self.started, 3),
+            'requests': dict(self.requests),
+            'statuses': {str(k): v for k, v in self.statuses.items()},
+            'total': sum(self.requests.values()),
+        }
+
+
+def _digest(*parts) -> bytes:
+    return hashlib.sha1('|'.join(str(p) for p in parts).encode('utf-8')).digest()
+
+
+def _tokens(text: str) -> List[str]:
+    return re.findall(r'[a-z0-9]+', (text or '').lower())
+
+
+def _slug(text: str) -> str:
+    return '-'.join(_tokens(text))
+
+
+class Catalog:
+    """Deterministic businesses and reviews served by the replay server."""
+
+    def __init__(self, roofers: List[Dict], seed: int = 0, max_reviews: int = 400):
+        self.seed = seed
+        self.businesses: List[Business] = []
+        self.by_alias: Dict[str, Business] = {}
+        self.by_id: Dict[str, Business] = {}
+        self.by_place: Dict[str, Business] = {}
+        self._reviews: Dict[str, List[Dict]] = {}
+        self._lock = threading.Lock()
+
+        for i, roofer in enumerate(roofers):
+            key = str(roofer.get('slug') or roofer.get('id') or i)
+            digest = _digest(seed, key)
+            rng = random.Random(digest)
+            alias = _slug(f"{roofer.get('name', key)} {roofer.get('city', '')}") or key
+            while alias in self.by_alias:
+                alias += '-2'
+            # Review counts are long-tailed: most roofers have a handful, a few have hundreds
+            total = min(max_reviews, int(rng.paretovariate(1.2)) - 1 + rng.randint(0, 12))
+            business = Business(
+                key=key,
+                id=base64.urlsafe_b64encode(digest[:16]).decode('ascii').rstrip('='),
+                alias=alias,
+                place_id='ChIJ' + base64.urlsafe_b64encode(digest[4:20]).decode('ascii').rstrip('='),
+                name=roofer.get('name') or key,
+                phone=roofer.get('phone') or '',
+                address=roofer.get('address') or '',
+                city=roofer.get('city') or '',
+                state=roofer.get('state') or 'FL',
+                zip_code=str(roofer.get('zipCode') or ''),
+                website=roofer.get('websiteUrl') or '',
+                review_total=max(0, total),
+                quality=rng.betavariate(6, 1.5),
+                tokens=frozenset(t for t in _tokens(roofer.get('name')) if t not in GENERIC_NAME_WORDS),
+            )
+            self.businesses.append(business)
+            self.by_alias[alias] = business
+            self.by_id[business.id] = business
+            self.by_place[business.place_id] = business
+
+    @classmethod
+    def from_roster(cls, path: Optional[Path] = None, seed: int = 0) -> 'Catalog':
+        from .roofers_ts import load_roofers
+        roofers = load_roofers(path) if path else load_roofers()
+        return cls([r for r in roofers if not r.get('isHidden')], seed)
+
+    @classmethod
+    def synthetic(cls, n: int, seed: int = 0) -> 'Catalog':
+        from .benchmark import synthetic_roofers
+        return cls([fields for _, fields in synthetic_roofers(n, seed)], seed)
+
+    def lookup(self, value: str) -> Optional[Business]:
+        return self.by_id.get(value) or self.by_alias.get(value) or self.by_place.get(value)
+
+    def reviews(self, business: Business) -> List[Dict]:
+        """All reviews of a business, newest first (generated once, then cached)."""
+        cached = self._reviews.get(business.id)
+        if cached is not None:
+            return cached
+
+        from .benchmark import REVIEW_FRAGMENTS
+        from .reviews import NEGATIVE_KEYWORDS, POSITIVE_KEYWORDS
+
+        rng = random.Random(_digest(self.seed, business.id, 'reviews'))
+        ages = sorted(rng.randrange(MAX_REVIEW_AGE_DAYS * 24 * 60) for _ in range(business.review_total))
+        reviews = []
+        for n, minutes in enumerate(ages):
+            good = rng.random() < business.quality
+            rating = rng.choice((4, 5, 5)) if good else rng.choice((1, 1, 2, 3))
+            keyword = rng.choice(POSITIVE_KEYWORDS if good else NEGATIVE_KEYWORDS)
+            text = (f"{rng.choice(REVIEW_FRAGMENTS)} {keyword.capitalize()} experience with {business.name.title()}. "
+                    f"{rng.choice(REVIEW_FRAGMENTS)}")
+            created = REVIEW_EPOCH - timedelta(minutes=minutes)
+            reviews.append({
+                'id': base64.urlsafe_b64encode(_digest(business.id, n)[:16]).decode('ascii').rstrip('='),
+                'rating': rating,
+                'text': text,
+                'time_created': created.strftime('%Y-%m-%d %H:%M:%S'),
+                'user': f"{rng.choice(REVIEWER_FIRST)} {rng.choice(REVIEWER_LAST)}.",
+            })
+        with self._lock:
+            self._reviews.setdefault(business.id, reviews)
+        return self._reviews[business.id]
+
+    def rating(self, business: Business) -> Optional[float]:
+        """Average rating rounded to the half star, as Yelp shows it."""
+        reviews = self.reviews(business)
+        if not reviews:
+            return None
+        return round(sum(r['rating'] for r in reviews) / len(reviews) * 2) / 2
+
+    def search(self, term: str, location: str = '') -> List[Business]:
+        """Businesses sharing a distinctive name word with `term`, best match first."""
+        wanted = set(_tokens(term)) - GENERIC_NAME_WORDS
+        place = ' '.join(_tokens(location))
+        scored = []
+        for business in self.businesses:
+            score = len(wanted & business.tokens)
+            if not score:
+                continue
+            in_city = bool(business.city) and ' '.join(_tokens(business.city)) in place
+            scored.append((-score, not in_city, business.alias, business))
+        scored.sort(key=lambda item: item[:3])
+        return [item[-1] for item in scored]
+
+
+# Response bodies
+
+def fusion_business(catalog: Catalog, business: Business, base: str) -> Dict:
+    return {
+        'id': business.id,
+        'alias': business.alias,
+        'name': business.name,
+        'url': f"{base}{business.yelp_path}",
+        'review_count': business.review_total,
+        'rating': catalog.rating(business),
+        'categories': [{'alias': 'roofing', 'title': 'Roofing'}],
+        'phone': business.phone,
+        'display_phone': business.phone,
+        'price': None,
+        'location': {'address1': business.address, 'city': business.city, 'state': business.state,
+                     'zip_code': business.zip_code, 'country': 'US',
+                     'display_address': [business.address, f"{business.city}, {business.state} {business.zip_code}"]},
+        'is_closed': False,
+    }
+
+
+def fusion_review(business: Business, review: Dict, base: str) -> Dict:
+    return {
+        'id': review['id'],
+        'url': f"{base}{business.yelp_path}?hrid={review['id']}",
+        'text': review['text'],
+        'rating': review['rating'],
+        'time_created': review['time_created'],
+        'user': {'id': review['id'][:12], 'name': review['user']},
+    }
+
+
+def outscraper_place(catalog: Catalog, business: Business) -> Dict:
+    return {
+        'query': business.name,
+        'name': business.name,
+        'place_id': business.place_id,
+        'google_id': '0x' + business.id.encode('ascii').hex()[:16],
+        'full_address': f"{business.address}, {business.city}, {business.state} {business.zip_code}",
+        'city': business.city,
+        'state': business.state,
+        'postal_code': business.zip_code,
+        'phone': business.phone,
+        'site': business.website,
+        'type': 'Roofing contractor',
+        'rating': catalog.rating(business),
+        'reviews': business.review_total,
+        'url': f"https://www.google.com/maps/place/?q=place_id:{business.place_id}",
+    }
+
+
+def outscraper_review(business: Business, review: Dict) -> Dict:
+    return {
+        'review_id': review['id'],
+        'review_pagination_id': review['id'],
+        'author_title': review['user'],
+        'reviewer_name': review['user'],
+        'review_text': review['text'],
+        'review_rating': review['rating'],
+        'rating': review['rating'],
+        'review_datetime_utc': review['time_created'],
+        'review_link': f"https://www.google.com/maps/reviews/data={business.place_id}:{review['id']}",
+    }
+
+
+def yelp_page(catalog: Catalog, business: Business, start: int) -> str:
+    """A business page in the shape the scrapers parse (JSON-LD rating, review divs, next link)."""
+    reviews = catalog.reviews(business)
+    page = reviews[start:start + YELP_PAGE_SIZE]
+    rating = catalog.rating(business)
+    ld = {'@context': 'https://schema.org', '@type': 'LocalBusiness', 'name': business.name,
+          'telephone': business.phone}
+    if rating is not None:
+        ld['aggregateRating'] = {'@type': 'AggregateRating', 'ratingValue': rating,
+                                 'reviewCount': business.review_total}
+    name = html.escape(business.name)
+    parts = [
+        '<!DOCTYPE html>',
+        f'<html lang="en"><head><meta charset="utf-8"><title>{name} - {html.escape(business.city)} - Yelp</title>',
+        f'<script type="application/ld+json">{json.dumps(ld)}</script>',
+    ]
+    if start + YELP_PAGE_SIZE < len(reviews):
+        parts.append(f'<link rel="next" href="{business.yelp_path}?start={start + YELP_PAGE_SIZE}">')
+    parts.append(f'</head><body><h1>{name}</h1>')
+    if rating is not None:
+        parts.append(f'<div aria-label="{rating:g} star rating"></div>')
+    parts.append(f'<span>{business.review_total} reviews</span>')
+    parts.append('<ul>')
+    for review in page:
+        parts.append(
+            f'<li><div class="review__container" data-review-id="{review["id"]}">'
+            f'<span class="user-name">{html.escape(review["user"])}</span>'
+            f'<div aria-label="{review["rating"]} star rating"></div>'
+            f'<span class="date">{review["time_created"][:10]}</span>'
+            f'<p class="comment"><span lang="en">{html.escape(review["text"])}</span></p>'
+            f'</div></li>')
+    parts.append('</ul>')
+    pages = (len(reviews) + YELP_PAGE_SIZE - 1) // YELP_PAGE_SIZE
+    if pages > 1:
+        parts.append(f'<nav aria-label="Pagination"><span>{start // YELP_PAGE_SIZE + 1} of {pages}</span>')
+        if start + YELP_PAGE_SIZE < len(reviews):
+            parts.append(f'<a class="next-link" href="{business.yelp_path}?start={start + YELP_PAGE_SIZE}">Next</a>')
+        parts.append('</nav>')
+    parts.append('</body></html>')
+    return '\n'.join(parts)
+
+
+def yelp_search_page(businesses: List[Business], term: str, location: str) -> str:
+    items = ''.join(f'<li><h3><a href="{b.yelp_path}">{html.escape(b.name)}</a></h3>'
+                    f'<p>{html.escape(b.city)}, {html.escape(b.state)}</p></li>' for b in businesses)
+    return (f'<!DOCTYPE html><html><head><title>Top 10 Best {html.escape(term)} near {html.escape(location)} - Yelp'
+            f'</title></head><body><ul>{items}</ul></body></html>')
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int, body: Dict, headers: Optional[Dict[str, str]] = None):
+        super().__init__(status)
+        self.status = status
+        self.body = body
+        self.headers = headers or {}
+
+
+class _TokenBucket:
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def take(self) -> float:
+        """0 if a request may proceed, otherwise seconds until the next token."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / self.rate
+
+
+def _service(path: str) -> str:
+    if path.startswith('/v3/'):
+        return 'fusion'
+    if path.startswith('/maps/'):
+        return 'outscraper'
+    return 'yelp'
+
+
+def _int(params: Dict[str, List[str]], name: str, default: int) -> int:
+    try:
+        return int(params[name][0])
+    except (KeyError, IndexError, ValueError):
+        return default
+
+
+def _fusion_validation(description: str) -> HTTPError:
+    return HTTPError(400, {'error': {'code': 'VALIDATION_ERROR', 'description': description}})
+
+
+class ReplayServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], catalog: Catalog, config: Optional[ReplayConfig] = None):
+        super().__init__(address, ReplayHandler)
+        self.catalog = catalog
+        self.config = config or ReplayConfig()
+        self.stats = ReplayStats()
+        self._attempts: Counter = Counter()
+        self._lock = threading.Lock()
+        self._buckets = {}
+        if self.config.rate_limit > 0:
+            self._buckets = {name: _TokenBucket(self.config.rate_limit, self.config.burst)
+                             for name in ('yelp', 'fusion', 'outscraper')}
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def reset(self):
+        with self._lock:
+            self._attempts.clear()
+            self.stats = ReplayStats()
+
+    def next_attempt(self, key: str) -> int:
+        with self._lock:
+            self._attempts[key] += 1
+            return self._attempts[key]
+
+    def record(self, service: str, status: int):
+        with self._lock:
+            self.stats.requests[service] += 1
+            self.stats.statuses[status] += 1
+
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    server: ReplayServer
+    protocol_version = 'HTTP/1.1'
+    server_version = 'RooferReplay/1.0'
+
+    def setup(self):
+        super().setup()
+        # Headers and body go out in separate writes; don't let Nagle hold the body back
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def do_GET(self):
+        self._handle()
+
+    def do_POST(self):
+        self._handle()
+
+    def log_message(self, format, *args):
+        if self.server.config.verbose:
+            super().log_message(format, *args)
+
+    # Request handling
+
+    def _handle(self):
+        parts = urlsplit(self.path)
+        path = parts.path.rstrip('/') or '/'
+        params = parse_qs(parts.query)
+        body = self._read_body()
+        if isinstance(body, dict):
+            for name, value in body.items():
+                params.setdefault(name, value if isinstance(value, list) else [value])
+
+        if path == '/__stats':
+            return self._send_json(200, self.server.stats.to_dict())
+        if path == '/__reset':
+            self.server.reset()
+            return self._send_json(200, {'reset': True})
+
+        service = _service(path)
+        try:
+            self._inject(service, f"{self.command} {self.path}")
+            self._check_key(service)
+            if service == 'fusion':
+                status, payload = 200, self._fusion(path, params)
+            elif service == 'outscraper':
+                status, payload = 200, self._outscraper(path, params)
+            else:
+                status, payload = 200, self._yelp(path, params)
+        except HTTPError as e:
+            self.server.record(service, e.status)
+            return self._send_json(e.status, e.body, e.headers)
+
+        self.server.record(service, status)
+        if isinstance(payload, str):
+            self._send(status, payload.encode('utf-8'), 'text/html; charset=utf-8')
+        else:
+            self._send_json(status, payload)
+
+    def _read_body(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        if not length:
+            return None
+        raw = self.rfile.read(length)
+        try:
+            return json.loads(raw)
+        except ValueError:
+            return None
+
+    def _inject(self, service: str, key: str):
+        """Latency, random faults and rate limiting, decided per (seed, request, attempt)."""
+        config = self.server.config
+        rng = random.Random(_digest(config.seed, key, self.server.next_attempt(key)))
+        delay = config.latency_ms + rng.random() * config.jitter_ms
+        throttled = rng.random() < config.throttle_rate
+        failed = rng.random() < config.error_rate
+        if delay:
+            time.sleep(delay / 1000)
+
+        bucket = self.server._buckets.get(service)
+        wait = bucket.take() if bucket else 0.0
+        if throttled or wait:
+            retry_after = max(config.retry_after, wait)
+            raise HTTPError(429, _throttle_body(service), {'Retry-After': f"{retry_after:g}"})
+        if failed:
+            raise HTTPError(503, {'error': {'code': 'SERVICE_UNAVAILABLE',
+                                            'description': 'Injected failure'}})
+
+    def _check_key(self, service: str):
+        if not self.server.config.require_keys or service == 'yelp':
+            return
+        if service == 'fusion' and not self.headers.get('Authorization', '').startswith('Bearer '):
+            raise HTTPError(401, {'error': {'code': 'TOKEN_MISSING',
+                                            'description': 'An access token must be supplied in order to use this endpoint.'}})
+        if service == 'outscraper' and not self.headers.get('X-API-KEY'):
+            raise HTTPError(401, {'errorMessage': 'API key is missing'})
+
+    # Services
+
+    def _yelp(self, path: str, params: Dict[str, List[str]]) -> str:
+        catalog = self.server.catalog
+        if path == '/search':
+            term = (params.get('find_desc') or [''])[0]
+            location = (params.get('find_loc') or [''])[0]
+            return yelp_search_page(catalog.search(term, location)[:10], term, location)
+
+        match = re.fullmatch(r'/biz/([^/]+)', path)
+        business = catalog.by_alias.get(match.group(1)) if match else None
+        if not business:
+            raise HTTPError(404, {'error': {'code': 'NOT_FOUND', 'description': 'Page not found'}})
+        start = max(0, _int(params, 'start', 0))
+        recorded = self._recorded_page(business, start)
+        return recorded if recorded is not None else yelp_page(catalog, business, start)
+
+    def _recorded_page(self, business: Business, start: int) -> Optional[str]:
+        directory = self.server.config.recordings
+        if not directory:
+            return None
+        name = f"{business.alias}.html" if start == 0 else f"{business.alias}.start-{start}.html"
+        path = Path(directory) / 'biz' / name
+        return path.read_text(encoding='utf-8', errors='replace') if path.exists() else None
+
+    def _fusion(self, path: str, params: Dict[str, List[str]]) -> Dict:
+        catalog, base = self.server.catalog, self.server.base_url
+        limit = _int(params, 'limit', FUSION_DEFAULT_LIMIT)
+        offset = _int(params, 'offset', 0)
+        if not 0 < limit <= FUSION_MAX_LIMIT:
+            raise _fusion_validation(f"{limit} is not a valid limit (1-{FUSION_MAX_LIMIT})")
+        if offset < 0 or offset + limit > FUSION_MAX_RESULTS:
+            raise _fusion_validation(f"offset + limit must be <= {FUSION_MAX_RESULTS}")
+
+        if path == '/v3/businesses/search':
+            if not params.get('location') and not params.get('latitude'):
+                raise _fusion_validation('Please specify a location or a latitude and longitude')
+            found = catalog.search((params.get('term') or [''])[0], (params.get('location') or [''])[0])
+            return {'businesses': [fusion_business(catalog, b, base) for b in found[offset:offset + limit]],
+                    'total': len(found), 'region': {'center': None}}
+
+        match = re.fullmatch(r'/v3/businesses/([^/]+)(/reviews)?', path)
+        business = catalog.lookup(match.group(1)) if match else None
+        if not business:
+            raise HTTPError(404, {'error': {'code': 'BUSINESS_NOT_FOUND',
+                                            'description': 'The requested business could not be found.'}})
+        if not match.group(2):
+            return fusion_business(catalog, business, base)
+        reviews = catalog.reviews(business)
+        if (params.get('sort_by') or [''])[0] == 'oldest':
+            reviews = reviews[::-1]
+        return {'reviews': [fusion_review(business, r, base) for r in reviews[offset:offset + limit]],
+                'total': len(reviews), 'possible_languages': ['en']}
+
+    def _outscraper(self, path: str, params: Dict[str, List[str]]) -> Dict:
+        catalog = self.server.catalog
+        queries = [q for value in params.get('query', []) for q in (value if isinstance(value, list) else [value])]
+        if not queries:
+            raise HTTPError(400, {'errorMessage': 'query is required'})
+        request_id = base64.urlsafe_b64encode(_digest(self.path, queries)[:12]).decode('ascii')
+
+        if path == '/maps/search-v3':
+            limit = _int(params, 'limit', 20)
+            skip = _int(params, 'skip', 0)
+            data = [[outscraper_place(catalog, b) for b in catalog.search(q)[skip:skip + limit]] for q in queries]
+            return {'id': request_id, 'status': 'Success', 'data': data}
+
+        if path == '/maps/reviews-v3':
+            reviews_limit = _int(params, 'reviewsLimit', OUTSCRAPER_DEFAULT_REVIEWS)
+            after = (params.get('lastPaginationId') or [''])[0]
+            data = []
+            for query in queries:
+                business = catalog.lookup(query) or next(iter(catalog.search(query)), None)
+                if not business:
+                    data.append([])
+                    continue
+                reviews = catalog.reviews(business)
+                start = next((i + 1 for i, r in enumerate(reviews) if r['id'] == after), 0) if after else 0
+                page = reviews[start:start + reviews_limit] if reviews_limit > 0 else reviews[start:]
+                place = outscraper_place(catalog, business)
+                place['query'] = query
+                place['reviews_data'] = [outscraper_review(business, r) for r in page]
+                data.append(place)
+            return {'id': request_id, 'status': 'Success', 'data': data}
+
+        raise HTTPError(404, {'errorMessage': f"Unknown endpoint {path}"})
+
+    # Responses
+
+    def _send_json(self, status: int, payload, headers: Optional[Dict[str, str]] = None):
+        self._send(status, json.dumps(payload).encode('utf-8'), 'application/json', headers)
+
+    def _send(self, status: int, body: bytes, content_type: str, headers: Optional[Dict[str, str]] = None):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def _throttle_body(service: str) -> Dict:
+    if service == 'outscraper':
+        return {'errorMessage': 'Too many requests'}
+    return {'error': {'code': 'TOO_MANY_REQUESTS_PER_SECOND',
+                      'description': 'You have exceeded the queries-per-second limit for this endpoint.'}}
+
+
+def make_server(catalog: Catalog, config: Optional[ReplayConfig] = None,
+                host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> ReplayServer:
+    return ReplayServer((host, port), catalog, config)
+
+
+@contextmanager
+def running(catalog: Catalog, config: Optional[ReplayConfig] = None,
+            host: str = DEFAULT_HOST, port: int = 0) -> Iterator[ReplayServer]:
+    """
+    Serve in a background thread for the duration of the block.
+
+    Port 0 picks a free port; REPLAY_SERVER_URL is set to the server for the
+    block so service_url() routes to it.
+    """
+    server = make_server(catalog, config, host, port)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    previous = os.environ.get(REPLAY_ENV)
+    os.environ[REPLAY_ENV] = server.base_url
+    try:
+        yield server
+    finally:
+        if previous is None:
+            os.environ.pop(REPLAY_ENV, None)
+        else:
+            os.environ[REPLAY_ENV] = previous
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
@@ -0,0 +1,237 @@
+"""
+Exact and near-duplicate detection for review texts.
+
+The same review reaches us more than once: on two Yelp pages when new
+reviews shift the paging, from the Yelp API and the scraper, in a Google
+export and again in a manual import, cut to 200 characters by one source and
+complete in another. ReviewIndex catches these without comparing every pair:
+
+  exact       normalized text (lowercase, punctuation and whitespace
+              dropped) looked up in a dict
+  truncated   texts sharing their first PREFIX_WORDS words, where the shorter
+              one (less a possibly cut-off last word) starts the longer one
+  near        64-bit SimHash over word unigrams and bigrams, within
+              MAX_DISTANCE bits. The fingerprint is split into
+              MAX_DISTANCE + 2 blocks; two fingerprints that close agree on
+              at least two whole blocks, so reviews are bucketed by every
+              pair of blocks (~18-bit keys) and only reviews sharing a
+              bucket are compared.
+
+By default texts under MIN_WORDS words are never reported: "Great job!" from
+two customers is not a repeat.
+
+Each copy carries an Origin: its source, the source's review id, its rating
+and the fetch or import it came in with. Two copies from one source with
+different ids are two reviews, whatever their text: customers do post the
+same words twice. Copies from the same source and run are only matched
+exactly; truncated and near matches need another source or run, and the
+same rating, so a rewritten one-star review never folds into a five-star
+one.
+"""
+
+import hashlib
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import combinations
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+FINGERPRINT_BITS = 64
+# Unrelated reviews land ~32 bits apart (rarely under 20); edits beyond
+# punctuation and truncation, such as a changed word, move a short review by
+# a few bits
+MAX_DISTANCE = 5
+MIN_WORDS = 6
+PREFIX_WORDS = 8
+
+EXACT = 'exact'
+TRUNCATED = 'truncated'
+NEAR = 'near'
+
+_WORD = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+
+
+def normalize_words(text: Optional[str]) -> List[str]:
+    """Lowercased words with punctuation, whitespace and ellipses dropped."""
+    return _WORD.findall(str(text or '').lower().replace('’', "'"))
+
+
+@lru_cache(maxsize=1 << 16)
+def _word_hash(word: str) -> int:
+    return int.from_bytes(hashlib.blake2b(word.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def _mix(x: np.ndarray) -> np.ndarray:
+    """splitmix64 finalizer: spreads a combined pair of hashes over all 64 bits."""
+    x = x ^ (x >> np.uint64(30))
+    x = x * np.uint64(0xBF58476D1CE4E5B9)
+    x = x ^ (x >> np.uint64(27))
+    x = x * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+
+def _token_hashes(words: List[str]) -> np.ndarray:
+    unigrams = np.fromiter((_word_hash(word) for word in words), dtype=np.uint64, count=len(words))
+    bigrams = _mix(unigrams[:-1] * np.uint64(0x9E3779B97F4A7C15) ^ unigrams[1:])
+    return np.concatenate([unigrams, bigrams])
+
+
+def simhash(words: List[str]) -> int:
+    """64-bit SimHash of a word list (unigrams and bigrams, equal weights)."""
+    if not words:
+        return 0
+    hashes = _token_hashes(words).astype('<u8', copy=False)
+    bits = np.unpackbits(hashes.view(np.uint8).reshape(-1, 8), axis=1, bitorder='little')
+    votes = bits.sum(axis=0, dtype=np.int64) * 2 - len(bits)
+    return int(np.packbits(votes > 0, bitorder='little').view('<u8')[0])
+
+
+def hamming(a: int, b: int) -> int:
+    return bin(a ^ b).count('1')
+
+
+def _pair_masks(blocks: int) -> List[int]:
+    """Bit masks covering each pair of `blocks` contiguous blocks of the fingerprint."""
+    bounds = [FINGERPRINT_BITS * i // blocks for i in range(blocks + 1)]
+    block_masks = [((1 << end) - 1) ^ ((1 << start) - 1) for start, end in zip(bounds, bounds[1:])]
+    return [a | b for a, b in combinations(block_masks, 2)]
+
+
+@dataclass(frozen=True)
+class Origin:
+    source: Optional[str] = None    # 'yelp', 'google', a CSV, ...
+    review_id: Optional[str] = None  # the source's id for the review
+    rating: Optional[float] = None
+    run: Any = None                 # the fetch or import the copy came in with
+
+
+def _stars(value) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def review_origin(review: Dict) -> Origin:
+    """Origin of a review dict with source, id and rating keys (as load_reviews returns)."""
+    return Origin(review.get('source'), review.get('id'), _stars(review.get('rating')))
+
+
+def comparable(a: Origin, b: Origin, kind: str) -> bool:
+    """Whether a match of this kind between copies from a and b may count as a repeat."""
+    same_source = a.source == b.source
+    if same_source and a.review_id and b.review_id and a.review_id != b.review_id:
+        return False
+    if kind == EXACT:
+        return True
+    return (not same_source or a.run != b.run) and _stars(a.rating) == _stars(b.rating)
+
+
+@dataclass
+class Duplicate:
+    key: Any            # the indexed review this one repeats
+    kind: str           # EXACT, TRUNCATED or NEAR
+    distance: int = 0   # SimHash bits apart (NEAR only)
+
+
+class ReviewIndex:
+    """Incremental index of review texts; match() finds an earlier copy of a text."""
+
+    def __init__(self, max_distance: int = MAX_DISTANCE, min_words: int = MIN_WORDS):
+        self.max_distance = max_distance
+        self.min_words = min_words
+        self._masks = _pair_masks(max_distance + 2)
+        self._exact: Dict[str, List[Any]] = {}
+        self._origins: Dict[Any, Origin] = {}
+        self._prefixes: Dict[Tuple[str, ...], List[Tuple[Any, List[str]]]] = {}
+        self._buckets: List[Dict[int, List[Tuple[Any, int]]]] = [{} for _ in self._masks]
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def match(self, text: Optional[str], origin: Origin = Origin()) -> Optional[Duplicate]:
+        words = normalize_words(text)
+        return self._match(words, simhash(words), origin) if len(words) >= self.min_words else None
+
+    def _match(self, words: List[str], fingerprint: int, origin: Origin) -> Optional[Duplicate]:
+        for key in self._exact.get(' '.join(words), ()):
+            if comparable(origin, self._origins[key], EXACT):
+                return Duplicate(key, EXACT)
+
+        if len(words) >= PREFIX_WORDS:
+            for key, other in self._prefixes.get(tuple(words[:PREFIX_WORDS]), ()):
+                if not comparable(origin, self._origins[key], TRUNCATED):
+                    continue
+                shorter, longer = (words, other) if len(words) <= len(other) else (other, words)
+                # The shorter text may end in a word cut in half
+                if longer[:len(shorter) - 1] == shorter[:-1] and longer[len(shorter) - 1].startswith(shorter[-1]):
+                    return Duplicate(key, TRUNCATED)
+
+        best: Optional[Duplicate] = None
+        for buckets, mask in zip(self._buckets, self._masks):
+            for key, other in buckets.get(fingerprint & mask, ()):
+                distance = hamming(fingerprint, other)
+                if distance <= self.max_distance and (best is None or distance < best.distance) \
+                        and comparable(origin, self._origins[key], NEAR):
+                    best = Duplicate(key, NEAR, distance)
+        return best
+
+    def insert(self, key: Any, text: Optional[str], origin: Origin = Origin()):
+        """Index a text under key (without checking for a match first)."""
+        words = normalize_words(text)
+        if len(words) < self.min_words:
+            return
+        self._insert(key, words, simhash(words), origin)
+
+    def _insert(self, key: Any, words: List[str], fingerprint: int, origin: Origin):
+        self._origins[key] = origin
+        self._exact.setdefault(' '.join(words), []).append(key)
+        if len(words) >= PREFIX_WORDS:
+            self._prefixes.setdefault(tuple(words[:PREFIX_WORDS]), []).append((key, words))
+        for buckets, mask in zip(self._buckets, self._masks):
+            buckets.setdefault(fingerprint & mask, []).append((key, fingerprint))
+        self._size += 1
+
+    def add(self, key: Any, text: Optional[str], origin: Origin = Origin()) -> Optional[Duplicate]:
+        """Index the text unless it repeats one already indexed; returns the match if it does."""
+        words = normalize_words(text)
+        if len(words) < self.min_words:
+            return None
+        fingerprint = simhash(words)
+        duplicate = self._match(words, fingerprint, origin)
+        if duplicate is None:
+            self._insert(key, words, fingerprint, origin)
+        return duplicate
+
+
+def dedupe_reviews(reviews: Iterable[Dict], text: Callable[[Dict], Optional[str]] = lambda r: r.get('text'),
+                   index: Optional[ReviewIndex] = None,
+                   origin: Callable[[Dict], Origin] = review_origin
+                   ) -> Tuple[List[Dict], List[Tuple[Dict, Dict, Duplicate]]]:
+    """
+    Drop repeated reviews, keeping the first copy (list preferred sources first).
+
+    When a later copy is the untruncated version of a kept review it takes
+    that review's place, so the longer text survives. `origin` tells which
+    copies may be compared at all (see comparable()). Returns (kept,
+    [(dropped, kept review it repeats, match)]).
+    """
+    index = index or ReviewIndex()
+    kept: List[Dict] = []
+    dropped: List[Tuple[Dict, Dict, Duplicate]] = []
+    for review in reviews:
+        body = text(review)
+        duplicate = index.add(len(kept), body, origin(review))
+        if duplicate is None:
+            kept.append(review)
+            continue
+        original = kept[duplicate.key]
+        if duplicate.kind == TRUNCATED and len(body or '') > len(text(original) or ''):
+            kept[duplicate.key] = review
+            index.insert(duplicate.key, body, origin(review))
+            review, original = original, review
+        dropped.append((review, original, duplicate))
+    return kept, dropped
@@ -0,0 +1,24 @@
+"""
+Sentiment keywords for reviews.
+
+reviews.py counts them to score each review; review_themes.py keeps them out
+of the theme phrases, where they would only repeat the rating.
+"""
+
+POSITIVE_KEYWORDS = (
+    'excellent', 'great', 'amazing', 'wonderful', 'fantastic', 'outstanding',
+    'professional', 'quality', 'satisfied', 'happy', 'recommend', 'perfect',
+    'timely', 'clean', 'efficient', 'responsive', 'fair', 'honest', 'reliable',
+    'exceeded', 'pleased', 'impressed', 'awesome', 'terrific', 'superb',
+    'expert', 'skilled', 'knowledgeable', 'courteous', 'polite', 'helpful',
+    'thorough', 'complete', 'well done', 'top notch', 'best', 'love',
+)
+
+NEGATIVE_KEYWORDS = (
+    'poor', 'terrible', 'awful', 'horrible', 'disappointed', 'unprofessional',
+    'delayed', 'messy', 'unresponsive', 'overpriced', 'shoddy', 'incomplete',
+    'rude', 'unreliable', 'problem', 'issue', 'complaint', 'unsatisfied',
+    'worst', 'bad', 'avoid', 'waste', 'ripoff', 'scam', 'incompetent',
+    'slow', 'late', 'damage', 'broken', 'failed', 'mistake', 'error',
+    'unhappy', 'frustrated', 'angry', 'disgusted',
+)
@@ -0,0 +1,262 @@
+"""
+Columnar review store: every imported review in one compact file.
+
+Reviews otherwise live as pretty-printed JSON dicts (the Yelp analysis
+files) and TypeScript string literals (reviews.ts). The store keeps one
+column per field in a NumPy .npz archive:
+
+  roofer      int32 code into `roofers` (rows sorted by roofer)
+  source      uint8 code into `sources` ('google', 'yelp', 'manual', ...)
+  rating      int8 stars, 0 when unknown
+  date        datetime64[s], NaT when unknown
+  text_size   uint32 UTF-8 length of each text
+
+Texts are concatenated per roofer and each roofer's block compressed as its
+own zstd frame, so reading one roofer's reviews decompresses only that
+frame. Small frames compress poorly on their own; a dictionary trained on
+the texts (dictionary_size, once there is enough text) recovers much of the
+difference. Review ids
+are kept in one more frame.
+
+rating_summary() and the other aggregates work on the numeric columns and
+never decompress text; only building the store and reading text need the
+zstandard package.
+"""
+
+import csv
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .paths import DATA_DIR, REVIEWS_TS, ROOFERS_TS, YELP_ANALYSIS_JSON
+from .roofers_ts import load_roofers, parse_exported_object
+
+REVIEW_STORE = DATA_DIR / 'review-store.npz'
+YELP_ANALYSIS_FILES = (YELP_ANALYSIS_JSON, DATA_DIR / 'yelp-reviews-analysis-api.json')
+COMPRESSION_LEVEL = 12
+# Bytes; 0 disables the trained dictionary
+DICTIONARY_SIZE = 16 * 1024
+# A dictionary only pays for itself with ~100x its size in sample text
+DICTIONARY_MIN_SAMPLE_RATIO = 100
+FORMAT_VERSION = 1
+
+
+def _zstd():
+    import zstandard
+    return zstandard
+
+
+def parse_review_date(value: Optional[str]) -> np.datetime64:
+    """ISO date or timestamp ('2024-11-15', '2024-11-15T00:00:00Z') as datetime64[s]; NaT if unparseable."""
+    if not value:
+        return np.datetime64('NaT', 's')
+    try:
+        return np.datetime64(datetime.fromisoformat(str(value).strip().replace('Z', '+00:00'))
+                             .replace(tzinfo=None), 's')
+    except ValueError:
+        return np.datetime64('NaT', 's')
+
+
+def google_reviews(path: Path = REVIEWS_TS) -> List[Dict]:
+    """Reviews from the googleReviews object in reviews.ts."""
+    grouped = parse_exported_object(path.read_text(encoding='utf-8'), 'googleReviews') if path.exists() else {}
+    return [{'roofer': str(roofer_id), 'source': 'google', 'id': review.get('id'),
+             'rating': review.get('rating'), 'date': review.get('reviewDate'), 'text': review.get('reviewText')}
+            for roofer_id, reviews in grouped.items() for review in reviews]
+
+
+def yelp_reviews(paths: Iterable[Path], ids_by_name: Dict[str, str]) -> List[Dict]:
+    """Reviews kept in Yelp analysis files, matched to roofer ids by upper-cased name."""
+    reviews = []
+    for path in paths:
+        if not path.exists():
+            continue
+        with open(path, 'r', encoding='utf-8') as f:
+            businesses = json.load(f)
+        for business in businesses:
+            roofer_id = ids_by_name.get((business.get('name') or '').strip().upper())
+            if not roofer_id:
+                continue
+            analysis = business.get('review_analysis') or {}
+            for n, review in enumerate(analysis.get('positive', []) + analysis.get('negative', [])):
+                reviews.append({'roofer': roofer_id, 'source': f'yelp:{path.name}', 'id': f"{business['name']}#{n}",
+                                'rating': review.get('rating'), 'date': None, 'text': review.get('text')})
+    return reviews
+
+
+def csv_reviews(paths: Iterable[Path]) -> List[Dict]:
+    """Reviews from import CSVs (the import-google-reviews.py format)."""
+    reviews = []
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            for n, row in enumerate(csv.DictReader(f), start=2):
+                if row.get('rooferId'):
+                    reviews.append({'roofer': row['rooferId'], 'source': f'csv:{path.name}',
+                                    'id': row.get('reviewId') or f'line {n}', 'rating': row.get('rating'),
+                                    'date': row.get('reviewDate'), 'text': row.get('reviewText')})
+    return reviews
+
+
+def load_reviews(reviews_ts: Path = REVIEWS_TS, roofers_ts: Path = ROOFERS_TS,
+                 csv_files: Iterable[Path] = ()) -> List[Dict]:
+    """Every imported review: Google (reviews.ts), then Yelp, then the CSVs."""
+    ids_by_name = {(r.get('name') or '').strip().upper(): str(r.get('id')) for r in load_roofers(roofers_ts)}
+    return google_reviews(reviews_ts) + yelp_reviews(YELP_ANALYSIS_FILES, ids_by_name) + csv_reviews(csv_files)
+
+
+def _rating(value) -> int:
+    try:
+        stars = int(round(float(value)))
+    except (TypeError, ValueError):
+        return 0
+    return stars if 1 <= stars <= 5 else 0
+
+
+@dataclass
+class ReviewStore:
+    roofers: np.ndarray         # roofer ids, indexed by the roofer column
+    sources: np.ndarray         # source names, indexed by the source column
+    roofer: np.ndarray
+    source: np.ndarray
+    rating: np.ndarray
+    date: np.ndarray
+    text_size: np.ndarray
+    frames: np.ndarray          # concatenated zstd frames, one per roofer
+    frame_offsets: np.ndarray   # len(roofers) + 1 byte offsets into frames
+    ids_frame: np.ndarray
+    dictionary: np.ndarray      # trained zstd dictionary (empty if none)
+
+    def __len__(self) -> int:
+        return len(self.roofer)
+
+    @classmethod
+    def build(cls, reviews: Iterable[Dict], dictionary_size: int = DICTIONARY_SIZE,
+              level: int = COMPRESSION_LEVEL) -> 'ReviewStore':
+        """Build a store from review dicts with roofer, source, id, rating, date and text keys."""
+        zstd = _zstd()
+        frame = pd.DataFrame(list(reviews), columns=['roofer', 'source', 'id', 'rating', 'date', 'text'])
+        frame['roofer'] = frame['roofer'].astype(str)
+        frame = frame.sort_values('roofer', kind='stable').reset_index(drop=True)
+        roofer_codes, roofers = pd.factorize(frame['roofer'], sort=True)
+        source_codes, sources = pd.factorize(frame['source'].fillna('unknown'), sort=True)
+        texts = [str(text or '').encode('utf-8') for text in frame['text']]
+
+        dictionary = b''
+        if dictionary_size and sum(map(len, texts)) >= dictionary_size * DICTIONARY_MIN_SAMPLE_RATIO:
+            try:
+                dictionary = zstd.train_dictionary(dictionary_size, [t for t in texts if t]).as_bytes()
+            except zstd.ZstdError:
+                dictionary = b''  # too few samples to train on
+        compressor = zstd.ZstdCompressor(
+            level=level, dict_data=zstd.ZstdCompressionDict(dictionary) if dictionary else None)
+
+        bounds = np.searchsorted(roofer_codes, np.arange(len(roofers) + 1))
+        blobs = [compressor.compress(b''.join(texts[start:end])) for start, end in zip(bounds, bounds[1:])]
+        ids = '\n'.join(str(value or '').replace('\n', ' ') for value in frame['id']).encode('utf-8')
+
+        return cls(
+            roofers=np.asarray(roofers, dtype=str),
+            sources=np.asarray(sources, dtype=str),
+            roofer=roofer_codes.astype(np.int32),
+            source=source_codes.astype(np.uint8),
+            rating=np.array([_rating(value) for value in frame['rating']], dtype=np.int8),
+            date=np.array([parse_review_date(value) for value in frame['date']], dtype='datetime64[s]'),
+            text_size=np.array([len(text) for text in texts], dtype=np.uint32),
+            frames=np.frombuffer(b''.join(blobs), dtype=np.uint8),
+            frame_offsets=np.concatenate([[0], np.cumsum([len(blob) for blob in blobs], dtype=np.int64)]),
+            ids_frame=np.frombuffer(zstd.ZstdCompressor(level=level).compress(ids), dtype=np.uint8),
+            dictionary=np.frombuffer(dictionary, dtype=np.uint8),
+        )
+
+    def save(self, path: Path = REVIEW_STORE):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez_compressed(path, version=np.array(FORMAT_VERSION), **self.__dict__)
+
+    @classmethod
+    def load(cls, path: Path = REVIEW_STORE) -> 'ReviewStore':
+        with np.load(path, allow_pickle=False) as archive:
+            if int(archive['version']) != FORMAT_VERSION:
+                raise ValueError(f"{path} has store format {int(archive['version'])}, expected {FORMAT_VERSION}")
+            return cls(**{name: archive[name] for name in cls.__dataclass_fields__})
+
+    @property
+    def compressed_bytes(self) -> int:
+        return int(self.frames.nbytes + self.ids_frame.nbytes + self.dictionary.nbytes)
+
+    def _decompressor(self):
+        zstd = _zstd()
+        if self.dictionary.size:
+            return zstd.ZstdDecompressor(dict_data=zstd.ZstdCompressionDict(self.dictionary.tobytes()))
+        return zstd.ZstdDecompressor()
+
+    def _code(self, roofer_id: str) -> Optional[int]:
+        code = int(np.searchsorted(self.roofers, roofer_id))
+        return code if code < len(self.roofers) and self.roofers[code] == roofer_id else None
+
+    def _roofer_rows(self, code: int) -> range:
+        start, end = np.searchsorted(self.roofer, [code, code + 1])
+        return range(int(start), int(end))
+
+    def ids(self) -> List[str]:
+        """Review ids in row order (decompresses the ids frame)."""
+        return _zstd().ZstdDecompressor().decompress(self.ids_frame.tobytes()).decode('utf-8').split('\n')
+
+    def roofer_texts(self, roofer_id: str) -> List[str]:
+        """One roofer's review texts, decompressing only that roofer's frame."""
+        code = self._code(roofer_id)
+        return [] if code is None else self._frame_texts(self._decompressor(), code)
+
+    def _frame_texts(self, decompressor, code: int) -> List[str]:
+        rows = self._roofer_rows(code)
+        start, end = self.frame_offsets[code], self.frame_offsets[code + 1]
+        data = decompressor.decompress(self.frames[start:end].tobytes(),
+                                       max_output_size=int(self.text_size[rows.start:rows.stop].sum()))
+        offsets = np.concatenate([[0], np.cumsum(self.text_size[rows.start:rows.stop], dtype=np.int64)])
+        return [data[a:b].decode('utf-8') for a, b in zip(offsets, offsets[1:])]
+
+    def reviews(self, roofer_id: Optional[str] = None) -> Iterator[Dict]:
+        """Rows as dicts with text, for one roofer or all of them (one frame at a time)."""
+        decompressor = self._decompressor()
+        ids = self.ids()
+        if roofer_id is None:
+            codes = range(len(self.roofers))
+        else:
+            codes = [code for code in [self._code(roofer_id)] if code is not None]
+        for code in codes:
+            rows = self._roofer_rows(code)
+            for row, text in zip(rows, self._frame_texts(decompressor, code)):
+                yield {
+                    'roofer': str(self.roofers[code]),
+                    'source': str(self.sources[self.source[row]]),
+                    'id': ids[row],
+                    'rating': int(self.rating[row]) or None,
+                    'date': None if np.isnat(self.date[row]) else str(self.date[row]),
+                    'text': text,
+                }
+
+    def rating_summary(self, sources: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """
+        Per-roofer review count, rated count, average stars and 1-5 star
+        distribution, from the rating and roofer columns only.
+        """
+        mask = np.ones(len(self), dtype=bool)
+        if sources is not None:
+            mask = np.isin(self.sources[self.source], list(sources))
+        roofer, rating = self.roofer[mask], self.rating[mask].astype(np.int64)
+        n = len(self.roofers)
+        counts = np.bincount(roofer * 6 + rating, minlength=n * 6).reshape(n, 6)
+        rated = counts[:, 1:].sum(axis=1)
+        stars = (counts[:, 1:] * np.arange(1, 6)).sum(axis=1)
+        summary = pd.DataFrame({
+            'reviews': counts.sum(axis=1),
+            'rated': rated,
+            'average_rating': np.divide(stars, rated, out=np.full(n, np.nan), where=rated > 0).round(2),
+        }, index=pd.Index(self.roofers, name='roofer'))
+        for star in range(1, 6):
+            summary[f'stars_{star}'] = counts[:, star]
+        return summary[summary['reviews'] > 0]
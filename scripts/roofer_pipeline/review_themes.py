@@ -0,0 +1,254 @@
+"""
+Review themes: the phrases each roofer's customers mention that reviews of
+other roofers rarely do.
+
+ThemeModel.fit() reads the whole review corpus once and keeps the inverse
+document frequency of every word n-gram (1 to 3 words, never across
+a sentence break, never starting or ending on a stop word) that appears in
+at least MIN_DF reviews. Phrases made only of sentiment keywords
+(review_keywords) and words every roofing review uses ("great job",
+"roofing company") are not candidates: they repeat the rating or say
+nothing about the roofer.
+
+  idf = log((1 + reviews) / (1 + reviews mentioning the phrase)) + 1
+
+themes() scores any number of roofers in one batch. Their reviews become a
+binary review x phrase sparse matrix X and a roofer x review indicator
+matrix G; G @ X counts, per roofer, the reviews mentioning each phrase.
+Each count is divided by the roofer's review count and multiplied by the
+phrase's idf. Phrases missing from the model count as seen in a single
+review. A roofer's top phrases come off its row, skipping phrases mentioned
+in fewer than MIN_REVIEWS of its reviews, phrases too common across the
+corpus (idf under MIN_IDF) and phrases overlapping one already picked. Everything is a single pass over the text plus sparse
+products, so the cost is linear in the size of the corpus.
+
+The model is saved to data/roofers/review-themes.npz by
+scripts/extract-review-themes.py; analyze_reviews() uses it for synopses.
+Without a saved model every phrase weighs the same and themes fall back to
+the roofer's most frequently mentioned phrases.
+"""
+
+import hashlib
+import re
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from pathlib import Path
+from typing import Dict, Hashable, Iterable, List, Mapping, Tuple
+
+import numpy as np
+from scipy import sparse
+
+from .paths import DATA_DIR
+from .review_keywords import NEGATIVE_KEYWORDS, POSITIVE_KEYWORDS
+
+REVIEW_THEMES = DATA_DIR / 'review-themes.npz'
+MIN_DF = 2
+MIN_REVIEWS = 2
+TOP_THEMES = 5
+# Phrases in more than about a third of the corpus describe roofers in general
+MIN_IDF = 2.0
+FORMAT_VERSION = 1
+
+STOP_WORDS = frozenset('''
+a about after again all also although am an and any are around as at back be because been before being
+both but by came can come could did do does doing done down during each even ever every few for from get
+go going got had has have having he her here him his how however i i'm i've if in into is it it's its just
+longer made make many me more most much my no nor not now of off on once one only or other our out over own
+really same she should since so some still such take than that the their them then there these they this
+those though through throughout to too took two under until up us use used very was we we're well went were
+what when where which while who whom why will with would yet you your
+'''.split())
+
+# Words that fill every roofing review; with sentiment keywords (and their
+# inflections, _INFLECTED) they never make a phrase a theme on their own
+GENERIC_WORDS = frozenset('''
+business businesses companies company contractor contractors crew crews customer customers day days definitely
+experience experiences everything finish fine good guy guys highly home homes house houses job jobs new nice ok
+okay old overall people person project projects result results roof roofer roofers roofing roofs service
+services start team thank thanks thing things time times work worked working year years
+'''.split())
+_INFLECTED = re.compile('(?:{})(?:s|es|d|ed|ly|ness|ism|ation)?'.format(
+    '|'.join(re.escape(word) for keyword in POSITIVE_KEYWORDS + NEGATIVE_KEYWORDS for word in keyword.split())))
+
+# Words, and the punctuation that ends a sentence (n-grams never span one)
+_TOKEN = re.compile(r"[a-z0-9]+(?:'[a-z]+)?|[.!?;:\n]|\s[-–—]+\s")
+
+
+def sentences(text: str) -> List[List[str]]:
+    """Normalized words (as review_dedupe.normalize_words) of each sentence in text."""
+    words: List[str] = []
+    found = [words]
+    for token in _TOKEN.findall(str(text or '').lower().replace('’', "'")):
+        if token[0].isalnum():
+            words.append(token)
+        elif words:
+            words = []
+            found.append(words)
+    return [words for words in found if words]
+
+
+@lru_cache(maxsize=1 << 16)
+def _says_something(word: str) -> bool:
+    """Neither a stop word, a generic roofing word nor a sentiment keyword."""
+    return word not in STOP_WORDS and word not in GENERIC_WORDS and not _INFLECTED.fullmatch(word)
+
+
+def phrases(text: str) -> set:
+    """Candidate theme phrases (1 to 3 words) of one review, each counted once."""
+    found = set()
+    for words in sentences(text):
+        ends = [word not in STOP_WORDS for word in words]
+        starts = [end and not word.isdigit() for end, word in zip(ends, words)]
+        useful = [_says_something(word) for word in words]
+        found.update(word for word, start, u in zip(words, starts, useful) if start and u)
+        found.update(f'{a} {b}' for a, b, start, end, u, v in zip(words, words[1:], starts, ends[1:], useful, useful[1:])
+                     if start and end and (u or v))
+        found.update(f'{a} {b} {c}' for a, b, c, start, end, u, v, w
+                     in zip(words, words[1:], words[2:], starts, ends[2:], useful, useful[1:], useful[2:])
+                     if start and end and (u or v or w))
+    return found
+
+
+def _review_matrix(texts: Iterable[str], known: Mapping[str, int], added: Dict[str, int]) -> sparse.csr_matrix:
+    """Binary review x phrase matrix; phrases not in `known` get the next free columns, recorded in `added`."""
+    indices: List[int] = []
+    indptr = [0]
+    for text in texts:
+        for phrase in phrases(text):
+            column = known.get(phrase)
+            if column is None:
+                column = added.setdefault(phrase, len(known) + len(added))
+            indices.append(column)
+        indptr.append(len(indices))
+    data = np.ones(len(indices), dtype=np.float32)
+    return sparse.csr_matrix((data, np.asarray(indices, dtype=np.int64), np.asarray(indptr, dtype=np.int64)),
+                             shape=(len(indptr) - 1, len(known) + len(added)))
+
+
+def _overlaps(a: str, b: str) -> bool:
+    """One phrase contains the other, or they chain ('stone coated metal' / 'coated metal roof')."""
+    if f' {a} ' in f' {b} ' or f' {b} ' in f' {a} ':
+        return True
+    x, y = a.split(), b.split()
+    return any(x[-k:] == y[:k] or y[-k:] == x[:k] for k in range(1, min(len(x), len(y))))
+
+
+@dataclass
+class ThemeModel:
+    terms: np.ndarray    # phrases kept from the corpus
+    idf: np.ndarray      # float32, aligned with terms
+    documents: int       # reviews the model was fitted on
+
+    @classmethod
+    def empty(cls) -> 'ThemeModel':
+        return cls(np.array([], dtype=str), np.array([], dtype=np.float32), 0)
+
+    @classmethod
+    def fit(cls, texts: Iterable[str], min_df: int = MIN_DF) -> 'ThemeModel':
+        vocabulary: Dict[str, int] = {}
+        matrix = _review_matrix(texts, {}, vocabulary)
+        df = matrix.getnnz(axis=0)
+        keep = np.flatnonzero(df >= min_df)
+        terms = np.array(list(vocabulary), dtype=str)[keep]
+        # Columns follow set iteration order, which changes with hash randomization;
+        # sorted terms give the same model and fingerprint on every run
+        order = np.argsort(terms, kind='stable')
+        return cls(terms[order], cls._idf(df[keep], matrix.shape[0])[order], matrix.shape[0])
+
+    @staticmethod
+    def _idf(df: np.ndarray, documents: int) -> np.ndarray:
+        return (np.log((1.0 + documents) / (1.0 + df)) + 1.0).astype(np.float32)
+
+    @property
+    def unseen_idf(self) -> float:
+        """idf of a phrase the model has not kept (seen in at most one review)."""
+        return float(self._idf(np.array([1]), self.documents)[0]) if self.documents else 1.0
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    @cached_property
+    def vocabulary(self) -> Dict[str, int]:
+        return {str(term): i for i, term in enumerate(self.terms)}
+
+    @cached_property
+    def fingerprint(self) -> str:
+        """Short hash of the terms and weights; 'none' for the empty model."""
+        if not self.documents:
+            return 'none'
+        digest = hashlib.blake2b(digest_size=8)
+        digest.update('\n'.join(map(str, self.terms)).encode('utf-8'))
+        digest.update(np.ascontiguousarray(self.idf, dtype=np.float32).tobytes())
+        return digest.hexdigest()
+
+    def save(self, path: Path = REVIEW_THEMES):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'wb') as f:
+            np.savez_compressed(f, format_version=np.int32(FORMAT_VERSION), terms=self.terms, idf=self.idf,
+                                documents=np.int64(self.documents))
+
+    @classmethod
+    def load(cls, path: Path = REVIEW_THEMES) -> 'ThemeModel':
+        with np.load(path, allow_pickle=False) as data:
+            if int(data['format_version']) != FORMAT_VERSION:
+                raise ValueError(f"{path} has theme model format {int(data['format_version'])}, "
+                                 f"expected {FORMAT_VERSION}; re-run scripts/extract-review-themes.py")
+            return cls(data['terms'], data['idf'], int(data['documents']))
+
+    def scores(self, groups: Mapping[Hashable, List[str]]) -> Tuple[sparse.csr_matrix, sparse.csr_matrix, np.ndarray]:
+        """
+        Score every phrase for every group of review texts in one batch.
+        Returns (group x phrase TF-IDF matrix, reviews mentioning each phrase
+        with the same sparsity pattern, phrase by column).
+        """
+        keys = list(groups)
+        sizes = np.array([len(groups[key]) for key in keys], dtype=np.int64)
+        added: Dict[str, int] = {}
+        reviews = _review_matrix((text for key in keys for text in groups[key]), self.vocabulary, added)
+        owner = np.repeat(np.arange(len(keys)), sizes)
+        membership = sparse.csr_matrix((np.ones(len(owner), dtype=np.float32), (owner, np.arange(len(owner)))),
+                                       shape=(len(keys), reviews.shape[0]))
+        counts = (membership @ reviews).tocsr()
+        counts.sort_indices()
+
+        idf = np.full(reviews.shape[1], self.unseen_idf, dtype=np.float32)
+        idf[:len(self.idf)] = self.idf
+        rows = np.repeat(np.arange(len(keys)), np.diff(counts.indptr))
+        weighted = counts.copy()
+        weighted.data = counts.data / np.maximum(sizes, 1)[rows] * idf[counts.indices]
+        return weighted, counts, np.concatenate([self.terms, np.array(list(added), dtype=str)])
+
+    def themes(self, groups: Mapping[Hashable, List[str]], top: int = TOP_THEMES,
+               min_reviews: int = MIN_REVIEWS, min_idf: float = MIN_IDF) -> Dict[Hashable, List[str]]:
+        """Top distinctive phrases for every group of review texts, in one batch."""
+        weighted, counts, terms = self.scores(groups)
+        lengths = np.char.count(terms, ' ')
+        # Without a fitted model every phrase weighs 1 and none is too common
+        common = np.zeros(len(terms), dtype=bool)
+        if self.documents:
+            common[:len(self.idf)] = self.idf < min_idf
+        result = {}
+        for row, key in enumerate(groups):
+            start, end = weighted.indptr[row], weighted.indptr[row + 1]
+            columns = weighted.indices[start:end]
+            mentions = counts.data[start:end]
+            # A lone review's phrases are its roofer's only evidence
+            needed = min(min_reviews, len(groups[key]))
+            # Highest score first; longer phrases win ties, then alphabetical
+            order = np.lexsort((terms[columns], -lengths[columns], -weighted.data[start:end]))
+            picked: List[str] = []
+            for i in order:
+                phrase = str(terms[columns[i]])
+                if mentions[i] < needed or common[columns[i]] or any(_overlaps(phrase, p) for p in picked):
+                    continue
+                picked.append(phrase)
+                if len(picked) == top:
+                    break
+            result[key] = picked
+        return result
+
+
+@lru_cache(maxsize=1)
+def default_model() -> ThemeModel:
+    """The saved corpus model, or an empty one (frequency ranking) if none was built."""
+    return ThemeModel.load(REVIEW_THEMES) if REVIEW_THEMES.exists() else ThemeModel.empty()
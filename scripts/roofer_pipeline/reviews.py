@@ -0,0 +1,150 @@
+"""
+Keyword sentiment analysis and synopsis for scraped reviews.
+
+Moved out of data/roofers/scrape-yelp-reviews.py so the scrapers and the
+benchmarks run the same analyzer. The themes in a synopsis are the roofer's
+most distinctive review phrases (see review_themes). Given an AnalysisCache,
+results are memoized per roofer, review set and analyzer version.
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+from . import metrics
+from .analysis_cache import AnalysisCache, review_set_key
+from .review_keywords import NEGATIVE_KEYWORDS, POSITIVE_KEYWORDS
+from .review_themes import ThemeModel, default_model
+
+# Bump when a change to the analysis or synopsis should invalidate cached results
+ANALYZER_VERSION = 3
+
+SYNOPSIS_THEMES = 3
+
+
+def synopsis_themes(reviews: List[Dict], theme_model: Optional[ThemeModel] = None) -> List[str]:
+    """The roofer's most distinctive review phrases, scored against the saved corpus model by default."""
+    model = theme_model or default_model()
+    return model.themes({None: [review.get('text') for review in reviews]}, top=SYNOPSIS_THEMES)[None]
+
+
+def analyzer_version(theme_model: Optional[ThemeModel] = None) -> str:
+    """ANALYZER_VERSION plus the theme model in use, which changes the synopsis as well."""
+    return f"{ANALYZER_VERSION}:{(theme_model or default_model()).fingerprint}"
+
+
+def analyze_reviews(reviews: Iterable[Dict], theme_model: Optional[ThemeModel] = None,
+                    cache: Optional[AnalysisCache] = None, roofer: Optional[str] = None) -> Dict:
+    """
+    Analyze reviews and categorize into positive/negative, generate synopsis.
+
+    `reviews` is consumed once, so it can be a stream of pages still being
+    fetched (yelp_pages.fetch_business). With a cache and the roofer they
+    belong to, the reviews are read in full first, and the roofer is not
+    analyzed again if its review set and the analyzer version are unchanged.
+    """
+    if cache is None or roofer is None:
+        return _analyze(reviews, theme_model)
+    reviews = list(reviews)
+    key, version = review_set_key(reviews), analyzer_version(theme_model)
+    result = cache.get(roofer, key, version)
+    metrics.cache('review_analysis', hits=int(result is not None), misses=int(result is None))
+    if result is None:
+        result = _analyze(reviews, theme_model)
+        cache.put(roofer, key, version, result)
+    return result
+
+
+def _analyze(reviews: Iterable[Dict], theme_model: Optional[ThemeModel]) -> Dict:
+    analyzed = []
+    positive_reviews = []
+    negative_reviews = []
+    all_positive_scores = []
+    all_negative_scores = []
+
+    for review in reviews:
+        analyzed.append(review)
+        text = review.get('text', '').lower()
+        rating = review.get('rating')
+
+        # Count keyword matches
+        positive_score = sum(1 for keyword in POSITIVE_KEYWORDS if keyword in text)
+        negative_score = sum(1 for keyword in NEGATIVE_KEYWORDS if keyword in text)
+
+        all_positive_scores.append(positive_score)
+        all_negative_scores.append(negative_score)
+
+        # Determine sentiment
+        if rating is not None:
+            is_positive = rating >= 4
+        else:
+            is_positive = positive_score > negative_score or (positive_score == negative_score and positive_score > 0)
+
+        review_data = {
+            'text': review.get('text', ''),
+            'rating': rating,
+            'sentiment_score': positive_score - negative_score
+        }
+
+        if is_positive:
+            positive_reviews.append(review_data)
+        else:
+            negative_reviews.append(review_data)
+
+    themes = synopsis_themes(analyzed, theme_model)
+    synopsis = generate_synopsis(analyzed, positive_reviews, negative_reviews, all_positive_scores, all_negative_scores,
+                                 themes)
+
+    return {
+        'positive': positive_reviews,
+        'negative': negative_reviews,
+        'total_analyzed': len(analyzed),
+        'themes': themes,
+        'synopsis': synopsis
+    }
+
+
+def generate_synopsis(reviews: List[Dict], positive: List[Dict], negative: List[Dict],
+                      pos_scores: List[int], neg_scores: List[int], themes: Optional[List[str]] = None) -> str:
+    """Generate a synopsis of the reviews; themes default to synopsis_themes()"""
+    if not reviews:
+        return "No reviews available for analysis."
+
+    total_reviews = len(reviews)
+    positive_count = len(positive)
+    negative_count = len(negative)
+    positive_pct = (positive_count / total_reviews * 100) if total_reviews > 0 else 0
+
+    # Calculate average sentiment
+    avg_sentiment = (sum(pos_scores) - sum(neg_scores)) / total_reviews if total_reviews > 0 else 0
+
+    if themes is None:
+        themes = synopsis_themes(reviews)
+
+    synopsis_parts = []
+
+    if positive_pct >= 80:
+        synopsis_parts.append(f"Highly rated with {positive_pct:.0f}% positive reviews.")
+    elif positive_pct >= 60:
+        synopsis_parts.append(f"Generally positive with {positive_pct:.0f}% positive reviews.")
+    elif positive_pct >= 40:
+        synopsis_parts.append(f"Mixed reviews with {positive_pct:.0f}% positive feedback.")
+    else:
+        synopsis_parts.append(f"More negative feedback with only {positive_pct:.0f}% positive reviews.")
+
+    if themes:
+        synopsis_parts.append(f"Common themes include: {', '.join(themes[:SYNOPSIS_THEMES])}.")
+
+    if avg_sentiment > 2:
+        synopsis_parts.append("Overall sentiment is very positive.")
+    elif avg_sentiment > 0:
+        synopsis_parts.append("Overall sentiment is positive.")
+    elif avg_sentiment > -2:
+        synopsis_parts.append("Overall sentiment is mixed.")
+    else:
+        synopsis_parts.append("Overall sentiment is negative.")
+
+    if positive_count > negative_count * 2:
+        synopsis_parts.append("Customers frequently recommend this business.")
+    elif negative_count > positive_count:
+        synopsis_parts.append("Some customers have expressed concerns.")
+
+    return ' '.join(synopsis_parts) if synopsis_parts else "Review analysis available."
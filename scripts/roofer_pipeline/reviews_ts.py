@@ -0,0 +1,208 @@
+"""
+Read, merge and write the googleReviews object in app/roofers/data/reviews.ts.
+
+Used by import-google-reviews.py (CSV exports) and fetch-google-reviews-free.py
+(Outscraper). merge_reviews() groups reviews by roofer and drops repeats
+(review_dedupe); write_reviews_ts() regenerates the object and keeps the
+interfaces above it and the helper functions below it.
+"""
+
+import re
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from .paths import REVIEWS_TS
+from .review_dedupe import Origin, dedupe_reviews
+from .roofers_ts import parse_exported_object
+
+RENDERED_COMMENT = '// Roofer reviews grouped by rooferId'
+
+DEFAULT_HEADER = '''// Google Business Reviews data structure
+// Reviews can be imported from Google Business pages
+
+export interface GoogleReview {
+  id: string; // Unique ID for the review
+  rooferId: string; // Links to roofer.id
+  reviewerName: string;
+  rating: number; // 1-5 stars
+  reviewText: string;
+  reviewDate: string; // ISO date string
+  googleReviewUrl?: string; // Link to the review on Google
+  reviewerPhotoUrl?: string; // Profile photo from Google
+  responseText?: string; // Business owner's response
+  responseDate?: string; // ISO date string
+  importedAt: string; // When this review was imported
+  lastUpdated?: string; // Last time review was synced
+}
+
+// Aggregated rating data for a roofer
+export interface RooferRatingSummary {
+  rooferId: string;
+  averageRating: number; // 0-5
+  totalReviews: number;
+  ratingDistribution: {
+    5: number;
+    4: number;
+    3: number;
+    2: number;
+    1: number;
+  };
+  lastUpdated: string;
+}
+
+'''
+
+DEFAULT_HELPERS = '''
+// Helper to get reviews for a specific roofer
+export function getReviewsForRoofer(rooferId: string): GoogleReview[] {
+  return googleReviews[rooferId] || [];
+}
+
+// Helper to get rating summary for a roofer
+export function getRatingSummary(rooferId: string): RooferRatingSummary {
+  const reviews = getReviewsForRoofer(rooferId);
+
+  if (reviews.length === 0) {
+    return {
+      rooferId,
+      averageRating: 0,
+      totalReviews: 0,
+      ratingDistribution: { 5: 0, 4: 0, 3: 0, 2: 0, 1: 0 },
+      lastUpdated: new Date().toISOString(),
+    };
+  }
+
+  const distribution = { 5: 0, 4: 0, 3: 0, 2: 0, 1: 0 };
+  let totalRating = 0;
+
+  reviews.forEach((review) => {
+    distribution[review.rating as keyof typeof distribution]++;
+    totalRating += review.rating;
+  });
+
+  return {
+    rooferId,
+    averageRating: Math.round((totalRating / reviews.length) * 10) / 10, // Round to 1 decimal
+    totalReviews: reviews.length,
+    ratingDistribution: distribution,
+    lastUpdated: reviews[reviews.length - 1]?.importedAt || new Date().toISOString(),
+  };
+}
+
+// Helper to get all reviews (for admin)
+export function getAllReviews(): GoogleReview[] {
+  return Object.values(googleReviews).flat();
+}
+'''
+
+
+def sanitize_text(text):
+    """Sanitize text for TypeScript string"""
+    if not text:
+        return ''
+    # Escape quotes and newlines
+    text = text.replace('\\', '\\\\')
+    text = text.replace('"', '\\"')
+    text = text.replace('\n', '\\n')
+    text = text.replace('\r', '\\r')
+    return text
+
+
+def read_reviews(path: Path = REVIEWS_TS) -> List[Dict]:
+    """Every review in reviews.ts, as a list (TSParseError if it cannot be read)."""
+    if not path.exists():
+        return []
+    grouped = parse_exported_object(path.read_text(encoding='utf-8'), 'googleReviews')
+    return [review for reviews in grouped.values() for review in reviews]
+
+
+def merge_reviews(existing: List[Dict], new_reviews: List[Dict]) -> Tuple[Dict[str, List[Dict]], List[Tuple]]:
+    """
+    Group reviews by rooferId, existing first. Same id: the later review
+    replaces the earlier one in place. Repeated text: the first copy is kept
+    (the longer one if the other is a truncation). Reviews with different
+    Google ids are never merged; ids made up for CSV rows ('google-...') do
+    not count as Google's. Near and truncated repeats only count between an
+    existing review and an imported one with the same rating.
+
+    Returns ({roofer id: reviews}, [(roofer id, dropped review, kept review, match)]).
+    """
+    imported = {id(review) for review in new_reviews}
+
+    def origin(review: Dict) -> Origin:
+        google_id = None if review['id'].startswith('google-') else review['id']
+        return Origin('google', google_id, review['rating'], run=id(review) in imported)
+
+    by_roofer: Dict[str, Dict[str, Dict]] = {}
+    for review in existing + new_reviews:
+        by_roofer.setdefault(str(review['rooferId']), {})[review['id']] = review
+
+    reviews_dict, duplicates = {}, []
+    for roofer_id, reviews in by_roofer.items():
+        kept, dropped = dedupe_reviews(reviews.values(), text=lambda r: r.get('reviewText'), origin=origin)
+        duplicates.extend((roofer_id, review, original, match) for review, original, match in dropped)
+        reviews_dict[roofer_id] = kept
+    return reviews_dict, duplicates
+
+
+def render_reviews(reviews_dict: Dict[str, List[Dict]]) -> str:
+    """TypeScript code for the googleReviews object"""
+    lines = []
+    lines.append(RENDERED_COMMENT)
+    lines.append('export const googleReviews: Record<string, GoogleReview[]> = {')
+
+    for roofer_id, reviews in sorted(reviews_dict.items()):
+        lines.append(f"  '{roofer_id}': [")
+
+        for review in reviews:
+            lines.append('    {')
+            lines.append(f"      id: '{review['id']}',")
+            lines.append(f"      rooferId: '{review['rooferId']}',")
+            lines.append(f"      reviewerName: '{sanitize_text(review['reviewerName'])}',")
+            lines.append(f"      rating: {review['rating']},")
+            lines.append(f"      reviewText: \"{sanitize_text(review['reviewText'])}\",")
+            lines.append(f"      reviewDate: '{review['reviewDate']}',")
+
+            if review.get('googleReviewUrl'):
+                lines.append(f"      googleReviewUrl: '{review['googleReviewUrl']}',")
+
+            if review.get('reviewerPhotoUrl'):
+                lines.append(f"      reviewerPhotoUrl: '{review['reviewerPhotoUrl']}',")
+
+            if review.get('responseText'):
+                lines.append(f"      responseText: \"{sanitize_text(review['responseText'])}\",")
+
+            if review.get('responseDate'):
+                lines.append(f"      responseDate: '{review['responseDate']}',")
+
+            lines.append(f"      importedAt: '{review['importedAt']}',")
+            lines.append('    },')
+
+        lines.append('  ],')
+
+    lines.append('};')
+
+    return '\n'.join(lines)
+
+
+def write_reviews_ts(reviews_dict: Dict[str, List[Dict]], path: Path = REVIEWS_TS) -> Path:
+    """
+    Regenerate googleReviews in reviews.ts, keeping the interfaces before it
+    and the helpers after it. The previous file is kept as reviews.ts.backup,
+    whose path is returned.
+    """
+    backup_path = path.with_suffix('.ts.backup')
+    existing_content = path.read_text(encoding='utf-8') if path.exists() else ''
+    if existing_content:
+        path.replace(backup_path)
+        # Everything before googleReviews (less the comment render_reviews() adds),
+        # and the helper functions after it, so an unchanged merge rewrites the same file
+        header = existing_content.split('export const googleReviews')[0].rstrip('\n')
+        header = header.removesuffix(RENDERED_COMMENT).rstrip('\n') + '\n'
+        helper_match = re.search(r'// Helper.*', existing_content, re.DOTALL)
+        helpers = '\n' + helper_match.group(0) if helper_match else ''
+    else:
+        header, helpers = DEFAULT_HEADER, DEFAULT_HELPERS
+
+    path.write_text(header + '\n' + render_reviews(reviews_dict) + '\n' + helpers, encoding='utf-8')
+    return backup_path
@@ -0,0 +1,143 @@
+"""
+Lookup index over roofers.ts and batch flag updates through it.
+
+The index is built once from a single parse of roofers.ts and resolves a
+roofer by id, record key, slug or company name. Flag updates for any number
+of roofers are turned into offset edits and written back in one pass.
+"""
+
+import json
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .paths import PREFERRED_CANDIDATES_JSON, ROOFERS_TS
+from .roofers_ts import RooferEntry, apply_edits, field_edits, parse_roofers
+
+# Fields the flag-update API is allowed to touch
+FLAG_FIELDS = ('isPreferred', 'isHidden', 'sortOverride', 'category')
+
+
+def create_slug(name: str) -> str:
+    """Same slug rule as createRooferSlug() in roofers.ts."""
+    return re.sub(r'[^a-z0-9]+', '-', str(name).lower()).strip('-')
+
+
+class RooferIndex:
+    """Resolves ids, slugs and names to roofers.ts entries."""
+
+    def __init__(self, entries: List[RooferEntry]):
+        self.entries = entries
+        self.by_id: Dict[str, RooferEntry] = {}
+        self.by_slug: Dict[str, RooferEntry] = {}
+        self.by_name: Dict[str, List[RooferEntry]] = {}
+        for entry in entries:
+            if entry.id is not None:
+                self.by_id[entry.id] = entry
+            self.by_slug[entry.key] = entry
+            self.by_slug.setdefault(entry.slug, entry)
+            name = entry.fields.get('name')
+            if name:
+                self.by_name.setdefault(create_slug(name), []).append(entry)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def resolve(self, identifier: Any) -> Optional[RooferEntry]:
+        """Find a roofer by id, slug or name; None if missing or ambiguous."""
+        if identifier is None:
+            return None
+        text = str(identifier).strip()
+        if text in self.by_id:
+            return self.by_id[text]
+        if text in self.by_slug:
+            return self.by_slug[text]
+        slug = create_slug(text)
+        if slug in self.by_slug:
+            return self.by_slug[slug]
+        matches = self.by_name.get(slug, [])
+        return matches[0] if len(matches) == 1 else None
+
+    def resolve_many(self, identifiers: Iterable[Any]) -> Tuple[Dict[str, RooferEntry], List[Any]]:
+        """Resolve a batch; returns ({key: entry}, [unresolved identifiers])."""
+        resolved, missing = {}, []
+        for identifier in identifiers:
+            entry = self.resolve(identifier)
+            if entry is None:
+                missing.append(identifier)
+            else:
+                resolved[entry.key] = entry
+        return resolved, missing
+
+
+@dataclass
+class FlagUpdateResult:
+    changed: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+    unresolved: List[Any] = field(default_factory=list)
+
+
+def load_index(path: Path = ROOFERS_TS) -> Tuple[str, RooferIndex]:
+    content = path.read_text(encoding='utf-8')
+    return content, RooferIndex(parse_roofers(content))
+
+
+def plan_flag_updates(content: str, index: RooferIndex,
+                      updates: Dict[Any, Dict[str, Any]]) -> Tuple[List[Tuple[int, int, str]], FlagUpdateResult]:
+    """Resolve every identifier in `updates` and build the edits for all of them."""
+    result = FlagUpdateResult()
+    merged: Dict[str, Tuple[RooferEntry, Dict[str, Any]]] = {}
+    for identifier, changes in updates.items():
+        unknown = set(changes) - set(FLAG_FIELDS)
+        if unknown:
+            raise ValueError(f"Not a flag field: {', '.join(sorted(unknown))}")
+        entry = index.resolve(identifier)
+        if entry is None:
+            result.unresolved.append(identifier)
+            continue
+        merged.setdefault(entry.key, (entry, {}))[1].update(changes)
+
+    edits = []
+    for key, (entry, changes) in merged.items():
+        pending = {k: v for k, v in changes.items() if entry.fields.get(k) != v}
+        if pending:
+            edits.extend(field_edits(content, entry, pending))
+            result.changed.append(key)
+        else:
+            result.unchanged.append(key)
+    return edits, result
+
+
+def update_roofer_flags(updates: Dict[Any, Dict[str, Any]], path: Path = ROOFERS_TS,
+                        dry_run: bool = False) -> FlagUpdateResult:
+    """
+    Apply isPreferred/isHidden/sortOverride/category changes to many roofers.
+
+    `updates` maps an id, slug or name to the fields to set; a value of None
+    removes the field. roofers.ts is read and parsed once and written at most
+    once.
+    """
+    content, index = load_index(path)
+    edits, result = plan_flag_updates(content, index, updates)
+    if edits and not dry_run:
+        path.write_text(apply_edits(content, edits), encoding='utf-8')
+    return result
+
+
+def set_flags(identifiers: Iterable[Any], path: Path = ROOFERS_TS, dry_run: bool = False,
+              **changes: Any) -> FlagUpdateResult:
+    """Apply the same flag changes to every identifier, e.g. set_flags(names, isPreferred=True)."""
+    return update_roofer_flags({identifier: dict(changes) for identifier in identifiers}, path, dry_run)
+
+
+def candidate_identifiers(candidates_file: Path = PREFERRED_CANDIDATES_JSON,
+                          top: Optional[int] = None, min_score: Optional[float] = None) -> List[str]:
+    """Read identifiers from a ranked candidates file written by analyze-preferred.py."""
+    with open(candidates_file, 'r', encoding='utf-8') as f:
+        candidates = json.load(f)
+    if min_score is not None:
+        candidates = [c for c in candidates if (c.get('score') or 0) >= min_score]
+    if top is not None:
+        candidates = candidates[:top]
+    return [c.get('slug') or c.get('id') or c.get('name') for c in candidates]
@@ -0,0 +1,365 @@
+"""
+Parser for the rooferData object literal in app/roofers/data/roofers.ts.
+
+The file is hand-edited as well as generated, so the parser reads the object
+literal itself (quoted or bare keys, '/"/` strings, arrays, nested objects,
+comments, trailing commas) instead of relying on line layout. Every entry
+keeps the character offsets of its top-level fields so callers can patch the
+file in place without re-rendering it.
+"""
+
+import math
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .paths import ROOFERS_TS
+
+ROOFER_DATA_START = re.compile(r'export\s+const\s+rooferData\b[^=]*=\s*\{')
+
+_STRING_PATTERNS = {
+    "'": re.compile(r"'((?:[^'\\]|\\.)*)'", re.DOTALL),
+    '"': re.compile(r'"((?:[^"\\]|\\.)*)"', re.DOTALL),
+    '`': re.compile(r'`((?:[^`\\]|\\.)*)`', re.DOTALL),
+}
+_SKIP = re.compile(r'(?:\s+|//[^\n]*|/\*.*?\*/)+', re.DOTALL)
+_CLOSE_ON_LINE = re.compile(r'[ \t]*\}')
+_NUMBER = re.compile(r'-?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?')
+_IDENTIFIER = re.compile(r'[A-Za-z_$][\w$]*')
+_ESCAPE = re.compile(r'\\(u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|\n|.)', re.DOTALL)
+_ESCAPE_CHARS = {'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0', '\n': ''}
+_KEYWORDS = {'true': True, 'false': False, 'null': None, 'undefined': None}
+
+
+class TSParseError(ValueError):
+    """Raised when roofers.ts does not contain a readable rooferData literal."""
+
+
+@dataclass
+class RooferEntry:
+    """One `'key': { ... }` entry of rooferData with its source offsets."""
+    key: str
+    start: int
+    body_start: int
+    end: int
+    fields: Dict[str, Any]
+    spans: Dict[str, Tuple[int, int]] = field(default_factory=dict)
+    field_starts: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def slug(self) -> str:
+        return self.fields.get('slug') or self.key
+
+    @property
+    def id(self) -> Optional[str]:
+        value = self.fields.get('id')
+        return str(value) if value is not None else None
+
+
+def _unescape(raw: str) -> str:
+    def replace(match):
+        token = match.group(1)
+        if token[0] in 'ux' and len(token) > 1:
+            return chr(int(token[1:], 16))
+        return _ESCAPE_CHARS.get(token, token)
+    return _ESCAPE.sub(replace, raw) if '\\' in raw else raw
+
+
+class _Parser:
+    """Minimal recursive-descent reader for JavaScript object literals."""
+
+    def __init__(self, text: str, pos: int = 0):
+        self.text = text
+        self.pos = pos
+
+    def error(self, message: str) -> TSParseError:
+        line = self.text.count('\n', 0, self.pos) + 1
+        return TSParseError(f"{message} at line {line}")
+
+    def skip(self):
+        match = _SKIP.match(self.text, self.pos)
+        if match:
+            self.pos = match.end()
+
+    def peek(self) -> str:
+        self.skip()
+        return self.text[self.pos] if self.pos < len(self.text) else ''
+
+    def expect(self, char: str):
+        if self.peek() != char:
+            raise self.error(f"Expected {char!r}")
+        self.pos += 1
+
+    def parse_key(self) -> str:
+        char = self.peek()
+        if char in _STRING_PATTERNS:
+            return self.parse_string()
+        match = _IDENTIFIER.match(self.text, self.pos) or _NUMBER.match(self.text, self.pos)
+        if not match:
+            raise self.error("Expected property name")
+        self.pos = match.end()
+        return match.group(0)
+
+    def parse_string(self) -> str:
+        match = _STRING_PATTERNS[self.text[self.pos]].match(self.text, self.pos)
+        if not match:
+            raise self.error("Unterminated string")
+        self.pos = match.end()
+        return _unescape(match.group(1))
+
+    def parse_value(self) -> Any:
+        char = self.peek()
+        if char == '{':
+            return self.parse_object()
+        if char == '[':
+            return self.parse_array()
+        if char in _STRING_PATTERNS:
+            return self.parse_string()
+        match = _NUMBER.match(self.text, self.pos)
+        if match:
+            self.pos = match.end()
+            number = match.group(0)
+            return float(number) if any(c in number for c in '.eE') else int(number)
+        match = _IDENTIFIER.match(self.text, self.pos)
+        if match and match.group(0) in _KEYWORDS:
+            self.pos = match.end()
+            return _KEYWORDS[match.group(0)]
+        raise self.error("Unsupported value")
+
+    def parse_array(self) -> List[Any]:
+        self.expect('[')
+        items = []
+        while self.peek() != ']':
+            items.append(self.parse_value())
+            if self.peek() == ',':
+                self.pos += 1
+        self.pos += 1
+        return items
+
+    def parse_object(self, spans: Optional[Dict[str, Tuple[int, int]]] = None,
+                     starts: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
+        self.expect('{')
+        result = {}
+        while self.peek() != '}':
+            if not self.peek():
+                raise self.error("Unterminated object")
+            if starts is not None:
+                starts_at = self.pos
+            key = self.parse_key()
+            if starts is not None:
+                starts[key] = starts_at
+            self.expect(':')
+            self.skip()
+            value_start = self.pos
+            result[key] = self.parse_value()
+            if spans is not None:
+                spans[key] = (value_start, self.pos)
+            if self.peek() == ',':
+                self.pos += 1
+        self.pos += 1
+        return result
+
+
+def parse_roofers(content: str) -> List[RooferEntry]:
+    """Parse every rooferData entry in the given roofers.ts source."""
+    start = ROOFER_DATA_START.search(content)
+    if not start:
+        raise TSParseError("Could not find `export const rooferData = {`")
+
+    parser = _Parser(content, start.end())
+    entries = []
+    while parser.peek() != '}':
+        if not parser.peek():
+            raise parser.error("Unterminated rooferData object")
+        entry_start = parser.pos
+        key = parser.parse_key()
+        parser.expect(':')
+        parser.skip()
+        body_start = parser.pos
+        spans, starts = {}, {}
+        fields = parser.parse_object(spans, starts)
+        entries.append(RooferEntry(key, entry_start, body_start, parser.pos, fields, spans, starts))
+        if parser.peek() == ',':
+            parser.pos += 1
+    return entries
+
+
+def to_ts_literal(value: Any, indent: str = '    ') -> str:
+    """Render a Python value as a TypeScript literal in the style of roofers.ts."""
+    if value is True:
+        return 'true'
+    if value is False:
+        return 'false'
+    if value is None:
+        return 'undefined'
+    if isinstance(value, (int, float)):
+        if not math.isfinite(value):
+            raise ValueError(f"Cannot render {value!r} as a TypeScript literal")
+        return repr(value)
+    if isinstance(value, str):
+        if '\n' in value:
+            return '`' + value.replace('\\', '\\\\').replace('`', '\\`').replace('${', '\\${') + '`'
+        return "'" + value.replace('\\', '\\\\').replace("'", "\\'") + "'"
+    if isinstance(value, (list, tuple)):
+        return '[' + ', '.join(to_ts_literal(item, indent) for item in value) + ']'
+    if isinstance(value, dict):
+        inner = indent + '  '
+        lines = [f"{inner}{key}: {to_ts_literal(item, inner)}" for key, item in value.items()]
+        return '{\n' + ',\n'.join(lines) + '\n' + indent + '}'
+    raise TypeError(f"Cannot render {type(value).__name__} as a TypeScript literal")
+
+
+def _line_indent(content: str, pos: int) -> str:
+    line_start = content.rfind('\n', 0, pos) + 1
+    prefix = content[line_start:pos]
+    return prefix if not prefix.strip() else re.match(r'\s*', prefix).group(0)
+
+
+def field_edits(content: str, entry: RooferEntry, changes: Dict[str, Any]) -> List[Tuple[int, int, str]]:
+    """
+    Compute (start, end, replacement) edits that apply `changes` to one entry.
+
+    Existing fields are replaced in place, new fields are appended after the
+    entry's last field (one per line, with the closing brace moved to its
+    own line if it shared the last field's) and fields set to None are
+    removed.
+    """
+    edits = []
+    appended = []
+    for key, value in changes.items():
+        if key in entry.spans:
+            start, end = entry.spans[key]
+            if value is not None:
+                edits.append((start, end, to_ts_literal(value, _line_indent(content, entry.field_starts[key]))))
+        elif value is not None:
+            appended.append((key, value))
+
+    # Adjacent removed fields go as one span, so they never compete for the comma between them
+    run: List[str] = []
+    for key in sorted(entry.field_starts, key=entry.field_starts.get) + [None]:
+        if key is not None and key in changes and changes[key] is None:
+            run.append(key)
+        elif run:
+            edits.append(_removal(content, entry.field_starts[run[0]], entry.spans[run[-1]][1]))
+            run = []
+
+    if appended:
+        if entry.spans:
+            last_key = max(entry.spans, key=lambda k: entry.spans[k][1])
+            anchor = entry.spans[last_key][1]
+            indent = _line_indent(content, entry.field_starts[last_key])
+        else:
+            anchor = entry.body_start + 1
+            indent = _line_indent(content, entry.start) + '  '
+        rest = _SKIP.match(content, anchor)
+        after = rest.end() if rest else anchor
+        has_comma = content[after:after + 1] == ','
+        text = ''.join(f",\n{indent}{key}: {to_ts_literal(value, indent)}" for key, value in appended)
+        if not entry.spans:
+            text = text[1:]
+        if has_comma:
+            at, text = after + 1, text[1:] + ','
+        else:
+            at = anchor
+        # Entry closed on its last field's line: move the brace to its own line
+        close = _CLOSE_ON_LINE.match(content, at)
+        if close:
+            edits.append((at, close.end() - 1, text + '\n' + _line_indent(content, entry.start)))
+        else:
+            edits.append((at, at, text))
+    return edits
+
+
+def _removal(content: str, start: int, end: int) -> Tuple[int, int, str]:
+    rest = _SKIP.match(content, end)
+    after = rest.end() if rest else end
+    if content[after:after + 1] == ',':
+        end = after + 1
+        # and the spaces after the comma, so the next field moves into place
+        while content[end:end + 1] in (' ', '\t'):
+            end += 1
+    else:
+        # Last field: drop the comma before it instead
+        before = start
+        while before > 0 and content[before - 1].isspace():
+            before -= 1
+        if content[before - 1:before] == ',':
+            return before - 1, end, ''
+    line_start = content.rfind('\n', 0, start) + 1
+    if not content[line_start:start].strip() and content[end:end + 1] == '\n':
+        # Field on a line of its own: drop the whole line
+        return line_start, end + 1, ''
+    if content[end:end + 1] in ('\n', ''):
+        # Rest of the line removed: trim the whitespace before the field too
+        while start > line_start and content[start - 1] in ' \t':
+            start -= 1
+    return start, end, ''
+
+
+def apply_edits(content: str, edits: List[Tuple[int, int, str]]) -> str:
+    """Apply non-overlapping (start, end, replacement) edits in a single pass."""
+    pieces = []
+    cursor = 0
+    for start, end, replacement in sorted(edits):
+        if start < cursor:
+            raise ValueError(f"Overlapping edits at offset {start}")
+        pieces.append(content[cursor:start])
+        pieces.append(replacement)
+        cursor = end
+    pieces.append(content[cursor:])
+    return ''.join(pieces)
+
+
+def data_end(content: str, entries: List[RooferEntry]) -> int:
+    """Offset of the closing brace of the rooferData object."""
+    parser = _Parser(content, entries[-1].end if entries else ROOFER_DATA_START.search(content).end())
+    if parser.peek() == ',':
+        parser.pos += 1
+    if parser.peek() != '}':
+        raise parser.error("Expected end of rooferData")
+    return parser.pos
+
+
+def render_entry(key: str, fields: Dict[str, Any], indent: str = '  ') -> str:
+    """Render a full `'key': { ... }` entry in the layout roofers.ts uses."""
+    inner = indent + '  '
+    lines = [f"{inner}{name}: {to_ts_literal(value, inner)}" for name, value in fields.items() if value is not None]
+    return f"{indent}{to_ts_literal(key)}: {{\n" + ',\n'.join(lines) + f"\n{indent}}}"
+
+
+def append_entries_edit(content: str, entries: List[RooferEntry],
+                        new_entries: List[Tuple[str, Dict[str, Any]]]) -> Tuple[int, int, str]:
+    """Edit that appends rendered entries just before the end of rooferData."""
+    if not new_entries:
+        raise ValueError("No entries to append")
+    rendered = ',\n\n'.join(render_entry(key, fields) for key, fields in new_entries)
+    if not entries:
+        end = data_end(content, entries)
+        return end, end, '\n' + rendered + '\n'
+    anchor = entries[-1].end
+    rest = _SKIP.match(content, anchor)
+    after = rest.end() if rest else anchor
+    if content[after:after + 1] == ',':
+        return after + 1, after + 1, '\n\n' + rendered + ','
+    return anchor, anchor, ',\n\n' + rendered
+
+
+def parse_exported_object(content: str, name: str) -> Any:
+    """Parse the literal assigned to `export const <name>` in a TypeScript module."""
+    start = re.search(rf'export\s+const\s+{re.escape(name)}\b[^=]*=\s*', content)
+    if not start:
+        raise TSParseError(f"Could not find `export const {name}`")
+    return _Parser(content, start.end()).parse_value()
+
+
+def read_roofers(path: Path = ROOFERS_TS) -> Tuple[str, List[RooferEntry]]:
+    """Read roofers.ts and return its source text together with the parsed entries."""
+    content = path.read_text(encoding='utf-8')
+    return content, parse_roofers(content)
+
+
+def load_roofers(path: Path = ROOFERS_TS) -> List[Dict[str, Any]]:
+    """Return the roofer objects from roofers.ts as plain dicts."""
+    _, entries = read_roofers(path)
+    return [entry.fields for entry in entries]
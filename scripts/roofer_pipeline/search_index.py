@@ -0,0 +1,218 @@
+"""
+Prefix search index for roofer search and service-area autocomplete.
+
+Every indexed field is split into tokens, and each distinct token points to
+the documents that contain it, with a precomputed base score:
+
+  field weight x document boost
+
+A query word matches every token it is a prefix of. Match quality is 1.0
+when the word is the whole token and falls towards 0.5 for short prefixes of
+long tokens; a document scores its best base score x match quality over the
+matching tokens. Tokens are sorted, so the matches for a word are one
+contiguous range found by binary search, and the list is front-coded (each
+token stores only the characters it does not share with the previous one)
+instead of repeating every prefix. Posting lists are sorted by score and
+capped. lib/search-index.ts runs the queries in the browser with the same
+tokenizer.
+"""
+
+import json
+import re
+from bisect import bisect_left
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+from .geography import counties, load_places
+from .paths import PUBLIC_DATA_DIR, ROOFERS_TS
+from .roofers_ts import load_roofers
+from .spatial import roofer_category
+
+SEARCH_INDEX_DIR = PUBLIC_DATA_DIR / 'search'
+
+FORMAT_VERSION = 2
+
+# Cap on each posting list. High enough that every token's list is complete
+# on the current roster; it only bounds the lists of very common tokens on
+# large rosters.
+MAX_POSTINGS = 1000
+
+# Words too common in company names to be worth a posting list
+STOP_WORDS = frozenset(['llc', 'inc', 'co', 'corp', 'corporation', 'company', 'the', 'of', 'and'])
+
+ROOFER_FIELD_WEIGHTS = {
+    'name': 10.0,
+    'zip': 6.0,
+    'city': 4.0,
+    'specialties': 3.0,
+    'service_cities': 2.0,
+    'counties': 2.0,
+    'regions': 1.0,
+}
+
+PLACE_FIELD_WEIGHTS = {
+    'name': 10.0,
+    'county': 2.0,
+    'region': 1.0,
+}
+
+CATEGORY_BOOST = {'preferred': 1.5, 'sponsored': 1.25, 'general': 1.0}
+PLACE_TYPE_BOOST = {'region': 1.3, 'county': 1.15, 'city': 1.0}
+
+# Extra weight for the first word of a name (what people usually type first)
+LEADING_TOKEN_BOOST = 1.2
+
+
+def tokenize(text, keep_stop_words: bool = False) -> List[str]:
+    """Lowercase alphanumeric tokens; must match tokenize() in lib/search-index.ts."""
+    tokens = [t for t in re.split(r'[^a-z0-9]+', str(text or '').lower()) if t]
+    return tokens if keep_stop_words else [t for t in tokens if t not in STOP_WORDS]
+
+
+def match_quality(prefix_length: int, token_length: int) -> float:
+    return 1.0 if prefix_length >= token_length else 0.5 + 0.5 * prefix_length / token_length
+
+
+def document_tokens(fields: Dict[str, Iterable[str]], weights: Dict[str, float],
+                    boost: float) -> Dict[str, float]:
+    """Best base score of every token found in a document's fields."""
+    best: Dict[str, float] = {}
+    for field, values in fields.items():
+        weight = weights[field] * boost
+        for value in values:
+            for position, token in enumerate(tokenize(value)):
+                lead = LEADING_TOKEN_BOOST if field == 'name' and position == 0 else 1.0
+                if weight * lead > best.get(token, 0):
+                    best[token] = weight * lead
+    return best
+
+
+def front_code(terms: List[str]) -> Tuple[List[int], List[str]]:
+    """Sorted terms as (characters shared with the previous term, rest of the term)."""
+    shared, suffixes, previous = [], [], ''
+    for term in terms:
+        common = 0
+        while common < min(len(term), len(previous)) and term[common] == previous[common]:
+            common += 1
+        shared.append(common)
+        suffixes.append(term[common:])
+        previous = term
+    return shared, suffixes
+
+
+def expand_terms(shared: List[int], suffixes: List[str]) -> List[str]:
+    """Inverse of front_code()."""
+    terms, previous = [], ''
+    for common, suffix in zip(shared, suffixes):
+        previous = previous[:common] + suffix
+        terms.append(previous)
+    return terms
+
+
+def build_index(documents: List[Tuple[Dict, Dict[str, Iterable[str]], float]],
+                weights: Dict[str, float]) -> Dict:
+    """
+    Index (document, fields, boost) triples.
+
+    Returns {'docs': [...], 'shared': [...], 'suffixes': [...], 'postings': [...]}:
+    the front-coded sorted tokens and, aligned with them, each token's
+    [doc, base score, doc, base score, ...] sorted by score and capped at
+    MAX_POSTINGS.
+    """
+    postings: Dict[str, List[Tuple[float, int]]] = {}
+    for doc_id, (_, fields, boost) in enumerate(documents):
+        for token, score in document_tokens(fields, weights, boost).items():
+            postings.setdefault(token, []).append((score, doc_id))
+
+    terms = sorted(postings)
+    lists = []
+    for term in terms:
+        ranked = sorted(postings[term], key=lambda p: (-p[0], p[1]))[:MAX_POSTINGS]
+        lists.append([v for score, doc_id in ranked for v in (doc_id, round(score, 2))])
+    shared, suffixes = front_code(terms)
+    return {
+        'generatedAt': datetime.now(timezone.utc).isoformat(),
+        'version': FORMAT_VERSION,
+        'docs': [doc for doc, _, _ in documents],
+        'shared': shared,
+        'suffixes': suffixes,
+        'postings': lists,
+    }
+
+
+def place_documents() -> List[Tuple[Dict, Dict[str, Iterable[str]], float]]:
+    """Regions, counties and cities, shaped like SearchResult in search-data.ts."""
+    documents = []
+    for place in load_places():
+        doc = {'type': place.type, 'name': place.name, 'slug': place.slug, 'path': place.path}
+        if place.type == 'city':
+            doc['county'] = place.county
+        if place.type != 'region':
+            doc['region'] = place.region
+        fields = {'name': [place.name], 'county': [place.county], 'region': [place.region]}
+        documents.append((doc, fields, PLACE_TYPE_BOOST[place.type]))
+    return documents
+
+
+def roofer_documents(path: Path = ROOFERS_TS) -> List[Tuple[Dict, Dict[str, Iterable[str]], float]]:
+    """Visible roofers, searchable by name, location, service areas, specialties and ZIP."""
+    places = load_places()
+    county_names = {p.slug: p.name for p in counties(places)}
+    region_names = {p.slug: p.name for p in places if p.type == 'region'}
+    city_names = {p.slug: p.name for p in places if p.type == 'city'}
+
+    documents = []
+    for roofer in load_roofers(path):
+        if roofer.get('isHidden'):
+            continue
+        areas = roofer.get('serviceAreas') or {}
+        fields = {
+            'name': [roofer.get('name')],
+            'zip': [roofer.get('zipCode')],
+            'city': [roofer.get('city')],
+            'specialties': roofer.get('specialties') or [],
+            'service_cities': [city_names.get(s, s.replace('-', ' ')) for s in areas.get('cities') or []],
+            'counties': [county_names.get(s, s.replace('-', ' ')) for s in areas.get('counties') or []],
+            'regions': [region_names.get(s, s.replace('-', ' ')) for s in areas.get('regions') or []],
+        }
+        doc = {'id': str(roofer.get('id')), 'name': roofer.get('name')}
+        documents.append((doc, fields, CATEGORY_BOOST[roofer_category(roofer)]))
+    return documents
+
+
+def write_index(index: Dict, path: Path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, separators=(',', ':'), ensure_ascii=False)
+
+
+def prefix_range(terms: List[str], prefix: str) -> range:
+    """Positions of the sorted terms that start with prefix ('~' sorts after every token character)."""
+    return range(bisect_left(terms, prefix), bisect_left(terms, prefix + '~'))
+
+
+def search(index: Dict, query: str, limit: int = 10) -> List[Tuple[Dict, float]]:
+    """
+    Run a query against a built index (same algorithm as lib/search-index.ts).
+
+    Every token must match; stop words are optional because they are not
+    indexed as whole words but may be the start of one ("co" -> "coral").
+    """
+    terms = expand_terms(index['shared'], index['suffixes'])
+    scores = None
+    for token in tokenize(query, keep_stop_words=True):
+        hits: Dict[int, float] = {}
+        for position in prefix_range(terms, token):
+            quality = match_quality(len(token), len(terms[position]))
+            flat = index['postings'][position]
+            for doc, score in zip(flat[0::2], flat[1::2]):
+                if score * quality > hits.get(doc, 0):
+                    hits[doc] = score * quality
+        matched = hits if scores is None else {doc: s + hits[doc] for doc, s in scores.items() if doc in hits}
+        if matched or token not in STOP_WORDS:
+            scores = matched
+        if scores is not None and not scores:
+            return []
+    ranked = sorted((scores or {}).items(), key=lambda item: (-item[1], item[0]))[:limit]
+    return [(index['docs'][doc], round(score, 2)) for doc, score in ranked]
@@ -0,0 +1,138 @@
+"""
+Spatial helpers over geocoded roofers.
+
+Points are indexed with a KD-tree on unit-sphere (x, y, z) vectors: the
+straight-line chord distance grows with the great-circle distance, so the
+tree's nearest neighbours are the haversine nearest neighbours, and the
+reported distances are recomputed exactly with the haversine formula.
+"""
+
+from pathlib import Path
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .geography import city_lookup, load_county_coordinates
+from .paths import ROOFERS_TS
+from .roofer_index import create_slug
+from .roofers_ts import load_roofers
+
+EARTH_RADIUS_MILES = 3959.0
+
+# Listing categories, in the order the site shows them
+CATEGORIES = ('preferred', 'sponsored', 'general')
+
+
+def haversine_miles(lat1, lng1, lat2, lng2) -> np.ndarray:
+    """Great-circle distance in miles; arguments broadcast like numpy arrays."""
+    lat1, lng1, lat2, lng2 = (np.radians(np.asarray(v, dtype=float)) for v in (lat1, lng1, lat2, lng2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) / 2) ** 2
+    return 2 * EARTH_RADIUS_MILES * np.arcsin(np.sqrt(np.clip(a, 0, 1)))
+
+
+def unit_vectors(lat, lng) -> np.ndarray:
+    lat, lng = np.radians(np.asarray(lat, dtype=float)), np.radians(np.asarray(lng, dtype=float))
+    return np.column_stack([np.cos(lat) * np.cos(lng), np.cos(lat) * np.sin(lng), np.sin(lat)])
+
+
+def miles_to_chord(miles: float) -> float:
+    """Unit-sphere chord length for a great-circle distance (for radius queries)."""
+    return 2 * np.sin(min(miles / EARTH_RADIUS_MILES, np.pi) / 2)
+
+
+class PointTree:
+    """KD-tree over lat/lng points answering haversine k-nearest queries."""
+
+    def __init__(self, lat, lng):
+        from scipy.spatial import cKDTree
+
+        self.lat = np.asarray(lat, dtype=float)
+        self.lng = np.asarray(lng, dtype=float)
+        self.tree = cKDTree(unit_vectors(self.lat, self.lng)) if len(self.lat) else None
+
+    def __len__(self) -> int:
+        return len(self.lat)
+
+    def query(self, lat, lng, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Indices and haversine miles of the k nearest points for each query.
+
+        Both arrays have shape (queries, min(k, len(tree))), nearest first.
+        """
+        lat, lng = np.atleast_1d(np.asarray(lat, dtype=float)), np.atleast_1d(np.asarray(lng, dtype=float))
+        k = min(k, len(self))
+        if k == 0:
+            empty = np.empty((len(lat), 0))
+            return empty.astype(int), empty
+        _, idx = self.tree.query(unit_vectors(lat, lng), k=k)
+        idx = idx.reshape(len(lat), k)
+        return idx, haversine_miles(lat[:, None], lng[:, None], self.lat[idx], self.lng[idx])
+
+    def within(self, lat: float, lng: float, miles: float) -> np.ndarray:
+        """Indices of the points within `miles` of one location."""
+        if self.tree is None:
+            return np.empty(0, dtype=int)
+        return np.asarray(self.tree.query_ball_point(unit_vectors([lat], [lng])[0], miles_to_chord(miles)), dtype=int)
+
+    def count_within(self, lat, lng, miles: float) -> np.ndarray:
+        """Number of points within `miles` of each location (one batched query)."""
+        lat = np.atleast_1d(np.asarray(lat, dtype=float))
+        if self.tree is None:
+            return np.zeros(len(lat), dtype=int)
+        return np.asarray(self.tree.query_ball_point(unit_vectors(lat, np.atleast_1d(lng)), miles_to_chord(miles),
+                                                     return_length=True), dtype=int)
+
+
+def roofer_category(fields: dict) -> str:
+    """Same rule as getCategory() on the near-me page."""
+    if fields.get('category') == 'preferred' or fields.get('isPreferred'):
+        return 'preferred'
+    if fields.get('category') == 'sponsored':
+        return 'sponsored'
+    return 'general'
+
+
+def fast_coordinates(fields: dict, cities=None, counties=None) -> Optional[Tuple[float, float]]:
+    """
+    Coordinates for a roofer the way lib/fast-coordinates.ts finds them.
+
+    Stored latitude/longitude first, then the roofer's city, then its first
+    service-area county, then the county of its city.
+    """
+    if fields.get('latitude') is not None and fields.get('longitude') is not None:
+        return float(fields['latitude']), float(fields['longitude'])
+    cities = city_lookup() if cities is None else cities
+    counties = load_county_coordinates() if counties is None else counties
+    place = cities.get(create_slug(fields['city'])) if fields.get('city') else None
+    if place and place.lat is not None:
+        return place.lat, place.lng
+    first_county = ((fields.get('serviceAreas') or {}).get('counties') or [None])[0]
+    if first_county in counties:
+        return counties[first_county]
+    if place and place.county_slug in counties:
+        return counties[place.county_slug]
+    return None
+
+
+def load_roofer_points(path: Path = ROOFERS_TS, include_hidden: bool = False) -> pd.DataFrame:
+    """Visible roofers with coordinates: id, slug, name, category, zip, lat, lng, is_preferred."""
+    cities, counties = city_lookup(), load_county_coordinates()
+    rows = []
+    for fields in load_roofers(path):
+        if fields.get('isHidden') and not include_hidden:
+            continue
+        coords = fast_coordinates(fields, cities, counties)
+        if coords is None:
+            continue
+        rows.append({
+            'id': str(fields.get('id')),
+            'slug': fields.get('slug'),
+            'name': fields.get('name'),
+            'category': roofer_category(fields),
+            'is_preferred': bool(fields.get('isPreferred')),
+            'zip': fields.get('zipCode'),
+            'lat': coords[0],
+            'lng': coords[1],
+        })
+    return pd.DataFrame(rows, columns=['id', 'slug', 'name', 'category', 'is_preferred', 'zip', 'lat', 'lng'])
@@ -0,0 +1,337 @@
+"""
+SQLite work queue of per-roofer tasks.
+
+Replaces the last_index progress files and hand-made batch-N slices: every
+worker process (any number, on one machine or several sharing the database
+file) claims tasks from the same queue, so the roster is split between them
+automatically.
+
+  pending --claim--> leased --complete--> done
+                       |  \\--fail--> pending (retry after a backoff) or failed
+                       \\--lease expires--> claimable again
+
+A claim takes a lease for lease_seconds, which the Worker renews from a
+heartbeat thread while the task is being processed. If a worker crashes its
+leases expire and another worker picks the tasks up. Each claim increments
+the task's attempt counter, and complete/fail only succeed for the worker
+holding the current attempt, so a worker whose lease expired cannot record
+a result over the one that took the task over: every roofer ends up done
+exactly once.
+
+Results are stored with the task; a worker writes the combined output file
+from the database instead of from its own in-memory list.
+
+The database uses SQLite's rollback journal (not WAL) so it also works on
+network filesystems; lease times are wall-clock, so machines sharing it need
+roughly synchronized clocks.
+"""
+
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from . import metrics
+from .ingest import unique_key
+from .paths import DATA_DIR
+from .roofer_index import create_slug
+
+WORK_QUEUE_DB = DATA_DIR / 'work-queue.sqlite'
+LEASE_SECONDS = 300
+MAX_ATTEMPTS = 3
+RETRY_BACKOFF = 30      # seconds before the first retry, doubled after each failure
+BUSY_TIMEOUT = 30
+
+PENDING = 'pending'
+LEASED = 'leased'
+DONE = 'done'
+FAILED = 'failed'
+STATUSES = (PENDING, LEASED, DONE, FAILED)
+
+
+@dataclass
+class Task:
+    queue: str
+    key: str
+    position: int
+    payload: Dict[str, Any]
+    attempt: int
+    owner: str
+
+
+def default_owner() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+
+def roster_tasks(rows: Iterable[Dict[str, Any]], name_column: str = 'Name') -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """(slug key, row) for each named roster row, keyed like the import (ingest.keyed_rows)."""
+    seen = set()
+    for row in rows:
+        name = (row.get(name_column) or '').strip()
+        if create_slug(name):
+            yield unique_key(name, seen), row
+
+
+@contextmanager
+def transaction(path: Path) -> Iterator[sqlite3.Connection]:
+    """
+    BEGIN IMMEDIATE ... COMMIT on a fresh connection. Taking the write lock up
+    front serializes concurrent claims; a connection per operation lets any
+    thread (the heartbeat runs on its own) use the database.
+    """
+    conn = sqlite3.connect(str(path), timeout=BUSY_TIMEOUT, isolation_level=None)
+    try:
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            yield conn
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        conn.execute('COMMIT')
+    finally:
+        conn.close()
+
+
+class WorkQueue:
+    """Tasks for any number of named queues in one SQLite file."""
+
+    def __init__(self, path: Path = WORK_QUEUE_DB, lease_seconds: float = LEASE_SECONDS,
+                 max_attempts: int = MAX_ATTEMPTS, retry_backoff: float = RETRY_BACKOFF):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        with self._transaction() as conn:
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS tasks ('
+                ' queue TEXT NOT NULL, key TEXT NOT NULL, position INTEGER NOT NULL,'
+                ' payload TEXT NOT NULL, status TEXT NOT NULL,'
+                ' attempts INTEGER NOT NULL DEFAULT 0, owner TEXT, lease_expires REAL,'
+                ' available_at REAL NOT NULL DEFAULT 0, result TEXT, error TEXT, updated_at REAL,'
+                ' PRIMARY KEY (queue, key))'
+            )
+            conn.execute('CREATE INDEX IF NOT EXISTS tasks_claim ON tasks (queue, status, available_at)')
+
+    def _transaction(self):
+        return transaction(self.path)
+
+    # Producers
+
+    def enqueue(self, queue: str, items: Iterable[Tuple[str, Dict[str, Any]]]) -> int:
+        """
+        Add tasks that are not in the queue yet; existing tasks (whatever their
+        status) are left alone, so every worker can enqueue the full roster.
+        Returns the number of new tasks.
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            start = conn.execute('SELECT COALESCE(MAX(position), -1) + 1 FROM tasks WHERE queue = ?',
+                                 (queue,)).fetchone()[0]
+            before = conn.total_changes
+            conn.executemany(
+                'INSERT OR IGNORE INTO tasks (queue, key, position, payload, status, updated_at)'
+                ' VALUES (?, ?, ?, ?, ?, ?)',
+                ((queue, key, start + i, json.dumps(payload, default=str), PENDING, now)
+                 for i, (key, payload) in enumerate(items)))
+            return conn.total_changes - before
+
+    def requeue(self, queue: str, items: Iterable[Tuple[str, Dict[str, Any]]]) -> int:
+        """
+        Make tasks pending again (for a scheduled re-fetch): new keys are added,
+        done and failed tasks are reopened with a fresh attempt budget and the
+        new payload, and tasks already pending or leased are left alone.
+        Returns the number of tasks that became pending.
+        """
+        items = list(items)
+        reopened = 0
+        with self._transaction() as conn:
+            for key, payload in items:
+                reopened += conn.execute(
+                    'UPDATE tasks SET status = ?, payload = ?, attempts = 0, available_at = 0, owner = NULL,'
+                    ' error = NULL, updated_at = ? WHERE queue = ? AND key = ? AND status IN (?, ?)',
+                    (PENDING, json.dumps(payload, default=str), time.time(), queue, key, DONE, FAILED)).rowcount
+        return reopened + self.enqueue(queue, items)
+
+    def retry_failed(self, queue: str) -> int:
+        """Put failed tasks back to pending with a fresh attempt budget."""
+        with self._transaction() as conn:
+            return conn.execute(
+                'UPDATE tasks SET status = ?, attempts = 0, available_at = 0, owner = NULL, error = NULL'
+                ' WHERE queue = ? AND status = ?', (PENDING, queue, FAILED)).rowcount
+
+    def reset(self, queue: str) -> int:
+        """Drop every task (and result) of a queue."""
+        with self._transaction() as conn:
+            return conn.execute('DELETE FROM tasks WHERE queue = ?', (queue,)).rowcount
+
+    # Workers
+
+    def claim(self, queue: str, owner: str) -> Optional[Task]:
+        """Lease the next ready task: pending and due, or leased with an expired lease."""
+        now = time.time()
+        with self._transaction() as conn:
+            # Expired leases that used up their attempts are failed, not retried
+            conn.execute(
+                'UPDATE tasks SET status = ?, error = COALESCE(error, ?), owner = NULL, updated_at = ?'
+                ' WHERE queue = ? AND status = ? AND lease_expires < ? AND attempts >= ?',
+                (FAILED, 'lease expired', now, queue, LEASED, now, self.max_attempts))
+            row = conn.execute(
+                'SELECT key, position, payload, attempts FROM tasks WHERE queue = ? AND ('
+                ' (status = ? AND available_at <= ?) OR (status = ? AND lease_expires < ?))'
+                ' ORDER BY available_at, position LIMIT 1',
+                (queue, PENDING, now, LEASED, now)).fetchone()
+            if row is None:
+                return None
+            key, position, payload, attempts = row
+            conn.execute(
+                'UPDATE tasks SET status = ?, attempts = ?, owner = ?, lease_expires = ?, updated_at = ?'
+                ' WHERE queue = ? AND key = ?',
+                (LEASED, attempts + 1, owner, now + self.lease_seconds, now, queue, key))
+        metrics.count('tasks_claimed', queue=queue)
+        return Task(queue, key, position, json.loads(payload), attempts + 1, owner)
+
+    def held(self, queue: str, owner: str) -> List[Task]:
+        """Tasks currently leased by owner, for workers that pick up their batch in a later process."""
+        with self._transaction() as conn:
+            rows = conn.execute('SELECT key, position, payload, attempts FROM tasks'
+                                ' WHERE queue = ? AND status = ? AND owner = ? ORDER BY position',
+                                (queue, LEASED, owner)).fetchall()
+        return [Task(queue, key, position, json.loads(payload), attempts, owner)
+                for key, position, payload, attempts in rows]
+
+    def _update_held(self, task: Task, assignments: str, values: tuple) -> bool:
+        """Apply an update only while the task is still leased by this attempt."""
+        with self._transaction() as conn:
+            return conn.execute(
+                f'UPDATE tasks SET {assignments}, updated_at = ?'
+                ' WHERE queue = ? AND key = ? AND status = ? AND owner = ? AND attempts = ?',
+                (*values, time.time(), task.queue, task.key, LEASED, task.owner, task.attempt)).rowcount == 1
+
+    def heartbeat(self, task: Task) -> bool:
+        """Extend the lease; False means it was lost to another worker."""
+        return self._update_held(task, 'lease_expires = ?', (time.time() + self.lease_seconds,))
+
+    def complete(self, task: Task, result: Any = None) -> bool:
+        done = self._update_held(task, 'status = ?, result = ?, error = NULL, lease_expires = NULL',
+                                 (DONE, json.dumps(result, default=str)))
+        metrics.count('tasks_completed' if done else 'tasks_lost', queue=task.queue)
+        return done
+
+    def fail(self, task: Task, error: str) -> str:
+        """Record a failure: back to pending after a backoff, or failed once out of attempts."""
+        if task.attempt >= self.max_attempts:
+            status, available_at = FAILED, 0
+        else:
+            status, available_at = PENDING, time.time() + self.retry_backoff * 2 ** (task.attempt - 1)
+        if not self._update_held(task, 'status = ?, error = ?, available_at = ?, lease_expires = NULL',
+                                 (status, error, available_at)):
+            return LEASED
+        metrics.count('tasks_failed' if status == FAILED else 'tasks_retried', queue=task.queue)
+        return status
+
+    def release(self, task: Task) -> bool:
+        """Give a task back untouched (e.g. on Ctrl+C); the attempt is not counted."""
+        return self._update_held(task, 'status = ?, attempts = attempts - 1, lease_expires = NULL',
+                                 (PENDING,))
+
+    # Reporting
+
+    def counts(self, queue: str) -> Dict[str, int]:
+        with self._transaction() as conn:
+            rows = dict(conn.execute('SELECT status, COUNT(*) FROM tasks WHERE queue = ? GROUP BY status',
+                                     (queue,)).fetchall())
+        return {status: rows.get(status, 0) for status in STATUSES}
+
+    def results(self, queue: str) -> List[Any]:
+        """Results of the done tasks in enqueue order."""
+        with self._transaction() as conn:
+            rows = conn.execute('SELECT result FROM tasks WHERE queue = ? AND status = ? ORDER BY position',
+                                (queue, DONE)).fetchall()
+        return [json.loads(result) for (result,) in rows]
+
+    def export(self, queue: str, path: Path, merge_on: Optional[str] = None) -> List[Any]:
+        """
+        Write the done results to a JSON file atomically (other workers may be
+        writing it too). With merge_on, entries already in the file are kept
+        and those with the same merge_on value are replaced in place.
+        """
+        results = self.results(queue)
+        if merge_on and path.exists():
+            with open(path, 'r', encoding='utf-8') as f:
+                existing = json.load(f)
+            fresh = {result.get(merge_on): result for result in results}
+            results = [fresh.pop(entry.get(merge_on), entry) for entry in existing] + list(fresh.values())
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        os.replace(tmp, path)
+        return results
+
+    def failures(self, queue: str) -> List[Tuple[str, int, str]]:
+        with self._transaction() as conn:
+            return conn.execute('SELECT key, attempts, error FROM tasks WHERE queue = ? AND status = ?'
+                                ' ORDER BY position', (queue, FAILED)).fetchall()
+
+
+class Worker:
+    """Claims tasks from one queue and processes them, renewing the lease while a handler runs."""
+
+    def __init__(self, work_queue: WorkQueue, queue: str, owner: Optional[str] = None):
+        self.work_queue = work_queue
+        self.queue = queue
+        self.owner = owner or default_owner()
+        self._current: Optional[Task] = None
+        self._stop = threading.Event()
+
+    def _heartbeat(self):
+        interval = max(1.0, self.work_queue.lease_seconds / 3)
+        while not self._stop.wait(interval):
+            task = self._current
+            if task is not None and not self.work_queue.heartbeat(task):
+                print(f"  ⚠️  Lost the lease on {task.key}; another worker has it")
+
+    def run(self, handler: Callable[[Task], Any], limit: Optional[int] = None,
+            on_done: Optional[Callable[[Task, Any], None]] = None) -> Dict[str, int]:
+        """
+        Process tasks until the queue has nothing ready (or `limit` tasks were
+        handled). handler(task) returns the result to store; an exception
+        fails the attempt. Ctrl+C releases the current task and stops.
+        """
+        handled = {DONE: 0, PENDING: 0, FAILED: 0, LEASED: 0}
+        beat = threading.Thread(target=self._heartbeat, name='queue-heartbeat', daemon=True)
+        beat.start()
+        try:
+            while limit is None or sum(handled.values()) < limit:
+                task = self.work_queue.claim(self.queue, self.owner)
+                if task is None:
+                    break
+                self._current = task
+                try:
+                    result = handler(task)
+                except KeyboardInterrupt:
+                    self.work_queue.release(task)
+                    raise
+                except Exception as e:
+                    status = self.work_queue.fail(task, f"{type(e).__name__}: {e}")
+                    handled[status] += 1
+                    print(f"  ❌ {task.key}: {e} ({'will retry' if status == PENDING else status})")
+                    continue
+                finally:
+                    self._current = None
+                if self.work_queue.complete(task, result):
+                    handled[DONE] += 1
+                    if on_done:
+                        on_done(task, result)
+                else:
+                    handled[LEASED] += 1
+                    print(f"  ⚠️  {task.key} was taken over by another worker; result discarded")
+        finally:
+            self._stop.set()
+        return handled
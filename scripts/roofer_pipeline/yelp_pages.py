@@ -0,0 +1,211 @@
+"""
+Yelp business pages: parsing and fetching every review page.
+
+A business page shows one page of reviews (YELP_PAGE_SIZE, paged with
+?start=N). fetch_business() reads the first page for the rating and total
+review count, works out how many pages there are, and fetches the rest
+concurrently through the caller's session, so the per-host rate limit in
+http_client still applies. Reviews are yielded as their page arrives, so the
+analyzer works through the first pages while later ones are in flight.
+
+Moved out of data/roofers/scrape-yelp-reviews.py so the single and batch
+scrapers parse pages the same way.
+"""
+
+import json
+import math
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from bs4 import BeautifulSoup
+
+from . import metrics
+from .replay import service_url
+from .review_dedupe import Origin, ReviewIndex
+
+YELP_PAGE_SIZE = 10
+# Pages fetched at once per business; the host's rate controller paces them
+PAGE_WORKERS = 4
+# Safety net against a misread review count (1000 reviews)
+MAX_PAGES = 100
+PAGE_TIMEOUT = 15
+
+REVIEW_SELECTORS = (
+    {'class': re.compile(r'review', re.I)},
+    {'data-review-id': True},
+    {'itemprop': 'review'},
+)
+
+
+def _json_ld(soup: BeautifulSoup) -> List[Dict]:
+    items = []
+    for script in soup.find_all('script', type='application/ld+json'):
+        try:
+            data = json.loads(script.string or '')
+        except ValueError:
+            continue
+        items.extend(item for item in (data if isinstance(data, list) else [data]) if isinstance(item, dict))
+    return items
+
+
+def parse_rating(soup: BeautifulSoup) -> Optional[float]:
+    """Overall star rating: aria-label, then JSON-LD, then "4.5 out of 5" text."""
+    for elem in soup.find_all(['div', 'span'], {'aria-label': re.compile(r'(\d+\.?\d*)\s+star', re.I)}):
+        match = re.search(r'(\d+\.?\d*)', elem.get('aria-label', ''))
+        if match and 0 <= float(match.group(1)) <= 5:
+            return float(match.group(1))
+
+    for item in _json_ld(soup):
+        if 'aggregateRating' in item:
+            try:
+                return float(item['aggregateRating'].get('ratingValue', 0))
+            except (TypeError, ValueError):
+                continue
+
+    match = re.search(r'(\d+\.?\d*)\s*(?:out of|/)\s*5', soup.get_text(), re.I)
+    return float(match.group(1)) if match else None
+
+
+def parse_review_count(soup: BeautifulSoup) -> int:
+    """Total reviews for the business: JSON-LD reviewCount, else the "N reviews" text."""
+    for item in _json_ld(soup):
+        try:
+            return int(item['aggregateRating']['reviewCount'])
+        except (KeyError, TypeError, ValueError):
+            continue
+
+    page_text = soup.get_text()
+    for pattern in (r'(\d+)\s+reviews?', r'reviewCount["\']?\s*:\s*(\d+)'):
+        match = re.search(pattern, page_text, re.I)
+        if match:
+            return int(match.group(1))
+    return 0
+
+
+def parse_page_size(soup: BeautifulSoup) -> int:
+    """Reviews per page, from the start= offset of the next-page link."""
+    link = soup.find('link', rel='next') or soup.find('a', class_=re.compile(r'next', re.I))
+    if link and link.get('href'):
+        start = dict(parse_qsl(urlsplit(link['href']).query)).get('start', '')
+        if start.isdigit() and int(start) > 0:
+            return int(start)
+    return YELP_PAGE_SIZE
+
+
+def parse_reviews(soup: BeautifulSoup) -> List[Dict]:
+    """The reviews on one page, as {'id', 'text', 'rating'}."""
+    for selector in REVIEW_SELECTORS:
+        reviews = []
+        seen = set()
+        for review_elem in soup.find_all('div', selector):
+            text_elem = (review_elem.find('p', class_=re.compile(r'comment|text|review', re.I))
+                         or review_elem.find('span', class_=re.compile(r'comment|text|review', re.I))
+                         or review_elem)
+            review_text = text_elem.get_text(strip=True)
+
+            # Filter for actual review text
+            if (len(review_text) <= 30 or len(review_text) >= 2000
+                    or 'review' in review_text.lower()[:15] or 'rating' in review_text.lower()[:15]):
+                continue
+            if review_text in seen:
+                continue
+            seen.add(review_text)
+
+            review_rating = None
+            rating_elem = review_elem.find(['div', 'span'], {'aria-label': re.compile(r'(\d+)\s+star', re.I)})
+            if rating_elem:
+                match = re.search(r'(\d+)', rating_elem.get('aria-label', ''))
+                if match:
+                    review_rating = int(match.group(1))
+
+            reviews.append({
+                'id': review_elem.get('data-review-id'),
+                'text': review_text,
+                'rating': review_rating,
+            })
+        if reviews:
+            return reviews
+    return []
+
+
+def page_url(url: str, start: int) -> str:
+    """The business URL for the page of reviews starting at `start`."""
+    parts = urlsplit(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query) if k != 'start']
+    if start:
+        query.append(('start', str(start)))
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), parts.fragment))
+
+
+@dataclass
+class BusinessPage:
+    url: str
+    rating: Optional[float]
+    review_count: int
+    pages: int
+    reviews: Iterator[Dict]     # first page's reviews, then the rest as their pages arrive
+
+
+def _get_soup(session: requests.Session, url: str) -> BeautifulSoup:
+    response = session.get(service_url(url), timeout=PAGE_TIMEOUT)
+    response.raise_for_status()
+    return BeautifulSoup(response.content, 'html.parser')
+
+
+def fetch_business(session: requests.Session, url: str, workers: int = PAGE_WORKERS,
+                   max_pages: int = MAX_PAGES) -> BusinessPage:
+    """
+    Fetch a business page and stream every review page.
+
+    The first page is fetched here (its errors raise); the other pages are
+    fetched while BusinessPage.reviews is consumed. A later page that fails
+    after the session's retries is skipped with a warning. Reviews repeated
+    across pages (new reviews shift the paging) are yielded once; reviews
+    with different ids are never merged, however alike their text.
+    """
+    soup = _get_soup(session, page_url(url, 0))
+    first = parse_reviews(soup)
+    review_count = parse_review_count(soup)
+    page_size = parse_page_size(soup)
+    pages = min(max_pages, max(1, math.ceil(review_count / page_size)))
+
+    def stream() -> Iterator[Dict]:
+        seen = set()
+        texts = ReviewIndex()
+
+        def fresh(reviews: List[Dict]) -> Iterator[Dict]:
+            for review in reviews:
+                key = review['id'] or review['text']
+                if key in seen:
+                    continue
+                seen.add(key)
+                # Same source and run: only an exact repeat of a review without an id
+                if texts.add(key, review['text'], Origin('yelp', review['id'], review['rating'])) is not None:
+                    metrics.count('duplicate_reviews', source='yelp')
+                    continue
+                yield review
+
+        yield from fresh(first)
+        if pages == 1:
+            return
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='yelp-pages')
+        try:
+            futures = {executor.submit(_get_soup, session, page_url(url, page * page_size)): page
+                       for page in range(1, pages)}
+            for future in as_completed(futures):
+                try:
+                    reviews = parse_reviews(future.result())
+                except requests.exceptions.RequestException as e:
+                    metrics.count('yelp_review_pages_failed')
+                    print(f"  ⚠️  Skipped review page {futures[future] + 1}/{pages}: {e}")
+                    continue
+                metrics.count('yelp_review_pages')
+                yield from fresh(reviews)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    return BusinessPage(url, parse_rating(soup), review_count, pages, stream())
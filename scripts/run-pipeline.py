@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Refresh the roofer data, re-running only the stages whose inputs changed.
+
+Runs convert-excel -> apply-changes -> assign-service-areas ->
+find-google-profiles / prepare-bulk-search -> outscraper ->
+process-bulk-results -> reviews. Inputs are fingerprinted by content hash
+(state in data/roofers/pipeline-state.json); stages that are up to date are
+skipped and independent stages run in parallel. Stages that need an API key
+are skipped when it is not set, and later stages use the files already on
+disk.
+
+Usage:
+  python scripts/run-pipeline.py
+  python scripts/run-pipeline.py --dry-run
+  python scripts/run-pipeline.py --force assign-service-areas
+  python scripts/run-pipeline.py --only convert-excel apply-changes
+  python scripts/run-pipeline.py --list
+
+Requirements:
+- pip install -r scripts/requirements-pipeline.txt
+"""
+
+import argparse
+import sys
+
+from roofer_pipeline import metrics
+from roofer_pipeline.orchestrator import (BLOCKED, EXCLUDED, FAILED, FRESH, OUTPUT_TAIL_LINES, PENDING, RAN,
+                                          STALE, UNAVAILABLE, Orchestrator, Outcome, build_graph)
+
+ICONS = {
+    RAN: '✅',
+    FRESH: '⏭️ ',
+    STALE: '🔄',
+    PENDING: '⏳',
+    FAILED: '❌',
+    BLOCKED: '⛔',
+    UNAVAILABLE: '⚠️ ',
+    EXCLUDED: '➖',
+}
+
+
+def print_stages(orchestrator: Orchestrator):
+    graph = orchestrator.graph
+    for stage in orchestrator.stages:
+        record = orchestrator.state['stages'].get(stage.name, {})
+        print(f"{stage.name:<22} {stage.description}")
+        print(f"{'':<22} reads: {', '.join(p.name for p in stage.inputs)}")
+        print(f"{'':<22} writes: {', '.join(p.name for p in stage.outputs)}")
+        print(f"{'':<22} after: {', '.join(graph.deps[stage.name]) or '-'}")
+        if stage.requires_env:
+            print(f"{'':<22} needs: {', '.join(stage.requires_env)}")
+        print(f"{'':<22} last run: {record.get('finishedAt', 'never')}")
+
+
+def make_reporter(verbose: bool):
+    def report(outcome: Outcome):
+        timing = f" in {outcome.seconds:.1f}s" if outcome.status in (RAN, FAILED) else ''
+        print(f"{ICONS.get(outcome.status, '•')} {outcome.stage:<22} {outcome.status}{timing}"
+              f"{f' ({outcome.reason})' if outcome.reason else ''}")
+        lines = outcome.output.rstrip().splitlines()
+        if outcome.status == RAN and not verbose:
+            lines = lines[-OUTPUT_TAIL_LINES:]
+        for line in lines:
+            print(f"   │ {line}")
+    return report
+
+
+def main():
+    metrics.start_run()
+    parser = argparse.ArgumentParser(description='Run the roofer data pipeline, skipping up-to-date stages')
+    parser.add_argument('--jobs', '-j', type=int, default=4, help='Stages to run at the same time')
+    parser.add_argument('--force', nargs='+', default=[], metavar='STAGE',
+                        help='Re-run these stages even if up to date ("all" for every stage)')
+    parser.add_argument('--only', nargs='+', default=[], metavar='STAGE',
+                        help='Consider only these stages; the rest keep their current outputs')
+    parser.add_argument('--dry-run', action='store_true', help='Show what would run without running it')
+    parser.add_argument('--list', action='store_true', help='List stages and their dependencies')
+    parser.add_argument('--verbose', '-v', action='store_true', help='Print the full output of every stage')
+    args = parser.parse_args()
+
+    try:
+        orchestrator = Orchestrator(jobs=args.jobs, force=tuple(args.force), only=tuple(args.only),
+                                    dry_run=args.dry_run,
+                                    report=make_reporter(args.verbose))
+    except ValueError as e:
+        print(f"❌ {e}")
+        print(f"   Stages: {', '.join(build_graph().stages)}")
+        sys.exit(2)
+
+    if args.list:
+        print_stages(orchestrator)
+        return
+
+    print(f"🚀 Roofer pipeline{' (dry run)' if args.dry_run else ''}\n")
+    outcomes = orchestrator.run()
+
+    ran = sum(1 for o in outcomes.values() if o.status == RAN)
+    fresh = sum(1 for o in outcomes.values() if o.status == FRESH)
+    failed = [o.stage for o in outcomes.values() if o.status == FAILED]
+    print(f"\n📊 {ran} ran, {fresh} up to date, {len(outcomes) - ran - fresh} other")
+    if failed:
+        print(f"❌ Failed: {', '.join(failed)}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Score every roofer on one comparable rating scale and write ratingScore and
+ratingCount into roofers.ts, which getRoofersByServiceArea() sorts on.
+
+Google and Yelp review counts and averages are combined with a Bayesian
+prior (roofer_pipeline.rating_score), so a single 5-star review no longer
+outranks 4.8 stars from hundreds of reviews.
+
+Usage:
+  python scripts/score-roofer-ratings.py
+  python scripts/score-roofer-ratings.py --dry-run --show 20
+  python scripts/score-roofer-ratings.py --prior-weight 25
+
+Requirements:
+- pip install -r scripts/requirements-pipeline.txt
+"""
+
+import argparse
+from pathlib import Path
+
+import pandas as pd
+
+from roofer_pipeline import metrics
+from roofer_pipeline.paths import REVIEWS_TS, ROOFERS_TS, YELP_REVIEWS_TS
+from roofer_pipeline.rating_score import PRIOR_WEIGHT, rating_scores, source_ratings, write_scores
+from roofer_pipeline.roofers_ts import load_roofers
+
+
+def main():
+    metrics.start_run()
+    parser = argparse.ArgumentParser(description='Bayesian cross-source rating score per roofer')
+    parser.add_argument('--roofers', type=Path, default=ROOFERS_TS)
+    parser.add_argument('--reviews', type=Path, default=REVIEWS_TS)
+    parser.add_argument('--yelp-reviews', type=Path, default=YELP_REVIEWS_TS)
+    parser.add_argument('--prior-weight', type=float, default=PRIOR_WEIGHT,
+                        help='Reviews worth of weight given to the roster-wide mean rating')
+    parser.add_argument('--show', type=int, default=10, help='Top roofers to print')
+    parser.add_argument('--dry-run', action='store_true', help='Report without writing roofers.ts')
+    args = parser.parse_args()
+
+    with metrics.stage('load') as stage:
+        roofers = load_roofers(args.roofers)
+        ratings = source_ratings(roofers, args.reviews, args.yelp_reviews)
+        stage.rows = len(ratings)
+    roster = [str(roofer['id']) for roofer in roofers if roofer.get('id') is not None]
+    with metrics.stage('score') as stage:
+        scores = rating_scores(roster, ratings, args.prior_weight)
+        stage.rows = len(scores)
+    rated = scores[scores['count'] > 0]
+    sources = ', '.join(f"{n} {source}" for source, n in ratings['source'].value_counts().items())
+    print(f"⭐ {len(rated)} of {len(scores)} roofers rated ({sources or 'no ratings'})")
+    if len(rated) < len(scores):
+        print(f"   {len(scores) - len(rated)} unrated roofers get no ratingScore and sort after rated ones")
+
+    names = {str(roofer.get('id')): roofer.get('name') for roofer in roofers}
+    for roofer_id, row in rated.sort_values('score', ascending=False).head(args.show).iterrows():
+        averages = '  '.join(f"{column[len('average_'):]} {row[column]:.1f}"
+                             for column in rated.columns if column.startswith('average_') and pd.notna(row[column]))
+        print(f"   {row['score']:.3f}  {int(row['count']):5d} reviews  {averages:24s} {names.get(roofer_id)}")
+
+    with metrics.stage('emit') as stage:
+        changed, unresolved = write_scores(scores, args.roofers, args.dry_run)
+        stage.rows = len(changed)
+    action = 'Would update' if args.dry_run else 'Updated'
+    print(f"✅ {action} ratingScore for {len(changed)} roofers in {args.roofers}")
+    if unresolved:
+        print(f"⚠️  {len(unresolved)} roofer ids not found in {args.roofers}")
+
+
+if __name__ == '__main__':
+    main()
@@ -11,6 +11,8 @@ from pathlib import Path
 from typing import Dict, List, Optional
 import urllib.parse
 
+from roofer_pipeline import metrics
+
 def extract_roofers_from_ts(file_path: Path) -> List[Dict]:
     """Extract roofer data from TypeScript file."""
     content = file_path.read_text()
@@ -73,6 +75,7 @@ def generate_google_search_url(roofer: Dict) -> str:
 
 def main():
     """Main function."""
+    metrics.start_run()
     print("🔍 Generating Google Business Profile search URLs...\n")
     
     roofers_file = Path('app/roofers/data/roofers.ts')
@@ -0,0 +1,13 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# The pipeline package lives next to the scripts, as for every CLI in scripts/
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+@pytest.fixture(autouse=True)
+def no_metrics(monkeypatch):
+    """Keep test runs (and the scripts they start) out of data/metrics/."""
+    monkeypatch.setenv('PIPELINE_METRICS_DIR', 'off')
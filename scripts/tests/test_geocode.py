@@ -0,0 +1,92 @@
+"""
+Geocoding precision: what Nominatim answers count as an address, and what
+precision the coordinates written to roofers.ts carry.
+"""
+
+import pytest
+
+from roofer_pipeline.geocode import (AddressQuery, GeocodeCache, GeocodeResult, NominatimProvider,
+                                     StaticProvider, backfill_coordinates)
+from roofer_pipeline.roofers_ts import load_roofers
+
+ROOFERS_TS = """export const rooferData: Record<string, RooferData> = {
+  'acme-roofing': {
+    id: '1',
+    name: 'ACME ROOFING',
+    address: '1 Main St',
+    city: 'Deerfield Beach',
+    zipCode: '33442',
+    serviceAreas: { regions: [], counties: ['broward'], cities: [] },
+    isHidden: false
+  },
+  'new-wave-roofing': {
+    id: '2',
+    name: 'NEW WAVE ROOFING',
+    serviceAreas: { regions: [], counties: ['broward'], cities: [] },
+    isHidden: false
+  }
+};
+"""
+
+
+class FakeResponse:
+    def __init__(self, results):
+        self.results = results
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.results
+
+
+class FakeSession:
+    def __init__(self, results):
+        self.results = results
+
+    def get(self, url, **kwargs):
+        return FakeResponse(self.results)
+
+
+@pytest.mark.parametrize('osm_class, osm_type, precision', [
+    ('building', 'yes', 'address'),
+    ('place', 'house', 'address'),
+    ('highway', 'residential', 'street'),
+    ('place', 'city', 'city'),
+    ('place', 'town', 'city'),
+    ('boundary', 'administrative', 'city'),
+])
+def test_nominatim_precision(osm_class, osm_type, precision):
+    provider = NominatimProvider()
+    provider.session = FakeSession([{'lat': '26.3184', 'lon': '-80.0998', 'class': osm_class, 'type': osm_type}])
+    result = provider.geocode(AddressQuery('1 Main St', 'Deerfield Beach', 'FL', '33442'))
+    assert result.precision == precision
+
+
+def test_backfill_records_precision(tmp_path):
+    path = tmp_path / 'roofers.ts'
+    path.write_text(ROOFERS_TS, encoding='utf-8')
+    provider = StaticProvider({'1 Main St, Deerfield Beach, FL, 33442, USA': [26.3184, -80.0998]})
+
+    outcome = backfill_coordinates([provider], path)
+
+    assert outcome.updated == ['acme-roofing', 'new-wave-roofing']
+    roofers = {r['id']: r for r in load_roofers(path)}
+    assert (roofers['1']['latitude'], roofers['1']['geocodePrecision']) == (26.3184, 'static')
+    # No address to look up: the first service-area county's center
+    assert roofers['2']['geocodePrecision'] == 'county'
+    assert backfill_coordinates([provider], path).updated == []
+
+
+def test_cache_drops_nominatim_addresses_from_before_version_1(tmp_path):
+    path = tmp_path / 'cache.sqlite'
+    with GeocodeCache(path) as cache:
+        cache.put('a', GeocodeResult(26.3, -80.1, 'address', 'nominatim'))
+        cache.put('b', GeocodeResult(26.3, -80.1, 'city', 'nominatim'))
+        cache.conn.execute('PRAGMA user_version = 0')
+
+    with GeocodeCache(path) as cache:
+        assert set(cache.get_many(['a', 'b'])) == {'b'}
+        cache.put('a', GeocodeResult(26.3, -80.1, 'address', 'nominatim'))
+    with GeocodeCache(path) as cache:
+        assert set(cache.get_many(['a', 'b'])) == {'a', 'b'}
@@ -0,0 +1,125 @@
+"""
+Orchestrated Excel import on a clean checkout: no import state, no pipeline
+state, a roster with curated contact details and a sheet with repeated rows.
+"""
+
+import json
+
+import pytest
+
+from roofer_pipeline.ingest import COLUMN_FIELDS
+from roofer_pipeline.orchestrator import FRESH, RAN, Orchestrator, Stage
+from roofer_pipeline.roofers_ts import load_roofers
+
+ROOFERS_TS = """export const rooferData: Record<string, RooferData> = {
+  'acme-roofing': {
+    id: '1',
+    name: 'ACME ROOFING',
+    slug: 'acme-roofing',
+    phone: '(561) 555-0100',
+    zipCode: '33442-3025',
+    serviceAreas: { regions: [], counties: [], cities: [] },
+    isPreferred: true,
+    isHidden: false
+  },
+  'batchelor-s-inc-roofing-contractors': {
+    id: '2',
+    name: "BATCHELOR'S INC ROOFING CONTRACTORS",
+    slug: 'batchelor-s-inc-roofing-contractors',
+    serviceAreas: { regions: [], counties: [], cities: [] },
+    isPreferred: false,
+    isHidden: false
+  }
+};
+"""
+
+ACME = ['ACME ROOFING', '561-555-0199', 'office@acme.com', 'acme.com', '1 Main St', 'Deerfield Beach', 'FL', 33442]
+BATCHELOR = ["BATCHELOR'S INC ROOFING CONTRACTORS", '904-555-0123', None, None, None, 'Jacksonville', 'FL', 32207]
+NEW = ['NEW WAVE ROOFING', '813-555-0142', None, 'newwave.com', None, 'Tampa', 'FL', 33602]
+
+
+def write_sheet(path, rows):
+    from openpyxl import Workbook
+
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.append(list(COLUMN_FIELDS))
+    for row in rows:
+        sheet.append(row)
+    workbook.save(path)
+
+
+@pytest.fixture
+def checkout(tmp_path):
+    paths = {name: tmp_path / name for name in
+             ('roster.xlsx', 'roofers-data.json', 'roofers-changes.json', 'import-state.json', 'roofers.ts')}
+    paths['roofers.ts'].write_text(ROOFERS_TS, encoding='utf-8')
+    write_sheet(paths['roster.xlsx'], [ACME, BATCHELOR, BATCHELOR, NEW, ['\\'] + [None] * 7])
+    return paths
+
+
+def import_stages(paths):
+    return [
+        Stage('convert-excel',
+              ['data/roofers/convert-excel.py', '--excel', str(paths['roster.xlsx']),
+               '--output', str(paths['roofers-data.json']), '--changes', str(paths['roofers-changes.json']),
+               '--state', str(paths['import-state.json'])],
+              inputs=[paths['roster.xlsx']],
+              outputs=[paths['roofers-data.json'], paths['roofers-changes.json']]),
+        Stage('apply-changes',
+              ['data/roofers/apply-roofer-changes.py', '--changes', str(paths['roofers-changes.json']),
+               '--file', str(paths['roofers.ts']), '--state', str(paths['import-state.json'])],
+              inputs=[paths['roofers-changes.json']],
+              outputs=[paths['roofers.ts'], paths['import-state.json']]),
+    ]
+
+
+def run(paths, tmp_path):
+    outcomes = Orchestrator(stages=import_stages(paths), state_file=tmp_path / 'pipeline-state.json', jobs=1).run()
+    for outcome in outcomes.values():
+        assert outcome.status in (RAN, FRESH), f"{outcome.stage}: {outcome.reason}\n{outcome.output}"
+    return {name: outcome.status for name, outcome in outcomes.items()}
+
+
+def test_first_run_seeds_the_roster_without_overwriting_it(checkout, tmp_path):
+    assert run(checkout, tmp_path) == {'convert-excel': RAN, 'apply-changes': RAN}
+
+    roofers = {r['slug']: r for r in load_roofers(checkout['roofers.ts'])}
+    assert list(roofers) == ['acme-roofing', 'batchelor-s-inc-roofing-contractors', 'new-wave-roofing']
+    # Curated fields are kept; only missing ones are filled in from the sheet
+    assert roofers['acme-roofing']['phone'] == '(561) 555-0100'
+    assert roofers['acme-roofing']['zipCode'] == '33442-3025'
+    assert roofers['acme-roofing']['email'] == 'office@acme.com'
+    # Both copies of the repeated row land on the one roofer
+    assert roofers['batchelor-s-inc-roofing-contractors']['phone'] == '904-555-0123'
+    assert roofers['new-wave-roofing']['id'] == '3'
+    assert roofers['new-wave-roofing']['websiteUrl'] == 'https://newwave.com'
+
+    state = json.loads(checkout['import-state.json'].read_text(encoding='utf-8'))
+    assert len(state['rows']) == 4
+
+    assert run(checkout, tmp_path) == {'convert-excel': FRESH, 'apply-changes': FRESH}
+
+
+def test_sheet_edit_after_first_run_updates_only_that_roofer(checkout, tmp_path):
+    run(checkout, tmp_path)
+    before = checkout['roofers.ts'].read_text(encoding='utf-8')
+
+    write_sheet(checkout['roster.xlsx'], [ACME[:1] + ['561-555-0177'] + ACME[2:], BATCHELOR, BATCHELOR, NEW])
+    assert run(checkout, tmp_path) == {'convert-excel': RAN, 'apply-changes': RAN}
+
+    after = checkout['roofers.ts'].read_text(encoding='utf-8')
+    assert after == before.replace("phone: '(561) 555-0100'", "phone: '561-555-0177'")
+
+
+def test_failed_apply_keeps_the_changes_for_the_next_run(checkout, tmp_path):
+    roster = checkout['roofers.ts'].read_text(encoding='utf-8')
+    checkout['roofers.ts'].write_text('export const somethingElse = {};\n', encoding='utf-8')
+    outcomes = Orchestrator(stages=import_stages(checkout), state_file=tmp_path / 'pipeline-state.json').run()
+    assert outcomes['apply-changes'].status == 'failed'
+    assert not checkout['import-state.json'].exists()
+
+    checkout['roofers.ts'].write_text(roster, encoding='utf-8')
+    # convert-excel is up to date and its change set still holds every row
+    assert run(checkout, tmp_path) == {'convert-excel': FRESH, 'apply-changes': RAN}
+    assert [r['slug'] for r in load_roofers(checkout['roofers.ts'])][-1] == 'new-wave-roofing'
@@ -0,0 +1,59 @@
+"""
+Rating trends written to roofers.ts, from a roofer's first snapshot on.
+"""
+
+import math
+
+import pandas as pd
+import pytest
+
+from roofer_pipeline.rating_history import DAY, analyze_trends, write_trends
+from roofer_pipeline.roofers_ts import load_roofers, to_ts_literal
+
+ROOFERS_TS = """export const rooferData: Record<string, RooferData> = {
+  'acme-roofing': {
+    id: '1',
+    name: 'ACME ROOFING',
+    slug: 'acme-roofing',
+    isHidden: false
+  },
+  'new-wave-roofing': {
+    id: '2',
+    name: 'NEW WAVE ROOFING',
+    slug: 'new-wave-roofing',
+    isHidden: false
+  }
+};
+"""
+
+NOW = 1_790_000_000.0
+
+
+def snapshots(rows):
+    return pd.DataFrame(rows, columns=['source', 'key', 'fetched_at', 'rating', 'review_count'])
+
+
+def test_first_snapshot_has_no_trend(tmp_path):
+    path = tmp_path / 'roofers.ts'
+    path.write_text(ROOFERS_TS, encoding='utf-8')
+    trends = analyze_trends(snapshots([
+        ('google', '1', NOW, 4.5, 10),
+        ('google', '2', NOW - 100 * DAY, 4.0, 5),
+        ('google', '2', NOW, 4.6, 9),
+    ]), now=NOW)
+
+    by_roofer, changed, unresolved = write_trends(trends, path)
+
+    assert (changed, unresolved) == (['acme-roofing', 'new-wave-roofing'], [])
+    assert 'trend' not in by_roofer['acme-roofing']['google']
+    assert 'change90d' not in by_roofer['acme-roofing']['google']
+    assert by_roofer['new-wave-roofing']['google']['trend'] == 'rising'
+    assert 'nan' not in path.read_text(encoding='utf-8')
+    roofers = {r['slug']: r for r in load_roofers(path)}
+    assert roofers['acme-roofing']['ratingTrends'] == by_roofer['acme-roofing']
+
+
+@pytest.mark.parametrize('value', [math.nan, math.inf, -math.inf])
+def test_non_finite_numbers_are_not_rendered(value):
+    with pytest.raises(ValueError):
+        to_ts_literal({'rating': value})
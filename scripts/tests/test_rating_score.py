@@ -0,0 +1,42 @@
+"""
+Rating scores written to roofers.ts: only roofers with reviews are scored.
+"""
+
+import pandas as pd
+
+from roofer_pipeline.rating_score import COLUMNS, rating_scores, write_scores
+from roofer_pipeline.roofers_ts import load_roofers
+
+ROOFERS_TS = """export const rooferData: Record<string, RooferData> = {
+  'acme-roofing': {
+    id: '1',
+    name: 'ACME ROOFING',
+    isHidden: false
+  },
+  'new-wave-roofing': {
+    id: '2',
+    name: 'NEW WAVE ROOFING',
+    isHidden: false,
+    ratingScore: 4.5,
+    ratingCount: 3
+  }
+};
+"""
+
+
+def test_unreviewed_roofers_get_no_score(tmp_path):
+    path = tmp_path / 'roofers.ts'
+    path.write_text(ROOFERS_TS, encoding='utf-8')
+    ratings = pd.DataFrame([('1', 'google', 4.4, 12)], columns=COLUMNS)
+    scores = rating_scores(['1', '2'], ratings, prior_weight=10.0, prior_mean=4.6)
+    # The prior alone would put the unreviewed roofer above the reviewed one
+    assert scores.loc['2', 'score'] > scores.loc['1', 'score']
+
+    changed, unresolved = write_scores(scores, path)
+
+    assert (changed, unresolved) == (['acme-roofing', 'new-wave-roofing'], [])
+    roofers = {r['id']: r for r in load_roofers(path)}
+    assert roofers['1']['ratingScore'] == round((10.0 * 4.6 + 12 * 4.4) / 22, 3)
+    assert roofers['1']['ratingCount'] == 12
+    assert 'ratingScore' not in roofers['2'] and 'ratingCount' not in roofers['2']
+    assert write_scores(scores, path) == ([], [])
@@ -0,0 +1,30 @@
+"""
+The theme model, and the analyzer version built on its fingerprint, must not
+depend on the interpreter's string hashing.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+SCRIPTS = Path(__file__).resolve().parent.parent
+
+FIT = """
+from roofer_pipeline.review_themes import ThemeModel
+texts = ['Great metal roof install, crew cleaned up', 'Metal roof install was quick and the crew cleaned up',
+         'Tile roof repair after the storm', 'Storm damage tile roof repair done fast'] * 2
+print(ThemeModel.fit(texts, min_df=2).fingerprint)
+"""
+
+
+def fingerprint(seed):
+    env = dict(os.environ, PYTHONHASHSEED=str(seed))
+    return subprocess.run([sys.executable, '-c', FIT], cwd=SCRIPTS, env=env,
+                          capture_output=True, text=True, check=True).stdout.strip()
+
+
+def test_fingerprint_is_the_same_under_every_hash_seed():
+    fingerprints = {fingerprint(seed) for seed in range(5)}
+    assert len(fingerprints) == 1
+    assert fingerprints != {'none'}
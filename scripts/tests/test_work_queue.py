@@ -0,0 +1,102 @@
+"""
+Lease guarantees of the work queue against a temporary database: concurrent
+workers split the queue with every task done exactly once, an expired lease
+is taken over, and the worker that lost it can no longer record anything.
+"""
+
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from roofer_pipeline.work_queue import DONE, FAILED, LEASED, PENDING, WorkQueue, Worker
+
+QUEUE = 'test'
+
+
+def tasks(n):
+    return [(f'roofer-{i}', {'i': i}) for i in range(n)]
+
+
+def drain(path, owner):
+    """One worker process: handle tasks until nothing is ready; the keys it completed."""
+    completed = []
+    Worker(WorkQueue(path), QUEUE, owner).run(lambda task: {'key': task.key, 'owner': owner},
+                                              on_done=lambda task, result: completed.append(task.key))
+    return completed
+
+
+def test_concurrent_workers_complete_every_task_exactly_once(tmp_path):
+    path = tmp_path / 'queue.sqlite'
+    WorkQueue(path).enqueue(QUEUE, tasks(200))
+
+    context = multiprocessing.get_context('fork')
+    with ProcessPoolExecutor(max_workers=6, mp_context=context) as pool:
+        handled = list(pool.map(drain, [path] * 6, [f'worker-{n}' for n in range(6)]))
+
+    keys = [key for completed in handled for key in completed]
+    assert sorted(keys) == sorted(key for key, _ in tasks(200))
+    queue = WorkQueue(path)
+    assert queue.counts(QUEUE) == {PENDING: 0, LEASED: 0, DONE: 200, FAILED: 0}
+    results = queue.results(QUEUE)
+    assert [r['key'] for r in results] == [key for key, _ in tasks(200)]
+    # Each stored result is the one reported by the worker that completed the task
+    owners = {key: f'worker-{n}' for n, completed in enumerate(handled) for key in completed}
+    assert all(r['owner'] == owners[r['key']] for r in results)
+
+
+def test_expired_lease_is_taken_over_and_the_stale_worker_is_ignored(tmp_path):
+    queue = WorkQueue(tmp_path / 'queue.sqlite', lease_seconds=0.2)
+    queue.enqueue(QUEUE, tasks(1))
+
+    first = queue.claim(QUEUE, 'a')
+    assert queue.claim(QUEUE, 'b') is None  # still leased
+    time.sleep(0.3)
+    second = queue.claim(QUEUE, 'b')
+    assert (second.key, second.attempt, second.owner) == (first.key, 2, 'b')
+
+    # The worker whose lease expired can neither renew, fail nor complete the task
+    assert not queue.heartbeat(first)
+    assert queue.fail(first, 'timeout') == LEASED
+    assert not queue.complete(first, 'from a')
+    assert queue.counts(QUEUE)[LEASED] == 1
+
+    assert queue.complete(second, 'from b')
+    assert not queue.complete(first, 'from a')
+    assert queue.results(QUEUE) == ['from b']
+    assert queue.counts(QUEUE) == {PENDING: 0, LEASED: 0, DONE: 1, FAILED: 0}
+
+
+def test_expired_lease_out_of_attempts_fails_instead_of_retrying(tmp_path):
+    queue = WorkQueue(tmp_path / 'queue.sqlite', lease_seconds=0.1, max_attempts=1)
+    queue.enqueue(QUEUE, tasks(1))
+    assert queue.claim(QUEUE, 'a') is not None
+    time.sleep(0.2)
+    assert queue.claim(QUEUE, 'b') is None
+    assert queue.failures(QUEUE) == [('roofer-0', 1, 'lease expired')]
+
+
+def test_heartbeat_keeps_a_slow_task_from_being_taken_over(tmp_path):
+    path = tmp_path / 'queue.sqlite'
+    WorkQueue(path).enqueue(QUEUE, tasks(1))
+    started = threading.Event()
+    stolen = []
+
+    def slow(task):
+        started.set()
+        time.sleep(3.0)  # twice the lease; the heartbeat renews it every second
+        return task.key
+
+    worker = threading.Thread(target=Worker(WorkQueue(path, lease_seconds=1.5), QUEUE, 'slow').run, args=(slow,))
+    worker.start()
+    started.wait()
+    other = WorkQueue(path, lease_seconds=1.5)
+    while worker.is_alive():
+        task = other.claim(QUEUE, 'thief')
+        if task is not None:
+            stolen.append(task)
+        time.sleep(0.1)
+    worker.join()
+
+    assert stolen == []
+    assert other.results(QUEUE) == ['roofer-0']